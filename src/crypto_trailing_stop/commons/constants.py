@@ -5,7 +5,21 @@ MEXC_API_BASE_URL = "https://api.mexc.com"
 MEXC_CONTRACT_API_BASE_URL = "https://contract.mexc.com"
 
 TELEGRAM_REPLY_EXCEPTION_MESSAGE_MAX_LENGTH = 3_000
+TELEGRAM_MESSAGE_MAX_LENGTH = 4_096
+TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR = "\n\n〰〰〰〰〰〰\n\n"
+# Telegram notification dispatcher defaults (Telegram allows ~1 message/second per chat and ~30 messages/second overall)
+DEFAULT_TELEGRAM_NOTIFICATION_WORKERS = 4
+DEFAULT_TELEGRAM_NOTIFICATION_DIGEST_WINDOW_SECONDS = 1.5
+DEFAULT_TELEGRAM_NOTIFICATION_PER_CHAT_INTERVAL_SECONDS = 1.0
+DEFAULT_TELEGRAM_NOTIFICATION_GLOBAL_RATE_LIMIT_PER_SECOND = 25
+DEFAULT_TELEGRAM_NOTIFICATION_MAX_PENDING_MESSAGES = 1_000
+DEFAULT_TELEGRAM_NOTIFICATION_MAX_RETRIES = 3
+DEFAULT_TELEGRAM_NOTIFICATION_SHUTDOWN_TIMEOUT_SECONDS = 10.0
 IDEMPOTENT_HTTP_METHODS = ["GET", "HEAD", "OPTIONS", "TRACE"]
+# Non-idempotent HTTP requests (e.g. creating orders) are not started with less than this ratio of the deadline left
+NON_IDEMPOTENT_HTTP_REQUEST_MIN_REMAINING_DEADLINE_RATIO = 0.2
+# Protective sell orders (e.g. market exits, moved stop-limit orders) get a fresh deadline of their own
+PROTECTIVE_ORDERS_DEADLINE_SECONDS = 30.0
 # Backoff status codes for Bit2Me
 BIT2ME_RETRYABLE_HTTP_STATUS_CODES = [403, 412, 417, 429, 451, 455, 502, 503, 504]
 # Backoff status codes for MEXC
@@ -22,11 +36,54 @@ STOP_LOSS_ALLOWED_VALUES_LIST = [*[-v for v in STOP_LOSS_STEPS_VALUE_LIST][::-1]
 PERCENT_TO_SELL_LIST = np.arange(25, 125, 25).tolist()
 TRAILING_STOP_LOSS_PRICE_DECREASE_THRESHOLD = 0.00025
 DEFAULT_IN_MEMORY_CACHE_TTL_IN_SECONDS = 86_400  # 1 day
+# Circuit breaker defaults for the exchange remote services
+DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_LATENCY_SLO_SECONDS = 15.0
+DEFAULT_CIRCUIT_BREAKER_OPEN_TIMEOUT_SECONDS = 30.0
+CIRCUIT_BREAKER_STALE_TICKERS_MAX_AGE_SECONDS = 120.0  # 2 minutes
+# Besides server side errors (5xx), only throttling means the endpoint is unhealthy
+CIRCUIT_BREAKER_FAILURE_HTTP_STATUS_CODES = [429]
+# Circuit breakers are kept by route template (IDs masked), but the registry is bounded anyway
+CIRCUIT_BREAKER_REGISTRY_MAX_ENDPOINTS = 256
 # Removing number of executions
 BUY_SELL_MINUTES_PAST_HOUR_EXECUTION_CRON_PATTERN = [0, 1, 2, 3, 5, 15, 30, 31, 32, 33, 35, 45]
-# Event Emitter - Event names
+# Sharding defaults (lease TTL must be greater than the heartbeat interval)
+DEFAULT_SHARDING_TOTAL_SHARDS = 16
+DEFAULT_SHARDING_LEASE_TTL_SECONDS = 30
+DEFAULT_SHARDING_HEARTBEAT_INTERVAL_SECONDS = 10
+SHARDING_LEADER_LEASE_NAME = "leader"
+SHARDING_SHARD_LEASE_NAME_PREFIX = "shard:"
+SHARDING_WORKER_LEASE_NAME_PREFIX = "worker:"
+# SQLite tuning defaults
+DEFAULT_DATABASE_SYNCHRONOUS = "NORMAL"  # Safe enough under WAL, a crash only loses the last commits
+DEFAULT_DATABASE_CACHE_SIZE_KIB = 16_384  # 16 MiB
+DEFAULT_DATABASE_MMAP_SIZE_BYTES = 134_217_728  # 128 MiB
+DEFAULT_DATABASE_BUSY_TIMEOUT_MS = 5_000  # 5 seconds
+DEFAULT_DATABASE_CONNECTION_POOL_SIZE = 4
+# Database maintenance defaults
+DEFAULT_DATABASE_MAINTENANCE_JOB_INTERVAL_SECONDS = 3_600  # 1 hour
+DEFAULT_DATABASE_INCREMENTAL_VACUUM_PAGES = 1_000
+DEFAULT_MARKET_SIGNAL_RETENTION_BATCH_SIZE = 500
+# Market signals write-behind defaults
+DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_BATCH_SIZE = 100
+DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_PENDING_ROWS = 10_000
+DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_ATTEMPTS = 5
+# Market history archive (Parquet datasets)
+MARKET_HISTORY_ARCHIVE_MARKET_METRICS_DATASET = "market_metrics"
+MARKET_HISTORY_ARCHIVE_MARKET_SIGNALS_DATASET = "market_signals"
+DEFAULT_MARKET_HISTORY_ARCHIVE_COMPACTION_MIN_FILES = 24
+# Minimal gap between two consecutive executions of the cron pattern above
+BUY_SELL_SIGNALS_CRON_RUN_DEADLINE_SECONDS = 60  # 1 minute
+# Minutes after a candle close in which signals are re-evaluated, as confirmation retries
+BUY_SELL_SIGNALS_CANDLE_CLOSE_CONFIRMATION_WINDOW_MINUTES = 5
+# Event names
 SIGNALS_EVALUATION_RESULT_EVENT_NAME = "signals_evaluation_result"
 TRIGGER_BUY_ACTION_EVENT_NAME = "trigger_buy_action"
+SHARDING_LEADERSHIP_CHANGED_EVENT_NAME = "sharding_leadership_changed"
+# Event bus defaults
+DEFAULT_EVENT_BUS_QUEUE_SIZE = 1_000
+DEFAULT_EVENT_BUS_SHUTDOWN_TIMEOUT_SECONDS = 10.0
 # Bit2Me Fees
 BIT2ME_TAKER_FEES = 0.00259
 # MEXC Fees
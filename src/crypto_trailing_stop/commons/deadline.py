@@ -0,0 +1,123 @@
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from httpx import Timeout
+
+# NOTE: Monotonic clock timestamp at which the current task run must be finished. None means no deadline at all
+_current_deadline: ContextVar[float | None] = ContextVar("current_deadline", default=None)
+# NOTE: Length in seconds of the current deadline, as it was set by its scope
+_current_deadline_seconds: ContextVar[float | None] = ContextVar("current_deadline_seconds", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    Raised when there is no time left to start a new operation within the current deadline.
+    NOTE: It does not inherit from httpx exceptions on purpose, so backoff decorators do not retry it.
+    """
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Generator[None]:
+    """
+    Set a deadline for the enclosed block. Nested scopes can only shrink the deadline, never extend it.
+    Args:
+        seconds (float | None): Seconds from now. None keeps the current deadline, if any.
+    """
+    current_deadline, current_deadline_seconds = _current_deadline.get(), _current_deadline_seconds.get()
+    if seconds is not None:
+        new_deadline = time.monotonic() + seconds
+        if current_deadline is None or new_deadline < current_deadline:
+            current_deadline, current_deadline_seconds = new_deadline, seconds
+    with _set_deadline(current_deadline, current_deadline_seconds):
+        yield
+
+
+@contextmanager
+def protective_deadline_scope(seconds: float) -> Generator[None]:
+    """
+    Set a fresh deadline for the enclosed block, replacing the current one even if it is longer.
+    Meant for operations which must not be left halfway, e.g. placing the protective order
+    right after cancelling the previous one.
+    Args:
+        seconds (float): Seconds from now.
+    """
+    with _set_deadline(time.monotonic() + seconds, seconds):
+        yield
+
+
+@contextmanager
+def no_deadline_scope() -> Generator[None]:
+    """
+    Clear the deadline for the enclosed block, e.g. for tasks spawned from a task run that must outlive it.
+    """
+    with _set_deadline(None, None):
+        yield
+
+
+def get_deadline_seconds() -> float | None:
+    """
+    Get the length in seconds of the current deadline. None if there is no deadline at all.
+    """
+    return _current_deadline_seconds.get()
+
+
+def get_deadline_remaining_seconds() -> float | None:
+    current_deadline = _current_deadline.get()
+    ret = max(current_deadline - time.monotonic(), 0.0) if current_deadline is not None else None
+    return ret
+
+
+def is_deadline_exceeded() -> bool:
+    remaining_seconds = get_deadline_remaining_seconds()
+    return remaining_seconds is not None and remaining_seconds <= 0
+
+
+def raise_if_deadline_exceeded(operation: str = "operation", *, min_remaining_seconds: float = 0.0) -> None:
+    """
+    Raise DeadlineExceededError if there is no time left to start the given operation.
+    Args:
+        operation (str): Operation to be started, for the error message.
+        min_remaining_seconds (float): Seconds the operation needs at least to be completed within the deadline.
+    """
+    remaining_seconds = get_deadline_remaining_seconds()
+    if remaining_seconds is not None and (remaining_seconds <= 0 or remaining_seconds < min_remaining_seconds):
+        raise DeadlineExceededError(f"Deadline exceeded before starting {operation}")
+
+
+def apply_deadline_to_timeout(timeout: Timeout, *, idempotent: bool = True) -> Timeout:
+    """
+    Shrink the httpx timeouts so the request cannot outlive the current deadline.
+    Args:
+        timeout (Timeout): Timeout of the request.
+        idempotent (bool): Whether the request can be safely cut short once it has been sent.
+            Otherwise, only the timeouts before sending it (connect and pool) are shrunk,
+            since cutting it short would leave its outcome unknown (e.g. an order might have been created)
+    """
+    remaining_seconds = get_deadline_remaining_seconds()
+    if remaining_seconds is None:
+        ret = timeout
+    else:
+        ret = Timeout(
+            connect=_shrink(timeout.connect, remaining_seconds),
+            read=_shrink(timeout.read, remaining_seconds) if idempotent else timeout.read,
+            write=_shrink(timeout.write, remaining_seconds) if idempotent else timeout.write,
+            pool=_shrink(timeout.pool, remaining_seconds),
+        )
+    return ret
+
+
+@contextmanager
+def _set_deadline(deadline: float | None, deadline_seconds: float | None) -> Generator[None]:
+    deadline_token = _current_deadline.set(deadline)
+    deadline_seconds_token = _current_deadline_seconds.set(deadline_seconds)
+    try:
+        yield
+    finally:
+        _current_deadline_seconds.reset(deadline_seconds_token)
+        _current_deadline.reset(deadline_token)
+
+
+def _shrink(value: float | None, remaining_seconds: float) -> float:
+    return min(value, remaining_seconds) if value is not None else remaining_seconds
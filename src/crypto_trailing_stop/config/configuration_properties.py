@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from os import getpid
+from socket import gethostname
 from typing import Any
 from uuid import uuid4
 
@@ -9,8 +11,35 @@ from pydantic_settings import BaseSettings, EnvSettingsSource, PydanticBaseSetti
 
 from crypto_trailing_stop.commons.constants import (
     BIT2ME_API_BASE_URL,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_BREAKER_LATENCY_SLO_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_OPEN_TIMEOUT_SECONDS,
+    DEFAULT_DATABASE_BUSY_TIMEOUT_MS,
+    DEFAULT_DATABASE_CACHE_SIZE_KIB,
+    DEFAULT_DATABASE_CONNECTION_POOL_SIZE,
+    DEFAULT_DATABASE_INCREMENTAL_VACUUM_PAGES,
+    DEFAULT_DATABASE_MAINTENANCE_JOB_INTERVAL_SECONDS,
+    DEFAULT_DATABASE_MMAP_SIZE_BYTES,
+    DEFAULT_DATABASE_SYNCHRONOUS,
+    DEFAULT_EVENT_BUS_QUEUE_SIZE,
+    DEFAULT_EVENT_BUS_SHUTDOWN_TIMEOUT_SECONDS,
     DEFAULT_GLOBAL_FLAG_CHECKER_JOB_INTERVAL_SECONDS,
     DEFAULT_JOB_INTERVAL_SECONDS,
+    DEFAULT_MARKET_HISTORY_ARCHIVE_COMPACTION_MIN_FILES,
+    DEFAULT_MARKET_SIGNAL_RETENTION_BATCH_SIZE,
+    DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_BATCH_SIZE,
+    DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_ATTEMPTS,
+    DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_PENDING_ROWS,
+    DEFAULT_SHARDING_HEARTBEAT_INTERVAL_SECONDS,
+    DEFAULT_SHARDING_LEASE_TTL_SECONDS,
+    DEFAULT_SHARDING_TOTAL_SHARDS,
+    DEFAULT_TELEGRAM_NOTIFICATION_DIGEST_WINDOW_SECONDS,
+    DEFAULT_TELEGRAM_NOTIFICATION_GLOBAL_RATE_LIMIT_PER_SECOND,
+    DEFAULT_TELEGRAM_NOTIFICATION_MAX_PENDING_MESSAGES,
+    DEFAULT_TELEGRAM_NOTIFICATION_PER_CHAT_INTERVAL_SECONDS,
+    DEFAULT_TELEGRAM_NOTIFICATION_SHUTDOWN_TIMEOUT_SECONDS,
+    DEFAULT_TELEGRAM_NOTIFICATION_WORKERS,
     DEFAULT_TRAILING_STOP_LOSS_PERCENT,
     MEXC_API_BASE_URL,
     MEXC_CONTRACT_API_BASE_URL,
@@ -40,9 +69,29 @@ class ConfigurationProperties(BaseSettings):
     cors_enabled: bool = False
     # Telegram bot token
     telegram_bot_token: str
+    # Telegram notification dispatcher (alerts are delivered in background, throttled and merged into digests)
+    telegram_notification_dispatcher_enabled: bool = True
+    telegram_notification_workers: int = DEFAULT_TELEGRAM_NOTIFICATION_WORKERS
+    telegram_notification_digest_window_seconds: float = DEFAULT_TELEGRAM_NOTIFICATION_DIGEST_WINDOW_SECONDS
+    telegram_notification_per_chat_interval_seconds: float = DEFAULT_TELEGRAM_NOTIFICATION_PER_CHAT_INTERVAL_SECONDS
+    telegram_notification_global_rate_limit_per_second: float = (
+        DEFAULT_TELEGRAM_NOTIFICATION_GLOBAL_RATE_LIMIT_PER_SECOND
+    )
+    telegram_notification_max_pending_messages: int = DEFAULT_TELEGRAM_NOTIFICATION_MAX_PENDING_MESSAGES
+    telegram_notification_shutdown_timeout_seconds: float = DEFAULT_TELEGRAM_NOTIFICATION_SHUTDOWN_TIMEOUT_SECONDS
     # Database configuration
     database_in_memory: bool = False
     database_path: str = "./crypto_stop_loss.sqlite"
+    database_wal_enabled: bool = True
+    database_synchronous: str = DEFAULT_DATABASE_SYNCHRONOUS
+    database_cache_size_kib: int = DEFAULT_DATABASE_CACHE_SIZE_KIB
+    database_mmap_size_bytes: int = DEFAULT_DATABASE_MMAP_SIZE_BYTES
+    database_busy_timeout_ms: int = DEFAULT_DATABASE_BUSY_TIMEOUT_MS
+    database_connection_pool_size: int = DEFAULT_DATABASE_CONNECTION_POOL_SIZE
+    database_maintenance_job_interval_seconds: int = DEFAULT_DATABASE_MAINTENANCE_JOB_INTERVAL_SECONDS
+    database_incremental_vacuum_pages: int = DEFAULT_DATABASE_INCREMENTAL_VACUUM_PAGES
+    # Configuration cache (None means never expires, or every heartbeat interval when sharding is enabled)
+    configuration_cache_ttl_seconds: float | None = None
     # Operating exchange
     operating_exchange: OperatingExchangeEnum = OperatingExchangeEnum.MEXC
     # MEXC API configuration
@@ -77,6 +126,19 @@ class ConfigurationProperties(BaseSettings):
     trailing_stop_loss_percent: float | int = DEFAULT_TRAILING_STOP_LOSS_PERCENT
     # Market Signals parameters
     market_signal_retention_days: int = 9
+    market_signal_retention_batch_size: int = DEFAULT_MARKET_SIGNAL_RETENTION_BATCH_SIZE
+    # XXX: Expired market signals are moved to the market history archive, instead of being just deleted
+    market_signal_archive_enabled: bool = False
+    # XXX: [JMSOLA] Disabled by default, since 1h signals enqueued but not written yet are lost if the process crashes
+    market_signal_write_behind_enabled: bool = False
+    market_signal_write_behind_flush_interval_seconds: float = DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS
+    market_signal_write_behind_batch_size: int = DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_BATCH_SIZE
+    market_signal_write_behind_max_pending_rows: int = DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_PENDING_ROWS
+    market_signal_write_behind_max_attempts: int = DEFAULT_MARKET_SIGNAL_WRITE_BEHIND_MAX_ATTEMPTS
+    # Market history archive (Parquet files partitioned by month and symbol)
+    market_history_archive_enabled: bool = False
+    market_history_archive_folder_path: str = "./market_history_archive"
+    market_history_archive_compaction_min_files: int = DEFAULT_MARKET_HISTORY_ARCHIVE_COMPACTION_MIN_FILES
     # XXX: ATR multipliers (RRR = 1.4)
     suggested_stop_loss_atr_multiplier: float = 2.5
     suggested_take_profit_atr_multiplier: float = 3.5
@@ -90,6 +152,25 @@ class ConfigurationProperties(BaseSettings):
     # Jobs configuration
     job_interval_seconds: int = DEFAULT_JOB_INTERVAL_SECONDS
     global_flag_checker_job_interval_seconds: int = DEFAULT_GLOBAL_FLAG_CHECKER_JOB_INTERVAL_SECONDS
+    # Event bus configuration (every subscriber owns a bounded queue and a fixed number of workers)
+    event_bus_queue_size: int = DEFAULT_EVENT_BUS_QUEUE_SIZE
+    event_bus_shutdown_timeout_seconds: float = DEFAULT_EVENT_BUS_SHUTDOWN_TIMEOUT_SECONDS
+    # XXX: Single worker by default, so signals of the same symbol are stored in the same order they were evaluated
+    market_signal_event_workers: int = 1
+    # Circuit breaker configuration
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    circuit_breaker_latency_slo_seconds: float = DEFAULT_CIRCUIT_BREAKER_LATENCY_SLO_SECONDS
+    circuit_breaker_open_timeout_seconds: float = DEFAULT_CIRCUIT_BREAKER_OPEN_TIMEOUT_SECONDS
+    # Sharding configuration (several worker processes sharing the same SQLite database)
+    sharding_enabled: bool = False
+    sharding_worker_id: str = Field(default_factory=lambda: f"{gethostname()}-{getpid()}")
+    sharding_total_shards: int = DEFAULT_SHARDING_TOTAL_SHARDS
+    # XXX: [JMSOLA] Shards of a crashed worker (i.e. without giving back its leases) are not guarded by anyone
+    #      until its leases expire and another worker claims them on its next heartbeat,
+    #      so that window lasts up to sharding_lease_ttl_seconds + sharding_heartbeat_interval_seconds
+    sharding_lease_ttl_seconds: int = DEFAULT_SHARDING_LEASE_TTL_SECONDS
+    sharding_heartbeat_interval_seconds: int = DEFAULT_SHARDING_HEARTBEAT_INTERVAL_SECONDS
 
     @classmethod
     def settings_customise_sources(
@@ -1,9 +1,23 @@
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 from urllib.parse import urlencode
 
 from httpx import URL, AsyncClient, Response
 
+from crypto_trailing_stop.commons.constants import (
+    IDEMPOTENT_HTTP_METHODS,
+    NON_IDEMPOTENT_HTTP_REQUEST_MIN_REMAINING_DEADLINE_RATIO,
+)
+from crypto_trailing_stop.commons.deadline import (
+    apply_deadline_to_timeout,
+    get_deadline_remaining_seconds,
+    get_deadline_seconds,
+    is_deadline_exceeded,
+    raise_if_deadline_exceeded,
+)
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerRegistry
+
 
 class AbstractHttpRemoteAsyncService(ABC):
     async def _perform_http_request(
@@ -29,17 +43,87 @@ class AbstractHttpRemoteAsyncService(ABC):
         Returns:
             Response: httpx.Response instance
         """
+        # XXX: [JMSOLA] Non-idempotent requests are never cut short once sent, so they are not even started
+        #      unless there is enough time left to complete them within the deadline,
+        #      which is always a fraction of the deadline, so they can be started at all
+        deadline_seconds = get_deadline_seconds()
+        min_remaining_seconds = (
+            deadline_seconds * NON_IDEMPOTENT_HTTP_REQUEST_MIN_REMAINING_DEADLINE_RATIO
+            if deadline_seconds is not None and not self._is_idempotent(method)
+            else 0.0
+        )
+        raise_if_deadline_exceeded(f"HTTP {method} {url}", min_remaining_seconds=min_remaining_seconds)
+        circuit_breaker_registry = self.get_circuit_breaker_registry()
+        if circuit_breaker_registry is None or not circuit_breaker_registry.enabled:
+            response = await self._internal_perform_http_request(
+                method=method, url=url, params=params, headers=headers, body=body, client=client, **kwargs
+            )
+        else:
+            circuit_breaker = circuit_breaker_registry.get(method, url)
+            # XXX: [JMSOLA] Fail fast when the endpoint circuit is open, raising CircuitBreakerOpenError
+            circuit_breaker.acquire()
+            started_at = time.monotonic()
+            try:
+                response = await self._internal_perform_http_request(
+                    method=method, url=url, params=params, headers=headers, body=body, client=client, **kwargs
+                )
+            except BaseException as e:
+                if is_deadline_exceeded():
+                    # NOTE: Timeouts shrunk by the deadline say nothing about the endpoint health
+                    circuit_breaker.release()
+                elif circuit_breaker_registry.is_failure(e):
+                    circuit_breaker.record_failure()
+                elif isinstance(e, Exception):
+                    circuit_breaker.record_success(time.monotonic() - started_at)
+                else:  # pragma: no cover
+                    # NOTE: Task cancellation says nothing about the endpoint health
+                    circuit_breaker.release()
+                raise e
+            circuit_breaker.record_success(time.monotonic() - started_at)
+        return response
+
+    def get_circuit_breaker_registry(self) -> CircuitBreakerRegistry | None:
+        """
+        Method to get the per-endpoint circuit breaker registry of this remote service
+        Returns:
+            CircuitBreakerRegistry | None: Circuit breaker registry. None if circuit breaking is not supported
+        """
+        return None
+
+    async def _internal_perform_http_request(
+        self,
+        *,
+        method: str = "GET",
+        url: URL | str = "/",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        body: Any | None = None,
+        client: AsyncClient = None,
+        **kwargs,
+    ) -> Response:
         params = params or {}
         headers = headers or {}
         params, headers = await self._apply_request_interceptor(
             method=method, url=url, params=params, headers=headers, body=body
         )
         if client:
-            response = await client.request(method=method, url=url, params=params, headers=headers, json=body, **kwargs)
+            response = await client.request(
+                method=method,
+                url=url,
+                params=params,
+                headers=headers,
+                json=body,
+                **self._apply_deadline(method, client, kwargs),
+            )
         else:  # pragma: no cover
             async with await self.get_http_client() as client:
                 response = await client.request(
-                    method=method, url=url, params=params, headers=headers, json=body, **kwargs
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    json=body,
+                    **self._apply_deadline(method, client, kwargs),
                 )
         response = await self._apply_response_interceptor(
             method=method, url=url, params=params, headers=headers, body=body, response=response
@@ -110,6 +194,19 @@ class AbstractHttpRemoteAsyncService(ABC):
             AsyncClient: httpx.AsyncClient new instance
         """
 
+    def _apply_deadline(self, method: str, client: AsyncClient, kwargs: dict[str, Any]) -> dict[str, Any]:
+        if get_deadline_remaining_seconds() is not None:
+            kwargs = {
+                **kwargs,
+                "timeout": apply_deadline_to_timeout(
+                    kwargs.get("timeout") or client.timeout, idempotent=self._is_idempotent(method)
+                ),
+            }
+        return kwargs
+
+    def _is_idempotent(self, method: str) -> bool:
+        return method.upper() in IDEMPOTENT_HTTP_METHODS
+
     def _build_full_url(self, path: str, query_params: dict[str, any]) -> str:
         full_url = path
         if query_params:
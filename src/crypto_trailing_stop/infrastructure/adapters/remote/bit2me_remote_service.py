@@ -18,6 +18,7 @@ from crypto_trailing_stop.commons.constants import (
     BIT2ME_RETRYABLE_HTTP_STATUS_CODES,
     DEFAULT_IN_MEMORY_CACHE_TTL_IN_SECONDS,
 )
+from crypto_trailing_stop.commons.deadline import get_deadline_remaining_seconds
 from crypto_trailing_stop.commons.utils import backoff_on_backoff_handler, prepare_backoff_giveup_handler_fn
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_account_info_dto import Bit2MeAccountInfoDto
@@ -37,6 +38,7 @@ from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_trading_wallet_bal
     Bit2MeTradingWalletBalanceDto,
 )
 from crypto_trailing_stop.infrastructure.adapters.remote.base import AbstractHttpRemoteAsyncService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerRegistry
 
 if TYPE_CHECKING:
     from crypto_trailing_stop.infrastructure.tasks.vo.types import Timeframe
@@ -52,6 +54,12 @@ class Bit2MeRemoteService(AbstractHttpRemoteAsyncService):
         self._api_secret = self._configuration_properties.bit2me_api_secret
         if not self._base_url or not self._api_key or not self._api_secret:
             raise ValueError("Bit2Me API configuration is missing or incomplete.")
+        self._circuit_breaker_registry = CircuitBreakerRegistry(
+            failure_threshold=self._configuration_properties.circuit_breaker_failure_threshold,
+            latency_slo_seconds=self._configuration_properties.circuit_breaker_latency_slo_seconds,
+            open_timeout_seconds=self._configuration_properties.circuit_breaker_open_timeout_seconds,
+            enabled=self._configuration_properties.circuit_breaker_enabled,
+        )
 
     async def get_account_info(self, *, client: AsyncClient | None = None) -> Bit2MeAccountInfoDto:
         response = await self._perform_http_request(url="/v1/account", client=client)
@@ -189,6 +197,9 @@ class Bit2MeRemoteService(AbstractHttpRemoteAsyncService):
         ret = {market_config.symbol: market_config for market_config in market_config_list}
         return ret
 
+    def get_circuit_breaker_registry(self) -> CircuitBreakerRegistry:
+        return self._circuit_breaker_registry
+
     async def get_http_client(self) -> AsyncClient:
         return AsyncClient(
             base_url=self._base_url, headers={"X-API-KEY": self._api_key}, timeout=Timeout(10, connect=5, read=60)
@@ -199,6 +210,7 @@ class Bit2MeRemoteService(AbstractHttpRemoteAsyncService):
         exception=(ValueError, NetworkError, TimeoutException),
         max_value=5,
         max_tries=7,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.random_jitter,
         giveup=prepare_backoff_giveup_handler_fn(BIT2ME_RETRYABLE_HTTP_STATUS_CODES),
         on_backoff=backoff_on_backoff_handler,
@@ -6,6 +6,7 @@ import cachebox
 import ccxt.async_support as ccxt
 
 from crypto_trailing_stop.commons.constants import DEFAULT_IN_MEMORY_CACHE_TTL_IN_SECONDS
+from crypto_trailing_stop.commons.deadline import get_deadline_remaining_seconds, raise_if_deadline_exceeded
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums.operating_exchange_enum import (
     OperatingExchangeEnum,
@@ -24,6 +25,7 @@ class CcxtRemoteService:
         exception=ccxt.BaseError,
         interval=2,
         max_tries=5,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.full_jitter,
         giveup=lambda e: isinstance(e, ccxt.BadRequest) or isinstance(e, ccxt.AuthenticationError),
         on_backoff=lambda details: logger.warning(
@@ -45,6 +47,7 @@ class CcxtRemoteService:
         Returns:
             list[list[Any]]: OHLCV data
         """
+        raise_if_deadline_exceeded(f"fetching {timeframe} bars for {symbol}")
         logger.info(f"Fetching {limit} {timeframe} bars for {symbol}...")
         # Fetch N+1 candles to account for the live one.
         if exchange:
@@ -63,6 +66,7 @@ class CcxtRemoteService:
         exception=ccxt.BaseError,
         interval=2,
         max_tries=5,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.full_jitter,
         giveup=lambda e: isinstance(e, ccxt.BadRequest) or isinstance(e, ccxt.AuthenticationError),
         on_backoff=lambda details: logger.warning(
@@ -0,0 +1,196 @@
+import logging
+import re
+import time
+from enum import Enum
+
+from httpx import URL, HTTPStatusError, NetworkError, TimeoutException
+
+from crypto_trailing_stop.commons.constants import (
+    CIRCUIT_BREAKER_FAILURE_HTTP_STATUS_CODES,
+    CIRCUIT_BREAKER_REGISTRY_MAX_ENDPOINTS,
+)
+
+logger = logging.getLogger(__name__)
+
+# NOTE: Path segments which are IDs (e.g. /v1/trading/order/{id}), either numeric or UUIDs
+_ID_PATH_SEGMENT_REGEX = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+class CircuitBreakerStateEnum(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerOpenError(Exception):
+    """
+    Raised when a call is short-circuited because the endpoint circuit is open.
+    NOTE: It does not inherit from ValueError / NetworkError on purpose,
+    so the backoff decorators in the remote services do not retry it.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(f"Circuit breaker is OPEN for endpoint '{endpoint}'. Retry after {retry_after:.2f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(
+        self, endpoint: str, *, failure_threshold: int, latency_slo_seconds: float, open_timeout_seconds: float
+    ) -> None:
+        self._endpoint = endpoint
+        self._failure_threshold = failure_threshold
+        self._latency_slo_seconds = latency_slo_seconds
+        self._open_timeout_seconds = open_timeout_seconds
+        self._state = CircuitBreakerStateEnum.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._half_open_probe_in_flight = False
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def state(self) -> CircuitBreakerStateEnum:
+        if (
+            self._state == CircuitBreakerStateEnum.OPEN
+            and self._get_open_elapsed_seconds() >= self._open_timeout_seconds
+        ):
+            self._state = CircuitBreakerStateEnum.HALF_OPEN
+            self._half_open_probe_in_flight = False
+            logger.info(f"Circuit breaker for endpoint '{self._endpoint}' is HALF-OPEN. Probing...")
+        return self._state
+
+    def acquire(self) -> None:
+        state = self.state
+        if state == CircuitBreakerStateEnum.OPEN:
+            raise CircuitBreakerOpenError(
+                self._endpoint, retry_after=self._open_timeout_seconds - self._get_open_elapsed_seconds()
+            )
+        elif state == CircuitBreakerStateEnum.HALF_OPEN:
+            # XXX: [JMSOLA] Only a single probe is allowed while half-open, the rest fail fast
+            if self._half_open_probe_in_flight:
+                raise CircuitBreakerOpenError(self._endpoint, retry_after=0.0)
+            self._half_open_probe_in_flight = True
+
+    def release(self) -> None:
+        self._half_open_probe_in_flight = False
+
+    def record_success(self, elapsed_seconds: float) -> None:
+        if elapsed_seconds > self._latency_slo_seconds:
+            logger.warning(
+                f"Endpoint '{self._endpoint}' breached the latency SLO "
+                + f"({elapsed_seconds:.2f}s > {self._latency_slo_seconds:.2f}s)"
+            )
+            self.record_failure()
+        else:
+            if self._state != CircuitBreakerStateEnum.CLOSED:
+                logger.info(f"Circuit breaker for endpoint '{self._endpoint}' is CLOSED again.")
+            self._state = CircuitBreakerStateEnum.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open_probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == CircuitBreakerStateEnum.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            if self._state != CircuitBreakerStateEnum.OPEN:
+                logger.warning(
+                    f"Circuit breaker for endpoint '{self._endpoint}' is OPEN "
+                    + f"after {self._consecutive_failures} consecutive failures."
+                )
+            self._state = CircuitBreakerStateEnum.OPEN
+            self._opened_at = time.monotonic()
+            self._half_open_probe_in_flight = False
+
+    def _get_open_elapsed_seconds(self) -> float:
+        return time.monotonic() - self._opened_at if self._opened_at is not None else 0.0
+
+
+class CircuitBreakerRegistry:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        latency_slo_seconds: float,
+        open_timeout_seconds: float,
+        failure_http_status_codes: list[int] = CIRCUIT_BREAKER_FAILURE_HTTP_STATUS_CODES,
+        max_endpoints: int = CIRCUIT_BREAKER_REGISTRY_MAX_ENDPOINTS,
+        enabled: bool = True,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._latency_slo_seconds = latency_slo_seconds
+        self._open_timeout_seconds = open_timeout_seconds
+        self._failure_http_status_codes = failure_http_status_codes
+        self._max_endpoints = max_endpoints
+        self._enabled = enabled
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def get(self, method: str, url: URL | str) -> CircuitBreaker:
+        endpoint = self._get_endpoint_key(method, url)
+        if endpoint in self._circuit_breakers:
+            # NOTE: Moved to the end, so the least recently used circuit breakers are evicted first
+            ret = self._circuit_breakers[endpoint] = self._circuit_breakers.pop(endpoint)
+        else:
+            if len(self._circuit_breakers) >= self._max_endpoints:
+                self._evict_least_recently_used()
+            ret = self._circuit_breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                failure_threshold=self._failure_threshold,
+                latency_slo_seconds=self._latency_slo_seconds,
+                open_timeout_seconds=self._open_timeout_seconds,
+            )
+        return ret
+
+    def get_states(self) -> dict[str, CircuitBreakerStateEnum]:
+        ret = {endpoint: circuit_breaker.state for endpoint, circuit_breaker in self._circuit_breakers.items()}
+        return ret
+
+    def is_degraded(self) -> bool:
+        # XXX: [JMSOLA] Half-open circuits are not degraded: their open timeout is over and, if they are never
+        #      probed again, they would be reported as degraded forever
+        ret = any(state == CircuitBreakerStateEnum.OPEN for state in self.get_states().values())
+        return ret
+
+    def is_failure(self, e: BaseException) -> bool:
+        """
+        Only transport errors and server side / throttling HTTP errors count as endpoint failures.
+        Client errors (e.g. order not found or not enough balance) mean the endpoint is actually healthy,
+        even when they are retried (see BIT2ME_RETRYABLE_HTTP_STATUS_CODES)
+        """
+        if isinstance(e, (NetworkError, TimeoutException)):
+            ret = True
+        elif isinstance(e, ValueError) and isinstance(e.__cause__, HTTPStatusError):
+            status_code = e.__cause__.response.status_code
+            ret = status_code >= 500 or status_code in self._failure_http_status_codes
+        else:
+            ret = False
+        return ret
+
+    def _evict_least_recently_used(self) -> None:
+        # NOTE: Closed circuit breakers are evicted first, since they hold no state worth keeping
+        endpoint = next(
+            (
+                endpoint
+                for endpoint, circuit_breaker in self._circuit_breakers.items()
+                if circuit_breaker.state == CircuitBreakerStateEnum.CLOSED
+            ),
+            next(iter(self._circuit_breakers)),
+        )
+        del self._circuit_breakers[endpoint]
+
+    def _get_endpoint_key(self, method: str, url: URL | str) -> str:
+        path = url.path if isinstance(url, URL) else str(url).split("?")[0]
+        # XXX: [JMSOLA] Keyed by route template, so every order ID does not create a circuit breaker of its own
+        route_template = "/".join(
+            "{id}" if _ID_PATH_SEGMENT_REGEX.match(segment) else segment for segment in path.split("/")
+        )
+        return f"{method.upper()} {route_template}"
@@ -1,10 +1,12 @@
 import logging
 from collections.abc import AsyncIterator
-
-from google import genai
+from typing import TYPE_CHECKING
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 
+if TYPE_CHECKING:
+    from google import genai
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +21,10 @@ class GeminiRemoteService:
 
     async def generate_content_stream(
         self, prompts: str | list[str], *, model: str = "gemini-2.5-pro"
-    ) -> AsyncIterator[genai.types.GenerateContentResponse]:
+    ) -> AsyncIterator["genai.types.GenerateContentResponse"]:
+        # XXX: [JMSOLA] google-genai is heavy and only needed on demand, so it is imported on first use
+        from google import genai
+
         client = genai.Client(api_key=self._configuration_properties.gemini_pro_api_key)
         response = await client.aio.models.generate_content_stream(model=model, contents=prompts)
         return response
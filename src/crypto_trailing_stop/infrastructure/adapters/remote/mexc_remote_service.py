@@ -15,6 +15,7 @@ from crypto_trailing_stop.commons.constants import (
     DEFAULT_IN_MEMORY_CACHE_TTL_IN_SECONDS,
     MEXC_RETRYABLE_HTTP_STATUS_CODES,
 )
+from crypto_trailing_stop.commons.deadline import apply_deadline_to_timeout, get_deadline_remaining_seconds
 from crypto_trailing_stop.commons.utils import backoff_on_backoff_handler, prepare_backoff_giveup_handler_fn
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_account_info_dto import MEXCAccountInfoDto
@@ -30,6 +31,7 @@ from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_book_dto impo
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_price_dto import MEXCTickerPriceDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_trade_dto import MEXCTradeDto
 from crypto_trailing_stop.infrastructure.adapters.remote.base import AbstractHttpRemoteAsyncService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,12 @@ class MEXCRemoteService(AbstractHttpRemoteAsyncService):
         self._api_secret = self._configuration_properties.mexc_api_secret
         if not self._base_url or not self._api_key or not self._api_secret:
             raise ValueError("MEXC API configuration is missing or incomplete.")
+        self._circuit_breaker_registry = CircuitBreakerRegistry(
+            failure_threshold=self._configuration_properties.circuit_breaker_failure_threshold,
+            latency_slo_seconds=self._configuration_properties.circuit_breaker_latency_slo_seconds,
+            open_timeout_seconds=self._configuration_properties.circuit_breaker_open_timeout_seconds,
+            enabled=self._configuration_properties.circuit_breaker_enabled,
+        )
 
     async def get_account_info(self, *, client: AsyncClient | None = None) -> MEXCAccountInfoDto:
         response = await self._perform_http_request(url="/api/v3/account", client=client)
@@ -61,6 +69,7 @@ class MEXCRemoteService(AbstractHttpRemoteAsyncService):
         exception=(ValueError, NetworkError, TimeoutException),
         max_value=5,
         max_tries=7,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.random_jitter,
         giveup=prepare_backoff_giveup_handler_fn(MEXC_RETRYABLE_HTTP_STATUS_CODES),
         on_backoff=backoff_on_backoff_handler,
@@ -77,7 +86,7 @@ class MEXCRemoteService(AbstractHttpRemoteAsyncService):
                 response = await client.get(
                     url,
                     headers={"ApiKey": self._api_key, "Request-Time": timestamp, "Signature": signature},
-                    timeout=Timeout(10, connect=5, read=30),
+                    timeout=apply_deadline_to_timeout(Timeout(10, connect=5, read=30)),
                 )
                 response.raise_for_status()
                 mexc_contract_response = MEXCContractResponseDto[list[MEXCContractAssetDto]].model_validate_json(
@@ -171,6 +180,9 @@ class MEXCRemoteService(AbstractHttpRemoteAsyncService):
         ret = MEXCExchangeInfoDto.model_validate_json(response.content)
         return ret
 
+    def get_circuit_breaker_registry(self) -> CircuitBreakerRegistry:
+        return self._circuit_breaker_registry
+
     async def get_http_client(self) -> AsyncClient:
         return AsyncClient(
             base_url=self._base_url, headers={"X-MEXC-APIKEY": self._api_key}, timeout=Timeout(10, connect=5, read=30)
@@ -181,6 +193,7 @@ class MEXCRemoteService(AbstractHttpRemoteAsyncService):
         exception=(ValueError, NetworkError, TimeoutException),
         max_value=5,
         max_tries=7,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.random_jitter,
         giveup=prepare_backoff_giveup_handler_fn(MEXC_RETRYABLE_HTTP_STATUS_CODES),
         on_backoff=backoff_on_backoff_handler,
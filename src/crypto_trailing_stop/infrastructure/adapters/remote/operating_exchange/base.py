@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerStateEnum
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import (
     OperatingExchangeEnum,
     OrderSideEnum,
@@ -275,6 +276,14 @@ class AbstractOperatingExchangeService(ABC):
             Any: A client object for the exchange.
         """
 
+    @abstractmethod
+    def get_circuit_breaker_states(self) -> dict[str, CircuitBreakerStateEnum]:
+        """Returns the circuit breaker state of every exchange endpoint called so far.
+
+        Returns:
+            dict[str, CircuitBreakerStateEnum]: Circuit breaker states by endpoint.
+        """
+
     @abstractmethod
     def has_global_summary_report(self) -> bool:
         """Indicates whether the exchange supports global summary reports.
@@ -6,6 +6,7 @@ import pydash
 from crypto_trailing_stop.commons.constants import BIT2ME_TAKER_FEES
 from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_order_dto import Bit2MeOrderDto, CreateNewBit2MeOrderDto
 from crypto_trailing_stop.infrastructure.adapters.remote.bit2me_remote_service import Bit2MeRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerStateEnum
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.base import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import (
     OperatingExchangeEnum,
@@ -198,6 +199,10 @@ class Bit2MeOperatingExchangeService(AbstractOperatingExchangeService):
     async def get_client(self) -> Any:
         return await self._bit2me_remote_service.get_http_client()
 
+    @override
+    def get_circuit_breaker_states(self) -> dict[str, CircuitBreakerStateEnum]:
+        return self._bit2me_remote_service.get_circuit_breaker_registry().get_states()
+
     @override
     def has_global_summary_report(self) -> bool:
         return True
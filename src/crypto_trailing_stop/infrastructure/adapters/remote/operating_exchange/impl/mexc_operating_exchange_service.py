@@ -15,6 +15,7 @@ from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_book_dto impo
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_price_dto import MEXCTickerPriceDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_trade_dto import MEXCTradeDto
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerStateEnum
 from crypto_trailing_stop.infrastructure.adapters.remote.mexc_remote_service import MEXCRemoteService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.base import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import (
@@ -215,6 +216,10 @@ class MEXCOperatingExchangeService(AbstractOperatingExchangeService):
     async def get_client(self) -> Any:
         return await self._mexc_remote_service.get_http_client()
 
+    @override
+    def get_circuit_breaker_states(self) -> dict[str, CircuitBreakerStateEnum]:
+        return self._mexc_remote_service.get_circuit_breaker_registry().get_states()
+
     @override
     def has_global_summary_report(self) -> bool:
         return False
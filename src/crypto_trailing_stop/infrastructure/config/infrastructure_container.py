@@ -1,7 +1,7 @@
 from dependency_injector import containers, providers
-from pyee.asyncio import AsyncIOEventEmitter
 
 from crypto_trailing_stop.infrastructure.services.config.services_container import ServicesContainer
+from crypto_trailing_stop.infrastructure.services.event_bus import EventBus
 from crypto_trailing_stop.infrastructure.tasks.config.tasks_container import TasksContainer
 
 
@@ -13,12 +13,12 @@ class InfrastructureContainer(containers.DeclarativeContainer):
 
     telegram_service = providers.Dependency()
 
-    event_emitter = providers.Singleton(AsyncIOEventEmitter)
+    event_bus = providers.Singleton(EventBus)
 
     services_container = providers.Container(
         ServicesContainer,
         configuration_properties=configuration_properties,
-        event_emitter=event_emitter,
+        event_bus=event_bus,
         operating_exchange_service=operating_exchange_service,
         ccxt_remote_service=ccxt_remote_service,
         gemini_remote_service=gemini_remote_service,
@@ -27,11 +27,12 @@ class InfrastructureContainer(containers.DeclarativeContainer):
     tasks_container = providers.Container(
         TasksContainer,
         configuration_properties=configuration_properties,
-        event_emitter=event_emitter,
+        event_bus=event_bus,
         operating_exchange_service=operating_exchange_service,
         ccxt_remote_service=ccxt_remote_service,
         global_flag_service=services_container.global_flag_service,
         market_signal_service=services_container.market_signal_service,
+        market_history_archive_service=services_container.market_history_archive_service,
         limit_sell_order_guard_cache_service=services_container.limit_sell_order_guard_cache_service,
         buy_sell_signals_config_service=services_container.buy_sell_signals_config_service,
         orders_analytics_service=services_container.orders_analytics_service,
@@ -39,5 +40,6 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         auto_buy_trader_config_service=services_container.auto_buy_trader_config_service,
         crypto_analytics_service=services_container.crypto_analytics_service,
         push_notification_service=services_container.push_notification_service,
+        shard_lease_service=services_container.shard_lease_service,
         telegram_service=telegram_service,
     )
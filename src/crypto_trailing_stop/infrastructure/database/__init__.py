@@ -1,3 +1,9 @@
-from crypto_trailing_stop.infrastructure.database.engine import init_database
+from crypto_trailing_stop.infrastructure.database.engine import (
+    batched_writes,
+    close_database,
+    init_database,
+    optimize_database,
+)
+from crypto_trailing_stop.infrastructure.database.write_behind_queue import WriteBehindQueue
 
-__all__ = ["init_database"]
+__all__ = ["init_database", "close_database", "batched_writes", "optimize_database", "WriteBehindQueue"]
@@ -1,10 +1,14 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from importlib import import_module
 from inspect import isclass
 from os import listdir, makedirs, path
 
 from piccolo.engine.base import Engine
-from piccolo.engine.sqlite import SQLiteEngine
-from piccolo.table import Table
+from piccolo.engine.sqlite import SQLiteEngine, TransactionType
+from piccolo.table import Table, create_db_tables
+
+from crypto_trailing_stop.infrastructure.database.sqlite_engine import SQLitePragmas, TunedSQLiteEngine
 
 _engine: Engine | None = None
 
@@ -15,12 +19,26 @@ async def init_database() -> None:
     global _engine
     application_container = get_application_container()
     configuration_properties = application_container.configuration_properties()
+    # Close the connections of a previous initialization, if any
+    await close_database()
     if configuration_properties.database_in_memory:  # pragma: no cover
         _engine = SQLiteEngine(path=":memory:")
     else:
         makedirs(path.dirname(configuration_properties.database_path), exist_ok=True)
-        _engine = SQLiteEngine(path=configuration_properties.database_path)
+        _engine = TunedSQLiteEngine(
+            path=configuration_properties.database_path,
+            pragmas=SQLitePragmas(
+                journal_mode="WAL" if configuration_properties.database_wal_enabled else "DELETE",
+                synchronous=configuration_properties.database_synchronous,
+                cache_size_kib=configuration_properties.database_cache_size_kib,
+                mmap_size_bytes=configuration_properties.database_mmap_size_bytes,
+                busy_timeout_ms=configuration_properties.database_busy_timeout_ms,
+            ),
+            connection_pool_size=configuration_properties.database_connection_pool_size,
+        )
+        await _engine.apply_persistent_pragmas()
     # Set up the database
+    tables: list[type[Table]] = []
     for model_filename in listdir(path.relpath(path.join(path.dirname(__file__), "models"))):
         if model_filename.endswith(".py") and model_filename != "__init__.py":
             module_name = model_filename[:-3]
@@ -29,10 +47,53 @@ async def init_database() -> None:
                 obj = getattr(module, obj_name)
                 if isclass(obj) and issubclass(obj, Table) and obj is not Table:
                     obj._meta.db = _engine
-                    await obj.create_table(if_not_exists=True)
+                    tables.append(obj)
+    # NOTE: All tables are created within a single transaction, instead of one round trip per table
+    await create_db_tables(*tables, if_not_exists=True)
+    await _create_composite_indexes(*tables)
+
+
+async def _create_composite_indexes(*tables: type[Table]) -> None:
+    for table in tables:
+        tablename = table._meta.tablename
+        for column_names in getattr(table, "composite_indexes", []):
+            index_name = f"{tablename}_{'_'.join(column_names)}_idx"
+            await table.raw(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {tablename} ({', '.join(column_names)})"  # nosec: B608
+            )
+
+
+async def close_database() -> None:
+    global _engine
+    if isinstance(_engine, TunedSQLiteEngine):
+        await _engine.close()
+    _engine = None
+
+
+async def optimize_database(*, incremental_vacuum_pages: int) -> None:
+    engine = get_engine()
+    # NOTE: PRAGMA optimize only runs ANALYZE on the tables whose statistics are out of date
+    await engine.run_ddl("PRAGMA optimize")
+    # Give back to the file system (some of) the pages freed by deletes, without rewriting the whole database
+    await engine.run_ddl(f"PRAGMA incremental_vacuum({incremental_vacuum_pages})")
 
 
 def get_engine() -> Engine:
     if _engine is None:
         raise ValueError("Database not initialized")
     return _engine
+
+
+@asynccontextmanager
+async def batched_writes() -> AsyncGenerator[None]:
+    """
+    Run every query within the block in a single transaction, so several writes only pay
+    a single commit (and fsync). Nested blocks join the outer transaction.
+    NOTE: IMMEDIATE takes the write lock upfront, which avoids lock upgrade deadlocks between writers
+    """
+    engine = get_engine()
+    if engine.current_transaction.get() is not None:
+        yield
+    else:
+        async with engine.transaction(transaction_type=TransactionType.immediate):
+            yield
@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from typing import ClassVar
 from uuid import UUID as UUIDType
 from uuid import uuid4
 
@@ -9,8 +10,15 @@ from crypto_trailing_stop.infrastructure.tasks.vo.types import MarketSignalType,
 
 
 class MarketSignal(Table):
+    # NOTE: Composite indexes, created by init_database, since piccolo only supports single column ones
+    composite_indexes: ClassVar[list[tuple[str, ...]]] = [
+        ("symbol", "timeframe", "timestamp"),
+        ("symbol", "timeframe", "signal_type"),
+    ]
+
     id: UUIDType = UUID(primary_key=True, default=uuid4)
-    timestamp: datetime = Timestamp(required=True, default=lambda: datetime.now(tz=UTC))
+    # NOTE: Indexed on its own for the retention policy, which expires signals regardless of the symbol
+    timestamp: datetime = Timestamp(required=True, default=lambda: datetime.now(tz=UTC), index=True)
     symbol = Text(required=True)
     timeframe: Timeframe = Text(required=True)
     signal_type: MarketSignalType = Text(required=True)
@@ -0,0 +1,13 @@
+from datetime import datetime
+from uuid import UUID as UUIDType
+from uuid import uuid4
+
+from piccolo.columns import UUID, Text, Timestamp
+from piccolo.table import Table
+
+
+class ShardLease(Table):
+    id: UUIDType = UUID(primary_key=True, default=uuid4)
+    name: str = Text(unique=True, required=True)
+    owner: str | None = Text(null=True, default=None)
+    expires_at: datetime | None = Timestamp(null=True, default=None)
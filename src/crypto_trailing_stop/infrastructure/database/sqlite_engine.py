@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, override
+
+import aiosqlite
+from piccolo.engine.sqlite import SQLiteEngine, dict_factory
+
+from crypto_trailing_stop.commons.constants import (
+    DEFAULT_DATABASE_BUSY_TIMEOUT_MS,
+    DEFAULT_DATABASE_CACHE_SIZE_KIB,
+    DEFAULT_DATABASE_MMAP_SIZE_BYTES,
+    DEFAULT_DATABASE_SYNCHRONOUS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SQLitePragmas:
+    journal_mode: str = "WAL"
+    auto_vacuum: str = "INCREMENTAL"
+    synchronous: str = DEFAULT_DATABASE_SYNCHRONOUS
+    cache_size_kib: int = DEFAULT_DATABASE_CACHE_SIZE_KIB
+    mmap_size_bytes: int = DEFAULT_DATABASE_MMAP_SIZE_BYTES
+    busy_timeout_ms: int = DEFAULT_DATABASE_BUSY_TIMEOUT_MS
+    temp_store: str = "MEMORY"
+
+    def get_connection_statements(self) -> list[str]:
+        # NOTE: Unlike journal_mode, which is persisted in the database file, these pragmas are per connection
+        ret = [
+            "PRAGMA foreign_keys = 1",
+            f"PRAGMA synchronous = {self.synchronous}",
+            # Negative values are expressed in KiB instead of pages
+            f"PRAGMA cache_size = -{self.cache_size_kib}",
+            f"PRAGMA mmap_size = {self.mmap_size_bytes}",
+            f"PRAGMA busy_timeout = {self.busy_timeout_ms}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+        return ret
+
+
+class SQLiteConnectionPool:
+    """
+    Reuses aiosqlite connections (each of them backed by its own thread),
+    instead of opening a brand new one for every single query.
+    """
+
+    def __init__(self, connect: Callable[[], Awaitable[aiosqlite.Connection]], *, max_size: int) -> None:
+        self._connect = connect
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._idle_connections: list[aiosqlite.Connection] = []
+        self._closed = False
+
+    async def acquire(self) -> aiosqlite.Connection:
+        await self._semaphore.acquire()
+        try:
+            ret = self._idle_connections.pop() if self._idle_connections else await self._connect()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return ret
+
+    async def release(self, connection: aiosqlite.Connection) -> None:
+        try:
+            if self._closed or connection.in_transaction:
+                # XXX: [JMSOLA] A connection left within a transaction is never reused, it would block writers
+                await connection.close()
+            else:
+                self._idle_connections.append(connection)
+        finally:
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        self._closed = True
+        idle_connections, self._idle_connections = self._idle_connections, []
+        for connection in idle_connections:
+            await connection.close()
+
+
+class TunedSQLiteEngine(SQLiteEngine):
+    """
+    SQLite engine with WAL journaling, tuned pragmas and a connection pool,
+    so readers (e.g. Limit Sell Order Guard) are not serialized behind concurrent writers.
+    """
+
+    def __init__(
+        self, path: str, *, pragmas: SQLitePragmas, connection_pool_size: int, **connection_kwargs: Any
+    ) -> None:
+        super().__init__(path=path, **connection_kwargs)
+        self._pragmas = pragmas
+        self._connection_pool = SQLiteConnectionPool(self._open_connection, max_size=connection_pool_size)
+
+    async def apply_persistent_pragmas(self) -> None:
+        connection = await aiosqlite.connect(**self.connection_kwargs)
+        try:
+            cursor = await connection.execute(f"PRAGMA journal_mode = {self._pragmas.journal_mode}")
+            journal_mode, *_ = await cursor.fetchone()
+            logger.info(f"SQLite journal mode is '{journal_mode}'")
+            # NOTE: auto_vacuum only takes effect on a brand new database file (or after a full VACUUM)
+            await connection.execute(f"PRAGMA auto_vacuum = {self._pragmas.auto_vacuum}")
+            cursor = await connection.execute("PRAGMA auto_vacuum")
+            auto_vacuum, *_ = await cursor.fetchone()
+            if auto_vacuum == 0:  # pragma: no cover
+                logger.info("SQLite auto vacuum is disabled in this database file, run VACUUM once to enable it")
+        finally:
+            await connection.close()
+
+    async def close(self) -> None:
+        await self._connection_pool.close()
+
+    @override
+    async def get_connection(self) -> aiosqlite.Connection:
+        # NOTE: Used by transactions, which own their connection till they finish
+        ret = await self._open_connection()
+        return ret
+
+    @override
+    async def _run_in_new_connection(self, *args: Any, **kwargs: Any) -> Any:
+        connection = await self._connection_pool.acquire()
+        try:
+            ret = await self._run_in_existing_connection(connection, *args, **kwargs)
+        finally:
+            await self._connection_pool.release(connection)
+        return ret
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        ret = await aiosqlite.connect(**self.connection_kwargs)
+        ret.row_factory = dict_factory
+        for statement in self._pragmas.get_connection_statements():
+            await ret.execute(statement)
+        return ret
@@ -0,0 +1,115 @@
+import asyncio
+import contextvars
+import logging
+from collections import deque
+
+from piccolo.table import Table
+
+from crypto_trailing_stop.infrastructure.database.engine import batched_writes
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue[T: Table]:
+    """
+    Defers the insertion of rows to a background consumer, which writes them in batched transactions,
+    so callers do not wait for the storage latency.
+    Rows are written in the same order they were enqueued: a batch is only dequeued once it is committed,
+    so a failed batch is retried before any later row is written, up to a maximum number of attempts.
+    """
+
+    def __init__(
+        self,
+        table: type[T],
+        *,
+        flush_interval_seconds: float,
+        batch_size: int,
+        max_pending_rows: int,
+        max_attempts: int,
+    ) -> None:
+        self._table = table
+        self._name = table._meta.tablename
+        self._flush_interval_seconds = flush_interval_seconds
+        self._batch_size = batch_size
+        self._max_pending_rows = max_pending_rows
+        self._max_attempts = max_attempts
+        self._pending_rows: deque[T] = deque()
+        self._failed_attempts = 0
+        self._flush_lock = asyncio.Lock()
+        self._pending_rows_event = asyncio.Event()
+        self._consumer_task: asyncio.Task | None = None
+        self._closed = False
+
+    def enqueue(self, *rows: T) -> None:
+        if self._closed:
+            raise ValueError(f"Write-behind queue '{self._name}' is already closed")
+        if len(self._pending_rows) + len(rows) > self._max_pending_rows:
+            # NOTE: Storage is not keeping up (or it is failing), so rows are dropped instead of exhausting memory
+            logger.error(
+                f"Too many rows pending to be written into '{self._name}' ({len(self._pending_rows)}), "
+                + f"dropping {len(rows)} rows: {rows!r}"
+            )
+            return
+        self._pending_rows.extend(rows)
+        self._pending_rows_event.set()
+        if self._consumer_task is None or self._consumer_task.done():
+            # XXX: [JMSOLA] Consumer runs within an empty context, so it neither joins the caller transaction
+            #      nor inherits the caller deadline
+            self._consumer_task = asyncio.create_task(self._consume(), context=contextvars.Context())
+
+    def get_pending_rows(self) -> list[T]:
+        # NOTE: Rows of the batch being written are still pending till their transaction is committed
+        return list(self._pending_rows)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            await self._flush_pending_rows()
+
+    async def close(self) -> None:
+        self._closed = True
+        # XXX: [JMSOLA] The lock is held before cancelling the consumer, so a batch being written is committed
+        #      and dequeued first. Otherwise, it might be committed but not dequeued, and so written twice
+        async with self._flush_lock:
+            if self._consumer_task is not None:
+                self._consumer_task.cancel()
+                await asyncio.gather(self._consumer_task, return_exceptions=True)
+                self._consumer_task = None
+            while self._pending_rows:
+                try:
+                    await self._flush_pending_rows()
+                except Exception as e:
+                    # NOTE: Failing batches are dropped after the maximum number of attempts, so it always ends
+                    logger.error(f"Write-behind queue '{self._name}' failed to flush on close, retrying :: {str(e)}")
+
+    async def _flush_pending_rows(self) -> None:
+        while self._pending_rows:
+            batch = [self._pending_rows[idx] for idx in range(min(self._batch_size, len(self._pending_rows)))]
+            try:
+                async with batched_writes():
+                    await self._table.insert(*batch)
+            except Exception as e:
+                self._failed_attempts += 1
+                if self._failed_attempts < self._max_attempts:
+                    raise e
+                logger.error(
+                    f"Write-behind queue '{self._name}' failed to write a batch {self._failed_attempts} times, "
+                    + f"dropping its {len(batch)} rows: {batch!r} :: {str(e)}",
+                    exc_info=True,
+                )
+            self._failed_attempts = 0
+            # XXX: [JMSOLA] Dequeued right after the commit, without awaiting in between,
+            #      so readers never see a row both pending and persisted
+            for _ in batch:
+                self._pending_rows.popleft()
+
+    async def _consume(self) -> None:
+        while True:
+            await self._pending_rows_event.wait()
+            self._pending_rows_event.clear()
+            # Wait for more rows, so they are written within the same transaction
+            await asyncio.sleep(self._flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind queue '{self._name}' failed to flush, retrying later :: {str(e)}")
+                self._pending_rows_event.set()
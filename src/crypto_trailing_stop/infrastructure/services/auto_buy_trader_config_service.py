@@ -1,9 +1,12 @@
 import logging
+from collections.abc import Hashable
+from typing import override
 
 import pydash
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.auto_buy_trader_config import AutoBuyTraderConfig
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 from crypto_trailing_stop.infrastructure.services.favourite_crypto_currency_service import (
     FavouriteCryptoCurrencyService,
 )
@@ -12,24 +15,23 @@ from crypto_trailing_stop.infrastructure.services.vo.auto_buy_trader_config_item
 logger = logging.getLogger(__name__)
 
 
-class AutoBuyTraderConfigService:
+class AutoBuyTraderConfigService(AbstractCachedConfigurationService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
         favourite_crypto_currency_service: FavouriteCryptoCurrencyService,
     ) -> None:
+        super().__init__(configuration_properties)
         self._configuration_properties = configuration_properties
         self._favourite_crypto_currency_service = favourite_crypto_currency_service
 
     async def find_all(
         self, *, include_favourite_cryptos: bool = True, order_by_symbol: bool = True
     ) -> list[AutoBuyTraderConfigItem]:
-        stored_config_list = await AutoBuyTraderConfig.objects()
+        snapshot = await self._configuration_cache.get_snapshot()
         ret = [
-            AutoBuyTraderConfigItem(
-                symbol=current.symbol, fiat_wallet_percent_assigned=current.fiat_wallet_percent_assigned
-            )
-            for current in stored_config_list
+            AutoBuyTraderConfigItem(symbol=symbol, fiat_wallet_percent_assigned=fiat_wallet_percent_assigned)
+            for symbol, fiat_wallet_percent_assigned in snapshot.items.items()
         ]
         if include_favourite_cryptos:
             additional_crypto_currencies = await self._favourite_crypto_currency_service.find_all()
@@ -42,13 +44,10 @@ class AutoBuyTraderConfigService:
         return ret
 
     async def find_by_symbol(self, symbol: str) -> AutoBuyTraderConfigItem:
-        config = await AutoBuyTraderConfig.objects().where(AutoBuyTraderConfig.symbol == symbol.upper()).first()
-        if config:
-            ret = AutoBuyTraderConfigItem(
-                symbol=config.symbol, fiat_wallet_percent_assigned=config.fiat_wallet_percent_assigned
-            )
-        else:
-            ret = AutoBuyTraderConfigItem(symbol=symbol.upper())
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = AutoBuyTraderConfigItem(
+            symbol=symbol.upper(), fiat_wallet_percent_assigned=snapshot.get(symbol.upper(), 0)
+        )
         return ret
 
     async def save_or_update(self, item: AutoBuyTraderConfigItem) -> None:
@@ -65,3 +64,10 @@ class AutoBuyTraderConfigService:
                 }
             )
         await config.save()
+        self._configuration_cache.put(config.symbol, config.fiat_wallet_percent_assigned)
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, int]:
+        stored_config_list = await AutoBuyTraderConfig.objects()
+        ret = {current.symbol: current.fiat_wallet_percent_assigned for current in stored_config_list}
+        return ret
@@ -5,13 +5,11 @@ from datetime import UTC, datetime
 from typing import Any, override
 
 from aiogram import html
-from pyee.asyncio import AsyncIOEventEmitter
 
 from crypto_trailing_stop.commons.constants import (
     AUTO_ENTRY_MARKET_ORDER_SAFETY_FACTOR,
     AUTO_ENTRY_TRADER_MAX_ATTEMPS_TO_BUY,
     AUTO_ENTRY_TRADER_MINIMAL_AMOUNT_TO_INVEST,
-    TRIGGER_BUY_ACTION_EVENT_NAME,
 )
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
@@ -33,6 +31,11 @@ from crypto_trailing_stop.infrastructure.services.crypto_analytics_service impor
 from crypto_trailing_stop.infrastructure.services.enums.candlestick_enum import CandleStickEnum
 from crypto_trailing_stop.infrastructure.services.enums.global_flag_enum import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.enums.push_notification_type_enum import PushNotificationTypeEnum
+from crypto_trailing_stop.infrastructure.services.event_bus import (
+    TRIGGER_BUY_ACTION_TOPIC,
+    EventBus,
+    EventOverflowPolicyEnum,
+)
 from crypto_trailing_stop.infrastructure.services.favourite_crypto_currency_service import (
     FavouriteCryptoCurrencyService,
 )
@@ -56,7 +59,7 @@ class AutoEntryTraderEventHandlerService(AbstractEventHandlerService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
-        event_emitter: AsyncIOEventEmitter,
+        event_bus: EventBus,
         operating_exchange_service: AbstractOperatingExchangeService,
         push_notification_service: PushNotificationService,
         telegram_service: TelegramService,
@@ -72,7 +75,7 @@ class AutoEntryTraderEventHandlerService(AbstractEventHandlerService):
     ) -> None:
         super().__init__(operating_exchange_service, push_notification_service, telegram_service)
         self._configuration_properties = configuration_properties
-        self._event_emitter = event_emitter
+        self._event_bus = event_bus
         self._ccxt_remote_service = ccxt_remote_service
         self._global_flag_service = global_flag_service
         self._favourite_crypto_currency_service = favourite_crypto_currency_service
@@ -86,7 +89,16 @@ class AutoEntryTraderEventHandlerService(AbstractEventHandlerService):
 
     @override
     def configure(self) -> None:
-        self._event_emitter.add_listener(TRIGGER_BUY_ACTION_EVENT_NAME, self.on_buy_market_signal)
+        self._event_bus.subscribe(
+            TRIGGER_BUY_ACTION_TOPIC,
+            self.on_buy_market_signal,
+            name=self.__class__.__name__,
+            queue_size=self._configuration_properties.event_bus_queue_size,
+            # NOTE: Buy actions are serialized anyway, so a pending buy action is replaced
+            #       by a newer one for the same symbol instead of buying twice in a row
+            overflow_policy=EventOverflowPolicyEnum.COALESCE,
+            coalesce_key=lambda market_signal_item: market_signal_item.symbol,
+        )
 
     async def trigger_immediate_buy_market_signal(self, symbol: str) -> None:
         crypto_market_metrics = await self._crypto_analytics_service.get_crypto_market_metrics(
@@ -102,7 +114,7 @@ class AutoEntryTraderEventHandlerService(AbstractEventHandlerService):
             closing_price=crypto_market_metrics.closing_price,
             ema_long_price=crypto_market_metrics.ema_long,
         )
-        self._event_emitter.emit(TRIGGER_BUY_ACTION_EVENT_NAME, market_signal_item)
+        self._event_bus.publish(TRIGGER_BUY_ACTION_TOPIC, market_signal_item)
 
     async def on_buy_market_signal(self, market_signal_item: MarketSignalItem) -> None:
         async with self._lock:
@@ -1,5 +1,6 @@
 import logging
 import math
+import time
 from abc import ABC
 from html import escape as html_escape
 
@@ -7,7 +8,12 @@ import pydash
 from aiogram import html
 from httpx import AsyncClient
 
-from crypto_trailing_stop.commons.constants import TELEGRAM_REPLY_EXCEPTION_MESSAGE_MAX_LENGTH
+from crypto_trailing_stop.commons.constants import (
+    CIRCUIT_BREAKER_STALE_TICKERS_MAX_AGE_SECONDS,
+    TELEGRAM_REPLY_EXCEPTION_MESSAGE_MAX_LENGTH,
+)
+from crypto_trailing_stop.commons.deadline import is_deadline_exceeded
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums.order_side_enum import OrderSideEnum
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.order import Order
@@ -30,15 +36,37 @@ class AbstractService(ABC):
         self._operating_exchange_service = operating_exchange_service
         self._push_notification_service = push_notification_service
         self._telegram_service = telegram_service
+        self._last_known_tickers_by_symbol: dict[str, tuple[float, SymbolTickers]] = {}
 
     async def _fetch_tickers_for_open_sell_orders(
         self, open_sell_orders: list[Order], *, client: AsyncClient
     ) -> dict[str, SymbolTickers]:
         open_sell_order_symbols = set([open_sell_order.symbol for open_sell_order in open_sell_orders])
-        tickers_list = await self._operating_exchange_service.get_tickers_by_symbols(
-            symbols=open_sell_order_symbols, client=client
-        )
+        try:
+            tickers_list = await self._operating_exchange_service.get_tickers_by_symbols(
+                symbols=open_sell_order_symbols, client=client
+            )
+        except CircuitBreakerOpenError as e:
+            # XXX: [JMSOLA] Degrade gracefully using the last known tickers, as long as they are not too old
+            ret = self._get_last_known_tickers_by_symbols(open_sell_order_symbols)
+            if ret is None:
+                raise e
+            logger.warning(f"{str(e)}. Using last known tickers for {', '.join(sorted(ret.keys()))}")
+            return ret
+        fetched_at = time.monotonic()
         ret = {tickers.symbol: tickers for tickers in tickers_list}
+        self._last_known_tickers_by_symbol.update({symbol: (fetched_at, tickers) for symbol, tickers in ret.items()})
+        return ret
+
+    def _get_last_known_tickers_by_symbols(self, symbols: set[str]) -> dict[str, SymbolTickers] | None:
+        now = time.monotonic()
+        ret: dict[str, SymbolTickers] | None = {}
+        for symbol in symbols:
+            fetched_at, tickers = self._last_known_tickers_by_symbol.get(symbol, (None, None))
+            if fetched_at is None or now - fetched_at > CIRCUIT_BREAKER_STALE_TICKERS_MAX_AGE_SECONDS:
+                ret = None
+                break
+            ret[symbol] = tickers
         return ret
 
     async def _get_last_buy_trades_by_opened_sell_orders(
@@ -57,24 +85,26 @@ class AbstractService(ABC):
         telegram_chat_ids = await self._push_notification_service.get_actived_subscription_by_type(
             notification_type=notification_type
         )
-        for tg_chat_id in telegram_chat_ids:
-            await self._telegram_service.send_message(chat_id=tg_chat_id, text=message)
+        await self._telegram_service.notify(telegram_chat_ids, message)
 
     async def _notify_fatal_error_via_telegram(self, e: Exception) -> None:
         exception_message = (
             pydash.truncate(str(e), length=TELEGRAM_REPLY_EXCEPTION_MESSAGE_MAX_LENGTH) if str(e) else ""
         )
         exception_text = f"{e.__class__.__name__} :: {exception_message}" if exception_message else e.__class__.__name__
+        if is_deadline_exceeded():
+            # NOTE: Errors raised because the run deadline was exceeded are expected, so they are not notified
+            logger.warning(f"[{self.__class__.__name__}] Deadline exceeded, skipping notification: {exception_text}")
+            return
         try:
             telegram_chat_ids = await self._push_notification_service.get_actived_subscription_by_type(
                 notification_type=PushNotificationTypeEnum.BACKGROUND_JOB_FALTAL_ERRORS
             )
-            for tg_chat_id in telegram_chat_ids:
-                await self._telegram_service.send_message(
-                    chat_id=tg_chat_id,
-                    text=f"⚠️ [{self.__class__.__name__}] FATAL ERROR occurred! "
-                    + f"Error message:\n\n{html.code(html_escape(exception_text))}",
-                )
+            await self._telegram_service.notify(
+                telegram_chat_ids,
+                f"⚠️ [{self.__class__.__name__}] FATAL ERROR occurred! "
+                + f"Error message:\n\n{html.code(html_escape(exception_text))}",
+            )
         except Exception as e:
             logger.warning(f"Unexpected error, notifying fatal error via Telegram: {exception_text}", exc_info=True)
 
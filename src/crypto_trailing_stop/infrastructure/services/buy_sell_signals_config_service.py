@@ -1,9 +1,12 @@
 import logging
+from collections.abc import Hashable
+from typing import override
 
 import pydash
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.buy_sell_signals_config import BuySellSignalsConfig
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 from crypto_trailing_stop.infrastructure.services.favourite_crypto_currency_service import (
     FavouriteCryptoCurrencyService,
 )
@@ -12,18 +15,19 @@ from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_ite
 logger = logging.getLogger(__name__)
 
 
-class BuySellSignalsConfigService:
+class BuySellSignalsConfigService(AbstractCachedConfigurationService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
         favourite_crypto_currency_service: FavouriteCryptoCurrencyService,
     ) -> None:
+        super().__init__(configuration_properties)
         self._configuration_properties = configuration_properties
         self._favourite_crypto_currency_service = favourite_crypto_currency_service
 
     async def find_all(self) -> list[BuySellSignalsConfigItem]:
-        stored_config_list = await BuySellSignalsConfig.objects()
-        ret = [self._convert_to_value_object(current) for current in stored_config_list]
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = [snapshot.get(symbol) for symbol in snapshot.items]
         additional_crypto_currencies = await self._favourite_crypto_currency_service.find_all()
         for additional_crypto_currency in additional_crypto_currencies:
             if not any(current.symbol.lower() == additional_crypto_currency.lower() for current in ret):
@@ -33,10 +37,8 @@ class BuySellSignalsConfigService:
 
     async def find_by_symbols(self, symbols: list[str]) -> list[BuySellSignalsConfigItem]:
         symbols = [symbol.upper() for symbol in symbols]
-        stored_config_list = await BuySellSignalsConfig.objects().where(
-            BuySellSignalsConfig.symbol.is_in(list(symbols))
-        )
-        ret = [self._convert_to_value_object(current) for current in stored_config_list]
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = [snapshot.get(symbol) for symbol in dict.fromkeys(symbols) if symbol in snapshot.items]
         for symbol in symbols:
             if not any(current.symbol.upper() == symbol.upper() for current in ret):
                 ret.append(self._get_defaults_by_symbol(symbol=symbol))
@@ -44,11 +46,8 @@ class BuySellSignalsConfigService:
         return ret
 
     async def find_by_symbol(self, symbol: str) -> BuySellSignalsConfigItem:
-        config = await BuySellSignalsConfig.objects().where(BuySellSignalsConfig.symbol == symbol.upper()).first()
-        if config:
-            ret = self._convert_to_value_object(config)
-        else:
-            ret = self._get_defaults_by_symbol(symbol=symbol)
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = snapshot.get(symbol.upper()) or self._get_defaults_by_symbol(symbol=symbol)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Using {repr(ret)} for {symbol}...")
         return ret
@@ -102,6 +101,13 @@ class BuySellSignalsConfigService:
                 }
             )
         await config.save()
+        self._configuration_cache.put(config.symbol, self._convert_to_value_object(config))
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, BuySellSignalsConfigItem]:
+        stored_config_list = await BuySellSignalsConfig.objects()
+        ret = {current.symbol: self._convert_to_value_object(current) for current in stored_config_list}
+        return ret
 
     def _convert_to_value_object(self, buy_sell_signals_config: BuySellSignalsConfig) -> BuySellSignalsConfigItem:
         return BuySellSignalsConfigItem(
@@ -0,0 +1,9 @@
+from crypto_trailing_stop.infrastructure.services.cache.abstract_cached_configuration_service import (
+    AbstractCachedConfigurationService,
+)
+from crypto_trailing_stop.infrastructure.services.cache.configuration_cache import (
+    ConfigurationCache,
+    ConfigurationSnapshot,
+)
+
+__all__ = ["AbstractCachedConfigurationService", "ConfigurationCache", "ConfigurationSnapshot"]
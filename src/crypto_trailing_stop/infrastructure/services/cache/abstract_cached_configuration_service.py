@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.cache.configuration_cache import ConfigurationCache
+
+
+class AbstractCachedConfigurationService(ABC):
+    def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        self._configuration_cache = ConfigurationCache(
+            self.__class__.__name__,
+            self._load_configuration_cache_items,
+            ttl_seconds=self._get_configuration_cache_ttl_seconds(configuration_properties),
+        )
+
+    async def warm_up(self) -> None:
+        await self._configuration_cache.load()
+
+    def _get_configuration_cache_ttl_seconds(self, configuration_properties: ConfigurationProperties) -> float | None:
+        ret = configuration_properties.configuration_cache_ttl_seconds
+        if ret is None and configuration_properties.sharding_enabled:
+            # XXX: [JMSOLA] Configuration might be saved by another worker sharing the same database,
+            #      so it is reloaded as often as the worker heartbeats instead of never expiring
+            ret = configuration_properties.sharding_heartbeat_interval_seconds
+        return ret
+
+    @abstractmethod
+    async def _load_configuration_cache_items(self) -> dict[Hashable, Any]:
+        """
+        Load every persisted item of the configuration table
+
+        Returns:
+            dict[Hashable, Any]: Items by key, as they are served from the configuration cache
+        """
@@ -0,0 +1,80 @@
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConfigurationSnapshot:
+    version: int
+    items: Mapping[Hashable, Any]
+    loaded_at: float
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        # NOTE: Items are copied on read, so callers mutating them do not alter the snapshot
+        ret = copy.copy(self.items[key]) if key in self.items else default
+        return ret
+
+
+class ConfigurationCache:
+    """
+    Write-through in-memory cache of a configuration table.
+    Reads are served lock-free from an immutable snapshot, which is replaced as a whole
+    (copy-on-write) on every save, bumping the version counter.
+    """
+
+    def __init__(
+        self, name: str, loader: Callable[[], Awaitable[dict[Hashable, Any]]], *, ttl_seconds: float | None = None
+    ) -> None:
+        self._name = name
+        self._loader = loader
+        self._ttl_seconds = ttl_seconds
+        self._snapshot: ConfigurationSnapshot | None = None
+        self._version = 0
+        self._load_lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    async def get_snapshot(self) -> ConfigurationSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None or self._is_expired(snapshot):
+            snapshot = await self.load(force=False)
+        return snapshot
+
+    async def load(self, *, force: bool = True) -> ConfigurationSnapshot:
+        # NOTE: Only loading is serialized, so concurrent cache misses query the database just once
+        async with self._load_lock:
+            if not force and self._snapshot is not None and not self._is_expired(self._snapshot):
+                return self._snapshot
+            while True:
+                version_before_loading = self._version
+                items = await self._loader()
+                # XXX: [JMSOLA] A save during the load could have been missed, so items are loaded again
+                if version_before_loading == self._version:
+                    break
+            self._version += 1
+            self._snapshot = ConfigurationSnapshot(
+                version=self._version, items=MappingProxyType(items), loaded_at=time.monotonic()
+            )
+            logger.debug(f"Configuration cache '{self._name}' loaded with {len(items)} items (v{self._version})")
+            return self._snapshot
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._version += 1
+        if self._snapshot is not None:
+            self._snapshot = ConfigurationSnapshot(
+                version=self._version,
+                items=MappingProxyType({**self._snapshot.items, key: copy.copy(value)}),
+                loaded_at=self._snapshot.loaded_at,
+            )
+
+    def _is_expired(self, snapshot: ConfigurationSnapshot) -> bool:
+        return self._ttl_seconds is not None and time.monotonic() - snapshot.loaded_at >= self._ttl_seconds
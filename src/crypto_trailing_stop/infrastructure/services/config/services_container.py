@@ -15,17 +15,19 @@ from crypto_trailing_stop.infrastructure.services.global_summary_service import
 from crypto_trailing_stop.infrastructure.services.limit_sell_order_guard_cache_service import (
     LimitSellOrderGuardCacheService,
 )
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
 from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
 from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_trailing_stop.infrastructure.services.risk_management_service import RiskManagementService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
 from crypto_trailing_stop.infrastructure.services.stop_loss_percent_service import StopLossPercentService
 from crypto_trailing_stop.infrastructure.services.trade_now_hints_service import TradeNowHintsService
 
 
 class ServicesContainer(containers.DeclarativeContainer):
     configuration_properties = providers.Dependency()
-    event_emitter = providers.Dependency()
+    event_bus = providers.Dependency()
     telegram_service = providers.Dependency()
 
     ccxt_remote_service = providers.Dependency()
@@ -35,6 +37,10 @@ class ServicesContainer(containers.DeclarativeContainer):
 
     global_flag_service = providers.Singleton(GlobalFlagService, configuration_properties=configuration_properties)
 
+    shard_lease_service = providers.Singleton(
+        ShardLeaseService, configuration_properties=configuration_properties, event_bus=event_bus
+    )
+
     push_notification_service = providers.Singleton(
         PushNotificationService, configuration_properties=configuration_properties
     )
@@ -56,7 +62,9 @@ class ServicesContainer(containers.DeclarativeContainer):
         global_flag_service=global_flag_service,
     )
 
-    risk_management_service = providers.Singleton(RiskManagementService)
+    risk_management_service = providers.Singleton(
+        RiskManagementService, configuration_properties=configuration_properties
+    )
 
     global_summary_service = providers.Singleton(
         GlobalSummaryService, operating_exchange_service=operating_exchange_service
@@ -88,7 +96,7 @@ class ServicesContainer(containers.DeclarativeContainer):
     auto_entry_trader_event_handler_service = providers.Singleton(
         AutoEntryTraderEventHandlerService,
         configuration_properties=configuration_properties,
-        event_emitter=event_emitter,
+        event_bus=event_bus,
         operating_exchange_service=operating_exchange_service,
         push_notification_service=push_notification_service,
         telegram_service=telegram_service,
@@ -109,13 +117,18 @@ class ServicesContainer(containers.DeclarativeContainer):
 
     limit_sell_order_guard_cache_service = providers.Singleton(LimitSellOrderGuardCacheService)
 
+    market_history_archive_service = providers.Singleton(
+        MarketHistoryArchiveService, configuration_properties=configuration_properties
+    )
+
     market_signal_service = providers.Singleton(
         MarketSignalService,
         configuration_properties=configuration_properties,
-        event_emitter=event_emitter,
+        event_bus=event_bus,
         operating_exchange_service=operating_exchange_service,
         push_notification_service=push_notification_service,
         telegram_service=telegram_service,
+        market_history_archive_service=market_history_archive_service,
     )
 
     trade_now_hints_service = providers.Singleton(
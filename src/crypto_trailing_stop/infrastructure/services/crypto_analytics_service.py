@@ -10,6 +10,7 @@ from ta.trend import MACD, ADXIndicator, EMAIndicator
 from ta.volatility import AverageTrueRange, BollingerBands
 
 from crypto_trailing_stop.commons.constants import DEFAULT_DIVERGENCE_WINDOW
+from crypto_trailing_stop.commons.deadline import get_deadline_remaining_seconds
 from crypto_trailing_stop.commons.utils import backoff_on_backoff_handler
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
@@ -63,23 +64,41 @@ class CryptoAnalyticsService:
         )
         return ret
 
-    # XXX: [JMSOLA] Add backoff to retry when no OHLCV data returned
+    async def calculate_technical_indicators(
+        self,
+        symbol: str,
+        *,
+        timeframe: Timeframe = "1h",
+        client: Any | None = None,
+        exchange: ccxt.Exchange | None = None,
+        ohlcv: pd.DataFrame | None = None,
+    ) -> tuple[pd.DataFrame, BuySellSignalsConfigItem]:
+        if ohlcv is None:
+            df = await self.fetch_ohlcv_dataframe(symbol, timeframe=timeframe, client=client, exchange=exchange)
+        else:
+            df = ohlcv.copy()
+        df_with_indicators, buy_sell_signals_config = await self._calculate_indicators(symbol, df)
+        return df_with_indicators, buy_sell_signals_config
+
+    # XXX: [JMSOLA] Add backoff to retry when no OHLCV data returned,
+    #      so the given OHLCV data is never retried when calculating technical indicators
     @backoff.on_exception(
         backoff.fibo,
         exception=IndexError,
         max_value=5,
         max_tries=7,
+        max_time=get_deadline_remaining_seconds,
         jitter=backoff.random_jitter,
         on_backoff=backoff_on_backoff_handler,
     )
-    async def calculate_technical_indicators(
+    async def fetch_ohlcv_dataframe(
         self,
         symbol: str,
         *,
         timeframe: Timeframe = "1h",
         client: Any | None = None,
         exchange: ccxt.Exchange | None = None,
-    ) -> tuple[pd.DataFrame, BuySellSignalsConfigItem]:
+    ) -> pd.DataFrame:
         exchange = exchange or self._exchange
         exchange_symbols = await self._ccxt_remote_service.get_exchange_symbols_by_fiat_currency(
             fiat_currency=symbol.split("/")[-1], exchange=exchange
@@ -88,10 +107,11 @@ class CryptoAnalyticsService:
             ohlcv = await self._ccxt_remote_service.fetch_ohlcv(symbol, timeframe, exchange=exchange)
         else:
             ohlcv = await self._operating_exchange_service.fetch_ohlcv(symbol, timeframe, client=client)
-        df = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df_with_indicators, buy_sell_signals_config = await self._calculate_indicators(symbol, df)
-        return df_with_indicators, buy_sell_signals_config
+        if not ohlcv:
+            raise IndexError(f"No OHLCV data returned for {symbol} ({timeframe})")
+        ret = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        ret["timestamp"] = pd.to_datetime(ret["timestamp"], unit="ms", utc=True)
+        return ret
 
     async def get_favourite_tickers(
         self, *, order_by_symbol: bool = False, client: Any | None = None
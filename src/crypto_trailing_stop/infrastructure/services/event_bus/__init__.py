@@ -0,0 +1,21 @@
+from crypto_trailing_stop.infrastructure.services.event_bus.event_bus import (
+    EventBus,
+    EventOverflowPolicyEnum,
+    EventSubscriberMetrics,
+    EventTopic,
+)
+from crypto_trailing_stop.infrastructure.services.event_bus.topics import (
+    SHARDING_LEADERSHIP_CHANGED_TOPIC,
+    SIGNALS_EVALUATION_RESULT_TOPIC,
+    TRIGGER_BUY_ACTION_TOPIC,
+)
+
+__all__ = [
+    "EventBus",
+    "EventOverflowPolicyEnum",
+    "EventSubscriberMetrics",
+    "EventTopic",
+    "SHARDING_LEADERSHIP_CHANGED_TOPIC",
+    "SIGNALS_EVALUATION_RESULT_TOPIC",
+    "TRIGGER_BUY_ACTION_TOPIC",
+]
@@ -0,0 +1,228 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EventOverflowPolicyEnum(str, Enum):
+    # Discards the oldest pending event, so subscribers always catch up with the latest ones
+    DROP_OLDEST = "drop_oldest"
+    # Discards the event being published, so pending events are handled in order
+    DROP_NEWEST = "drop_newest"
+    # Replaces the pending event with the same key (see coalesce_key), falling back to DROP_OLDEST
+    COALESCE = "coalesce"
+
+
+@dataclass(frozen=True)
+class EventTopic[E]:
+    name: str
+    event_type: type[E]
+
+
+@dataclass(frozen=True)
+class EventSubscriberMetrics:
+    topic: str
+    subscriber: str
+    queue_size: int
+    queue_depth: int
+    max_queue_depth: int
+    published: int
+    handled: int
+    failed: int
+    dropped: int
+    coalesced: int
+    avg_queue_wait_seconds: float
+    avg_handling_seconds: float
+    max_handling_seconds: float
+
+
+@dataclass
+class _QueuedEvent:
+    event: Any
+    published_at: float
+    coalesce_key: Hashable | None = None
+
+
+class _EventSubscription[E]:
+    def __init__(
+        self,
+        topic: EventTopic[E],
+        handler: Callable[[E], Awaitable[None]],
+        *,
+        name: str,
+        queue_size: int,
+        workers: int,
+        overflow_policy: EventOverflowPolicyEnum,
+        coalesce_key: Callable[[E], Hashable] | None,
+    ) -> None:
+        self._topic = topic
+        self._handler = handler
+        self._name = name
+        self._workers = workers
+        self._overflow_policy = overflow_policy
+        self._coalesce_key = coalesce_key
+        self._queue: asyncio.Queue[_QueuedEvent] = asyncio.Queue(maxsize=queue_size)
+        self._pending_by_coalesce_key: dict[Hashable, _QueuedEvent] = {}
+        self._worker_tasks: list[asyncio.Task] = []
+        # Metrics
+        self._published = 0
+        self._handled = 0
+        self._failed = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._max_queue_depth = 0
+        self._total_queue_wait_seconds = 0.0
+        self._total_handling_seconds = 0.0
+        self._max_handling_seconds = 0.0
+
+    def offer(self, event: E) -> None:
+        self._published += 1
+        coalesce_key = (
+            self._coalesce_key(event)
+            if self._overflow_policy == EventOverflowPolicyEnum.COALESCE and self._coalesce_key is not None
+            else None
+        )
+        if coalesce_key is not None and coalesce_key in self._pending_by_coalesce_key:
+            # Only the latest event matters, so the pending one is replaced, keeping its position in the queue
+            self._pending_by_coalesce_key[coalesce_key].event = event
+            self._coalesced += 1
+            return
+        if self._queue.full():
+            self._dropped += 1
+            if self._overflow_policy == EventOverflowPolicyEnum.DROP_NEWEST:
+                logger.warning(f"[{self._name}] Queue for '{self._topic.name}' events is full, dropping newest event")
+                return
+            logger.warning(f"[{self._name}] Queue for '{self._topic.name}' events is full, dropping oldest event")
+            self._forget(self._queue.get_nowait())
+            self._queue.task_done()
+        queued_event = _QueuedEvent(event=event, published_at=time.monotonic(), coalesce_key=coalesce_key)
+        if coalesce_key is not None:
+            self._pending_by_coalesce_key[coalesce_key] = queued_event
+        self._queue.put_nowait(queued_event)
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        self._ensure_workers()
+
+    def get_metrics(self) -> EventSubscriberMetrics:
+        completed = self._handled + self._failed
+        ret = EventSubscriberMetrics(
+            topic=self._topic.name,
+            subscriber=self._name,
+            queue_size=self._queue.maxsize,
+            queue_depth=self._queue.qsize(),
+            max_queue_depth=self._max_queue_depth,
+            published=self._published,
+            handled=self._handled,
+            failed=self._failed,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            avg_queue_wait_seconds=self._total_queue_wait_seconds / completed if completed else 0.0,
+            avg_handling_seconds=self._total_handling_seconds / completed if completed else 0.0,
+            max_handling_seconds=self._max_handling_seconds,
+        )
+        return ret
+
+    async def close(self, *, timeout: float | None) -> None:
+        if self._worker_tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except TimeoutError:  # pragma: no cover
+                logger.warning(f"[{self._name}] {self._queue.qsize()} '{self._topic.name}' events were not handled")
+            for worker_task in self._worker_tasks:
+                worker_task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+            self._worker_tasks = []
+
+    def _ensure_workers(self) -> None:
+        self._worker_tasks = [worker_task for worker_task in self._worker_tasks if not worker_task.done()]
+        while len(self._worker_tasks) < self._workers:
+            # XXX: [JMSOLA] Workers run within an empty context, so handlers do not inherit the publisher deadline
+            self._worker_tasks.append(asyncio.create_task(self._work(), context=contextvars.Context()))
+
+    async def _work(self) -> None:
+        while True:
+            queued_event = await self._queue.get()
+            try:
+                self._forget(queued_event)
+                started_at = time.monotonic()
+                try:
+                    await self._handler(queued_event.event)
+                    self._handled += 1
+                except Exception as e:
+                    self._failed += 1
+                    logger.error(f"[{self._name}] Error handling '{self._topic.name}' event :: {str(e)}", exc_info=True)
+                handling_seconds = time.monotonic() - started_at
+                self._total_queue_wait_seconds += started_at - queued_event.published_at
+                self._total_handling_seconds += handling_seconds
+                self._max_handling_seconds = max(self._max_handling_seconds, handling_seconds)
+            finally:
+                self._queue.task_done()
+
+    def _forget(self, queued_event: _QueuedEvent) -> None:
+        if self._pending_by_coalesce_key.get(queued_event.coalesce_key) is queued_event:
+            del self._pending_by_coalesce_key[queued_event.coalesce_key]
+
+
+class EventBus:
+    """
+    In-process publish/subscribe of typed events.
+    Every subscriber owns a bounded queue and a fixed number of workers, so bursts of events are absorbed
+    (or dropped / coalesced, depending on the overflow policy) instead of piling up unbounded tasks.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions_by_topic_name: dict[str, list[_EventSubscription]] = defaultdict(list)
+
+    def subscribe[E](
+        self,
+        topic: EventTopic[E],
+        handler: Callable[[E], Awaitable[None]],
+        *,
+        name: str,
+        queue_size: int,
+        workers: int = 1,
+        overflow_policy: EventOverflowPolicyEnum = EventOverflowPolicyEnum.DROP_OLDEST,
+        coalesce_key: Callable[[E], Hashable] | None = None,
+    ) -> None:
+        if overflow_policy == EventOverflowPolicyEnum.COALESCE and coalesce_key is None:
+            raise ValueError(f"Coalesce key is required to coalesce '{topic.name}' events")
+        self._subscriptions_by_topic_name[topic.name].append(
+            _EventSubscription(
+                topic,
+                handler,
+                name=name,
+                queue_size=queue_size,
+                workers=workers,
+                overflow_policy=overflow_policy,
+                coalesce_key=coalesce_key,
+            )
+        )
+
+    def publish[E](self, topic: EventTopic[E], event: E) -> None:
+        if not isinstance(event, topic.event_type):
+            raise TypeError(f"'{topic.name}' events must be {topic.event_type.__name__}, not {type(event).__name__}")
+        for subscription in self._subscriptions_by_topic_name.get(topic.name, []):
+            subscription.offer(event)
+
+    def get_metrics(self) -> list[EventSubscriberMetrics]:
+        ret = [
+            subscription.get_metrics()
+            for subscriptions in self._subscriptions_by_topic_name.values()
+            for subscription in subscriptions
+        ]
+        return ret
+
+    async def close(self, *, timeout: float | None = None) -> None:
+        await asyncio.gather(
+            *[
+                subscription.close(timeout=timeout)
+                for subscriptions in self._subscriptions_by_topic_name.values()
+                for subscription in subscriptions
+            ]
+        )
@@ -0,0 +1,13 @@
+from crypto_trailing_stop.commons.constants import (
+    SHARDING_LEADERSHIP_CHANGED_EVENT_NAME,
+    SIGNALS_EVALUATION_RESULT_EVENT_NAME,
+    TRIGGER_BUY_ACTION_EVENT_NAME,
+)
+from crypto_trailing_stop.infrastructure.services.event_bus.event_bus import EventTopic
+from crypto_trailing_stop.infrastructure.services.vo.market_signal_item import MarketSignalItem
+from crypto_trailing_stop.infrastructure.services.vo.sharding_leadership_change import ShardingLeadershipChange
+from crypto_trailing_stop.infrastructure.tasks.vo.signals_evaluation_result import SignalsEvaluationResult
+
+SIGNALS_EVALUATION_RESULT_TOPIC = EventTopic(SIGNALS_EVALUATION_RESULT_EVENT_NAME, SignalsEvaluationResult)
+TRIGGER_BUY_ACTION_TOPIC = EventTopic(TRIGGER_BUY_ACTION_EVENT_NAME, MarketSignalItem)
+SHARDING_LEADERSHIP_CHANGED_TOPIC = EventTopic(SHARDING_LEADERSHIP_CHANGED_EVENT_NAME, ShardingLeadershipChange)
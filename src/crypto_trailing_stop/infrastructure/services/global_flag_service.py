@@ -1,8 +1,10 @@
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, override
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.global_flag import GlobalFlag
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.vo.global_flag_item import GlobalFlagItem
 
@@ -12,8 +14,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class GlobalFlagService:
+class GlobalFlagService(AbstractCachedConfigurationService):
     def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        super().__init__(configuration_properties)
         self._configuration_properties = configuration_properties
         self._task_manager = None
 
@@ -21,11 +24,8 @@ class GlobalFlagService:
         self._task_manager = task_manager
 
     async def find_all(self) -> list[GlobalFlagItem]:
-        flags = await GlobalFlag.objects()
-        ret = []
-        for current in GlobalFlagTypeEnum:
-            persisted = next(filter(lambda n: GlobalFlagTypeEnum.from_value(n.name) == current, flags), None)
-            ret.append(GlobalFlagItem(name=current, value=persisted is None or persisted.value is True))
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = [GlobalFlagItem(name=current, value=snapshot.get(current.value, True)) for current in GlobalFlagTypeEnum]
         return ret
 
     async def toggle_by_name(self, name: GlobalFlagTypeEnum) -> GlobalFlagItem:
@@ -36,6 +36,7 @@ class GlobalFlagService:
             global_flag = GlobalFlag(name=name.value, value=False)
         await self._toggle_task(name, value=global_flag.value)
         await global_flag.save()
+        self._configuration_cache.put(global_flag.name, global_flag.value)
         ret = GlobalFlagItem(name=GlobalFlagTypeEnum.from_value(global_flag.name), value=global_flag.value)
         return ret
 
@@ -48,6 +49,7 @@ class GlobalFlagService:
         else:
             global_flag = GlobalFlag(name=name.value, value=False)
         await global_flag.save()
+        self._configuration_cache.put(global_flag.name, global_flag.value)
 
     async def force_enable_by_name(self, name: GlobalFlagTypeEnum) -> None:
         # Immediately stop the task!
@@ -58,10 +60,30 @@ class GlobalFlagService:
         else:
             global_flag = GlobalFlag(name=name.value, value=True)
         await global_flag.save()
+        self._configuration_cache.put(global_flag.name, global_flag.value)
 
     async def is_enabled_for(self, name: GlobalFlagTypeEnum) -> bool:
-        global_flag = await GlobalFlag.objects().where(GlobalFlag.name == name.value).first()
-        return global_flag is None or global_flag.value is True
+        snapshot = await self._configuration_cache.get_snapshot()
+        return snapshot.get(name.value, True) is True
+
+    async def reconcile_tasks(self) -> None:
+        """
+        Start or stop the tasks of this worker based on the global flags stored in the database.
+        When sharding is enabled, flags are toggled by a single worker, so the rest of them apply the changes
+        on their next heartbeat, reading the flags from the database instead of the local cache.
+        """
+        snapshot = await self._configuration_cache.load()
+        for name in GlobalFlagTypeEnum:
+            value = snapshot.get(name.value, True) is True
+            if self._task_manager.is_started(name) != value:
+                logger.info(f"Global flag {name.value} changed to {value} by another worker. Reconciling task...")
+                await self._toggle_task(name, value=value)
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, bool]:
+        flags = await GlobalFlag.objects()
+        ret = {flag.name: flag.value for flag in flags}
+        return ret
 
     async def _toggle_task(self, name: GlobalFlagTypeEnum, value: bool) -> None:
         if value:
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import UTC, datetime
+from os import listdir, makedirs, path, remove, rename
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+
+from crypto_trailing_stop.commons.constants import (
+    MARKET_HISTORY_ARCHIVE_MARKET_METRICS_DATASET,
+    MARKET_HISTORY_ARCHIVE_MARKET_SIGNALS_DATASET,
+)
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
+from crypto_trailing_stop.infrastructure.services.vo.market_signal_item import MarketSignalItem
+from crypto_trailing_stop.infrastructure.tasks.vo.signals_evaluation_result import SignalsEvaluationResult
+from crypto_trailing_stop.infrastructure.tasks.vo.types import Timeframe
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# NOTE: How every column is aggregated when downsampling market metrics
+_MARKET_METRICS_DOWNSAMPLING_AGGREGATIONS = {
+    "opening_price": "first",
+    "highest_price": "max",
+    "lowest_price": "min",
+    "closing_price": "last",
+    # Boolean flags, any of them within the period (max) or all of them (min)
+    "buy": "max",
+    "sell": "max",
+    "is_choppy": "min",
+    "bearish_divergence": "max",
+    "bullish_divergence": "max",
+}
+
+
+class MarketHistoryArchiveService:
+    """
+    Append-only columnar archive of the evaluated market metrics and market signals,
+    stored as Parquet files partitioned by month and symbol (Hive layout), e.g.
+    market_metrics/month=2025-08/symbol=ETH%2FEUR/part-<uuid>.parquet
+    Historical queries are served from these files, without touching the live SQLite database.
+    """
+
+    def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        self._configuration_properties = configuration_properties
+        self._pending_rows_by_dataset: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._configuration_properties.market_history_archive_enabled
+
+    def append_market_metrics(
+        self, market_metrics: CryptoMarketMetrics, *, timeframe: Timeframe, signals: SignalsEvaluationResult
+    ) -> None:
+        if self.enabled:
+            # XXX: [JMSOLA] Values are normalized (e.g. numpy or int values to float),
+            #      so every Parquet file shares the same schema
+            row: dict[str, Any] = {
+                field_name: bool(value) if isinstance(value, bool | np.bool_) else float(value)
+                for field_name, value in asdict(market_metrics).items()
+                if field_name not in ["symbol", "timestamp", "is_rounded"]
+            }
+            row.update(
+                symbol=market_metrics.symbol,
+                timestamp=pd.Timestamp(market_metrics.timestamp).to_pydatetime(),
+                timeframe=timeframe,
+                rsi_state=market_metrics.rsi_state,
+                buy=signals.buy,
+                sell=signals.sell,
+                is_choppy=signals.is_choppy,
+            )
+            # Buffered in memory, since it is written on every flush as a whole
+            self._pending_rows_by_dataset[MARKET_HISTORY_ARCHIVE_MARKET_METRICS_DATASET].append(row)
+
+    async def write_market_signals(self, market_signals: list[MarketSignalItem]) -> None:
+        # NOTE: Written right away, since callers delete them from the live database afterwards
+        rows = [asdict(market_signal) for market_signal in market_signals]
+        await self._write_rows(MARKET_HISTORY_ARCHIVE_MARKET_SIGNALS_DATASET, rows)
+
+    async def flush(self) -> None:
+        pending_rows_by_dataset, self._pending_rows_by_dataset = self._pending_rows_by_dataset, defaultdict(list)
+        for dataset_name, rows in pending_rows_by_dataset.items():
+            await self._write_rows(dataset_name, rows)
+
+    async def find_market_metrics(
+        self,
+        symbol: str,
+        *,
+        start: datetime,
+        end: datetime,
+        timeframe: Timeframe | None = None,
+        resample_rule: str | None = None,
+    ) -> pd.DataFrame:
+        ret = await asyncio.to_thread(
+            self._scan, MARKET_HISTORY_ARCHIVE_MARKET_METRICS_DATASET, symbol, start=start, end=end, timeframe=timeframe
+        )
+        if resample_rule and not ret.empty:
+            ret = self._downsample(ret, resample_rule)
+        return ret
+
+    async def find_market_signals(
+        self, symbol: str, *, start: datetime, end: datetime, timeframe: Timeframe | None = None
+    ) -> pd.DataFrame:
+        ret = await asyncio.to_thread(
+            self._scan, MARKET_HISTORY_ARCHIVE_MARKET_SIGNALS_DATASET, symbol, start=start, end=end, timeframe=timeframe
+        )
+        return ret
+
+    async def compact(self) -> int:
+        async with self._write_lock:
+            ret = await asyncio.to_thread(self._compact_partitions)
+        return ret
+
+    async def _write_rows(self, dataset_name: str, rows: list[dict[str, Any]]) -> None:
+        if rows:
+            async with self._write_lock:
+                await asyncio.to_thread(self._write_partitions, dataset_name, rows)
+
+    def _write_partitions(self, dataset_name: str, rows: list[dict[str, Any]]) -> None:
+        # XXX: [JMSOLA] pyarrow is heavy and only needed when archiving, so it is imported on first use
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows_by_partition: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            partition_row = dict(row)
+            symbol = partition_row.pop("symbol")
+            timestamp: datetime = partition_row["timestamp"].astimezone(UTC)
+            partition_row["timestamp"] = timestamp
+            rows_by_partition[(timestamp.strftime("%Y-%m"), symbol)].append(partition_row)
+        for (month, symbol), partition_rows in rows_by_partition.items():
+            partition_folder_path = self._get_partition_folder_path(dataset_name, month=month, symbol=symbol)
+            makedirs(partition_folder_path, exist_ok=True)
+            self._write_table_atomically(
+                pq, pa.Table.from_pylist(partition_rows), partition_folder_path=partition_folder_path
+            )
+
+    def _scan(
+        self, dataset_name: str, symbol: str, *, start: datetime, end: datetime, timeframe: Timeframe | None
+    ) -> pd.DataFrame:
+        import pyarrow.dataset as ds
+
+        dataset_folder_path = path.join(self._configuration_properties.market_history_archive_folder_path, dataset_name)
+        if not path.exists(dataset_folder_path):
+            return pd.DataFrame()
+        start, end = start.astimezone(UTC), end.astimezone(UTC)
+        months = pd.period_range(start=start.replace(tzinfo=None), end=end.replace(tzinfo=None), freq="M")
+        # Partition filters prune the folders to read, before any file is opened
+        expression = (
+            ds.field("month").isin([month.strftime("%Y-%m") for month in months])
+            & (ds.field("symbol") == symbol)
+            & (ds.field("timestamp") >= start)
+            & (ds.field("timestamp") < end)
+        )
+        if timeframe:
+            expression &= ds.field("timeframe") == timeframe
+        dataset = ds.dataset(dataset_folder_path, format="parquet", partitioning="hive")
+        ret = dataset.to_table(filter=expression).to_pandas()
+        if not ret.empty:
+            ret = ret.drop(columns=["month"]).sort_values("timestamp", ignore_index=True)
+        return ret
+
+    def _downsample(self, df: pd.DataFrame, resample_rule: str) -> pd.DataFrame:
+        aggregations = {
+            column: _MARKET_METRICS_DOWNSAMPLING_AGGREGATIONS.get(column, "last")
+            for column in df.columns
+            if column not in ["timestamp", "symbol", "timeframe"]
+        }
+        ret = (
+            df.set_index("timestamp")
+            .groupby(["symbol", "timeframe"], observed=True)
+            .resample(resample_rule)
+            .agg(aggregations)
+            .dropna(subset=["closing_price"])
+            .reset_index()
+        )
+        return ret
+
+    def _compact_partitions(self) -> int:
+        import pyarrow.parquet as pq
+
+        ret = 0
+        archive_folder_path = self._configuration_properties.market_history_archive_folder_path
+        min_files = self._configuration_properties.market_history_archive_compaction_min_files
+        for dataset_name in self._list_folder_names(archive_folder_path):
+            for month_folder_name in self._list_folder_names(path.join(archive_folder_path, dataset_name)):
+                month_folder_path = path.join(archive_folder_path, dataset_name, month_folder_name)
+                for symbol_folder_name in self._list_folder_names(month_folder_path):
+                    partition_folder_path = path.join(month_folder_path, symbol_folder_name)
+                    part_filepaths = sorted(
+                        path.join(partition_folder_path, filename)
+                        for filename in listdir(partition_folder_path)
+                        if filename.endswith(".parquet")
+                    )
+                    if len(part_filepaths) >= min_files:
+                        table = pq.read_table(part_filepaths, partitioning=None).sort_by("timestamp")
+                        # XXX: [JMSOLA] Merged file is written before deleting the parts,
+                        #      so a crash in between duplicates rows instead of losing them
+                        self._write_table_atomically(pq, table, partition_folder_path=partition_folder_path)
+                        for part_filepath in part_filepaths:
+                            remove(part_filepath)
+                        ret += 1
+        return ret
+
+    def _write_table_atomically(self, pq: Any, table: "pa.Table", *, partition_folder_path: str) -> None:
+        filename = f"part-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}-{uuid4().hex}.parquet"
+        tmp_filepath = path.join(partition_folder_path, f".{filename}.tmp")
+        pq.write_table(table, tmp_filepath, compression="zstd")
+        rename(tmp_filepath, path.join(partition_folder_path, filename))
+
+    def _get_partition_folder_path(self, dataset_name: str, *, month: str, symbol: str) -> str:
+        # NOTE: Symbols are URI encoded (e.g. ETH/EUR -> ETH%2FEUR), as expected by the Hive partitioning
+        return path.join(
+            self._configuration_properties.market_history_archive_folder_path,
+            dataset_name,
+            f"month={month}",
+            f"symbol={quote(symbol, safe='')}",
+        )
+
+    def _list_folder_names(self, folder_path: str) -> list[str]:
+        ret = (
+            [name for name in listdir(folder_path) if path.isdir(path.join(folder_path, name))]
+            if path.exists(folder_path)
+            else []
+        )
+        return ret
@@ -1,14 +1,22 @@
+import asyncio
 import logging
+import math
+import time
 from datetime import UTC, datetime, timedelta
 from typing import override
 
-from pyee.asyncio import AsyncIOEventEmitter
-
-from crypto_trailing_stop.commons.constants import SIGNALS_EVALUATION_RESULT_EVENT_NAME, TRIGGER_BUY_ACTION_EVENT_NAME
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
+from crypto_trailing_stop.infrastructure.database import WriteBehindQueue, batched_writes
 from crypto_trailing_stop.infrastructure.database.models.market_signal import MarketSignal
 from crypto_trailing_stop.infrastructure.services.base import AbstractEventHandlerService
+from crypto_trailing_stop.infrastructure.services.event_bus import (
+    SIGNALS_EVALUATION_RESULT_TOPIC,
+    TRIGGER_BUY_ACTION_TOPIC,
+    EventBus,
+    EventOverflowPolicyEnum,
+)
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_trailing_stop.infrastructure.services.vo.market_signal_item import MarketSignalItem
 from crypto_trailing_stop.infrastructure.tasks.vo.signals_evaluation_result import SignalsEvaluationResult
@@ -22,18 +30,54 @@ class MarketSignalService(AbstractEventHandlerService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
-        event_emitter: AsyncIOEventEmitter,
+        event_bus: EventBus,
         operating_exchange_service: AbstractOperatingExchangeService,
         push_notification_service: PushNotificationService,
         telegram_service: TelegramService,
+        market_history_archive_service: MarketHistoryArchiveService,
     ) -> None:
         super().__init__(operating_exchange_service, push_notification_service, telegram_service)
         self._configuration_properties = configuration_properties
-        self._event_emitter = event_emitter
+        self._event_bus = event_bus
+        self._market_history_archive_service = market_history_archive_service
+        # XXX: [JMSOLA] Latest signal per (symbol, timeframe), kept up to date by the code path which stores signals,
+        #      so the Limit Sell Order Guard does not query the database on every tick.
+        #      NOTE: With sharding enabled, signals of a symbol are only stored by the worker owning its shard
+        self._last_market_signal_cache: dict[tuple[str, Timeframe], MarketSignalItem | None] = {}
+        # XXX: [JMSOLA] A worker which regains the shard of a symbol must not serve the last signal it cached
+        #      before losing it, so cached signals are loaded again every heartbeat interval when sharding is enabled
+        self._last_market_signal_cache_loaded_at: dict[tuple[str, Timeframe], float] = {}
+        self._last_market_signal_cache_ttl_seconds: float | None = (
+            self._configuration_properties.sharding_heartbeat_interval_seconds
+            if self._configuration_properties.sharding_enabled
+            else None
+        )
+        # NOTE: 1h signals are persisted by a background consumer, so triggering a buy action
+        #       does not wait for the SQLite write
+        self._market_signal_write_behind_queue: WriteBehindQueue[MarketSignal] | None = (
+            WriteBehindQueue(
+                MarketSignal,
+                flush_interval_seconds=self._configuration_properties.market_signal_write_behind_flush_interval_seconds,
+                batch_size=self._configuration_properties.market_signal_write_behind_batch_size,
+                max_pending_rows=self._configuration_properties.market_signal_write_behind_max_pending_rows,
+                max_attempts=self._configuration_properties.market_signal_write_behind_max_attempts,
+            )
+            if self._configuration_properties.market_signal_write_behind_enabled
+            else None
+        )
 
     @override
     def configure(self) -> None:
-        self._event_emitter.add_listener(SIGNALS_EVALUATION_RESULT_EVENT_NAME, self.on_signals_evaluation_result)
+        self._event_bus.subscribe(
+            SIGNALS_EVALUATION_RESULT_TOPIC,
+            self.on_signals_evaluation_result,
+            name=self.__class__.__name__,
+            queue_size=self._configuration_properties.event_bus_queue_size,
+            workers=self._configuration_properties.market_signal_event_workers,
+            # NOTE: A newer evaluation of the same candle supersedes the pending one
+            overflow_policy=EventOverflowPolicyEnum.COALESCE,
+            coalesce_key=lambda signals: (signals.symbol, signals.timeframe, signals.timestamp),
+        )
 
     async def find_by_symbol(
         self, symbol: str, *, timeframe: Timeframe | None = None, ascending: bool = True
@@ -41,26 +85,75 @@ class MarketSignalService(AbstractEventHandlerService):
         query = MarketSignal.objects().where(MarketSignal.symbol == symbol)
         if timeframe:
             query = query.where(MarketSignal.timeframe == timeframe)
-        market_signals = await query.order_by(MarketSignal.timestamp, ascending=ascending)
-        ret = [self._convert_model_to_vo(market_signal) for market_signal in market_signals]
+        market_signals = [
+            *await query.order_by(MarketSignal.timestamp, ascending=ascending),
+            *self._get_pending_market_signals(symbol, timeframe=timeframe),
+        ]
+        ret = [
+            self._convert_model_to_vo(market_signal)
+            for market_signal in sorted(
+                market_signals, key=lambda market_signal: market_signal.timestamp, reverse=not ascending
+            )
+        ]
         return ret
 
     async def find_last_market_signal(self, symbol: str, *, timeframe: Timeframe = "1h") -> MarketSignalItem | None:
-        last_market_signal: MarketSignal | None = (
-            await MarketSignal.objects()
-            .where(MarketSignal.symbol == symbol)
-            .where(MarketSignal.timeframe == timeframe)
-            .order_by(MarketSignal.timestamp, ascending=False)
-            .first()
-        )
-        ret: MarketSignalItem | None = None
-        if last_market_signal:
-            ret = self._convert_model_to_vo(last_market_signal)
-        return ret
+        cache_key = (symbol, timeframe)
+        if cache_key not in self._last_market_signal_cache or self._is_last_market_signal_cache_expired(cache_key):
+            self._last_market_signal_cache[cache_key] = await self._find_last_stored_market_signal(
+                symbol, timeframe=timeframe
+            )
+            self._last_market_signal_cache_loaded_at[cache_key] = time.monotonic()
+        return self._last_market_signal_cache[cache_key]
 
     async def find_all_symbols(self) -> list[str]:
         query_result = await MarketSignal.select(MarketSignal.symbol).distinct()
-        ret = [current["symbol"] for current in query_result]
+        ret = list(
+            dict.fromkeys(
+                [
+                    *[current["symbol"] for current in query_result],
+                    *[market_signal.symbol for market_signal in self._get_pending_market_signals()],
+                ]
+            )
+        )
+        return ret
+
+    async def close(self) -> None:
+        # Flush the pending signals, so they are not lost on shutdown
+        if self._market_signal_write_behind_queue is not None:
+            await self._market_signal_write_behind_queue.close()
+
+    async def apply_retention_policy(self) -> int:
+        expiration_date = datetime.now(tz=UTC) - timedelta(
+            days=self._configuration_properties.market_signal_retention_days
+        )
+        ret = 0
+        while True:
+            # NOTE: 4h signals never expire, since only the last market switcher is kept for them
+            expired_market_signals: list[MarketSignal] = await (
+                MarketSignal.objects()
+                .where(MarketSignal.timeframe != "4h")
+                .where(MarketSignal.timestamp < expiration_date)
+                .order_by(MarketSignal.timestamp)
+                .limit(self._configuration_properties.market_signal_retention_batch_size)
+            )
+            if not expired_market_signals:
+                break
+            # XXX: [JMSOLA] Archived before deleting them, so a crash in between duplicates rows instead of losing them
+            if self._configuration_properties.market_signal_archive_enabled:
+                await self._market_history_archive_service.write_market_signals(
+                    [self._convert_model_to_vo(market_signal) for market_signal in expired_market_signals]
+                )
+            # Bounded batches keep every write short, so the write lock is released in between
+            await MarketSignal.delete().where(
+                MarketSignal.id.is_in([expired_market_signal.id for expired_market_signal in expired_market_signals])
+            )
+            for expired_market_signal in expired_market_signals:
+                cache_key = (expired_market_signal.symbol, expired_market_signal.timeframe)
+                self._last_market_signal_cache.pop(cache_key, None)
+            ret += len(expired_market_signals)
+            # Yield control between batches, so the protective jobs are not delayed meanwhile
+            await asyncio.sleep(0)
         return ret
 
     async def on_signals_evaluation_result(self, signals: SignalsEvaluationResult) -> None:
@@ -95,15 +188,17 @@ class MarketSignalService(AbstractEventHandlerService):
             # Store new 4h signal if the market switches from bullish to bearish or viceversa.
             # Same trend does not make any effect
             if count <= 0:
-                # 1.) Delete all 4h signals for the symbol, since we only need the last one
-                # if it is a market switcher
-                await (
-                    MarketSignal.delete()
-                    .where(MarketSignal.symbol == signals.symbol)
-                    .where(MarketSignal.timeframe == signals.timeframe)
-                )
-                # 2.) Save the new one
-                await self._save_new_market_signals(signals)
+                async with batched_writes():
+                    # 1.) Delete all 4h signals for the symbol, since we only need the last one
+                    # if it is a market switcher
+                    await (
+                        MarketSignal.delete()
+                        .where(MarketSignal.symbol == signals.symbol)
+                        .where(MarketSignal.timeframe == signals.timeframe)
+                    )
+                    self._last_market_signal_cache.pop((signals.symbol, signals.timeframe), None)
+                    # 2.) Save the new one
+                    await self._save_new_market_signals(signals)
         elif signals.is_divergence_signal:  # pragma: no cover
             logger.debug("Divergence signals for 4h timeframe are ignored for now!")
 
@@ -111,12 +206,11 @@ class MarketSignalService(AbstractEventHandlerService):
         new_market_signals = await self._save_new_market_signals(signals)
         for new_market_signal in new_market_signals:
             if new_market_signal.is_candidate_to_trigger_buy_action:
-                self._event_emitter.emit(TRIGGER_BUY_ACTION_EVENT_NAME, new_market_signal)
+                self._event_bus.publish(TRIGGER_BUY_ACTION_TOPIC, new_market_signal)
 
     async def _save_new_market_signals(self, signals: SignalsEvaluationResult) -> list[MarketSignalItem]:
-        if signals.timeframe != "4h":
-            await self._apply_market_signal_retention_policy(signals)
-        ret = []
+        # NOTE: Retention policy is applied by the database maintenance job,
+        #       so storing new signals is a single insert and nothing else
         market_signal_common_args = dict(
             symbol=signals.symbol,
             timeframe=signals.timeframe,
@@ -125,31 +219,77 @@ class MarketSignalService(AbstractEventHandlerService):
             closing_price=signals.closing_price,
             ema_long_price=signals.ema_long_price,
         )
+        new_market_signals: list[MarketSignal] = []
         if signals.is_buy_sell_signal:
-            buy_sell_market_signal = MarketSignal(
-                signal_type="buy" if signals.buy else "sell", **market_signal_common_args
+            new_market_signals.append(
+                MarketSignal(signal_type="buy" if signals.buy else "sell", **market_signal_common_args)
             )
-            await buy_sell_market_signal.save()
-            ret.append(self._convert_model_to_vo(buy_sell_market_signal))
         if signals.is_divergence_signal:
-            divergence_market_signal = MarketSignal(
-                signal_type="bearish_divergence" if signals.bearish_divergence else "bullish_divergence",
-                **market_signal_common_args,
+            new_market_signals.append(
+                MarketSignal(
+                    signal_type="bearish_divergence" if signals.bearish_divergence else "bullish_divergence",
+                    **market_signal_common_args,
+                )
             )
-            await divergence_market_signal.save()
-            ret.append(self._convert_model_to_vo(divergence_market_signal))
+        if new_market_signals:
+            # XXX: [JMSOLA] 4h signals replace the previous ones within a transaction, so they are written inline
+            if self._market_signal_write_behind_queue is not None and signals.timeframe != "4h":
+                self._market_signal_write_behind_queue.enqueue(*new_market_signals)
+            else:
+                await MarketSignal.insert(*new_market_signals)
+        ret = [self._convert_model_to_vo(new_market_signal) for new_market_signal in new_market_signals]
+        self._update_last_market_signal_cache(signals, new_market_signals=ret)
         return ret
 
-    async def _apply_market_signal_retention_policy(self, signals: SignalsEvaluationResult) -> None:
-        expiration_date = datetime.now(tz=UTC) - timedelta(
-            days=self._configuration_properties.market_signal_retention_days
-        )
-        await (
-            MarketSignal.delete()
-            .where(MarketSignal.symbol == signals.symbol)
-            .where(MarketSignal.timeframe == signals.timeframe)
-            .where(MarketSignal.timestamp < expiration_date)
+    def _update_last_market_signal_cache(
+        self, signals: SignalsEvaluationResult, *, new_market_signals: list[MarketSignalItem]
+    ) -> None:
+        cache_key = (signals.symbol, signals.timeframe)
+        if cache_key in self._last_market_signal_cache:
+            last_market_signal = self._last_market_signal_cache[cache_key]
+            for new_market_signal in new_market_signals:
+                if last_market_signal is None or new_market_signal.timestamp >= last_market_signal.timestamp:
+                    last_market_signal = new_market_signal
+            self._last_market_signal_cache[cache_key] = last_market_signal
+
+    def _is_last_market_signal_cache_expired(self, cache_key: tuple[str, Timeframe]) -> bool:
+        ret = (
+            self._last_market_signal_cache_ttl_seconds is not None
+            and time.monotonic() - self._last_market_signal_cache_loaded_at.get(cache_key, -math.inf)
+            >= self._last_market_signal_cache_ttl_seconds
         )
+        return ret
+
+    def _get_pending_market_signals(
+        self, symbol: str | None = None, *, timeframe: Timeframe | None = None
+    ) -> list[MarketSignal]:
+        ret: list[MarketSignal] = []
+        if self._market_signal_write_behind_queue is not None:
+            ret = [
+                market_signal
+                for market_signal in self._market_signal_write_behind_queue.get_pending_rows()
+                if (not symbol or market_signal.symbol == symbol)
+                and (not timeframe or market_signal.timeframe == timeframe)
+            ]
+        return ret
+
+    async def _find_last_stored_market_signal(self, symbol: str, *, timeframe: Timeframe) -> MarketSignalItem | None:
+        pending_market_signals = self._get_pending_market_signals(symbol, timeframe=timeframe)
+        # NOTE: Pending signals are always newer than the persisted ones
+        if pending_market_signals:
+            last_market_signal: MarketSignal | None = pending_market_signals[-1]
+        else:
+            last_market_signal = (
+                await MarketSignal.objects()
+                .where(MarketSignal.symbol == symbol)
+                .where(MarketSignal.timeframe == timeframe)
+                .order_by(MarketSignal.timestamp, ascending=False)
+                .first()
+            )
+        ret: MarketSignalItem | None = None
+        if last_market_signal:
+            ret = self._convert_model_to_vo(last_market_signal)
+        return ret
 
     def _convert_model_to_vo(self, market_signal: MarketSignal) -> MarketSignalItem:
         ret = MarketSignalItem(
@@ -37,7 +37,8 @@ class OrdersAnalyticsService(AbstractService):
         buy_sell_signals_config_service: BuySellSignalsConfigService,
         crypto_analytics_service: CryptoAnalyticsService,
     ) -> None:
-        self._operating_exchange_service = operating_exchange_service
+        # NOTE: No notifications are sent by this service
+        super().__init__(operating_exchange_service, push_notification_service=None, telegram_service=None)
         self._ccxt_remote_service = ccxt_remote_service
         self._stop_loss_percent_service = stop_loss_percent_service
         self._buy_sell_signals_config_service = buy_sell_signals_config_service
@@ -1,15 +1,19 @@
 import logging
+from collections.abc import Hashable
+from typing import override
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.push_notification import PushNotification
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 from crypto_trailing_stop.infrastructure.services.enums import PushNotificationTypeEnum
 from crypto_trailing_stop.infrastructure.services.vo.push_notification_item import PushNotificationItem
 
 logger = logging.getLogger(__name__)
 
 
-class PushNotificationService:
+class PushNotificationService(AbstractCachedConfigurationService):
     def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        super().__init__(configuration_properties)
         self._configuration_properties = configuration_properties
 
     async def find_push_notification_by_telegram_chat_id(self, telegram_chat_id: int) -> list[PushNotificationItem]:
@@ -49,6 +53,9 @@ class PushNotificationService:
                 telegram_chat_id=telegram_chat_id, notification_type=notification_type.value, activated=True
             )
         await push_notification.save()
+        self._configuration_cache.put(
+            (push_notification.telegram_chat_id, push_notification.notification_type), push_notification.activated
+        )
         ret = PushNotificationItem(
             telegram_chat_id=push_notification.telegram_chat_id,
             notification_type=PushNotificationTypeEnum.from_value(push_notification.notification_type),
@@ -57,10 +64,19 @@ class PushNotificationService:
         return ret
 
     async def get_actived_subscription_by_type(self, notification_type: PushNotificationTypeEnum) -> list[int]:
-        push_notifications = (
-            await PushNotification.objects()
-            .where(PushNotification.notification_type == notification_type.value)
-            .where(PushNotification.activated.eq(True))
-        )
-        ret = [push_notification.telegram_chat_id for push_notification in push_notifications]
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = [
+            telegram_chat_id
+            for (telegram_chat_id, current_notification_type), activated in snapshot.items.items()
+            if current_notification_type == notification_type.value and activated
+        ]
+        return ret
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, bool]:
+        push_notifications = await PushNotification.objects()
+        ret = {
+            (push_notification.telegram_chat_id, push_notification.notification_type): push_notification.activated
+            for push_notification in push_notifications
+        }
         return ret
@@ -1,20 +1,25 @@
 from asyncio import Lock
+from collections.abc import Hashable
+from typing import override
 
 from crypto_trailing_stop.commons.constants import STOP_LOSS_STEPS_VALUE_LIST
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.risk_management import RiskManagement
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 
+# NOTE: Risk management is a single row table, so it is cached under a single key
+_RISK_VALUE_CACHE_KEY = "value"
 
-class RiskManagementService:
-    def __init__(self) -> None:
+
+class RiskManagementService(AbstractCachedConfigurationService):
+    def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        super().__init__(configuration_properties)
         self._lock = Lock()
         self._default_risk_management_percent_value = STOP_LOSS_STEPS_VALUE_LIST[-1]
 
     async def get_risk_value(self) -> float:
-        risk_management = await RiskManagement.objects().first()
-        if risk_management:
-            ret = risk_management.value
-        else:
-            ret = self._default_risk_management_percent_value
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = snapshot.get(_RISK_VALUE_CACHE_KEY, self._default_risk_management_percent_value)
         return ret
 
     async def set_risk_value(self, value: float) -> None:
@@ -26,3 +31,10 @@ class RiskManagementService:
         else:
             risk_management = RiskManagement({RiskManagement.value: value})
         await risk_management.save()
+        self._configuration_cache.put(_RISK_VALUE_CACHE_KEY, risk_management.value)
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, float]:
+        risk_management = await RiskManagement.objects().first()
+        ret = {_RISK_VALUE_CACHE_KEY: risk_management.value} if risk_management else {}
+        return ret
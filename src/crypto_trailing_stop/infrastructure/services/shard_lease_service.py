@@ -0,0 +1,145 @@
+import logging
+import math
+import zlib
+from datetime import UTC, datetime, timedelta
+
+from crypto_trailing_stop.commons.constants import (
+    SHARDING_LEADER_LEASE_NAME,
+    SHARDING_SHARD_LEASE_NAME_PREFIX,
+    SHARDING_WORKER_LEASE_NAME_PREFIX,
+)
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.database.models.shard_lease import ShardLease
+from crypto_trailing_stop.infrastructure.services.event_bus import SHARDING_LEADERSHIP_CHANGED_TOPIC, EventBus
+from crypto_trailing_stop.infrastructure.services.vo.sharding_leadership_change import ShardingLeadershipChange
+
+logger = logging.getLogger(__name__)
+
+
+class ShardLeaseService:
+    """
+    Splits the symbols between several worker processes sharing the same SQLite database.
+    Every worker claims shards through lease rows, renews them on every heartbeat and gives back
+    the ones above its fair share, so shards are automatically rebalanced when workers come and go.
+    A single worker also holds the leader lease, which owns Telegram polling and non-sharded jobs.
+    """
+
+    def __init__(self, configuration_properties: ConfigurationProperties, event_bus: EventBus) -> None:
+        self._configuration_properties = configuration_properties
+        self._event_bus = event_bus
+        self._worker_id = self._configuration_properties.sharding_worker_id
+        self._total_shards = self._configuration_properties.sharding_total_shards
+        self._owned_shards: frozenset[int] = frozenset()
+        self._is_leader = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._configuration_properties.sharding_enabled
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    def get_owned_shards(self) -> frozenset[int]:
+        return self._owned_shards
+
+    def get_shard_by_symbol(self, symbol: str) -> int:
+        # NOTE: crc32 is stable across processes, unlike the built-in hash(..)
+        crypto_currency, *_ = symbol.split("/")
+        return zlib.crc32(crypto_currency.strip().upper().encode("utf-8")) % self._total_shards
+
+    def owns_symbol(self, symbol: str) -> bool:
+        return not self.enabled or self.get_shard_by_symbol(symbol) in self._owned_shards
+
+    def is_leader(self) -> bool:
+        return not self.enabled or self._is_leader
+
+    async def heartbeat(self) -> None:
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(seconds=self._configuration_properties.sharding_lease_ttl_seconds)
+        await self._ensure_lease_rows_exist()
+        # 1. Register (or renew) the worker presence, so the rest of workers are aware of it
+        await self._try_acquire_lease(f"{SHARDING_WORKER_LEASE_NAME_PREFIX}{self._worker_id}", now, expires_at)
+        # 2. Calculate the fair share of shards based on the live workers
+        live_workers = (
+            await ShardLease.count()
+            .where(ShardLease.name.like(f"{SHARDING_WORKER_LEASE_NAME_PREFIX}%"))
+            .where(ShardLease.expires_at > now)
+        )
+        fair_share = math.ceil(self._total_shards / max(live_workers, 1))
+        # 3. Renew owned shards and give back the ones above the fair share
+        owned_shards: set[int] = set()
+        for shard in range(self._total_shards):
+            if len(owned_shards) < fair_share and await self._try_acquire_lease(
+                self._get_shard_lease_name(shard), now, expires_at, only_if_owned=True
+            ):
+                owned_shards.add(shard)
+        await self._release_leases(
+            [self._get_shard_lease_name(shard) for shard in set(self._owned_shards) - owned_shards]
+        )
+        # 4. Claim free or expired shards until reaching the fair share
+        for shard in range(self._total_shards):
+            if len(owned_shards) >= fair_share:
+                break
+            if shard not in owned_shards and await self._try_acquire_lease(
+                self._get_shard_lease_name(shard), now, expires_at
+            ):
+                owned_shards.add(shard)
+        if owned_shards != self._owned_shards:
+            logger.info(
+                f"[Worker {self._worker_id}] Owned shards: {sorted(owned_shards)} "
+                + f"({live_workers} live workers, fair share {fair_share})"
+            )
+        self._owned_shards = frozenset(owned_shards)
+        # 5. Leader election
+        is_leader = await self._try_acquire_lease(SHARDING_LEADER_LEASE_NAME, now, expires_at)
+        if is_leader != self._is_leader:
+            logger.info(f"[Worker {self._worker_id}] Leadership {'acquired' if is_leader else 'lost'}!")
+            self._is_leader = is_leader
+            self._event_bus.publish(
+                SHARDING_LEADERSHIP_CHANGED_TOPIC,
+                ShardingLeadershipChange(worker_id=self._worker_id, is_leader=is_leader),
+            )
+
+    async def release_all(self) -> None:
+        owned_lease_names = await ShardLease.select(ShardLease.name).where(ShardLease.owner == self._worker_id)
+        await self._release_leases([current["name"] for current in owned_lease_names])
+        self._owned_shards = frozenset()
+        self._is_leader = False
+
+    async def _ensure_lease_rows_exist(self) -> None:
+        lease_names = [
+            SHARDING_LEADER_LEASE_NAME,
+            f"{SHARDING_WORKER_LEASE_NAME_PREFIX}{self._worker_id}",
+            *[self._get_shard_lease_name(shard) for shard in range(self._total_shards)],
+        ]
+        await ShardLease.insert(*[ShardLease(name=name) for name in lease_names]).on_conflict(
+            target=ShardLease.name, action="DO NOTHING"
+        )
+
+    async def _try_acquire_lease(
+        self, lease_name: str, now: datetime, expires_at: datetime, *, only_if_owned: bool = False
+    ) -> bool:
+        # XXX: [JMSOLA] Conditional UPDATE is atomic in SQLite, so only one worker can win a free lease
+        query = ShardLease.update({ShardLease.owner: self._worker_id, ShardLease.expires_at: expires_at}).where(
+            ShardLease.name == lease_name
+        )
+        if only_if_owned:
+            query = query.where(ShardLease.owner == self._worker_id).where(ShardLease.expires_at > now)
+        else:
+            query = query.where(
+                (ShardLease.owner == self._worker_id) | ShardLease.owner.is_null() | (ShardLease.expires_at <= now)
+            )
+        updated = await query.returning(ShardLease.name)
+        return len(updated) > 0
+
+    async def _release_leases(self, lease_names: list[str]) -> None:
+        if lease_names:
+            await (
+                ShardLease.update({ShardLease.owner: None, ShardLease.expires_at: None})
+                .where(ShardLease.name.is_in(lease_names))
+                .where(ShardLease.owner == self._worker_id)
+            )
+
+    def _get_shard_lease_name(self, shard: int) -> str:
+        return f"{SHARDING_SHARD_LEASE_NAME_PREFIX}{shard}"
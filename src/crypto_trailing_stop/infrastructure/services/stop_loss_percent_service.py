@@ -1,10 +1,13 @@
 import logging
 from asyncio import Lock
+from collections.abc import Hashable
+from typing import override
 
 import pydash
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.database.models.stop_loss_percent import StopLossPercent
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.favourite_crypto_currency_service import (
     FavouriteCryptoCurrencyService,
@@ -15,47 +18,43 @@ from crypto_trailing_stop.infrastructure.services.vo.stop_loss_percent_item impo
 logger = logging.getLogger(__name__)
 
 
-class StopLossPercentService:
+class StopLossPercentService(AbstractCachedConfigurationService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
         favourite_crypto_currency_service: FavouriteCryptoCurrencyService,
         global_flag_service: GlobalFlagService,
     ) -> None:
+        super().__init__(configuration_properties)
         self._configuration_properties = configuration_properties
         self._favourite_crypto_currency_service = favourite_crypto_currency_service
         self._global_flag_service = global_flag_service
+        # NOTE: Only writes are serialized
         self._lock = Lock()
 
     async def find_all(self) -> list[StopLossPercentItem]:
-        async with self._lock:
-            stored_stop_loss_percent_list = await StopLossPercent.objects()
-            ret = [
-                StopLossPercentItem(symbol=current.symbol, value=current.value)
-                for current in stored_stop_loss_percent_list
-            ]
-            additional_crypto_currencies = await self._favourite_crypto_currency_service.find_all()
-            for additional_crypto_currency in additional_crypto_currencies:
-                if not any(current.symbol.lower() == additional_crypto_currency.lower() for current in ret):
-                    ret.append(
-                        StopLossPercentItem(
-                            symbol=additional_crypto_currency.upper(),
-                            value=self._configuration_properties.trailing_stop_loss_percent,
-                        )
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = [StopLossPercentItem(symbol=symbol, value=value) for symbol, value in snapshot.items.items()]
+        additional_crypto_currencies = await self._favourite_crypto_currency_service.find_all()
+        for additional_crypto_currency in additional_crypto_currencies:
+            if not any(current.symbol.lower() == additional_crypto_currency.lower() for current in ret):
+                ret.append(
+                    StopLossPercentItem(
+                        symbol=additional_crypto_currency.upper(),
+                        value=self._configuration_properties.trailing_stop_loss_percent,
                     )
-            ret = pydash.order_by(ret, ["symbol"])
-            return ret
+                )
+        ret = pydash.order_by(ret, ["symbol"])
+        return ret
 
     async def find_symbol(self, symbol: str) -> StopLossPercentItem:
-        async with self._lock:
-            stop_loss_percent = await StopLossPercent.objects().where(StopLossPercent.symbol == symbol.upper()).first()
-            if stop_loss_percent:
-                ret = StopLossPercentItem(symbol=stop_loss_percent.symbol, value=stop_loss_percent.value)
-            else:
-                ret = StopLossPercentItem(
-                    symbol=symbol.upper(), value=self._configuration_properties.trailing_stop_loss_percent
-                )
-            return ret
+        # NOTE: Reads are lock-free, they are served from an immutable snapshot of the configuration cache
+        snapshot = await self._configuration_cache.get_snapshot()
+        ret = StopLossPercentItem(
+            symbol=symbol.upper(),
+            value=snapshot.get(symbol.upper(), self._configuration_properties.trailing_stop_loss_percent),
+        )
+        return ret
 
     async def save_or_update(
         self, item: StopLossPercentItem, *, force_disable_limit_sell_order_guard: bool = True
@@ -73,3 +72,10 @@ class StopLossPercentService:
                     {StopLossPercent.symbol: item.symbol, StopLossPercent.value: item.value}
                 )
             await stop_loss_percent.save()
+            self._configuration_cache.put(stop_loss_percent.symbol, stop_loss_percent.value)
+
+    @override
+    async def _load_configuration_cache_items(self) -> dict[Hashable, float]:
+        stored_stop_loss_percent_list = await StopLossPercent.objects()
+        ret = {current.symbol: current.value for current in stored_stop_loss_percent_list}
+        return ret
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ShardingLeadershipChange:
+    worker_id: str
+    is_leader: bool
@@ -4,7 +4,10 @@ from abc import ABCMeta, abstractmethod
 from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from crypto_trailing_stop.commons.deadline import DeadlineExceededError, deadline_scope
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.services.base import AbstractService
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
@@ -37,11 +40,20 @@ class AbstractTaskService(AbstractService, metaclass=ABCMeta):
             self._job.pause()
 
     async def run(self) -> None:
-        try:
-            await self._run()
-        except Exception as e:  # pragma: no cover
-            logger.error(str(e), exc_info=True)
-            await self._notify_fatal_error_via_telegram(e)
+        with deadline_scope(self._get_run_deadline_seconds()):
+            try:
+                await self._run()
+            except DeadlineExceededError as e:
+                logger.warning(f"[{self.__class__.__name__}] Run aborted, it did not finish in time :: {str(e)}")
+            except CircuitBreakerOpenError as e:
+                # NOTE: The exchange is degraded, so this run is bounded and skipped without notifying a fatal error
+                logger.warning(
+                    f"[{self.__class__.__name__}] Run skipped, exchange is degraded: {str(e)}. "
+                    + f"Circuit breaker states: {self._operating_exchange_service.get_circuit_breaker_states()}"
+                )
+            except Exception as e:  # pragma: no cover
+                logger.error(str(e), exc_info=True)
+                await self._notify_fatal_error_via_telegram(e)
 
     @abstractmethod
     def get_global_flag_type(self) -> GlobalFlagTypeEnum | None:
@@ -65,6 +77,18 @@ class AbstractTaskService(AbstractService, metaclass=ABCMeta):
         Get the job trigger
         """
 
+    def _get_run_deadline_seconds(self) -> float | None:
+        """
+        Get the maximum wall-clock time of a single run, so it ends within its interval
+        and the next tick is free to act on fresh prices.
+
+        Returns:
+            float | None: Deadline in seconds. None if the run is unbounded
+        """
+        trigger = self._get_job_trigger()
+        ret = trigger.interval.total_seconds() if isinstance(trigger, IntervalTrigger) else None
+        return ret
+
     def _create_job(self) -> Job:
         trigger = self._get_job_trigger()
         job = self._scheduler.add_job(
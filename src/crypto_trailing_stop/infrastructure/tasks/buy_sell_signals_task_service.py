@@ -1,4 +1,5 @@
 import logging
+from datetime import UTC, datetime, timedelta
 from typing import get_args, override
 
 import ccxt.async_support as ccxt
@@ -9,31 +10,38 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from httpx import AsyncClient
-from pyee.asyncio import AsyncIOEventEmitter
 
 from crypto_trailing_stop.commons.constants import (
     BUY_SELL_MINUTES_PAST_HOUR_EXECUTION_CRON_PATTERN,
-    SIGNALS_EVALUATION_RESULT_EVENT_NAME,
+    BUY_SELL_SIGNALS_CANDLE_CLOSE_CONFIRMATION_WINDOW_MINUTES,
+    BUY_SELL_SIGNALS_CRON_RUN_DEADLINE_SECONDS,
 )
+from crypto_trailing_stop.commons.deadline import DeadlineExceededError
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.symbol_market_config import (
     SymbolMarketConfig,
 )
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.symbol_tickers import SymbolTickers
 from crypto_trailing_stop.infrastructure.services.auto_buy_trader_config_service import AutoBuyTraderConfigService
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
 from crypto_trailing_stop.infrastructure.services.crypto_analytics_service import CryptoAnalyticsService
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum, PushNotificationTypeEnum
 from crypto_trailing_stop.infrastructure.services.enums.candlestick_enum import CandleStickEnum
+from crypto_trailing_stop.infrastructure.services.event_bus import SIGNALS_EVALUATION_RESULT_TOPIC, EventBus
 from crypto_trailing_stop.infrastructure.services.favourite_crypto_currency_service import (
     FavouriteCryptoCurrencyService,
 )
 from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
 from crypto_trailing_stop.infrastructure.tasks.base import AbstractTaskService
+from crypto_trailing_stop.infrastructure.tasks.vo.closed_candles_fingerprint import ClosedCandlesFingerprint
 from crypto_trailing_stop.infrastructure.tasks.vo.signals_evaluation_result import SignalsEvaluationResult
 from crypto_trailing_stop.infrastructure.tasks.vo.types import RSIState, Timeframe
 from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
@@ -48,24 +56,31 @@ class BuySellSignalsTaskService(AbstractTaskService):
         operating_exchange_service: AbstractOperatingExchangeService,
         push_notification_service: PushNotificationService,
         telegram_service: TelegramService,
-        event_emitter: AsyncIOEventEmitter,
+        event_bus: EventBus,
         scheduler: AsyncIOScheduler,
         ccxt_remote_service: CcxtRemoteService,
         global_flag_service: GlobalFlagService,
         favourite_crypto_currency_service: FavouriteCryptoCurrencyService,
         crypto_analytics_service: CryptoAnalyticsService,
         auto_buy_trader_config_service: AutoBuyTraderConfigService,
+        buy_sell_signals_config_service: BuySellSignalsConfigService,
+        shard_lease_service: ShardLeaseService,
+        market_history_archive_service: MarketHistoryArchiveService,
     ):
         super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
         self._configuration_properties = configuration_properties
-        self._event_emitter = event_emitter
+        self._event_bus = event_bus
         self._ccxt_remote_service = ccxt_remote_service
         self._global_flag_service = global_flag_service
         self._favourite_crypto_currency_service = favourite_crypto_currency_service
         self._crypto_analytics_service = crypto_analytics_service
         self._auto_buy_trader_config_service = auto_buy_trader_config_service
+        self._buy_sell_signals_config_service = buy_sell_signals_config_service
+        self._shard_lease_service = shard_lease_service
+        self._market_history_archive_service = market_history_archive_service
         self._exchange = self._ccxt_remote_service.get_exchange()
         self._last_signal_evalutation_result_cache: dict[str, SignalsEvaluationResult] = {}
+        self._closed_candles_fingerprint_cache: dict[tuple[str, Timeframe], ClosedCandlesFingerprint] = {}
         self._job = self._create_job()
 
     @override
@@ -89,10 +104,13 @@ class BuySellSignalsTaskService(AbstractTaskService):
             current_tickers_by_symbol: dict[str, SymbolTickers] = {
                 tickers.symbol: tickers for tickers in sorted_favourite_tickers_list
             }
+            now = datetime.now(UTC)
             symbol_timeframe_tuples = [
                 (tickers.symbol, timeframe)
                 for tickers in sorted_favourite_tickers_list
                 for timeframe in get_args(Timeframe)
+                if self._shard_lease_service.owns_symbol(tickers.symbol)
+                and self._is_signals_evaluation_due(tickers.symbol, timeframe, now=now)
             ]
             async with self._exchange as exchange:
                 for current_symbol, current_timeframe in symbol_timeframe_tuples:
@@ -104,9 +122,15 @@ class BuySellSignalsTaskService(AbstractTaskService):
                             client=client,
                             exchange=exchange,
                         )
+                    except (CircuitBreakerOpenError, DeadlineExceededError) as e:  # pragma: no cover
+                        logger.warning(
+                            f"Skipping signals evaluation for {current_symbol} ({current_timeframe}) :: {str(e)}"
+                        )
                     except Exception as e:  # pragma: no cover
                         logger.error(str(e), exc_info=True)
                         await self._notify_fatal_error_via_telegram(e)
+        # Market metrics evaluated along this run are archived at once
+        await self._market_history_archive_service.flush()
 
     @override
     def get_global_flag_type(self) -> GlobalFlagTypeEnum | None:
@@ -122,6 +146,14 @@ class BuySellSignalsTaskService(AbstractTaskService):
             trigger = IntervalTrigger(seconds=self._configuration_properties.job_interval_seconds)
         return trigger
 
+    @override
+    def _get_run_deadline_seconds(self) -> float | None:
+        if self._configuration_properties.buy_sell_signals_run_via_cron_pattern:
+            ret = BUY_SELL_SIGNALS_CRON_RUN_DEADLINE_SECONDS
+        else:
+            ret = super()._get_run_deadline_seconds()
+        return ret
+
     async def _get_prioritised_favourite_tickers(self, *, client: AsyncClient) -> list[SymbolTickers]:
         auto_buy_trader_config_list = await self._auto_buy_trader_config_service.find_all(
             include_favourite_cryptos=False, order_by_symbol=False
@@ -142,6 +174,15 @@ class BuySellSignalsTaskService(AbstractTaskService):
     async def _eval_and_notify_signals(
         self, symbol: str, timeframe: Timeframe, tickers: SymbolTickers, client: AsyncClient, exchange: ccxt.Exchange
     ) -> None:
+        ohlcv = await self._crypto_analytics_service.fetch_ohlcv_dataframe(
+            symbol, timeframe=timeframe, client=client, exchange=exchange
+        )
+        crypto_currency, *_ = symbol.split("/")
+        buy_sell_signals_config = await self._buy_sell_signals_config_service.find_by_symbol(crypto_currency)
+        closed_candles_fingerprint = ClosedCandlesFingerprint.from_ohlcv(ohlcv, buy_sell_signals_config)
+        if self._closed_candles_fingerprint_cache.get((symbol, timeframe)) == closed_candles_fingerprint:
+            logger.info(f"Closed {timeframe} candles for {symbol} did not change. Skipping signals evaluation...")
+            return
         trading_market_config = await self._operating_exchange_service.get_trading_market_config_by_symbol(
             symbol, client=client
         )
@@ -149,12 +190,20 @@ class BuySellSignalsTaskService(AbstractTaskService):
             df_with_indicators,
             buy_sell_signals_config,
         ) = await self._crypto_analytics_service.calculate_technical_indicators(
-            symbol, timeframe=timeframe, client=client, exchange=exchange
+            symbol, timeframe=timeframe, client=client, exchange=exchange, ohlcv=ohlcv
         )
         # Use the default, wider threshold for 4H signals
         signals = self._check_signals(
             symbol, timeframe, df_with_indicators, buy_sell_signals_config, trading_market_config=trading_market_config
         )
+        self._closed_candles_fingerprint_cache[(symbol, timeframe)] = closed_candles_fingerprint
+        self._market_history_archive_service.append_market_metrics(
+            CryptoMarketMetrics.from_candlestick(
+                symbol, df_with_indicators.iloc[CandleStickEnum.LAST], trading_market_config=trading_market_config
+            ),
+            timeframe=timeframe,
+            signals=signals,
+        )
         is_new_signals, previous_signals = self._is_new_signals(signals)
         if is_new_signals:
             try:
@@ -186,10 +235,32 @@ class BuySellSignalsTaskService(AbstractTaskService):
                             base_symbol=base_symbol,
                         )
             finally:
-                self._event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals)
+                # NOTE: Handled by the event bus workers, which do not inherit the deadline of this run
+                self._event_bus.publish(SIGNALS_EVALUATION_RESULT_TOPIC, signals)
         else:  # pragma: no cover
             logger.info("Calculated signals were already notified previously!")
 
+    def _is_signals_evaluation_due(self, symbol: str, timeframe: Timeframe, *, now: datetime) -> bool:
+        """
+        Signals only depend on closed candles, so a (symbol, timeframe) is only evaluated when a new candle
+        has closed since its last evaluation, or within the confirmation window right after the candle close,
+        in case the exchange has not published the closed candle (or its final values) yet.
+        """
+        closed_candles_fingerprint = self._closed_candles_fingerprint_cache.get((symbol, timeframe))
+        if closed_candles_fingerprint is None:
+            ret = True
+        else:
+            timeframe_delta = pd.Timedelta(timeframe).to_pytimedelta()
+            current_candle_open = pd.Timestamp(now).floor(timeframe).to_pydatetime()
+            is_new_candle_closed = (
+                closed_candles_fingerprint.last_closed_candle_timestamp + timeframe_delta < current_candle_open
+            )
+            is_within_confirmation_window = now - current_candle_open <= timedelta(
+                minutes=BUY_SELL_SIGNALS_CANDLE_CLOSE_CONFIRMATION_WINDOW_MINUTES
+            )
+            ret = is_new_candle_closed or is_within_confirmation_window
+        return ret
+
     def _is_new_signals(self, current_signals: SignalsEvaluationResult) -> tuple[bool, SignalsEvaluationResult | None]:
         is_new_signals = current_signals.cache_key not in self._last_signal_evalutation_result_cache
         previous_signals: SignalsEvaluationResult | None = None
@@ -593,8 +664,7 @@ class BuySellSignalsTaskService(AbstractTaskService):
         message = f"⚡⚡ {html.bold('ATTENTION')} ⚡⚡\n\n"
         message += f"{body_message}\n"
         message += html.bold(f"🔥 {crypto_currency} current price is {tickers.close} {fiat_currency}")
-        for tg_chat_id in telegram_chat_ids:
-            await self._telegram_service.send_message(chat_id=tg_chat_id, text=message)
+        await self._telegram_service.notify(telegram_chat_ids, message)
 
     def _is_trend_momentum_confirmed(
         self, *, candle: CryptoMarketMetrics, buy_sell_signals_config: BuySellSignalsConfigItem
@@ -2,8 +2,10 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dependency_injector import containers, providers
 
 from crypto_trailing_stop.infrastructure.tasks.buy_sell_signals_task_service import BuySellSignalsTaskService
+from crypto_trailing_stop.infrastructure.tasks.database_maintenance_task_service import DatabaseMaintenanceTaskService
 from crypto_trailing_stop.infrastructure.tasks.global_flag_checker_task_service import GlobalFlagCheckerTaskService
 from crypto_trailing_stop.infrastructure.tasks.limit_sell_order_guard_task_service import LimitSellOrderGuardTaskService
+from crypto_trailing_stop.infrastructure.tasks.shard_lease_heartbeat_task_service import ShardLeaseHeartbeatTaskService
 from crypto_trailing_stop.infrastructure.tasks.task_manager import TaskManager
 from crypto_trailing_stop.infrastructure.tasks.trailing_stop_loss_task_service import TrailingStopLossTaskService
 
@@ -12,7 +14,7 @@ class TasksContainer(containers.DeclarativeContainer):
     __self__ = providers.Self()
 
     configuration_properties = providers.Dependency()
-    event_emitter = providers.Dependency()
+    event_bus = providers.Dependency()
 
     ccxt_remote_service = providers.Dependency()
 
@@ -20,6 +22,7 @@ class TasksContainer(containers.DeclarativeContainer):
 
     global_flag_service = providers.Dependency()
     market_signal_service = providers.Dependency()
+    market_history_archive_service = providers.Dependency()
     limit_sell_order_guard_cache_service = providers.Dependency()
     buy_sell_signals_config_service = providers.Dependency()
     orders_analytics_service = providers.Dependency()
@@ -27,6 +30,7 @@ class TasksContainer(containers.DeclarativeContainer):
     auto_buy_trader_config_service = providers.Dependency()
     crypto_analytics_service = providers.Dependency()
     push_notification_service = providers.Dependency()
+    shard_lease_service = providers.Dependency()
     telegram_service = providers.Dependency()
 
     scheduler = providers.Singleton(AsyncIOScheduler)
@@ -37,13 +41,16 @@ class TasksContainer(containers.DeclarativeContainer):
         operating_exchange_service=operating_exchange_service,
         push_notification_service=push_notification_service,
         telegram_service=telegram_service,
-        event_emitter=event_emitter,
+        event_bus=event_bus,
         scheduler=scheduler,
         ccxt_remote_service=ccxt_remote_service,
         global_flag_service=global_flag_service,
         favourite_crypto_currency_service=favourite_crypto_currency_service,
         crypto_analytics_service=crypto_analytics_service,
         auto_buy_trader_config_service=auto_buy_trader_config_service,
+        buy_sell_signals_config_service=buy_sell_signals_config_service,
+        shard_lease_service=shard_lease_service,
+        market_history_archive_service=market_history_archive_service,
     )
 
     limit_sell_order_guard_task_service = providers.Singleton(
@@ -60,6 +67,7 @@ class TasksContainer(containers.DeclarativeContainer):
         buy_sell_signals_config_service=buy_sell_signals_config_service,
         crypto_analytics_service=crypto_analytics_service,
         orders_analytics_service=orders_analytics_service,
+        shard_lease_service=shard_lease_service,
     )
 
     trailing_stop_loss_task_service = providers.Singleton(
@@ -71,6 +79,7 @@ class TasksContainer(containers.DeclarativeContainer):
         scheduler=scheduler,
         ccxt_remote_service=ccxt_remote_service,
         orders_analytics_service=orders_analytics_service,
+        shard_lease_service=shard_lease_service,
     )
 
     global_flag_checker_task_service = providers.Singleton(
@@ -81,6 +90,30 @@ class TasksContainer(containers.DeclarativeContainer):
         telegram_service=telegram_service,
         scheduler=scheduler,
         global_flag_service=global_flag_service,
+        shard_lease_service=shard_lease_service,
+    )
+
+    shard_lease_heartbeat_task_service = providers.Singleton(
+        ShardLeaseHeartbeatTaskService,
+        configuration_properties=configuration_properties,
+        operating_exchange_service=operating_exchange_service,
+        push_notification_service=push_notification_service,
+        telegram_service=telegram_service,
+        scheduler=scheduler,
+        shard_lease_service=shard_lease_service,
+        global_flag_service=global_flag_service,
+    )
+
+    database_maintenance_task_service = providers.Singleton(
+        DatabaseMaintenanceTaskService,
+        configuration_properties=configuration_properties,
+        operating_exchange_service=operating_exchange_service,
+        push_notification_service=push_notification_service,
+        telegram_service=telegram_service,
+        scheduler=scheduler,
+        market_signal_service=market_signal_service,
+        market_history_archive_service=market_history_archive_service,
+        shard_lease_service=shard_lease_service,
     )
 
     task_manager = providers.Singleton(TaskManager, global_flag_service=global_flag_service, tasks_container=__self__)
@@ -0,0 +1,76 @@
+import logging
+from typing import override
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
+from crypto_trailing_stop.infrastructure.database import optimize_database
+from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
+from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
+from crypto_trailing_stop.infrastructure.tasks.base import AbstractTaskService
+from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseMaintenanceTaskService(AbstractTaskService):
+    def __init__(
+        self,
+        configuration_properties: ConfigurationProperties,
+        operating_exchange_service: AbstractOperatingExchangeService,
+        push_notification_service: PushNotificationService,
+        telegram_service: TelegramService,
+        scheduler: AsyncIOScheduler,
+        market_signal_service: MarketSignalService,
+        market_history_archive_service: MarketHistoryArchiveService,
+        shard_lease_service: ShardLeaseService,
+    ):
+        super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
+        self._configuration_properties = configuration_properties
+        self._market_signal_service = market_signal_service
+        self._market_history_archive_service = market_history_archive_service
+        self._shard_lease_service = shard_lease_service
+        self._job = self._create_job()
+
+    @override
+    async def start(self) -> None:
+        """
+        Start method does not do anything,
+        this job will be running every time to keep the database small and its statistics up to date
+        """
+
+    @override
+    async def stop(self) -> None:
+        """
+        Stop method does not do anything,
+        this job will be running every time to keep the database small and its statistics up to date
+        """
+
+    @override
+    def get_global_flag_type(self) -> GlobalFlagTypeEnum | None:
+        return None
+
+    @override
+    async def _run(self) -> None:
+        # NOTE: The database is shared by all the workers, so only the leader maintains it
+        if not self._shard_lease_service.is_leader():  # pragma: no cover
+            return
+        deleted_market_signals = await self._market_signal_service.apply_retention_policy()
+        if deleted_market_signals > 0:
+            logger.info(f"{deleted_market_signals} expired market signals have been deleted!")
+        await optimize_database(
+            incremental_vacuum_pages=self._configuration_properties.database_incremental_vacuum_pages
+        )
+        # Merge the small Parquet files appended on every run, so the archive stays compact
+        compacted_partitions = await self._market_history_archive_service.compact()
+        if compacted_partitions > 0:
+            logger.info(f"{compacted_partitions} market history archive partitions have been compacted!")
+
+    @override
+    def _get_job_trigger(self) -> IntervalTrigger:
+        return IntervalTrigger(seconds=self._configuration_properties.database_maintenance_job_interval_seconds)
@@ -10,6 +10,7 @@ from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange impo
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum, PushNotificationTypeEnum
 from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
 from crypto_trailing_stop.infrastructure.tasks.base import AbstractTaskService
 from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
 
@@ -25,10 +26,12 @@ class GlobalFlagCheckerTaskService(AbstractTaskService):
         telegram_service: TelegramService,
         scheduler: AsyncIOScheduler,
         global_flag_service: GlobalFlagService,
+        shard_lease_service: ShardLeaseService,
     ):
         super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
         self._configuration_properties = configuration_properties
         self._global_flag_service = global_flag_service
+        self._shard_lease_service = shard_lease_service
         self._job = self._create_job()
 
     @override
@@ -51,6 +54,9 @@ class GlobalFlagCheckerTaskService(AbstractTaskService):
 
     @override
     async def _run(self) -> None:
+        # NOTE: Sell orders are not sharded here, so only the leader worker checks them to avoid duplicated alerts
+        if not self._shard_lease_service.is_leader():
+            return
         # Check if Limit Sell Order Guard Service is enabled!
         is_enabled_for_limit_sell_order_guard = await self._global_flag_service.is_enabled_for(
             GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
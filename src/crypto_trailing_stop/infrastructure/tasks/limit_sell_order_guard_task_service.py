@@ -10,9 +10,12 @@ from httpx import AsyncClient
 from crypto_trailing_stop.commons.constants import (
     INITIAL_LIMIT_SELL_ORDER_GUARD_SAFETY_FACTOR,
     LIMIT_SELL_ORDER_GUARD_SAFETY_FACTOR_STEP,
+    PROTECTIVE_ORDERS_DEADLINE_SECONDS,
 )
+from crypto_trailing_stop.commons.deadline import DeadlineExceededError, protective_deadline_scope
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums.order_side_enum import OrderSideEnum
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums.order_type_enum import OrderTypeEnum
@@ -35,6 +38,7 @@ from crypto_trailing_stop.infrastructure.services.limit_sell_order_guard_cache_s
 from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
 from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
 from crypto_trailing_stop.infrastructure.services.vo.limit_sell_order_guard_metrics import LimitSellOrderGuardMetrics
@@ -61,6 +65,7 @@ class LimitSellOrderGuardTaskService(AbstractTaskService):
         buy_sell_signals_config_service: BuySellSignalsConfigService,
         crypto_analytics_service: CryptoAnalyticsService,
         orders_analytics_service: OrdersAnalyticsService,
+        shard_lease_service: ShardLeaseService,
     ):
         super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
         self._configuration_properties = configuration_properties
@@ -71,6 +76,7 @@ class LimitSellOrderGuardTaskService(AbstractTaskService):
         self._buy_sell_signals_config_service = buy_sell_signals_config_service
         self._crypto_analytics_service = crypto_analytics_service
         self._orders_analytics_service = orders_analytics_service
+        self._shard_lease_service = shard_lease_service
         self._exchange = self._ccxt_remote_service.get_exchange()
         self._technical_indicators_by_symbol_cache: dict[str, TechnicalIndicatorsCacheItem] = {}
 
@@ -82,6 +88,11 @@ class LimitSellOrderGuardTaskService(AbstractTaskService):
     async def _run(self) -> None:
         async with await self._operating_exchange_service.get_client() as client:
             sell_orders = await self._operating_exchange_service.get_pending_sell_orders(client=client)
+            # NOTE: When sharding is enabled, every worker only supervises the symbols of its own shards
+            #       (see sharding_lease_ttl_seconds for the shards of a crashed worker)
+            sell_orders = [
+                sell_order for sell_order in sell_orders if self._shard_lease_service.owns_symbol(sell_order.symbol)
+            ]
             if sell_orders:
                 await self._handle_opened_sell_orders(sell_orders, client=client)
             else:  # pragma: no cover
@@ -111,6 +122,8 @@ class LimitSellOrderGuardTaskService(AbstractTaskService):
                     previous_used_buy_trades=previous_used_buy_trades,
                     client=client,
                 )
+            except (CircuitBreakerOpenError, DeadlineExceededError) as e:
+                logger.warning(f"Skipping sell order for {sell_order.symbol} in this run :: {str(e)}")
             except Exception as e:  # pragma: no cover
                 logger.error(str(e), exc_info=True)
                 await self._notify_fatal_error_via_telegram(e)
@@ -247,31 +260,34 @@ class LimitSellOrderGuardTaskService(AbstractTaskService):
         client,
     ) -> Order:
         final_amount_to_sell = self._get_final_amount_to_sell(sell_order, trading_market_config, auto_exit_reason)
-        # Cancel current take-profit sell limit order
-        await self._operating_exchange_service.cancel_order(sell_order, client=client)
-        # Create new market SELL order
-        new_sell_market_order = await self._ensure_market_sell_order_creation(
-            sell_order=sell_order,
-            trading_market_config=trading_market_config,
-            final_amount_to_sell=final_amount_to_sell,
-            client=client,
-        )
-        logger.info(
-            f"[LIMIT SELL ORDER GUARD] NEW MARKET ORDER Id: '{new_sell_market_order.id}', "
-            + f"for selling {auto_exit_reason.percent_to_sell}% "
-            + f"of {sell_order.amount} {crypto_currency} immediately!"  # noqa: E501
-        )
-        if (remaining_amount := sell_order.amount - final_amount_to_sell) > 0:
-            # NOTE: If we sold a percent less than 100.0%,
-            #  we have to create again the sell order with the remaining order amount
-            await self._create_sell_order_for_remaining_amount(
+        # XXX: [JMSOLA] Once the current sell order is cancelled, the market exit must be completed
+        #      even if the run deadline is exceeded, otherwise the position would be left unprotected
+        with protective_deadline_scope(PROTECTIVE_ORDERS_DEADLINE_SECONDS):
+            # Cancel current take-profit sell limit order
+            await self._operating_exchange_service.cancel_order(sell_order, client=client)
+            # Create new market SELL order
+            new_sell_market_order = await self._ensure_market_sell_order_creation(
                 sell_order=sell_order,
-                tickers=tickers,
-                crypto_currency=crypto_currency,
                 trading_market_config=trading_market_config,
-                remaining_amount=remaining_amount,
+                final_amount_to_sell=final_amount_to_sell,
                 client=client,
             )
+            logger.info(
+                f"[LIMIT SELL ORDER GUARD] NEW MARKET ORDER Id: '{new_sell_market_order.id}', "
+                + f"for selling {auto_exit_reason.percent_to_sell}% "
+                + f"of {sell_order.amount} {crypto_currency} immediately!"  # noqa: E501
+            )
+            if (remaining_amount := sell_order.amount - final_amount_to_sell) > 0:
+                # NOTE: If we sold a percent less than 100.0%,
+                #  we have to create again the sell order with the remaining order amount
+                await self._create_sell_order_for_remaining_amount(
+                    sell_order=sell_order,
+                    tickers=tickers,
+                    crypto_currency=crypto_currency,
+                    trading_market_config=trading_market_config,
+                    remaining_amount=remaining_amount,
+                    client=client,
+                )
         return new_sell_market_order
 
     async def _ensure_market_sell_order_creation(
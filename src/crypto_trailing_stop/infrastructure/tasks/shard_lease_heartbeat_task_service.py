@@ -0,0 +1,63 @@
+import logging
+from typing import override
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
+from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
+from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
+from crypto_trailing_stop.infrastructure.tasks.base import AbstractTaskService
+from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
+
+logger = logging.getLogger(__name__)
+
+
+class ShardLeaseHeartbeatTaskService(AbstractTaskService):
+    def __init__(
+        self,
+        configuration_properties: ConfigurationProperties,
+        operating_exchange_service: AbstractOperatingExchangeService,
+        push_notification_service: PushNotificationService,
+        telegram_service: TelegramService,
+        scheduler: AsyncIOScheduler,
+        shard_lease_service: ShardLeaseService,
+        global_flag_service: GlobalFlagService,
+    ):
+        super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
+        self._configuration_properties = configuration_properties
+        self._shard_lease_service = shard_lease_service
+        self._global_flag_service = global_flag_service
+        if self._shard_lease_service.enabled:
+            self._job = self._create_job()
+
+    @override
+    async def start(self) -> None:
+        """
+        Start method does not do anything,
+        this job will be running every time to keep the shard leases alive
+        """
+
+    @override
+    async def stop(self) -> None:
+        """
+        Stop method does not do anything,
+        this job will be running every time to keep the shard leases alive
+        """
+
+    @override
+    def get_global_flag_type(self) -> GlobalFlagTypeEnum | None:
+        return None
+
+    @override
+    async def _run(self) -> None:
+        await self._shard_lease_service.heartbeat()
+        # NOTE: Global flags might have been toggled by another worker (e.g. the leader, through Telegram)
+        await self._global_flag_service.reconcile_tasks()
+
+    @override
+    def _get_job_trigger(self) -> IntervalTrigger:
+        return IntervalTrigger(seconds=self._configuration_properties.sharding_heartbeat_interval_seconds)
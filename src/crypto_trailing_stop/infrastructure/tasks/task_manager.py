@@ -17,29 +17,38 @@ class TaskManager:
         self._global_flag_service = global_flag_service
         self._tasks_container = tasks_container
         self._tasks: dict[GlobalFlagTypeEnum, AbstractTaskService] = {}
+        self._started_by_global_flag_type: dict[GlobalFlagTypeEnum, bool] = {}
         self._global_flag_service.set_task_manager(self)
 
     async def load_tasks(self) -> Self:
         self._tasks.update(self._import_task_modules())
         logger.info("Task classes imported and instantiated! Starting what are needed!")
-        for global_flag_type in GlobalFlagTypeEnum:
-            is_global_flag_type_enabled = await self._global_flag_service.is_enabled_for(global_flag_type)
-            if is_global_flag_type_enabled:
-                await self.start(global_flag_type)
+        # NOTE: All global flags are fetched at once, instead of a query per flag, to shorten the startup
+        for global_flag_item in await self._global_flag_service.find_all():
+            if global_flag_item.value:
+                await self.start(global_flag_item.name)
             else:
-                await self.stop(global_flag_type)
+                await self.stop(global_flag_item.name)
         return self
 
     async def start(self, global_flag_type: GlobalFlagTypeEnum) -> None:
+        self._started_by_global_flag_type[global_flag_type] = True
         if global_flag_type in self._tasks:
             await self._tasks[global_flag_type].start()
             logger.info(f"Task {global_flag_type.value} STARTED!")
 
     async def stop(self, global_flag_type: GlobalFlagTypeEnum) -> None:
+        self._started_by_global_flag_type[global_flag_type] = False
         if global_flag_type in self._tasks:
             await self._tasks[global_flag_type].stop()
             logger.info(f"Task {global_flag_type.value} STOPPED!")
 
+    def is_started(self, global_flag_type: GlobalFlagTypeEnum) -> bool | None:
+        """
+        Whether the task has been started or stopped by this worker. None if it has not been done yet
+        """
+        return self._started_by_global_flag_type.get(global_flag_type)
+
     def get_tasks(self) -> list[AbstractTaskService]:
         return dict(self._tasks)
 
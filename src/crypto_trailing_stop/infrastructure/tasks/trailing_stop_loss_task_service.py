@@ -7,15 +7,21 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from httpx import AsyncClient
 
-from crypto_trailing_stop.commons.constants import TRAILING_STOP_LOSS_PRICE_DECREASE_THRESHOLD
+from crypto_trailing_stop.commons.constants import (
+    PROTECTIVE_ORDERS_DEADLINE_SECONDS,
+    TRAILING_STOP_LOSS_PRICE_DECREASE_THRESHOLD,
+)
+from crypto_trailing_stop.commons.deadline import DeadlineExceededError, protective_deadline_scope
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.order import Order
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.symbol_tickers import SymbolTickers
 from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
 from crypto_trailing_stop.infrastructure.services.vo.stop_loss_percent_item import StopLossPercentItem
 from crypto_trailing_stop.infrastructure.tasks.base import AbstractTaskService
 from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
@@ -33,11 +39,13 @@ class TrailingStopLossTaskService(AbstractTaskService):
         scheduler: AsyncIOScheduler,
         ccxt_remote_service: CcxtRemoteService,
         orders_analytics_service: OrdersAnalyticsService,
+        shard_lease_service: ShardLeaseService,
     ):
         super().__init__(operating_exchange_service, push_notification_service, telegram_service, scheduler)
         self._configuration_properties = configuration_properties
         self._ccxt_remote_service = ccxt_remote_service
         self._orders_analytics_service = orders_analytics_service
+        self._shard_lease_service = shard_lease_service
         self._trailing_stop_loss_price_decrease_threshold = 1 - TRAILING_STOP_LOSS_PRICE_DECREASE_THRESHOLD
 
     @override
@@ -50,6 +58,13 @@ class TrailingStopLossTaskService(AbstractTaskService):
             opened_stop_limit_sell_orders = await self._operating_exchange_service.get_pending_sell_orders(
                 order_type="stop-limit", client=client
             )
+            # NOTE: When sharding is enabled, every worker only supervises the symbols of its own shards
+            #       (see sharding_lease_ttl_seconds for the shards of a crashed worker)
+            opened_stop_limit_sell_orders = [
+                sell_order
+                for sell_order in opened_stop_limit_sell_orders
+                if self._shard_lease_service.owns_symbol(sell_order.symbol)
+            ]
             if opened_stop_limit_sell_orders:
                 await self._handle_opened_stop_limit_sell_orders(opened_stop_limit_sell_orders, client=client)
             else:
@@ -75,6 +90,8 @@ class TrailingStopLossTaskService(AbstractTaskService):
                 await self._handle_single_sell_order(
                     sell_order, current_tickers_by_symbol, max_and_min_buy_order_amount_by_symbol, client=client
                 )
+            except (CircuitBreakerOpenError, DeadlineExceededError) as e:
+                logger.warning(f"Skipping sell order for {sell_order.symbol} in this run :: {str(e)}")
             except Exception as e:  # pragma: no cover
                 logger.error(str(e), exc_info=True)
                 await self._notify_fatal_error_via_telegram(e)
@@ -115,21 +132,24 @@ class TrailingStopLossTaskService(AbstractTaskService):
         )
         if sell_order.stop_price < new_stop_price:
             logger.info(f"Updating order {repr(sell_order)} to new stop price {new_stop_price} {sell_order.symbol}.")
-            await self._operating_exchange_service.cancel_order(sell_order, client=client)
-            new_order = await self._operating_exchange_service.create_order(
-                order=Order(
-                    order_type=sell_order.order_type,
-                    side=sell_order.side,
-                    symbol=sell_order.symbol,
-                    price=round(
-                        new_stop_price * self._trailing_stop_loss_price_decrease_threshold,
-                        ndigits=trading_market_config.price_precision,
+            # XXX: [JMSOLA] Once the current stop-limit order is cancelled, the new one must be created
+            #      even if the run deadline is exceeded, otherwise the position would be left unprotected
+            with protective_deadline_scope(PROTECTIVE_ORDERS_DEADLINE_SECONDS):
+                await self._operating_exchange_service.cancel_order(sell_order, client=client)
+                new_order = await self._operating_exchange_service.create_order(
+                    order=Order(
+                        order_type=sell_order.order_type,
+                        side=sell_order.side,
+                        symbol=sell_order.symbol,
+                        price=round(
+                            new_stop_price * self._trailing_stop_loss_price_decrease_threshold,
+                            ndigits=trading_market_config.price_precision,
+                        ),
+                        amount=sell_order.amount,
+                        stop_price=new_stop_price,
                     ),
-                    amount=sell_order.amount,
-                    stop_price=new_stop_price,
-                ),
-                client=client,
-            )
+                    client=client,
+                )
             logger.info(f"New Order has been created with id = {new_order.id}")
         else:
             logger.info(f"Order {repr(sell_order)} is still valid, no update needed.")
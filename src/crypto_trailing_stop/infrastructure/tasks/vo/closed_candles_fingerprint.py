@@ -0,0 +1,27 @@
+import hashlib
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Self
+
+import pandas as pd
+
+from crypto_trailing_stop.infrastructure.services.enums.candlestick_enum import CandleStickEnum
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+
+
+@dataclass(frozen=True)
+class ClosedCandlesFingerprint:
+    last_closed_candle_timestamp: datetime
+    digest: str
+
+    @classmethod
+    def from_ohlcv(cls, ohlcv: pd.DataFrame, buy_sell_signals_config: BuySellSignalsConfigItem) -> Self:
+        # XXX: [JMSOLA] The current candle is still alive, so it is excluded from the fingerprint
+        closed_candles = ohlcv.iloc[: CandleStickEnum.CURRENT]
+        sha256 = hashlib.sha256()
+        sha256.update(pd.util.hash_pandas_object(closed_candles, index=False).to_numpy().tobytes())
+        # Signals also depend on the symbol configuration, so any change on it forces a new evaluation
+        sha256.update(repr(sorted(asdict(buy_sell_signals_config).items())).encode("utf-8"))
+        return cls(
+            last_closed_candle_timestamp=ohlcv.iloc[CandleStickEnum.LAST]["timestamp"], digest=sha256.hexdigest()
+        )
@@ -1,6 +1,11 @@
-from fastapi import APIRouter
+from dataclasses import asdict
 
+from fastapi import APIRouter, Request, Response, status
+
+from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.interfaces.dtos.event_subscriber_metrics_dto import EventSubscriberMetricsDto
 from crypto_trailing_stop.interfaces.dtos.health_status_dto import HealthStatusDto
+from crypto_trailing_stop.interfaces.dtos.readiness_status_dto import ReadinessStatusDto
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -8,3 +13,25 @@ router = APIRouter(prefix="/health", tags=["health"])
 @router.get("/status")
 async def health_check():
     return HealthStatusDto()
+
+
+@router.get("/readiness")
+async def readiness_check(request: Request, response: Response) -> ReadinessStatusDto:
+    # NOTE: Ready means the protective jobs (e.g. Limit Sell Order Guard) are able to run,
+    # even though non-critical features might still be loading in background
+    ret = ReadinessStatusDto(
+        ready=getattr(request.app.state, "ready", False),
+        startup_duration_seconds=getattr(request.app.state, "startup_duration_seconds", None),
+        non_critical_features_loaded=getattr(request.app.state, "non_critical_features_loaded", False),
+    )
+    if not ret.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ret
+
+
+@router.get("/event-bus")
+async def event_bus_metrics() -> list[EventSubscriberMetricsDto]:
+    # NOTE: Queue depth and handling latency per subscriber, to find out event handlers falling behind
+    event_bus = get_application_container().infrastructure_container().event_bus()
+    ret = [EventSubscriberMetricsDto(**asdict(metrics)) for metrics in event_bus.get_metrics()]
+    return ret
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class EventSubscriberMetricsDto(BaseModel):
+    topic: str
+    subscriber: str
+    queue_size: int
+    queue_depth: int
+    max_queue_depth: int
+    published: int
+    handled: int
+    failed: int
+    dropped: int
+    coalesced: int
+    avg_queue_wait_seconds: float
+    avg_handling_seconds: float
+    max_handling_seconds: float
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ReadinessStatusDto(BaseModel):
+    ready: bool
+    startup_duration_seconds: float | None = None
+    non_critical_features_loaded: bool = False
@@ -47,6 +47,7 @@ class TelegramContainer(containers.DeclarativeContainer):
 
     telegram_service = providers.Singleton(
         TelegramService,
+        configuration_properties=configuration_properties,
         telegram_bot=telegram_bot,
         keyboards_builder=keyboards_builder,
         session_storage_service=session_storage_service,
@@ -0,0 +1,133 @@
+import asyncio
+import contextvars
+import logging
+import time
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+
+from crypto_trailing_stop.commons.constants import (
+    DEFAULT_TELEGRAM_NOTIFICATION_MAX_RETRIES,
+    TELEGRAM_MESSAGE_MAX_LENGTH,
+    TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TelegramNotificationDispatcher:
+    """
+    Delivers notifications in background, so callers enqueue them and return right away.
+    Messages enqueued for the same chat within the digest window are merged into a single digest message,
+    and deliveries are spaced out to honour the Telegram per-chat and global rate limits.
+    """
+
+    def __init__(
+        self,
+        telegram_bot: Bot,
+        *,
+        workers: int,
+        digest_window_seconds: float,
+        per_chat_interval_seconds: float,
+        global_rate_limit_per_second: float,
+        max_pending_messages: int,
+    ) -> None:
+        self._telegram_bot = telegram_bot
+        self._workers = workers
+        self._digest_window_seconds = digest_window_seconds
+        self._per_chat_interval_seconds = per_chat_interval_seconds
+        self._global_interval_seconds = 1.0 / global_rate_limit_per_second
+        self._max_pending_messages = max_pending_messages
+        self._pending_messages_by_chat_id: dict[str, list[str]] = {}
+        self._pending_messages_count = 0
+        # NOTE: Chats with pending messages, along with the monotonic time their first message was enqueued
+        self._ready_chats: asyncio.Queue[tuple[float, str]] = asyncio.Queue()
+        self._next_slot_by_chat_id: dict[str, float] = {}
+        self._next_global_slot = 0.0
+        self._worker_tasks: list[asyncio.Task] = []
+        self._closed = False
+
+    def enqueue(self, chat_id: str, text: str) -> None:
+        if self._closed:
+            logger.warning(f"Telegram notification dispatcher is closed, dropping message for chat {chat_id}")
+            return
+        if self._pending_messages_count >= self._max_pending_messages:
+            logger.warning(f"Too many pending Telegram notifications, dropping message for chat {chat_id}")
+            return
+        self._pending_messages_count += 1
+        if chat_id in self._pending_messages_by_chat_id:
+            # Merged into the digest which is already waiting to be sent
+            self._pending_messages_by_chat_id[chat_id].append(text)
+        else:
+            self._pending_messages_by_chat_id[chat_id] = [text]
+            self._ready_chats.put_nowait((time.monotonic(), chat_id))
+        self._ensure_workers()
+
+    async def close(self, *, timeout: float | None = None) -> None:
+        self._closed = True
+        if self._worker_tasks:
+            try:
+                await asyncio.wait_for(self._ready_chats.join(), timeout=timeout)
+            except TimeoutError:  # pragma: no cover
+                logger.warning(f"{self._pending_messages_count} Telegram notifications could not be sent on time")
+            for worker_task in self._worker_tasks:
+                worker_task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+            self._worker_tasks = []
+
+    def _ensure_workers(self) -> None:
+        self._worker_tasks = [worker_task for worker_task in self._worker_tasks if not worker_task.done()]
+        while len(self._worker_tasks) < self._workers:
+            # XXX: [JMSOLA] Workers run within an empty context, so they do not inherit the caller deadline
+            self._worker_tasks.append(asyncio.create_task(self._work(), context=contextvars.Context()))
+
+    async def _work(self) -> None:
+        while True:
+            enqueued_at, chat_id = await self._ready_chats.get()
+            try:
+                # Wait for the rest of the burst, so it is sent as a single digest message
+                await asyncio.sleep(max(0.0, enqueued_at + self._digest_window_seconds - time.monotonic()))
+                messages = self._pending_messages_by_chat_id.pop(chat_id, [])
+                self._pending_messages_count -= len(messages)
+                digests = self._build_digests(messages)
+                # XXX: [JMSOLA] Slots are reserved before awaiting anything, so digests are sent in order
+                #      even when another worker picks up newer messages for the same chat
+                slots = [self._reserve_slot(chat_id) for _ in digests]
+                for digest, slot in zip(digests, slots, strict=True):
+                    await asyncio.sleep(max(0.0, slot - time.monotonic()))
+                    await self._send(chat_id, digest)
+            finally:
+                self._ready_chats.task_done()
+
+    def _build_digests(self, messages: list[str]) -> list[str]:
+        ret: list[str] = []
+        for message in messages:
+            candidate = f"{ret[-1]}{TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR}{message}" if ret else None
+            if candidate is not None and len(candidate) <= TELEGRAM_MESSAGE_MAX_LENGTH:
+                ret[-1] = candidate
+            else:
+                # NOTE: Messages are never split, since it could break their HTML markup
+                ret.append(message)
+        return ret
+
+    def _reserve_slot(self, chat_id: str) -> float:
+        now = time.monotonic()
+        ret = max(now, self._next_slot_by_chat_id.get(chat_id, 0.0), self._next_global_slot)
+        self._next_slot_by_chat_id[chat_id] = ret + self._per_chat_interval_seconds
+        self._next_global_slot = ret + self._global_interval_seconds
+        return ret
+
+    async def _send(self, chat_id: str, text: str) -> None:
+        for attempt in range(1, DEFAULT_TELEGRAM_NOTIFICATION_MAX_RETRIES + 1):
+            try:
+                await self._telegram_bot.send_message(chat_id=chat_id, text=text)
+                return
+            except TelegramRetryAfter as e:  # pragma: no cover
+                logger.warning(f"Telegram rate limit exceeded for chat {chat_id}, retrying in {e.retry_after} seconds")
+                # Throttle every chat, since the global limit might have been exceeded as well
+                self._next_global_slot = max(self._next_global_slot, time.monotonic() + e.retry_after)
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                logger.error(f"Unexpected error sending Telegram notification to chat {chat_id} :: {str(e)}")
+                return
+        logger.error(f"Telegram notification to chat {chat_id} dropped after {attempt} attempts")  # pragma: no cover
@@ -3,18 +3,37 @@ from typing import Any
 from aiogram import Bot
 from aiogram.types import ReplyMarkupUnion
 
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.services.session_storage_service import SessionStorageService
 from crypto_trailing_stop.interfaces.dtos.login_dto import LoginDto
 from crypto_trailing_stop.interfaces.telegram.keyboards_builder import KeyboardsBuilder
+from crypto_trailing_stop.interfaces.telegram.services.telegram_notification_dispatcher import (
+    TelegramNotificationDispatcher,
+)
 
 
 class TelegramService:
     def __init__(
-        self, telegram_bot: Bot, session_storage_service: SessionStorageService, keyboards_builder: KeyboardsBuilder
+        self,
+        configuration_properties: ConfigurationProperties,
+        telegram_bot: Bot,
+        session_storage_service: SessionStorageService,
+        keyboards_builder: KeyboardsBuilder,
     ) -> None:
+        self._configuration_properties = configuration_properties
         self._telegram_bot = telegram_bot
         self._session_storage_service = session_storage_service
         self._keyboards_builder = keyboards_builder
+        self._notification_dispatcher = TelegramNotificationDispatcher(
+            telegram_bot,
+            workers=self._configuration_properties.telegram_notification_workers,
+            digest_window_seconds=self._configuration_properties.telegram_notification_digest_window_seconds,
+            per_chat_interval_seconds=self._configuration_properties.telegram_notification_per_chat_interval_seconds,
+            global_rate_limit_per_second=(
+                self._configuration_properties.telegram_notification_global_rate_limit_per_second
+            ),
+            max_pending_messages=self._configuration_properties.telegram_notification_max_pending_messages,
+        )
 
     async def perform_successful_login(self, login: LoginDto, userinfo: dict[str, Any]) -> None:
         """Sets the user as logged in by storing their information in the session."""
@@ -42,3 +61,18 @@ class TelegramService:
         await self._telegram_bot.send_message(
             chat_id=chat_id, text=text, reply_to_message_id=reply_to_message_id, reply_markup=reply_markup
         )
+
+    async def notify(self, chat_ids: list[str], text: str) -> None:
+        """Sends a notification to the given Telegram chats, in background when the dispatcher is enabled."""
+        if self._configuration_properties.telegram_notification_dispatcher_enabled:
+            for chat_id in chat_ids:
+                self._notification_dispatcher.enqueue(chat_id, text)
+        else:
+            for chat_id in chat_ids:
+                await self.send_message(chat_id=chat_id, text=text)
+
+    async def close(self) -> None:
+        """Sends the pending notifications, waiting for them at most the configured shutdown timeout."""
+        await self._notification_dispatcher.close(
+            timeout=self._configuration_properties.telegram_notification_shutdown_timeout_seconds
+        )
@@ -2,7 +2,8 @@ import asyncio
 import importlib
 import logging
 import sys
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager
 from inspect import isclass
 from os import listdir, path
@@ -16,8 +17,16 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.config.dependencies import get_application_container
-from crypto_trailing_stop.infrastructure.database import init_database
+from crypto_trailing_stop.infrastructure.database import close_database, init_database
 from crypto_trailing_stop.infrastructure.services.base import AbstractEventHandlerService
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService
+from crypto_trailing_stop.infrastructure.services.event_bus import (
+    SHARDING_LEADERSHIP_CHANGED_TOPIC,
+    EventBus,
+    EventOverflowPolicyEnum,
+)
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
+from crypto_trailing_stop.infrastructure.services.vo.sharding_leadership_change import ShardingLeadershipChange
 from crypto_trailing_stop.interfaces.controllers.health_controller import router as health_router
 from crypto_trailing_stop.interfaces.controllers.login_controller import router as login_router
 
@@ -28,62 +37,142 @@ logger = logging.getLogger(__name__)
 app: FastAPI | None = None
 
 
-def _load_modules_by_folder(root_folder: str, root_package: str, folder_name: str) -> None:
+def _get_module_names_by_folder(root_folder: str, root_package: str, folder_name: str) -> Generator[str]:
     if path.exists(root_folder) and path.isdir(root_folder):
         current_folder = path.join(root_folder, folder_name)
         if path.exists(current_folder) and path.isdir(current_folder):
             for filename in listdir(current_folder):
                 if path.isdir(path.join(current_folder, filename)):
-                    _load_modules_by_folder(
+                    yield from _get_module_names_by_folder(
                         root_folder=current_folder, root_package=f"{root_package}.{folder_name}", folder_name=filename
                     )
                 elif filename.endswith(".py") and filename != "__init__.py":
-                    module_name = f"{root_package}.{folder_name}.{filename[:-3]}"
-                    importlib.import_module(module_name)
+                    yield f"{root_package}.{folder_name}.{filename[:-3]}"
 
 
-def _load_telegram_commands() -> None:
+async def _load_telegram_commands() -> None:
     for layer_name in ["commands", "callbacks"]:
-        _load_modules_by_folder(
+        for module_name in _get_module_names_by_folder(
             root_folder=path.join(path.dirname(__file__), "interfaces", "telegram"),
             root_package=f"{__package__}.interfaces.telegram",
             folder_name=layer_name,
-        )
+        ):
+            importlib.import_module(module_name)
+            # XXX: [JMSOLA] Yield control between modules, so the protective jobs are not delayed meanwhile
+            await asyncio.sleep(0)
+
+
+def _configure_telegram_polling_by_leadership(
+    configuration_properties: ConfigurationProperties, dp: Dispatcher, telegram_bot: Bot, event_bus: EventBus
+) -> None:  # pragma: no cover
+    # NOTE: Telegram only allows a single getUpdates consumer per bot, so only the leader worker polls
+    async def _on_leadership_changed(leadership_change: ShardingLeadershipChange) -> None:
+        if leadership_change.is_leader:
+            logger.info("Leadership acquired. Starting Telegram polling...")
+            asyncio.create_task(dp.start_polling(telegram_bot))
+        else:
+            logger.info("Leadership lost. Stopping Telegram polling...")
+            await dp.stop_polling()
+
+    event_bus.subscribe(
+        SHARDING_LEADERSHIP_CHANGED_TOPIC,
+        _on_leadership_changed,
+        name="TelegramPollingByLeadership",
+        queue_size=configuration_properties.event_bus_queue_size,
+        # NOTE: Only the latest leadership of this worker matters, so it supersedes the pending one
+        overflow_policy=EventOverflowPolicyEnum.COALESCE,
+        coalesce_key=lambda leadership_change: leadership_change.worker_id,
+    )
+
+
+async def _load_non_critical_features(
+    app: FastAPI,
+    configuration_properties: ConfigurationProperties,
+    dp: Dispatcher,
+    event_bus: EventBus,
+    shard_lease_service: ShardLeaseService,
+) -> None:
+    started_at = time.perf_counter()
+    # Telegram commands and callbacks (e.g. Gemini, global summary) are loaded once the guard is already running
+    await _load_telegram_commands()
+    # Initialize Bot instance with default bot properties which will be passed to all API calls
+    # Telegram bot initialization
+    # And the run events dispatching
+    if configuration_properties.telegram_bot_enabled:  # pragma: no cover
+        telegram_bot: Bot = get_application_container().interfaces_container().telegram_container().telegram_bot()
+        if shard_lease_service.enabled:
+            _configure_telegram_polling_by_leadership(configuration_properties, dp, telegram_bot, event_bus)
+            if shard_lease_service.is_leader():
+                asyncio.create_task(dp.start_polling(telegram_bot))
+        else:
+            asyncio.create_task(dp.start_polling(telegram_bot))
+    app.state.non_critical_features_loaded = True
+    logger.info(f"Non-critical features loaded in {time.perf_counter() - started_at:.3f} seconds.")
 
 
 @asynccontextmanager
-async def _lifespan(_: FastAPI) -> AsyncGenerator[None]:
+async def _lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    started_at = time.perf_counter()
+    app.state.ready = False
+    app.state.non_critical_features_loaded = False
     application_container = get_application_container()
     configuration_properties: ConfigurationProperties = application_container.configuration_properties()
     dp: Dispatcher = application_container.interfaces_container().telegram_container().dispatcher()
     scheduler: BaseScheduler = application_container.infrastructure_container().tasks_container().scheduler()
+    event_bus: EventBus = application_container.infrastructure_container().event_bus()
+    shard_lease_service: ShardLeaseService = (
+        application_container.infrastructure_container().services_container().shard_lease_service()
+    )
 
     # Initialize database
     await init_database()
-    # Background task manager initialization
-    task_manager = await application_container.infrastructure_container().tasks_container().task_manager().load_tasks()
+    # Background task manager initialization, warming up the configuration caches and, when sharding is enabled,
+    # claiming the shards before the first job execution, so this worker knows its symbols in advance
+    task_manager, *_ = await asyncio.gather(
+        application_container.infrastructure_container().tasks_container().task_manager().load_tasks(),
+        *[
+            provider().warm_up()
+            for provider in application_container.infrastructure_container()
+            .services_container()
+            .traverse(types=[Singleton])
+            if isclass(provider.provides) and issubclass(provider.provides, AbstractCachedConfigurationService)
+        ],
+        *([shard_lease_service.heartbeat()] if shard_lease_service.enabled else []),
+    )
     logger.info(f"{len(task_manager.get_tasks())} jobs have been loaded!")
-    # Initialize Bot instance with default bot properties which will be passed to all API calls
-    # Telegram bot initialization
-    # And the run events dispatching
-    if configuration_properties.telegram_bot_enabled:  # pragma: no cover
-        telegram_bot: Bot = application_container.interfaces_container().telegram_container().telegram_bot()
-        asyncio.create_task(dp.start_polling(telegram_bot))
     if configuration_properties.background_tasks_enabled:
         scheduler.start()
-    # Configure pyee listeners
+    # Subscribe the event handlers to the event bus
     for provider in application_container.infrastructure_container().services_container().traverse(types=[Singleton]):
         if isclass(provider.provides) and issubclass(provider.provides, AbstractEventHandlerService):
             dependency_object = provider()
             dependency_object.configure()
-    logger.info("Application startup complete.")
+    # NOTE: From now on, protective jobs are able to run, so the application is ready
+    app.state.ready = True
+    app.state.startup_duration_seconds = time.perf_counter() - started_at
+    logger.info(f"Application startup complete in {app.state.startup_duration_seconds:.3f} seconds.")
+    non_critical_features_task = asyncio.create_task(
+        _load_non_critical_features(app, configuration_properties, dp, event_bus, shard_lease_service)
+    )
     # Yield control back to the FastAPI apps
     yield
     # Cleanup on shutdown
-    if configuration_properties.telegram_bot_enabled:  # pragma: no cover
+    non_critical_features_task.cancel()
+    if configuration_properties.telegram_bot_enabled and shard_lease_service.is_leader():  # pragma: no cover
         asyncio.create_task(dp.stop_polling())
     if configuration_properties.background_tasks_enabled:
         scheduler.shutdown()
+    # Handle the pending events, since their handlers store market signals and trigger buy actions
+    await event_bus.close(timeout=configuration_properties.event_bus_shutdown_timeout_seconds)
+    # Flush the market signals which are still pending to be written, before closing the database
+    await application_container.infrastructure_container().services_container().market_signal_service().close()
+    await application_container.infrastructure_container().services_container().market_history_archive_service().flush()
+    # Deliver the notifications which are still pending to be sent
+    await application_container.interfaces_container().telegram_container().telegram_service().close()
+    # Give back the leases, so the rest of workers can rebalance right away instead of waiting for expiration
+    if shard_lease_service.enabled:  # pragma: no cover
+        await shard_lease_service.release_all()
+    await close_database()
     logger.info("Application shutdown complete.")
 
 
@@ -116,8 +205,7 @@ def _boostrap_app() -> None:
     # Include other routers here
     # e.g., app.include_router(other_router)
 
-    # Load Telegram commands dynamically
-    _load_telegram_commands()
+    # NOTE: Telegram commands are loaded dynamically in background, once the application is ready
 
 
 def main() -> FastAPI:
@@ -0,0 +1,106 @@
+import logging
+from datetime import UTC, datetime
+from os import makedirs, path, rename
+from typing import Any
+from urllib.parse import quote
+from uuid import uuid4
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from crypto_trailing_stop.scripts.constants import DEFAULT_CANDLES_FOLDER_PATH
+
+logger = logging.getLogger(__name__)
+
+CANDLES_SCHEMA = pa.schema(
+    [
+        ("timestamp", pa.int64()),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ]
+)
+
+
+class CandleStore:
+    """
+    Parquet dataset of downloaded candles, partitioned by exchange, symbol and timeframe (Hive layout).
+    Every download is appended as a new part file, so the stored history is never rewritten.
+    """
+
+    def __init__(self, folder_path: str = DEFAULT_CANDLES_FOLDER_PATH) -> None:
+        self._folder_path = folder_path
+
+    def get_timestamp_bounds(self, *, exchange: str, symbol: str, timeframe: str) -> tuple[int, int] | None:
+        """
+        First and last stored candle timestamps (in milliseconds), or None if nothing is stored yet.
+        """
+        dataset = self._get_dataset(exchange=exchange, symbol=symbol, timeframe=timeframe)
+        if dataset is None:
+            return None
+        min_max = pc.min_max(dataset.to_table(columns=["timestamp"])["timestamp"]).as_py()
+        ret = (min_max["min"], min_max["max"]) if min_max["min"] is not None else None
+        return ret
+
+    def append(self, ohlcv: list[list[Any]], *, exchange: str, symbol: str, timeframe: str) -> None:
+        if not ohlcv:
+            return
+        partition_folder_path = self._get_partition_folder_path(exchange=exchange, symbol=symbol, timeframe=timeframe)
+        makedirs(partition_folder_path, exist_ok=True)
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(zip(*ohlcv), CANDLES_SCHEMA, strict=True)],
+            schema=CANDLES_SCHEMA,
+        )
+        filename = f"part-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}-{uuid4().hex}.parquet"
+        tmp_filepath = path.join(partition_folder_path, f".{filename}.tmp")
+        pq.write_table(table.sort_by("timestamp"), tmp_filepath, compression="zstd")
+        rename(tmp_filepath, path.join(partition_folder_path, filename))
+        logger.info(f"💾 {len(ohlcv)} candles appended to {partition_folder_path}")
+
+    def load(self, *, exchange: str, symbol: str, timeframe: str, since: datetime | None = None) -> pd.DataFrame:
+        """
+        Stored candles sorted by timestamp (as UTC datetimes). When the same candle has been downloaded
+        more than once (e.g. the last one, which was still open), the most recently downloaded one wins.
+        """
+        dataset = self._get_dataset(exchange=exchange, symbol=symbol, timeframe=timeframe)
+        if dataset is None:
+            raise FileNotFoundError(
+                f"No {timeframe} candles of {symbol} from {exchange} found in '{self._folder_path}'"
+            )
+        expression = ds.field("timestamp") >= int(since.timestamp() * 1000) if since else None
+        # NOTE: Part files are named after their download time, so their order is the download order
+        fragments = sorted(dataset.get_fragments(filter=expression), key=lambda fragment: fragment.path)
+        ret = (
+            pd.concat(
+                [fragment.to_table(filter=expression, schema=CANDLES_SCHEMA).to_pandas() for fragment in fragments],
+                ignore_index=True,
+            )
+            if fragments
+            else CANDLES_SCHEMA.empty_table().to_pandas()
+        )
+        ret = ret.drop_duplicates(subset="timestamp", keep="last").sort_values("timestamp").dropna()
+        ret["timestamp"] = pd.to_datetime(ret["timestamp"], unit="ms", utc=True)
+        ret.reset_index(drop=True, inplace=True)
+        return ret
+
+    def _get_dataset(self, *, exchange: str, symbol: str, timeframe: str) -> ds.Dataset | None:
+        partition_folder_path = self._get_partition_folder_path(exchange=exchange, symbol=symbol, timeframe=timeframe)
+        if not path.exists(partition_folder_path):
+            return None
+        # NOTE: Hidden temporary files (see append) are ignored by default
+        ret = ds.dataset(partition_folder_path, schema=CANDLES_SCHEMA, format="parquet")
+        return ret
+
+    def _get_partition_folder_path(self, *, exchange: str, symbol: str, timeframe: str) -> str:
+        # NOTE: Symbols are URI encoded (e.g. ETH/EUR -> ETH%2FEUR), as expected by the Hive partitioning
+        return path.join(
+            self._folder_path,
+            f"exchange={exchange.lower()}",
+            f"symbol={quote(symbol.upper(), safe='')}",
+            f"timeframe={timeframe}",
+        )
@@ -0,0 +1,127 @@
+import logging
+import shutil
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from os import listdir, makedirs, path, rename
+from types import TracebackType
+from typing import Self
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from crypto_trailing_stop.scripts.constants import (
+    DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUP_SIZE,
+    DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUPS_PER_FILE,
+)
+from crypto_trailing_stop.scripts.serde import BacktestResultSerde
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+
+logger = logging.getLogger(__name__)
+
+_KEY_COLUMN_NAME = "key"
+
+
+class ResearchCheckpoint:
+    """
+    Folder of Parquet files where research results are streamed in row groups while they are run,
+    keyed by the same content hash as the results cache, so an interrupted research resumes from them.
+    """
+
+    def __init__(
+        self,
+        folder_path: str,
+        *,
+        row_group_size: int = DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUP_SIZE,
+        row_groups_per_file: int = DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUPS_PER_FILE,
+    ) -> None:
+        self._folder_path = folder_path
+        self._row_group_size = row_group_size
+        self._row_groups_per_file = row_groups_per_file
+        self._serde = BacktestResultSerde()
+        self._pending_results_by_key: dict[str, BacktestingExecutionResult] = {}
+        self._writer: pq.ParquetWriter | None = None
+        self._writer_filepath: str | None = None
+        self._writer_row_groups = 0
+
+    def load(self, keys: Iterable[str] | None = None) -> dict[str, BacktestingExecutionResult]:
+        """
+        Checkpointed results of the given keys (all of them by default).
+        """
+        ret: dict[str, BacktestingExecutionResult] = {}
+        if not path.exists(self._folder_path):
+            return ret
+        requested_keys = set(keys) if keys is not None else None
+        for filename in sorted(listdir(self._folder_path)):
+            # NOTE: Hidden files are still being written (or were, when the process was killed)
+            if filename.startswith(".") or not filename.endswith(".parquet"):
+                continue
+            with pq.ParquetFile(path.join(self._folder_path, filename)) as parquet_file:
+                for row_group in range(parquet_file.num_row_groups):
+                    ret.update(self._load_row_group(parquet_file, row_group, requested_keys=requested_keys))
+        logger.info(f"♻️ {len(ret)} results loaded from the checkpoint {self._folder_path}")
+        return ret
+
+    def write(self, key: str, result: BacktestingExecutionResult) -> None:
+        self._pending_results_by_key[key] = result
+        if len(self._pending_results_by_key) >= self._row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_results_by_key:
+            return
+        pending_results_by_key, self._pending_results_by_key = self._pending_results_by_key, {}
+        table = self._serde.to_table(list(pending_results_by_key.values())).append_column(
+            _KEY_COLUMN_NAME, pa.array(list(pending_results_by_key.keys()), type=pa.string())
+        )
+        if self._writer is None:
+            makedirs(self._folder_path, exist_ok=True)
+            filename = f"part-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}-{uuid4().hex}.parquet"
+            self._writer_filepath = path.join(self._folder_path, filename)
+            self._writer = pq.ParquetWriter(self._get_tmp_filepath(self._writer_filepath), table.schema)
+        # Every flush is written as a row group
+        self._writer.write_table(table)
+        self._writer_row_groups += 1
+        # XXX: [JMSOLA] Parquet files can only be read once their footer has been written on close,
+        #      so files are rotated, bounding what is lost if the process is killed
+        if self._writer_row_groups >= self._row_groups_per_file:
+            self._close_writer()
+
+    def close(self) -> None:
+        self.flush()
+        self._close_writer()
+
+    def remove(self) -> None:
+        self.close()
+        shutil.rmtree(self._folder_path, ignore_errors=True)
+
+    def _load_row_group(
+        self, parquet_file: pq.ParquetFile, row_group: int, *, requested_keys: set[str] | None
+    ) -> dict[str, BacktestingExecutionResult]:
+        # XXX: [JMSOLA] Only the keys are read to find out the requested rows, so the whole results
+        #      are only read and deserialised for the row groups with any of them
+        keys = parquet_file.read_row_group(row_group, columns=[_KEY_COLUMN_NAME]).column(_KEY_COLUMN_NAME).to_pylist()
+        indices = [index for index, key in enumerate(keys) if requested_keys is None or key in requested_keys]
+        if not indices:
+            return {}
+        table = parquet_file.read_row_group(row_group).take(indices)
+        ret = dict(zip([keys[index] for index in indices], self._serde.from_table(table), strict=True))
+        return ret
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            rename(self._get_tmp_filepath(self._writer_filepath), self._writer_filepath)
+            self._writer, self._writer_filepath, self._writer_row_groups = None, None, 0
+
+    def _get_tmp_filepath(self, filepath: str) -> str:
+        return path.join(path.dirname(filepath), f".{path.basename(filepath)}.tmp")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        # NOTE: Closed on errors as well (e.g. Ctrl-C), so the results run so far are kept
+        self.close()
@@ -1,6 +1,7 @@
 import dataclasses
 import os
 import warnings
+from datetime import datetime
 from pathlib import Path
 from typing import get_args
 
@@ -11,10 +12,22 @@ import typer
 from faker import Faker
 
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
-from crypto_trailing_stop.scripts.constants import DEFAULT_MONTHS_BACK, SECOND_ITERATION_DECENT_WIN_RATE_THRESHOLD
+from crypto_trailing_stop.scripts.constants import (
+    DEFAULT_MONTHS_BACK,
+    DEFAULT_RESEARCH_CHUNK_SIZE,
+    DEFAULT_RESEARCH_MAX_CHUNKS_PER_WORKER,
+    DEFAULT_SUCCESSIVE_HALVING_REDUCTION_FACTOR,
+    DEFAULT_SUCCESSIVE_HALVING_RUNGS,
+    SECOND_ITERATION_DECENT_WIN_RATE_THRESHOLD,
+)
 from crypto_trailing_stop.scripts.services import BacktestingCliService
 from crypto_trailing_stop.scripts.utils import echo_backtesting_execution_result
-from crypto_trailing_stop.scripts.vo import TakeProfitFilter
+from crypto_trailing_stop.scripts.vo import (
+    ResearchExecutorConfig,
+    ResearchSearchStrategy,
+    SuccessiveHalvingConfig,
+    TakeProfitFilter,
+)
 
 warnings.filterwarnings("ignore")
 
@@ -49,21 +62,17 @@ def download_data(
     months_back: int = typer.Option(DEFAULT_MONTHS_BACK, help="The number of months of data to download."),
 ):
     """
-    Downloads the last 1 year of 1H historical data for a symbol and saves it to data/candles.
+    Downloads the missing historical candles of a symbol and appends them to the Parquet dataset in data/candles.
     """
     symbol = symbol.strip().upper()
     try:
-        typer.secho(f"📥 Starting download for {exchange.upper()} :: {symbol} on 1h timeframe...", fg=typer.colors.BLUE)
-        all_ohlcv = backtesting_cli_service.download_backtesting_data(
+        typer.secho(
+            f"📥 Starting download for {exchange.upper()} :: {symbol} on {timeframe} timeframe...", fg=typer.colors.BLUE
+        )
+        downloaded_candles = backtesting_cli_service.download_backtesting_data(
             symbol, exchange, timeframe, months_back, echo_fn=typer.secho
         )
-        typer.secho(f"✅ Download complete. {len(all_ohlcv)} candles fetched.", fg=typer.colors.GREEN)
-        if all_ohlcv:
-            df = pd.DataFrame(all_ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-            os.makedirs("data/candles", exist_ok=True)
-            filename = f"data/candles/{symbol.replace('/', '_')}.csv"
-            df.to_csv(filename, index=False)
-            typer.echo(f"💾 Data saved to '{filename}'")
+        typer.secho(f"✅ Download complete. {downloaded_candles} candles fetched.", fg=typer.colors.GREEN)
     except Exception as e:
         typer.secho(f"❌ Error downloading data: {e}", fg=typer.colors.RED)
 
@@ -99,11 +108,7 @@ def backtesting(
     symbol = symbol.strip().upper()
     # Create the config object from the CLI options
     try:
-        data_file = f"data/candles/{symbol.replace('/', '_')}.csv"
-        df = pd.read_csv(data_file)
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df.dropna(inplace=True)
-        df.reset_index(drop=True, inplace=True)
+        df = backtesting_cli_service.load_backtesting_data(symbol, exchange, timeframe)
 
         typer.echo(f"📊 {len(df)} candles loaded. Calculating indicators and signals...")
 
@@ -147,9 +152,9 @@ def backtesting(
         echo_backtesting_execution_result(current_execution_result)
         if show_plot:
             bt.plot()
-    except FileNotFoundError:
-        typer.secho(f"❌ Error: Data file '{data_file}' not found.", fg=typer.colors.RED)
-        typer.echo(f"👉 Please run 'cli download-data {symbol}' first.")
+    except FileNotFoundError as e:
+        typer.secho(f"❌ Error: {e}.", fg=typer.colors.RED)
+        typer.echo(f"👉 Please run 'cli download-data {symbol} --exchange={exchange} --timeframe={timeframe}' first.")
         raise typer.Exit()
 
 
@@ -177,8 +182,39 @@ def research(
     from_parquet: Path = typer.Option(
         None, "--from-parquet", help="Path to a Parquet file with precomputed backtesting results (skips execution)."
     ),
+    from_results_store: bool = typer.Option(
+        False,
+        "--from-results-store",
+        help="Select the best parameters among the stored research runs of the symbol (skips execution).",
+    ),
+    results_since: datetime = typer.Option(
+        None, formats=["%Y-%m-%d"], help="With --from-results-store, only the research runs since this date."
+    ),
     download_candles: bool = typer.Option(True, help="Download data before running the research."),
     disable_progress_bar: bool = typer.Option(False, help="Disable the progress bar."),
+    workers: int = typer.Option(None, help="Number of worker processes, defaults to the number of CPUs."),
+    chunk_size: int = typer.Option(
+        DEFAULT_RESEARCH_CHUNK_SIZE, help="Number of combinations dispatched at once to a worker."
+    ),
+    max_chunks_per_worker: int = typer.Option(
+        DEFAULT_RESEARCH_MAX_CHUNKS_PER_WORKER,
+        help="Number of chunks a worker processes before being replaced (0 means never).",
+    ),
+    use_results_cache: bool = typer.Option(
+        True, help="Reuse the results of combinations already run on the same candles and strategy code."
+    ),
+    search: str = typer.Option(
+        "grid",
+        "--search",
+        help="Search strategy: 'grid' (default, two iterations over the cartesian product) or 'successive-halving'.",
+        case_sensitive=False,
+        click_type=click.Choice(list(get_args(ResearchSearchStrategy)), case_sensitive=False),
+    ),
+    reduction_factor: int = typer.Option(
+        DEFAULT_SUCCESSIVE_HALVING_REDUCTION_FACTOR,
+        help="Successive halving: only the best 1/N candidates are promoted to the next rung.",
+    ),
+    rungs: int = typer.Option(DEFAULT_SUCCESSIVE_HALVING_RUNGS, help="Successive halving: number of rungs."),
 ):
     """
     Runs a research process to find the best parameters for a symbol, using local data.
@@ -186,14 +222,10 @@ def research(
     symbol = symbol.strip().upper()
     try:
         df: pd.DataFrame | None = None
-        if from_parquet is None:
+        if from_parquet is None and not from_results_store:
             if download_candles:
                 download_data(symbol=symbol, exchange=exchange, timeframe=timeframe, months_back=months_back)
-            data_file = f"data/candles/{symbol.replace('/', '_')}.csv"
-            df = pd.read_csv(data_file)
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-            df.dropna(inplace=True)
-            df.reset_index(drop=True, inplace=True)
+            df = backtesting_cli_service.load_backtesting_data(symbol, exchange, timeframe, months_back=months_back)
 
         typer.secho("--- ⚙️ Research Parameters ---", fg=typer.colors.BLUE, bold=True)
         typer.echo(f"Symbol:                      {symbol}")
@@ -208,7 +240,18 @@ def research(
         typer.echo(f"Min SQN:                     {min_sqn if min_sqn is not None else 'N/A'}")
         typer.echo(f"Take Profit Filter:          {tp_filter}")
         typer.echo(f"From Parquet:                {from_parquet if from_parquet is not None else 'No'}")
+        typer.echo(f"From Results Store:          {from_results_store}")
+        if from_results_store:
+            typer.echo(f"Results Since:               {results_since.date() if results_since is not None else 'All'}")
         typer.echo(f"Download Candles:            {download_candles}")
+        typer.echo(f"Workers:                     {workers if workers is not None else 'All CPUs'}")
+        typer.echo(f"Chunk Size:                  {chunk_size}")
+        typer.echo(f"Max Chunks per Worker:       {max_chunks_per_worker or 'Unlimited'}")
+        typer.echo(f"Use Results Cache:           {use_results_cache}")
+        typer.echo(f"Search Strategy:             {search}")
+        if search == "successive-halving":
+            typer.echo(f"Reduction Factor:            {reduction_factor}")
+            typer.echo(f"Rungs:                       {rungs}")
         typer.secho("-----------------------------", fg=typer.colors.BLUE, bold=True)
 
         execution_summary = backtesting_cli_service.find_out_best_parameters(
@@ -225,7 +268,15 @@ def research(
             tp_filter=tp_filter,
             df=df,
             from_parquet=from_parquet,
+            from_results_store=from_results_store,
+            results_since=results_since.date() if results_since is not None else None,
             disable_progress_bar=disable_progress_bar,
+            research_executor_config=ResearchExecutorConfig(
+                workers=workers, chunk_size=chunk_size, max_chunks_per_worker=max_chunks_per_worker or None
+            ),
+            use_results_cache=use_results_cache,
+            search_strategy=search,
+            successive_halving_config=SuccessiveHalvingConfig(reduction_factor=reduction_factor, rungs=rungs),
             echo_fn=typer.secho,
         )
         # Print the summary
@@ -242,10 +293,60 @@ def research(
                     typer.secho(f"\n--- {symbol.upper()} 🏆 Champion: {pydash.start_case(field.name)} ---")
                     echo_backtesting_execution_result(value)
 
-    except FileNotFoundError:
-        typer.secho(f"❌ Error: Data file '{data_file}' not found.", fg=typer.colors.RED)
-        typer.echo(f"👉 Please run 'cli download-data {symbol}' first.")
+    except FileNotFoundError as e:
+        typer.secho(f"❌ Error: {e}.", fg=typer.colors.RED)
+        typer.echo(f"👉 Please run 'cli download-data {symbol} --exchange={exchange} --timeframe={timeframe}' first.")
+        raise typer.Exit()
+
+
+@app.command()
+def query_results(
+    symbol: str = typer.Argument(None, help="The symbol to query, e.g., ETH/EUR (all of them by default)"),
+    exchange: str = typer.Option(None, help="The name of the exchange (all of them by default)."),
+    timeframe: str = typer.Option(None, help="The timeframe (all of them by default)."),
+    since: datetime = typer.Option(None, formats=["%Y-%m-%d"], help="Only the research runs since this date."),
+    until: datetime = typer.Option(None, formats=["%Y-%m-%d"], help="Only the research runs until this date."),
+    only_profitable: bool = typer.Option(True, help="Only the results with a positive net profit."),
+    min_trades: int = typer.Option(None, help="Minimum number of trades."),
+    min_win_rate: float = typer.Option(None, help="Minimum win rate."),
+    max_drawdown: float = typer.Option(None, help="Deepest max. drawdown allowed, as a positive percentage."),
+    tp_filter: str = typer.Option(
+        "all",
+        "--tp-filter",
+        help="Filter results by Take Profit: 'all' (default), 'enabled', or 'disabled'.",
+        case_sensitive=False,
+        click_type=click.Choice(list(get_args(TakeProfitFilter)), case_sensitive=False),
+    ),
+    columns: str = typer.Option(
+        None, help="Comma separated columns to show, e.g., parameters.adx_threshold,win_rate (all by default)."
+    ),
+    sort_by: str = typer.Option("net_profit_amount", help="Column to sort the results by, descending."),
+    limit: int = typer.Option(20, help="Maximum number of results to show."),
+):
+    """
+    Queries the results of the research runs stored in data/backtesting/results.
+    """
+    selected_columns = [column.strip() for column in columns.split(",")] if columns else None
+    if selected_columns is not None and sort_by not in selected_columns:
+        selected_columns.append(sort_by)
+    table = backtesting_cli_service.query_research_results(
+        symbol=symbol.strip().upper() if symbol else None,
+        exchange=exchange,
+        timeframe=timeframe,
+        since=since.date() if since is not None else None,
+        until=until.date() if until is not None else None,
+        only_profitable=only_profitable,
+        min_trades=min_trades,
+        min_win_rate=min_win_rate,
+        max_drawdown_percentage=max_drawdown,
+        tp_filter=tp_filter,
+        columns=selected_columns,
+    )
+    if table.num_rows <= 0:
+        typer.secho("❌ No research results match the given filters.", fg=typer.colors.RED)
         raise typer.Exit()
+    typer.secho(f"🔎 {table.num_rows} research results found", fg=typer.colors.GREEN)
+    typer.echo(table.to_pandas().nlargest(limit, sort_by).to_string(index=False))
 
 
 if __name__ == "__main__":
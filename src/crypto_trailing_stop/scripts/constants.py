@@ -25,3 +25,27 @@ MAX_VOLUME_THRESHOLD_VALUES_FIRST_ITERATION = [
     for max_volume_threshold in np.arange(2.5, 4.5, MAX_VOLUME_THRESHOLD_STEP_FIRST_ITERATION).tolist()
 ]
 ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS = 15
+
+# Research executor
+DEFAULT_RESEARCH_CHUNK_SIZE = 16
+DEFAULT_RESEARCH_MAX_CHUNKS_PER_WORKER = 64
+
+# Candles download
+DEFAULT_CANDLES_FOLDER_PATH = "data/candles"
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 8
+
+# Backtesting results cache
+DEFAULT_BACKTESTING_RESULTS_CACHE_FILEPATH = "data/backtesting/cache/results.sqlite"
+
+# Successive halving search
+DEFAULT_SUCCESSIVE_HALVING_REDUCTION_FACTOR = 3
+DEFAULT_SUCCESSIVE_HALVING_RUNGS = 3
+
+# Research checkpoints
+DEFAULT_RESEARCH_CHECKPOINTS_FOLDER_PATH = "data/backtesting/checkpoints"
+DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUP_SIZE = 256
+DEFAULT_RESEARCH_CHECKPOINT_ROW_GROUPS_PER_FILE = 16
+
+# Research results store
+DEFAULT_RESEARCH_RESULTS_FOLDER_PATH = "data/backtesting/results"
+DEFAULT_RESEARCH_RESULTS_ROW_GROUP_SIZE = 16_384
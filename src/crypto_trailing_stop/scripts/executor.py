@@ -0,0 +1,87 @@
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from itertools import batched
+from types import TracebackType
+from typing import Any, Self
+
+from tqdm import tqdm
+
+from crypto_trailing_stop.scripts.jobs import initialize_research_worker, run_chunk
+from crypto_trailing_stop.scripts.vo import ResearchExecutorConfig
+
+
+class ResearchExecutor:
+    """
+    Pool of research worker processes. Every worker initializes its service graph once,
+    combinations are dispatched in chunks, and workers are replaced after a number of chunks,
+    so any memory they might have piled up is given back.
+    """
+
+    def __init__(self, research_executor_config: ResearchExecutorConfig) -> None:
+        self._chunk_size = research_executor_config.chunk_size
+        # XXX: [JMSOLA] multiprocessing.Pool instead of ProcessPoolExecutor, since the latter might deadlock
+        #      when replacing its workers (max_tasks_per_child) on some CPython releases
+        self._pool = multiprocessing.get_context("spawn").Pool(
+            processes=research_executor_config.workers,
+            initializer=initialize_research_worker,
+            maxtasksperchild=research_executor_config.max_chunks_per_worker,
+        )
+
+    def starmap[R](
+        self,
+        fn: Callable[..., R],
+        iterable: Iterable[tuple[Any, ...]],
+        *,
+        chunk_size: int | None = None,
+        disable_progress_bar: bool = False,
+    ) -> list[R]:
+        """
+        Equivalent of itertools.starmap, returning the results in the same order as the arguments.
+        """
+        args_list = list(iterable)
+        ret = list(
+            self.istarmap(
+                fn, args_list, total=len(args_list), chunk_size=chunk_size, disable_progress_bar=disable_progress_bar
+            )
+        )
+        return ret
+
+    def istarmap[R](
+        self,
+        fn: Callable[..., R],
+        iterable: Iterable[tuple[Any, ...]],
+        *,
+        total: int | None = None,
+        chunk_size: int | None = None,
+        disable_progress_bar: bool = False,
+    ) -> Iterator[R]:
+        """
+        Lazy equivalent of starmap, which yields the results in the same order as the arguments
+        as soon as they are ready, instead of waiting for all of them.
+        """
+        chunk_size = chunk_size or self._chunk_size
+        with tqdm(total=total, disable=disable_progress_bar) as progress_bar:
+            # NOTE: imap yields the results of every chunk in order, while the rest of them are still running
+            for chunk_results in self._pool.imap(partial(run_chunk, fn), map(list, batched(iterable, chunk_size))):
+                progress_bar.update(len(chunk_results))
+                yield from chunk_results
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -1,40 +1,93 @@
+import logging
+import warnings
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
 import pandas as pd
 
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.shared_frames import SharedFrame
 from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
 
+if TYPE_CHECKING:
+    from crypto_trailing_stop.scripts.services import BacktestingCliService
+
+logger = logging.getLogger(__name__)
+
+# NOTE: Service graph of the current worker process, built once and reused by all the combinations it runs
+_backtesting_cli_service: "BacktestingCliService | None" = None
+
+
+def initialize_research_worker() -> None:
+    """
+    Initializes a research worker process, so the imports and the service graph are paid once per process.
+    """
+    warnings.filterwarnings("ignore")
+    _get_backtesting_cli_service()
+
+
+def run_chunk[R](fn: Callable[..., R], args_list: list[tuple[Any, ...]]) -> list[R]:
+    """
+    Runs a chunk of jobs within the same worker process, so they are dispatched all at once.
+    """
+    ret = [fn(*args) for args in args_list]
+    return ret
+
 
 def run_single_backtest_combination(
     exchange: str,
     simulated_bs_config: BuySellSignalsConfigItem,
     initial_cash: float,
-    df: pd.DataFrame,
+    df: pd.DataFrame | SharedFrame,
     timeframe: str = "1h",
+    *,
+    indicators_calculated: bool = False,
+    warmup_bars: int = 0,
 ) -> BacktestingExecutionResult | None:
     """
     Runs a single backtest for one combination of parameters. Designed to be called in parallel.
     """
-    import logging
-    import warnings
-
-    from crypto_trailing_stop.scripts.services import BacktestingCliService
-
     warnings.filterwarnings("ignore")
-    logger = logging.getLogger(__name__)
-
-    backtesting_cli_service = BacktestingCliService()
     ret: BacktestingExecutionResult | None = None
     try:
-        # We use df.copy() to ensure each process gets its own data
-        ret, *_ = backtesting_cli_service.execute_backtesting(
+        ret = _get_backtesting_cli_service().simulate_backtesting(
             exchange=exchange,
             simulated_bs_config=simulated_bs_config,
             initial_cash=initial_cash,
-            df=df.copy(),
+            df=_get_own_frame(df),
             timeframe=timeframe,
-            use_tqdm=False,
+            indicators_calculated=indicators_calculated,
+            warmup_bars=warmup_bars,
         )
     except Exception as e:
         # We use echo_fn for thread-safe printing if needed
         logger.warning(f"Backtest failed for params {simulated_bs_config}: {e}", exc_info=True)
     return ret
+
+
+def calculate_indicators_frame(
+    simulated_bs_config: BuySellSignalsConfigItem, df: SharedFrame, directory: str
+) -> SharedFrame:
+    """
+    Calculates the indicators frame shared by every combination with the same indicators parameters,
+    publishing it into the given directory. Designed to be called in parallel.
+    """
+    indicators_df = _get_backtesting_cli_service().calculate_indicators(_get_own_frame(df), simulated_bs_config)
+    ret = SharedFrame.publish(indicators_df, directory)
+    return ret
+
+
+def _get_backtesting_cli_service() -> "BacktestingCliService":
+    global _backtesting_cli_service
+    if _backtesting_cli_service is None:
+        # XXX: [JMSOLA] Imported here, since the services module depends on this one
+        from crypto_trailing_stop.scripts.services import BacktestingCliService
+
+        _backtesting_cli_service = BacktestingCliService()
+    return _backtesting_cli_service
+
+
+def _get_own_frame(df: pd.DataFrame | SharedFrame) -> pd.DataFrame:
+    # NOTE: Either way, changes made by the backtest are not visible to the rest of the workers
+    ret = df.attach() if isinstance(df, SharedFrame) else df.copy()
+    return ret
@@ -0,0 +1,158 @@
+import ast
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import cached_property
+from glob import glob
+from importlib import import_module
+from importlib.metadata import version
+from importlib.util import find_spec
+from os import makedirs, path
+
+import pandas as pd
+
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.constants import DEFAULT_BACKTESTING_RESULTS_CACHE_FILEPATH
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+
+logger = logging.getLogger(__name__)
+
+# NOTE: Package whose code, along with the project modules it imports, the backtesting results depend on,
+#       so changing any of them invalidates the cache
+_STRATEGY_CODE_PACKAGE_NAME = "crypto_trailing_stop.scripts"
+# NOTE: Libraries the backtesting results depend on (indicators, frames and the simulator itself)
+_STRATEGY_LIBRARY_NAMES = ["backtesting", "numpy", "pandas", "ta"]
+
+
+class BacktestResultCache:
+    """
+    Content-addressed cache of backtesting results, stored as a local SQLite index.
+    Results are keyed by the hash of the candles, the strategy code version and the full parameters,
+    so changing any of them is a cache miss and stale results are never returned.
+    """
+
+    def __init__(self, filepath: str = DEFAULT_BACKTESTING_RESULTS_CACHE_FILEPATH) -> None:
+        self._filepath = filepath
+
+    @cached_property
+    def strategy_code_version(self) -> str:
+        sha256 = hashlib.sha256()
+        for filepath in self._get_strategy_code_filepaths():
+            with open(filepath, "rb") as module_file:
+                sha256.update(module_file.read())
+        for library_name in _STRATEGY_LIBRARY_NAMES:
+            sha256.update(f"{library_name}=={version(library_name)}".encode())
+        ret = sha256.hexdigest()
+        return ret
+
+    def get_candles_hash(self, df: pd.DataFrame) -> str:
+        sha256 = hashlib.sha256(",".join(map(str, df.columns)).encode())
+        sha256.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        ret = sha256.hexdigest()
+        return ret
+
+    def get_key(
+        self,
+        *,
+        candles_hash: str,
+        exchange: str,
+        initial_cash: float,
+        timeframe: str,
+        simulated_bs_config: BuySellSignalsConfigItem,
+        warmup_bars: int = 0,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "candles": candles_hash,
+                "code": self.strategy_code_version,
+                "exchange": exchange,
+                "initial_cash": initial_cash,
+                "timeframe": timeframe,
+                "parameters": asdict(simulated_bs_config),
+                "warmup_bars": warmup_bars,
+            },
+            sort_keys=True,
+        )
+        ret = hashlib.sha256(payload.encode()).hexdigest()
+        return ret
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, BacktestingExecutionResult]:
+        keys = list(keys)
+        ret: dict[str, BacktestingExecutionResult] = {}
+        if not keys or not path.exists(self._filepath):
+            return ret
+        with self._connect() as connection:
+            connection.execute("CREATE TEMPORARY TABLE requested_keys (key TEXT PRIMARY KEY)")
+            connection.executemany("INSERT OR IGNORE INTO requested_keys VALUES (?)", [(key,) for key in keys])
+            rows = connection.execute(
+                "SELECT results.key, results.result FROM results JOIN requested_keys USING (key)"
+            ).fetchall()
+        for key, result in rows:
+            result_data = json.loads(result)
+            ret[key] = BacktestingExecutionResult(
+                parameters=BuySellSignalsConfigItem(**result_data.pop("parameters")), **result_data
+            )
+        return ret
+
+    def put_many(self, results_by_key: dict[str, BacktestingExecutionResult]) -> None:
+        if not results_by_key:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                # NOTE: Metrics might be numpy scalars, which are stored as their Python counterparts
+                [
+                    (key, json.dumps(asdict(result), default=lambda value: value.item()))
+                    for key, result in results_by_key.items()
+                ],
+            )
+        logger.info(f"💾 {len(results_by_key)} results stored in the cache {self._filepath}")
+
+    def _get_strategy_code_filepaths(self) -> list[str]:
+        package_folder_path = path.dirname(import_module(_STRATEGY_CODE_PACKAGE_NAME).__file__)
+        package_filepaths = sorted(glob(path.join(package_folder_path, "*.py")))
+        imported_filepaths: set[str] = set()
+        for package_filepath in package_filepaths:
+            with open(package_filepath, "rb") as module_file:
+                tree = ast.parse(module_file.read())
+            for node in ast.walk(tree):
+                if isinstance(node, ast.ImportFrom) and node.module:
+                    # NOTE: Imported names might be modules as well (e.g. from package import module)
+                    module_names = [node.module, *[f"{node.module}.{alias.name}" for alias in node.names]]
+                elif isinstance(node, ast.Import):
+                    module_names = [alias.name for alias in node.names]
+                else:
+                    continue
+                imported_filepaths.update(
+                    filepath
+                    for module_name in module_names
+                    if module_name.startswith("crypto_trailing_stop.")
+                    and (filepath := self._find_module_filepath(module_name)) is not None
+                )
+        ret = [*package_filepaths, *sorted(imported_filepaths.difference(package_filepaths))]
+        return ret
+
+    def _find_module_filepath(self, module_name: str) -> str | None:
+        try:
+            module_spec = find_spec(module_name)
+        except ModuleNotFoundError:
+            # NOTE: Imported names which are not modules (e.g. classes) within a module
+            module_spec = None
+        ret = module_spec.origin if module_spec is not None else None
+        return ret
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        makedirs(path.dirname(self._filepath) or ".", exist_ok=True)
+        connection = sqlite3.connect(self._filepath)
+        try:
+            # NOTE: Commits on success and rolls back on error, but it does not close the connection
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+                yield connection
+        finally:
+            connection.close()
@@ -0,0 +1,141 @@
+import logging
+import operator
+from datetime import UTC, date, datetime
+from functools import reduce
+from os import makedirs, path, rename
+from urllib.parse import quote
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from crypto_trailing_stop.scripts.constants import (
+    DEFAULT_RESEARCH_RESULTS_FOLDER_PATH,
+    DEFAULT_RESEARCH_RESULTS_ROW_GROUP_SIZE,
+)
+from crypto_trailing_stop.scripts.serde import BACKTEST_RESULTS_SCHEMA, BacktestResultSerde
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, TakeProfitFilter
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_RESULTS_PARTITIONING_SCHEMA = pa.schema(
+    [("symbol", pa.string()), ("exchange", pa.string()), ("timeframe", pa.string()), ("date", pa.date32())]
+)
+
+
+class ResearchResultsStore:
+    """
+    Parquet dataset of the results of every research run, partitioned by symbol, exchange, timeframe
+    and date of the run (Hive layout), which is queried through pyarrow.dataset, so filters are pushed down
+    to the partitions and to the statistics of every row group, and only the requested columns are read.
+    """
+
+    def __init__(
+        self,
+        folder_path: str = DEFAULT_RESEARCH_RESULTS_FOLDER_PATH,
+        *,
+        row_group_size: int = DEFAULT_RESEARCH_RESULTS_ROW_GROUP_SIZE,
+    ) -> None:
+        self._folder_path = folder_path
+        self._row_group_size = row_group_size
+        self._serde = BacktestResultSerde()
+
+    def append(
+        self,
+        results: list[BacktestingExecutionResult],
+        *,
+        symbol: str,
+        exchange: str,
+        timeframe: str,
+        run_name: str,
+        run_date: date | None = None,
+    ) -> str:
+        """
+        Stores the results of a research run as a new part file, returning its path.
+        """
+        partition_folder_path = self._get_partition_folder_path(
+            symbol=symbol, exchange=exchange, timeframe=timeframe, run_date=run_date or datetime.now(UTC).date()
+        )
+        makedirs(partition_folder_path, exist_ok=True)
+        # XXX: [JMSOLA] Sorted by net profit, so the statistics of the row groups with losing configurations,
+        #      which every selection discards, let them be skipped without being read
+        table = self._serde.to_table(results).sort_by([("net_profit_amount", "descending")])
+        filename = f"{run_name}-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}-{uuid4().hex}.parquet"
+        tmp_filepath = path.join(partition_folder_path, f".{filename}.tmp")
+        pq.write_table(table, tmp_filepath, row_group_size=self._row_group_size, compression="zstd")
+        ret = path.join(partition_folder_path, filename)
+        rename(tmp_filepath, ret)
+        logger.info(f"💾 {len(results)} research results stored in {ret}")
+        return ret
+
+    def query(
+        self,
+        *,
+        symbol: str | None = None,
+        exchange: str | None = None,
+        timeframe: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        only_profitable: bool = False,
+        min_trades: int | None = None,
+        min_win_rate: float | None = None,
+        max_drawdown_percentage: float | None = None,
+        tp_filter: TakeProfitFilter = "all",
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """
+        Stored results matching every given filter, with the given columns only (all the result columns by default).
+
+        :param since: First date of the research runs to include.
+        :param until: Last date of the research runs to include.
+        :param max_drawdown_percentage: Deepest max. drawdown allowed, as a positive percentage (e.g. 15.0).
+        """
+        columns = columns or BACKTEST_RESULTS_SCHEMA.names
+        if not path.exists(self._folder_path):
+            return self._get_dataset_schema().empty_table().select(columns)
+        expressions: list[ds.Expression] = []
+        if symbol is not None:
+            expressions.append(ds.field("symbol") == symbol.upper())
+        if exchange is not None:
+            expressions.append(ds.field("exchange") == exchange.lower())
+        if timeframe is not None:
+            expressions.append(ds.field("timeframe") == timeframe)
+        if since is not None:
+            expressions.append(ds.field("date") >= since)
+        if until is not None:
+            expressions.append(ds.field("date") <= until)
+        if only_profitable:
+            expressions.append(ds.field("net_profit_amount") > 0)
+        if min_trades is not None:
+            expressions.append(ds.field("number_of_trades") >= min_trades)
+        if min_win_rate is not None:
+            expressions.append(ds.field("win_rate") >= min_win_rate)
+        if max_drawdown_percentage is not None:
+            # NOTE: Drawdowns are stored as negative percentages
+            expressions.append(ds.field("max_drawdown_percentage") >= -abs(max_drawdown_percentage))
+        if tp_filter != "all":
+            expressions.append(ds.field("parameters.enable_exit_on_take_profit") == (tp_filter == "enabled"))
+        # NOTE: Hidden temporary files (see append) are ignored by default
+        dataset = ds.dataset(
+            self._folder_path,
+            schema=self._get_dataset_schema(),
+            format="parquet",
+            partitioning=ds.partitioning(RESEARCH_RESULTS_PARTITIONING_SCHEMA, flavor="hive"),
+        )
+        ret = dataset.to_table(columns=columns, filter=reduce(operator.and_, expressions) if expressions else None)
+        return ret
+
+    def _get_dataset_schema(self) -> pa.Schema:
+        ret = pa.unify_schemas([BACKTEST_RESULTS_SCHEMA, RESEARCH_RESULTS_PARTITIONING_SCHEMA])
+        return ret
+
+    def _get_partition_folder_path(self, *, symbol: str, exchange: str, timeframe: str, run_date: date) -> str:
+        # NOTE: Symbols are URI encoded (e.g. ETH/EUR -> ETH%2FEUR), as expected by the Hive partitioning
+        return path.join(
+            self._folder_path,
+            f"symbol={quote(symbol.upper(), safe='')}",
+            f"exchange={exchange.lower()}",
+            f"timeframe={timeframe}",
+            f"date={run_date.isoformat()}",
+        )
@@ -0,0 +1,67 @@
+import logging
+import math
+from collections.abc import Callable
+
+import pandas as pd
+
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, SuccessiveHalvingConfig
+
+logger = logging.getLogger(__name__)
+
+# Candidates, candles and number of leading candles which are only there to warm up the indicators
+EvaluateFn = Callable[[list[BuySellSignalsConfigItem], pd.DataFrame, int], list[BacktestingExecutionResult]]
+
+
+class SuccessiveHalvingSearch:
+    """
+    Successive halving search: every candidate is run on a short window of the most recent candles,
+    and only the best ones are promoted to progressively longer windows, up to all the candles,
+    so most of the losing combinations are discarded before paying for a full backtest.
+    """
+
+    def __init__(self, successive_halving_config: SuccessiveHalvingConfig) -> None:
+        if successive_halving_config.reduction_factor < 2 or successive_halving_config.rungs < 1:
+            raise ValueError("Successive halving needs a reduction factor of at least 2 and at least 1 rung")
+        self._reduction_factor = successive_halving_config.reduction_factor
+        self._rungs = successive_halving_config.rungs
+
+    def search(
+        self,
+        candidates: list[BuySellSignalsConfigItem],
+        *,
+        df: pd.DataFrame,
+        evaluate_fn: EvaluateFn,
+        echo_fn: Callable[[str], None] | None = None,
+    ) -> list[BacktestingExecutionResult]:
+        """
+        Runs the search, returning the results of the candidates which reached the last rung (run on all the candles).
+        """
+        ret: list[BacktestingExecutionResult] = []
+        # NOTE: Indicators need some previous candles to warm up (e.g. EMA), which are prepended to every window,
+        #       but neither traded nor scored, so every rung is only evaluated on its own window
+        warmup_candles = max((candidate.ema_long_value for candidate in candidates), default=0)
+        for rung in range(self._rungs):
+            window_candles = len(df) // self._reduction_factor ** (self._rungs - 1 - rung)
+            rung_df = (
+                df.iloc[-(window_candles + warmup_candles) :].reset_index(drop=True)
+                if window_candles + warmup_candles < len(df)
+                else df
+            )
+            if echo_fn:
+                echo_fn(
+                    f"🪜 Rung {rung + 1}/{self._rungs}: running {len(candidates)} candidates "
+                    + f"on the last {min(window_candles, len(df))} candles..."
+                )
+            ret = evaluate_fn(candidates, rung_df, max(len(rung_df) - window_candles, 0))
+            if rung < self._rungs - 1:
+                promoted_candidates_count = max(1, math.ceil(len(candidates) / self._reduction_factor))
+                ret = sorted(ret, key=_get_score, reverse=True)[:promoted_candidates_count]
+                candidates = [result.parameters for result in ret]
+        return ret
+
+
+def _get_score(result: BacktestingExecutionResult) -> float:
+    # Same criteria as the "best overall" category (profit x win rate x trades)
+    ret = result.net_profit_percentage * result.win_rate * result.number_of_trades
+    return ret if not math.isnan(ret) else -math.inf
@@ -0,0 +1,194 @@
+import math
+from dataclasses import dataclass, replace
+from typing import Self
+
+import numpy as np
+import pyarrow as pa
+
+from crypto_trailing_stop.scripts.constants import (
+    ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS,
+    MIN_ENTRIES_PER_WEEK,
+    MIN_TRADES_FOR_STATS,
+)
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+
+_METRICS_COLUMN_NAMES = [
+    "net_profit_amount",
+    "net_profit_percentage",
+    "number_of_trades",
+    "win_rate",
+    "profit_factor",
+    "sqn",
+]
+
+
+@dataclass(frozen=True)
+class _SelectionThresholds:
+    decent_win_rate: float | None
+    min_profit_factor: float | None
+    min_sqn: float | None
+
+
+def get_min_trades_for_stats(downloaded_months_back: int) -> int:
+    """
+    Minimum number of trades required to consider a strategy for stats.
+    """
+    num_of_weeks_downloaded = downloaded_months_back * 4
+    ret = max(MIN_TRADES_FOR_STATS, math.ceil(num_of_weeks_downloaded * MIN_ENTRIES_PER_WEEK))
+    return ret
+
+
+class FinalResultsSelector:
+    """
+    Selects the champions of a research over a columnar results table (see BacktestResultSerde.to_table).
+    Thresholds are relaxed step by step until some result survives, but every step is just a comparison
+    against the best value of the survivors of the rest of filters, so the whole table is only scanned once per column.
+    """
+
+    def __init__(self, table: pa.Table) -> None:
+        self._num_rows = table.num_rows
+        self._net_profit_amount = self._to_numpy(table, "net_profit_amount")
+        self._net_profit_percentage = self._to_numpy(table, "net_profit_percentage")
+        self._number_of_trades = self._to_numpy(table, "number_of_trades")
+        self._win_rate = self._to_numpy(table, "win_rate")
+        self._profit_factor = self._to_numpy(table, "profit_factor")
+        self._sqn = self._to_numpy(table, "sqn")
+
+    @classmethod
+    def from_results(cls, results: list[BacktestingExecutionResult]) -> Self:
+        # NOTE: Only the metrics involved in the selection are turned into columns
+        table = pa.table(
+            {
+                column_name: pa.array([getattr(result, column_name) for result in results], type=pa.float64())
+                for column_name in _METRICS_COLUMN_NAMES
+            }
+        )
+        return cls(table)
+
+    def select(
+        self,
+        *,
+        downloaded_months_back: int,
+        disable_minimal_trades: bool,
+        disable_decent_win_rate: bool,
+        decent_win_rate: float,
+        min_profit_factor: float | None,
+        min_sqn: float | None,
+    ) -> dict[str, int]:
+        """
+        Row index of every champion (best_overall, highest_quality, best_profitable and best_win_rate),
+        or an empty dict when no result is profitable.
+        """
+        # NOTE: Filters which are never relaxed
+        base_mask = self._net_profit_amount > 0
+        if not disable_minimal_trades:
+            base_mask &= self._number_of_trades >= get_min_trades_for_stats(downloaded_months_back)
+        win_rate_thresholds = self._get_relaxed_thresholds(decent_win_rate, step=1)
+        # Same cascade of relaxed thresholds as the research used to try, one after the other
+        cascade: list[tuple[str, list[_SelectionThresholds]]] = [
+            # 1. Relax the decent win rate
+            (
+                "decent_win_rate",
+                [_SelectionThresholds(threshold, min_profit_factor, min_sqn) for threshold in win_rate_thresholds],
+            ),
+            # 2. Relax the minimum SQN
+            (
+                "min_sqn",
+                [
+                    _SelectionThresholds(decent_win_rate, min_profit_factor, threshold)
+                    for threshold in self._get_relaxed_thresholds(min_sqn, step=0.1)
+                ],
+            ),
+            # 3. Relax the minimum profit factor, without minimum SQN
+            (
+                "min_profit_factor",
+                [
+                    _SelectionThresholds(decent_win_rate, threshold, None)
+                    for threshold in self._get_relaxed_thresholds(min_profit_factor, step=0.1)
+                ],
+            ),
+            # 4. Relax the decent win rate again, without minimum profit factor and minimum SQN
+            ("decent_win_rate", [_SelectionThresholds(threshold, None, None) for threshold in win_rate_thresholds]),
+        ]
+        values_by_threshold_name = {
+            "decent_win_rate": self._win_rate,
+            "min_profit_factor": self._profit_factor,
+            "min_sqn": self._sqn,
+        }
+        for relaxed_threshold_name, thresholds_list in cascade:
+            # XXX: [JMSOLA] The relaxed threshold is left out of the mask, so the first threshold which lets
+            #      any result in is the first one not above its best value among the survivors of the rest of filters
+            mask = base_mask & self._get_mask(
+                replace(thresholds_list[0], **{relaxed_threshold_name: None}),
+                disable_decent_win_rate=disable_decent_win_rate,
+            )
+            if not mask.any():
+                continue
+            best_value = np.nanmax(values_by_threshold_name[relaxed_threshold_name][mask], initial=-np.inf)
+            for thresholds in thresholds_list:
+                threshold = getattr(thresholds, relaxed_threshold_name)
+                is_disabled = relaxed_threshold_name == "decent_win_rate" and disable_decent_win_rate
+                if is_disabled or threshold is None or best_value >= threshold:
+                    mask &= self._get_mask(thresholds, disable_decent_win_rate=disable_decent_win_rate)
+                    return self._select_champions(np.flatnonzero(mask))
+        return {}
+
+    def _select_champions(self, indices: np.ndarray) -> dict[str, int]:
+        win_rate = self._win_rate[indices]
+        net_profit_amount = self._net_profit_amount[indices]
+        # --- Category 4: Best Win Rate ---
+        # Results with a win rate close to the maximum (within 5 percentage points), picking the highest net return
+        max_win_rate = self._python_max(win_rate)
+        elite_indices = np.flatnonzero(win_rate >= (max_win_rate - 5.0))
+        best_win_rate = (
+            indices[elite_indices[self._python_argmax(net_profit_amount[elite_indices])]]
+            if elite_indices.size > 0
+            else indices[self._python_argmax(win_rate)]
+        )
+        ret = {
+            # --- Category 1: Best Overall (Profit x Win Rate x Trades) ---
+            "best_overall": indices[
+                self._python_argmax(self._net_profit_percentage[indices] * win_rate * self._number_of_trades[indices])
+            ],
+            # --- Category 2: Highest Quality (Return x Win Rate) ---
+            "highest_quality": indices[self._python_argmax(self._net_profit_percentage[indices] * win_rate)],
+            # --- Category 3: Best Profitable Configuration ---
+            "best_profitable": indices[self._python_argmax(net_profit_amount)],
+            "best_win_rate": best_win_rate,
+        }
+        return {name: int(index) for name, index in ret.items()}
+
+    def _get_mask(self, thresholds: _SelectionThresholds, *, disable_decent_win_rate: bool) -> np.ndarray:
+        # NOTE: Comparisons against NaN are always False, as they were in the former Python filters
+        ret = np.ones(self._num_rows, dtype=bool)
+        if not disable_decent_win_rate and thresholds.decent_win_rate is not None:
+            ret &= self._win_rate >= thresholds.decent_win_rate
+        if thresholds.min_sqn is not None:
+            ret &= self._sqn >= thresholds.min_sqn
+        if thresholds.min_profit_factor is not None:
+            ret &= self._profit_factor >= thresholds.min_profit_factor
+        return ret
+
+    def _get_relaxed_thresholds(self, initial_value: float | None, *, step: float) -> list[float | None]:
+        ret: list[float | None] = []
+        current_value = None
+        for _ in range(ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS):
+            current_value = initial_value if current_value is None else (current_value - step)
+            current_value = round(current_value, ndigits=2) if current_value is not None else None
+            ret.append(current_value if current_value is not None and current_value > 0 else None)
+        return ret
+
+    def _python_argmax(self, values: np.ndarray) -> int:
+        # XXX: [JMSOLA] Same result as max() over Python floats: the first maximum wins, NaN values are skipped,
+        #      except for a leading NaN, which is never replaced, since nothing is greater than NaN
+        if np.isnan(values[0]) or np.isnan(values).all():
+            return 0
+        ret = int(np.nanargmax(values))
+        return ret
+
+    def _python_max(self, values: np.ndarray) -> float:
+        return float(values[self._python_argmax(values)])
+
+    def _to_numpy(self, table: pa.Table, column_name: str) -> np.ndarray:
+        ret = table.column(column_name).to_numpy().astype(np.float64)
+        return ret
@@ -1,13 +1,38 @@
 import logging
-from dataclasses import asdict, fields
+from dataclasses import fields
+from functools import reduce
+from typing import get_type_hints
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
 
 logger = logging.getLogger(__name__)
 
+_ARROW_TYPES_BY_PYTHON_TYPE: dict[type, pa.DataType] = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+}
+_PARAMETERS_COLUMN_PREFIX = "parameters."
+# NOTE: Parameters are flattened as "parameters.<name>" columns, followed by the metrics
+_PARAMETERS_FIELDS = [
+    (field.name, _ARROW_TYPES_BY_PYTHON_TYPE[get_type_hints(BuySellSignalsConfigItem)[field.name]])
+    for field in fields(BuySellSignalsConfigItem)
+]
+_METRICS_FIELDS = [
+    (field.name, _ARROW_TYPES_BY_PYTHON_TYPE[get_type_hints(BacktestingExecutionResult)[field.name]])
+    for field in fields(BacktestingExecutionResult)
+    if field.name != "parameters"
+]
+BACKTEST_RESULTS_SCHEMA = pa.schema(
+    [(f"{_PARAMETERS_COLUMN_PREFIX}{name}", arrow_type) for name, arrow_type in _PARAMETERS_FIELDS] + _METRICS_FIELDS
+)
+
 
 class BacktestResultSerde:
     """
@@ -16,12 +41,7 @@ class BacktestResultSerde:
     """
 
     def save(self, results: list[BacktestingExecutionResult], filepath: str) -> None:
-        # Convert to list of dicts
-        dict_results = [asdict(result) for result in results]
-        # Flatten with json_normalize
-        df = pd.json_normalize(dict_results, sep=".")
-        # Save to Parquet
-        df.to_parquet(filepath, index=False)
+        pq.write_table(self.to_table(results), filepath)
         logger.info(f"✅ Successfully saved {len(results)} results to {filepath}")
 
     def load(self, filepath: str, *, drop_na: bool = True) -> list[BacktestingExecutionResult]:
@@ -31,28 +51,71 @@ class BacktestResultSerde:
         :param filepath: The path of the Parquet file to load.
         :return: A list of BacktestingExecutionResult objects.
         """
-        df = pd.read_parquet(filepath)
-        if drop_na:
-            df.dropna(inplace=True)
-        results = []
-        # Get field names for reconstruction
-        config_fields = {f.name for f in fields(BuySellSignalsConfigItem)}
-        result_fields = {f.name for f in fields(BacktestingExecutionResult)}
-
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
-
-            # Extract nested parameters.* keys
-            params_data = {
-                key.split("parameters.")[1]: value
-                for key, value in row_dict.items()
-                if key.startswith("parameters.") and key.split("parameters.")[1] in config_fields
-            }
-            config_item = BuySellSignalsConfigItem(**params_data)
-            # Extract top-level fields
-            result_data = {key: row_dict[key] for key in result_fields if key in row_dict and key != "parameters"}
-            # Rebuild dataclass
-            result_item = BacktestingExecutionResult(parameters=config_item, **result_data)
-            results.append(result_item)
+        results = self.from_table(self.load_table(filepath, drop_na=drop_na))
         logger.info(f"✅ Successfully loaded {len(results)} results from {filepath}")
         return results
+
+    def load_table(self, filepath: str, *, drop_na: bool = True) -> pa.Table:
+        """
+        Columnar counterpart of load, for analysis which does not need the result objects
+        (e.g. load_table(filepath).to_pandas()).
+        """
+        # NOTE: Files written through pandas might differ on some column types (e.g. large strings)
+        ret = pq.read_table(filepath, columns=BACKTEST_RESULTS_SCHEMA.names).cast(BACKTEST_RESULTS_SCHEMA)
+        if drop_na:
+            ret = self.drop_na(ret)
+        else:
+            # XXX: [JMSOLA] pandas writes NaN metrics as nulls, which are read back as NaN, not as None
+            ret = pa.Table.from_arrays(
+                [
+                    pc.fill_null(column, float("nan")) if pa.types.is_floating(column.type) else column
+                    for column in ret.columns
+                ],
+                schema=BACKTEST_RESULTS_SCHEMA,
+            )
+        return ret
+
+    def drop_na(self, table: pa.Table) -> pa.Table:
+        """
+        Drops the rows with any missing value, either null or NaN.
+        """
+        has_missing_values = reduce(pc.or_, [pc.is_null(column, nan_is_null=True) for column in table.columns])
+        ret = table.filter(pc.invert(has_missing_values))
+        return ret
+
+    def to_table(self, results: list[BacktestingExecutionResult]) -> pa.Table:
+        """
+        Flattens the results into a table, with a "parameters.<name>" column per parameter.
+        """
+        columns = [
+            pa.array([getattr(result.parameters, name) for result in results], type=arrow_type)
+            for name, arrow_type in _PARAMETERS_FIELDS
+        ] + [
+            pa.array([getattr(result, name) for result in results], type=arrow_type)
+            for name, arrow_type in _METRICS_FIELDS
+        ]
+        ret = pa.Table.from_arrays(columns, schema=BACKTEST_RESULTS_SCHEMA)
+        return ret
+
+    def from_table(self, table: pa.Table) -> list[BacktestingExecutionResult]:
+        """
+        Rebuilds the results from a table flattened by to_table, converting every column at once.
+        """
+        ret: list[BacktestingExecutionResult] = []
+        parameters_names = [name for name, _ in _PARAMETERS_FIELDS]
+        metrics_names = [name for name, _ in _METRICS_FIELDS]
+        for record_batch in table.select(BACKTEST_RESULTS_SCHEMA.names).to_batches():
+            parameters_columns = [
+                record_batch.column(f"{_PARAMETERS_COLUMN_PREFIX}{name}").to_pylist() for name in parameters_names
+            ]
+            metrics_columns = [record_batch.column(name).to_pylist() for name in metrics_names]
+            ret.extend(
+                BacktestingExecutionResult(
+                    parameters=BuySellSignalsConfigItem(**dict(zip(parameters_names, parameters_values, strict=True))),
+                    **dict(zip(metrics_names, metrics_values, strict=True)),
+                )
+                for parameters_values, metrics_values in zip(
+                    zip(*parameters_columns, strict=True), zip(*metrics_columns, strict=True), strict=True
+                )
+            )
+        return ret
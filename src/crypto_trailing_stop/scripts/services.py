@@ -1,20 +1,22 @@
-import math
+import asyncio
+import logging
 import os
-from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Iterator, Mapping
+from datetime import UTC, date, datetime, timedelta
+from functools import partial
 from itertools import product
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
-import ccxt
+import ccxt.async_support as ccxt_async
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pydash
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from backtesting import backtesting
-from joblib import Parallel, delayed
-from tqdm import tqdm
 
 from crypto_trailing_stop.commons.constants import (
     ADX_THRESHOLD_VALUES,
@@ -27,33 +29,51 @@ from crypto_trailing_stop.commons.constants import (
 )
 from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.impl.bit2me_operating_exchange_service import (  # noqa: E501
+    Bit2MeOperatingExchangeService,
+)
 from crypto_trailing_stop.infrastructure.services.crypto_analytics_service import CryptoAnalyticsService
+from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.tasks.buy_sell_signals_task_service import BuySellSignalsTaskService
+from crypto_trailing_stop.scripts.candles import CandleStore
+from crypto_trailing_stop.scripts.checkpoint import ResearchCheckpoint
 from crypto_trailing_stop.scripts.constants import (
     DEFAULT_LIMIT_DOWNLOAD_BATCHES,
+    DEFAULT_MAX_CONCURRENT_DOWNLOADS,
     DEFAULT_MONTHS_BACK,
-    DEFAULT_TRADING_MARKET_CONFIG,
+    DEFAULT_RESEARCH_CHECKPOINTS_FOLDER_PATH,
     FIRST_ITERATION_DECENT_WIN_RATE_THRESHOLD,
-    ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS,
     MAX_VOLUME_THRESHOLD_STEP_FIRST_ITERATION,
     MAX_VOLUME_THRESHOLD_VALUES_FIRST_ITERATION,
-    MIN_ENTRIES_PER_WEEK,
-    MIN_TRADES_FOR_STATS,
     MIN_VOLUME_THRESHOLD_STEP_FIRST_ITERATION,
     MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
     SECOND_ITERATION_DECENT_WIN_RATE_THRESHOLD,
 )
-from crypto_trailing_stop.scripts.jobs import run_single_backtest_combination
+from crypto_trailing_stop.scripts.executor import ResearchExecutor
+from crypto_trailing_stop.scripts.jobs import calculate_indicators_frame, run_single_backtest_combination
+from crypto_trailing_stop.scripts.result_cache import BacktestResultCache
+from crypto_trailing_stop.scripts.results_store import ResearchResultsStore
+from crypto_trailing_stop.scripts.search import SuccessiveHalvingSearch
+from crypto_trailing_stop.scripts.selection import FinalResultsSelector, get_min_trades_for_stats
 from crypto_trailing_stop.scripts.serde import BacktestResultSerde
+from crypto_trailing_stop.scripts.shared_frames import SharedFrameStore
+from crypto_trailing_stop.scripts.signals import calculate_buy_sell_signals
+from crypto_trailing_stop.scripts.simulator import SignalStrategySimulator
 from crypto_trailing_stop.scripts.strategy import SignalStrategy
 from crypto_trailing_stop.scripts.vo import (
     BacktestingExecutionResult,
     BacktestingExecutionSummary,
+    IndicatorsKey,
     ParametersRefinementResult,
+    ResearchExecutorConfig,
+    ResearchSearchStrategy,
+    SuccessiveHalvingConfig,
     TakeProfitFilter,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class BacktestingCliService:
     def __init__(self) -> None:
@@ -64,20 +84,33 @@ class BacktestingCliService:
             favourite_crypto_currency_service=None,
             buy_sell_signals_config_service=None,
         )
+        self._orders_analytics_service = OrdersAnalyticsService(
+            operating_exchange_service=Bit2MeOperatingExchangeService(bit2me_remote_service=None),
+            ccxt_remote_service=ccxt_remote_service,
+            stop_loss_percent_service=None,
+            buy_sell_signals_config_service=None,
+            crypto_analytics_service=self._analytics_service,
+        )
         self._signal_service = BuySellSignalsTaskService(
             configuration_properties=ConfigurationProperties(),
             operating_exchange_service=None,
             push_notification_service=None,
             telegram_service=None,
-            event_emitter=None,
+            event_bus=None,
             scheduler=AsyncIOScheduler(),
             ccxt_remote_service=ccxt_remote_service,
             global_flag_service=None,
             favourite_crypto_currency_service=None,
             crypto_analytics_service=None,
             auto_buy_trader_config_service=None,
+            buy_sell_signals_config_service=None,
+            shard_lease_service=None,
+            market_history_archive_service=None,
         )
         self._serde = BacktestResultSerde()
+        self._candle_store = CandleStore()
+        self._results_cache = BacktestResultCache()
+        self._results_store = ResearchResultsStore()
 
     def download_backtesting_data(
         self,
@@ -88,45 +121,124 @@ class BacktestingCliService:
         *,
         callback_fn: Callable[[], None] = None,
         echo_fn: Callable[[str], None],
-    ) -> list[list[Any]]:
+    ) -> int:
+        """
+        Downloads the missing candles of the last months into the candle store, returning how many were fetched.
+        """
+        ret = asyncio.run(
+            self._download_backtesting_data(
+                symbol, exchange, timeframe, months_back, callback_fn=callback_fn, echo_fn=echo_fn
+            )
+        )
+        return ret
+
+    def load_backtesting_data(
+        self, symbol: str, exchange: str, timeframe: str, *, months_back: int | None = None
+    ) -> pd.DataFrame:
+        since = datetime.now(UTC) - timedelta(days=30 * months_back) if months_back else None
+        ret = self._candle_store.load(exchange=exchange, symbol=symbol, timeframe=timeframe, since=since)
+        return ret
+
+    async def _download_backtesting_data(
+        self,
+        symbol: str,
+        exchange: str,
+        timeframe: str,
+        months_back: int,
+        *,
+        callback_fn: Callable[[], None] | None,
+        echo_fn: Callable[[str], None],
+    ) -> int:
         _, fiat_currency, *_ = symbol.split("/")
-        interval = self._convert_timeframe_to_interval(timeframe)
-        exchange = getattr(ccxt, exchange)()
-
-        end_date = datetime.now(UTC)
-        start_date = end_date - timedelta(days=30 * months_back)
-        previous_since_timestamp, since_timestamp = None, int(start_date.timestamp() * 1000)
-        end_timestamp = int(end_date.timestamp() * 1000)
-
-        markets = exchange.load_markets()
-        supported_symbols = [
-            market["symbol"]
-            for market in markets.values()
-            if (market.get("active", False) or market.get("spot", False))
-            and str(market["quote"]).upper() == str(fiat_currency).upper()
+        interval_in_millis = self._convert_timeframe_to_interval(timeframe) * 60_000
+        end_timestamp = int(datetime.now(UTC).timestamp() * 1000)
+        start_timestamp = int((datetime.now(UTC) - timedelta(days=30 * months_back)).timestamp() * 1000)
+        # XXX: [JMSOLA] Only the ranges which are not stored yet are downloaded. The last stored candle
+        #      is downloaded again, since it could be still open when it was stored
+        time_ranges: list[tuple[int, int]] = []
+        timestamp_bounds = self._candle_store.get_timestamp_bounds(
+            exchange=exchange, symbol=symbol, timeframe=timeframe
+        )
+        if timestamp_bounds is None:
+            time_ranges.append((start_timestamp, end_timestamp))
+        else:
+            first_timestamp, last_timestamp = timestamp_bounds
+            if start_timestamp < first_timestamp:
+                time_ranges.append((start_timestamp, first_timestamp))
+            time_ranges.append((last_timestamp, end_timestamp))
+        # Every range is split in batches, which are fetched concurrently
+        batch_in_millis = DEFAULT_LIMIT_DOWNLOAD_BATCHES * interval_in_millis
+        batches = [
+            (since, min(since + batch_in_millis, until))
+            for range_start, until in time_ranges
+            for since in range(range_start, until, batch_in_millis)
         ]
-        if symbol not in supported_symbols:
-            raise ValueError(
-                f"Symbol {symbol} is not supported by exchange {exchange.id} for fiat {fiat_currency}. "
-                + "Please, check other exchange (e.g. Kraken, Coinbase etc.)."
+        # NOTE: ccxt throttles all the requests of the same client, so they never exceed the exchange rate limit
+        client: ccxt_async.Exchange = getattr(ccxt_async, exchange)({"enableRateLimit": True})
+        try:
+            markets = await client.load_markets()
+            supported_symbols = [
+                market["symbol"]
+                for market in markets.values()
+                if (market.get("active", False) or market.get("spot", False))
+                and str(market["quote"]).upper() == str(fiat_currency).upper()
+            ]
+            if symbol not in supported_symbols:
+                raise ValueError(
+                    f"Symbol {symbol} is not supported by exchange {client.id} for fiat {fiat_currency}. "
+                    + "Please, check other exchange (e.g. Kraken, Coinbase etc.)."
+                )
+            semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_DOWNLOADS)
+            ohlcv_batches = await asyncio.gather(
+                *[
+                    self._fetch_ohlcv_batch(
+                        client,
+                        symbol,
+                        timeframe,
+                        since=since,
+                        until=until,
+                        semaphore=semaphore,
+                        callback_fn=callback_fn,
+                        echo_fn=echo_fn,
+                    )
+                    for since, until in batches
+                ]
             )
-        has_more_data, ret = True, []
-        while (
-            has_more_data
-            and since_timestamp < end_timestamp
-            and (previous_since_timestamp is None or previous_since_timestamp < since_timestamp)
-        ):
-            start_datetime = datetime.fromtimestamp(since_timestamp / 1000)
-            end_datetime = start_datetime + timedelta(minutes=DEFAULT_LIMIT_DOWNLOAD_BATCHES * interval)
+        finally:
+            await client.close()
+        ohlcv = [candle for ohlcv_batch in ohlcv_batches for candle in ohlcv_batch]
+        self._candle_store.append(ohlcv, exchange=exchange, symbol=symbol, timeframe=timeframe)
+        ret = len(ohlcv)
+        return ret
+
+    async def _fetch_ohlcv_batch(
+        self,
+        client: ccxt_async.Exchange,
+        symbol: str,
+        timeframe: str,
+        *,
+        since: int,
+        until: int,
+        semaphore: asyncio.Semaphore,
+        callback_fn: Callable[[], None] | None,
+        echo_fn: Callable[[str], None],
+    ) -> list[list[Any]]:
+        ret: list[list[Any]] = []
+        async with semaphore:
+            start_datetime = datetime.fromtimestamp(since / 1000, tz=UTC)
+            end_datetime = datetime.fromtimestamp(until / 1000, tz=UTC)
             echo_fn(f"📆 Dowloading candles from {start_datetime.isoformat()} to {end_datetime.isoformat()}")
-            ohlcv = exchange.fetch_ohlcv(symbol, "1h", since=since_timestamp, limit=DEFAULT_LIMIT_DOWNLOAD_BATCHES)
-            has_more_data = ohlcv is not None and len(ohlcv) > 0
-            if has_more_data:
-                ret.extend(ohlcv)
-                previous_since_timestamp = since_timestamp
-                since_timestamp = ohlcv[-1][0] + 1
-                if callback_fn:
-                    callback_fn()
+            # NOTE: Some exchanges return less candles than requested, so the batch is paged until it is completed
+            has_more_data = True
+            while has_more_data and since < until:
+                ohlcv = await client.fetch_ohlcv(symbol, timeframe, since=since, limit=DEFAULT_LIMIT_DOWNLOAD_BATCHES)
+                ohlcv = [candle for candle in ohlcv or [] if since <= candle[0] < until]
+                has_more_data = len(ohlcv) > 0
+                if has_more_data:
+                    ret.extend(ohlcv)
+                    since = ohlcv[-1][0] + 1
+            if callback_fn:
+                callback_fn()
         return ret
 
     def find_out_best_parameters(
@@ -144,18 +256,25 @@ class BacktestingCliService:
         min_sqn: float | None = None,
         tp_filter: TakeProfitFilter = "all",
         from_parquet: Path | None = None,
+        from_results_store: bool = False,
+        results_since: date | None = None,
         df: pd.DataFrame | None = None,
         disable_progress_bar: bool = False,
+        research_executor_config: ResearchExecutorConfig | None = None,
+        use_results_cache: bool = True,
+        search_strategy: ResearchSearchStrategy = "grid",
+        successive_halving_config: SuccessiveHalvingConfig | None = None,
         echo_fn: Callable[[str], None],
     ) -> BacktestingExecutionSummary:
-        if from_parquet is None and df is None:
-            raise ValueError("Either 'from_parquet' or 'df' must be provided.")
-        if from_parquet is None:
-            ret = self._find_out_best_parameters_in_real_time(
+        if from_parquet is None and not from_results_store and df is None:
+            raise ValueError("Either 'from_parquet', 'from_results_store' or 'df' must be provided.")
+        if from_results_store:
+            # 3.1 Select the best parameters among the research runs stored previously
+            ret = self._find_out_best_parameters_from_results_store(
                 symbol=symbol,
                 exchange=exchange,
                 timeframe=timeframe,
-                initial_cash=initial_cash,
+                results_since=results_since,
                 downloaded_months_back=downloaded_months_back,
                 disable_minimal_trades=disable_minimal_trades,
                 disable_decent_win_rate=disable_decent_win_rate,
@@ -163,10 +282,49 @@ class BacktestingCliService:
                 min_profit_factor=min_profit_factor,
                 min_sqn=min_sqn,
                 tp_filter=tp_filter,
-                df=df,
-                disable_progress_bar=disable_progress_bar,
-                echo_fn=echo_fn,
             )
+        elif from_parquet is None and search_strategy == "successive-halving":
+            with ResearchExecutor(research_executor_config or ResearchExecutorConfig()) as research_executor:
+                ret = self._find_out_best_parameters_by_successive_halving(
+                    symbol=symbol,
+                    exchange=exchange,
+                    timeframe=timeframe,
+                    initial_cash=initial_cash,
+                    downloaded_months_back=downloaded_months_back,
+                    disable_minimal_trades=disable_minimal_trades,
+                    disable_decent_win_rate=disable_decent_win_rate,
+                    decent_win_rate=decent_win_rate,
+                    min_profit_factor=min_profit_factor,
+                    min_sqn=min_sqn,
+                    tp_filter=tp_filter,
+                    df=df,
+                    research_executor=research_executor,
+                    results_cache=self._results_cache if use_results_cache else None,
+                    successive_halving_config=successive_halving_config or SuccessiveHalvingConfig(),
+                    disable_progress_bar=disable_progress_bar,
+                    echo_fn=echo_fn,
+                )
+        elif from_parquet is None:
+            # The same worker processes are reused along all the research iterations
+            with ResearchExecutor(research_executor_config or ResearchExecutorConfig()) as research_executor:
+                ret = self._find_out_best_parameters_in_real_time(
+                    symbol=symbol,
+                    exchange=exchange,
+                    timeframe=timeframe,
+                    initial_cash=initial_cash,
+                    downloaded_months_back=downloaded_months_back,
+                    disable_minimal_trades=disable_minimal_trades,
+                    disable_decent_win_rate=disable_decent_win_rate,
+                    decent_win_rate=decent_win_rate,
+                    min_profit_factor=min_profit_factor,
+                    min_sqn=min_sqn,
+                    tp_filter=tp_filter,
+                    df=df,
+                    research_executor=research_executor,
+                    results_cache=self._results_cache if use_results_cache else None,
+                    disable_progress_bar=disable_progress_bar,
+                    echo_fn=echo_fn,
+                )
         else:
             # 3.1 Load execution results from parquet file stored previously
             ret = self._find_out_best_parameters_from_parquet_file(
@@ -181,6 +339,41 @@ class BacktestingCliService:
             )
         return ret
 
+    def query_research_results(
+        self,
+        *,
+        symbol: str | None = None,
+        exchange: str | None = None,
+        timeframe: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        only_profitable: bool = False,
+        min_trades: int | None = None,
+        min_win_rate: float | None = None,
+        max_drawdown_percentage: float | None = None,
+        tp_filter: TakeProfitFilter = "all",
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        ret = self._results_store.query(
+            symbol=symbol,
+            exchange=exchange,
+            timeframe=timeframe,
+            since=since,
+            until=until,
+            only_profitable=only_profitable,
+            min_trades=min_trades,
+            min_win_rate=min_win_rate,
+            max_drawdown_percentage=max_drawdown_percentage,
+            tp_filter=tp_filter,
+            columns=columns,
+        )
+        return ret
+
+    def calculate_indicators(self, df: pd.DataFrame, simulated_bs_config: BuySellSignalsConfigItem) -> pd.DataFrame:
+        self._analytics_service._calculate_simple_indicators(df, simulated_bs_config)
+        self._analytics_service._calculate_complex_indicators(df)
+        return df
+
     def execute_backtesting(
         self,
         *,
@@ -191,51 +384,29 @@ class BacktestingCliService:
         timeframe: str = "1h",
         echo_fn: Callable[[str], None] | None = None,
         use_tqdm: bool = True,
+        indicators_calculated: bool = False,
     ) -> tuple[BacktestingExecutionResult, backtesting.Backtest, pd.Series]:
         original_backtesting_tqdm = backtesting._tqdm
         try:
-            self._analytics_service._calculate_simple_indicators(df, simulated_bs_config)
-            self._analytics_service._calculate_complex_indicators(df)
-
-            buy_signals = []
-            sell_signals = []
-
-            if echo_fn:
-                echo_fn("🧠 Generating signals for each historical candle...")
-            range_of_values = range(4, len(df))
-            for i in tqdm(range_of_values) if use_tqdm else range_of_values:
-                window_df = df.iloc[: i + 1]
-                signals = self._signal_service._check_signals(
-                    symbol=simulated_bs_config.symbol,
-                    timeframe=timeframe,
-                    df=window_df,
-                    buy_sell_signals_config=simulated_bs_config,
-                    trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
-                )
-                buy_signals.append(signals.buy)
-                sell_signals.append(signals.sell)
-
-            df["buy_signal"] = pd.Series(buy_signals, index=df.index[4:])
-            df["sell_signal"] = pd.Series(sell_signals, index=df.index[4:])
-            # NEW: Add previous MACD hist for the accelerating momentum check
-            df["prev_macd_hist"] = df["macd_hist"].shift(1)
-            df.fillna(False, inplace=True)
-
+            self._prepare_signals(
+                df,
+                simulated_bs_config,
+                timeframe=timeframe,
+                echo_fn=echo_fn,
+                indicators_calculated=indicators_calculated,
+            )
             if echo_fn:
                 echo_fn("🚀 Running trading simulation...")
             df.rename(
                 columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"},
                 inplace=True,
             )
-            bt = backtesting.Backtest(
-                df,
-                SignalStrategy,
-                cash=initial_cash,
-                commission=MEXC_TAKER_FEES if exchange == "mexc" else BIT2ME_TAKER_FEES,
-            )
+            bt = backtesting.Backtest(df, SignalStrategy, cash=initial_cash, commission=self._get_taker_fees(exchange))
             if not use_tqdm:
                 backtesting._tqdm = lambda iterable=None, *args, **kwargs: iterable
-            stats = bt.run(simulated_bs_config=simulated_bs_config, analytics_service=self._analytics_service)
+            stats = bt.run(
+                simulated_bs_config=simulated_bs_config, orders_analytics_service=self._orders_analytics_service
+            )
             current_execution_result = self._to_execution_result(
                 simulated_bs_config, initial_cash, stats, timeframe=timeframe
             )
@@ -243,6 +414,36 @@ class BacktestingCliService:
         finally:
             backtesting._tqdm = original_backtesting_tqdm
 
+    def simulate_backtesting(
+        self,
+        *,
+        exchange: str,
+        simulated_bs_config: BuySellSignalsConfigItem,
+        initial_cash: float,
+        df: pd.DataFrame,
+        timeframe: str = "1h",
+        indicators_calculated: bool = False,
+        warmup_bars: int = 0,
+    ) -> BacktestingExecutionResult:
+        """
+        Same as execute_backtesting, but running the native event-driven simulator instead of backtesting.py,
+        so it is way faster. It does not provide any plot, though.
+
+        :param warmup_bars: Number of leading candles which are only used to warm up the indicators,
+            so no trade is entered on them and they are left out of the stats.
+        """
+        self._prepare_signals(df, simulated_bs_config, timeframe=timeframe, indicators_calculated=indicators_calculated)
+        stats = SignalStrategySimulator(
+            df,
+            simulated_bs_config,
+            orders_analytics_service=self._orders_analytics_service,
+            initial_cash=initial_cash,
+            commission=self._get_taker_fees(exchange),
+            warmup_bars=warmup_bars,
+        ).run()
+        ret = self._to_execution_result(simulated_bs_config, initial_cash, stats, timeframe=timeframe)
+        return ret
+
     def _find_out_best_parameters_in_real_time(
         self,
         *,
@@ -258,28 +459,34 @@ class BacktestingCliService:
         min_sqn: float | None = None,
         tp_filter: TakeProfitFilter = "all",
         df: pd.DataFrame | None = None,
+        research_executor: ResearchExecutor,
+        results_cache: BacktestResultCache | None = None,
         disable_progress_bar: bool = False,
         echo_fn: Callable[[str], None],
     ):
         echo_fn("🍵 Starting first run with bigger volume ranges...")
         # 2.1 Run first iteration for backtesting in order to find out best candidates
-        first_executions_results = self._apply_cartesian_production_execution(
-            symbol=symbol,
-            exchange=exchange,
-            initial_cash=initial_cash,
-            ema_short_mid_pairs_as_tuples=EMA_SHORT_MID_PAIRS_AS_TUPLES,
-            buy_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
-            buy_max_volume_threshold_values=MAX_VOLUME_THRESHOLD_VALUES_FIRST_ITERATION,
-            sell_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
-            tp_filter=tp_filter,
-            disable_progress_bar=disable_progress_bar,
-            df=df,
-            timeframe=timeframe,
-            echo_fn=echo_fn,
-        )
+        with self._get_research_checkpoint(symbol, timeframe, tp_filter, suffix="first_run") as checkpoint:
+            first_executions_results = self._apply_cartesian_production_execution(
+                symbol=symbol,
+                exchange=exchange,
+                initial_cash=initial_cash,
+                ema_short_mid_pairs_as_tuples=EMA_SHORT_MID_PAIRS_AS_TUPLES,
+                buy_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
+                buy_max_volume_threshold_values=MAX_VOLUME_THRESHOLD_VALUES_FIRST_ITERATION,
+                sell_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
+                tp_filter=tp_filter,
+                research_executor=research_executor,
+                results_cache=results_cache,
+                checkpoint=checkpoint,
+                disable_progress_bar=disable_progress_bar,
+                df=df,
+                timeframe=timeframe,
+                echo_fn=echo_fn,
+            )
         # 2.2 Store the all execution results in a parquet file
         self._save_executions_results_in_parquet_file(
-            symbol, timeframe, tp_filter, first_executions_results, suffix="first_run"
+            symbol, exchange, timeframe, tp_filter, first_executions_results, suffix="first_run"
         )
         # 2.3 Get first Execution Result Summary
         first_execution_result_summary = self._iter_over_executions_results_to_get_final_results(
@@ -330,17 +537,21 @@ class BacktestingCliService:
             )
             second_full_cartesian_product.extend(current_cartesian_product)
         echo_fn("🍵 Running second iteration with refined parameters...")
-        second_executions_results = self._exec_joblib_execution_by_cartesian_product(
-            exchange=exchange,
-            initial_cash=initial_cash,
-            disable_progress_bar=disable_progress_bar,
-            df=df,
-            timeframe=timeframe,
-            cartesian_product=second_full_cartesian_product,
-        )
+        with self._get_research_checkpoint(symbol, timeframe, tp_filter, suffix="second_run") as checkpoint:
+            second_executions_results = self._exec_parallel_execution_by_cartesian_product(
+                exchange=exchange,
+                initial_cash=initial_cash,
+                research_executor=research_executor,
+                results_cache=results_cache,
+                checkpoint=checkpoint,
+                disable_progress_bar=disable_progress_bar,
+                df=df,
+                timeframe=timeframe,
+                cartesian_product=second_full_cartesian_product,
+            )
         # 2.5 Store the all execution results in a parquet file for the second run
         self._save_executions_results_in_parquet_file(
-            symbol, timeframe, tp_filter, second_executions_results, suffix="second_run"
+            symbol, exchange, timeframe, tp_filter, second_executions_results, suffix="second_run"
         )
         echo_fn("🍵 Done, gathering results...")
         # 2.6 Get final results
@@ -355,6 +566,77 @@ class BacktestingCliService:
         )
         return ret
 
+    def _find_out_best_parameters_by_successive_halving(
+        self,
+        *,
+        symbol: str,
+        exchange: str,
+        timeframe: str,
+        initial_cash: float,
+        downloaded_months_back: int = DEFAULT_MONTHS_BACK,
+        disable_minimal_trades: bool = False,
+        disable_decent_win_rate: bool = False,
+        decent_win_rate: float = SECOND_ITERATION_DECENT_WIN_RATE_THRESHOLD,
+        min_profit_factor: float | None = None,
+        min_sqn: float | None = None,
+        tp_filter: TakeProfitFilter = "all",
+        df: pd.DataFrame,
+        research_executor: ResearchExecutor,
+        results_cache: BacktestResultCache | None = None,
+        successive_halving_config: SuccessiveHalvingConfig,
+        disable_progress_bar: bool = False,
+        echo_fn: Callable[[str], None],
+    ) -> BacktestingExecutionSummary:
+        echo_fn("🍵 Starting successive halving over the whole grid...")
+        # 2.1 Same candidates as the first iteration of the grid search
+        candidates = self._calculate_cartesian_product(
+            symbol=symbol,
+            ema_short_mid_pairs_as_tuples=EMA_SHORT_MID_PAIRS_AS_TUPLES,
+            buy_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
+            buy_max_volume_threshold_values=MAX_VOLUME_THRESHOLD_VALUES_FIRST_ITERATION,
+            sell_min_volume_threshold_values=MIN_VOLUME_THRESHOLD_VALUES_FOR_FIRST_ITERATION,
+            tp_filter=tp_filter,
+            echo_fn=echo_fn,
+        )
+        # 2.2 Only the candidates promoted to the last rung are run on all the candles
+        # NOTE: Every rung runs on a different window of candles, so all of them share the same checkpoint
+        with self._get_research_checkpoint(symbol, timeframe, tp_filter, suffix="successive_halving") as checkpoint:
+            executions_results = SuccessiveHalvingSearch(successive_halving_config).search(
+                candidates,
+                df=df,
+                evaluate_fn=lambda rung_candidates, rung_df, warmup_bars: (
+                    self._exec_parallel_execution_by_cartesian_product(
+                        exchange=exchange,
+                        initial_cash=initial_cash,
+                        research_executor=research_executor,
+                        disable_progress_bar=disable_progress_bar,
+                        df=rung_df,
+                        timeframe=timeframe,
+                        cartesian_product=rung_candidates,
+                        results_cache=results_cache,
+                        checkpoint=checkpoint,
+                        warmup_bars=warmup_bars,
+                    )
+                ),
+                echo_fn=echo_fn,
+            )
+        # 2.3 Store the execution results of the last rung in a parquet file
+        self._save_executions_results_in_parquet_file(
+            symbol, exchange, timeframe, tp_filter, executions_results, suffix="successive_halving"
+        )
+        echo_fn("🍵 Done, gathering results...")
+        # 2.4 Get final results
+        ret = self._iter_over_executions_results_to_get_final_results(
+            downloaded_months_back=downloaded_months_back,
+            disable_minimal_trades=disable_minimal_trades,
+            disable_decent_win_rate=disable_decent_win_rate,
+            decent_win_rate=decent_win_rate,
+            min_profit_factor=min_profit_factor,
+            min_sqn=min_sqn,
+            executions_results=executions_results,
+        )
+        return ret
+
     def _find_out_best_parameters_from_parquet_file(
         self,
         *,
@@ -367,23 +649,84 @@ class BacktestingCliService:
         min_sqn: float | None = None,
         tp_filter: TakeProfitFilter = "all",
     ) -> BacktestingExecutionSummary:
-        executions_results = self._serde.load(from_parquet)
+        table = self._serde.load_table(from_parquet)
         # 3.2 Filter results based on cli parameters
-        if tp_filter == "enabled":
-            executions_results = [res for res in executions_results if res.parameters.enable_exit_on_take_profit]
-        elif tp_filter == "disabled":
-            executions_results = [res for res in executions_results if not res.parameters.enable_exit_on_take_profit]
-        ret = self._iter_over_executions_results_to_get_final_results(
+        if tp_filter != "all":
+            enable_exit_on_take_profit = table.column("parameters.enable_exit_on_take_profit")
+            table = table.filter(
+                enable_exit_on_take_profit if tp_filter == "enabled" else pc.invert(enable_exit_on_take_profit)
+            )
+        ret = self._get_final_results_from_table(
+            table,
+            downloaded_months_back=downloaded_months_back,
+            disable_minimal_trades=disable_minimal_trades,
+            disable_decent_win_rate=disable_decent_win_rate,
+            decent_win_rate=decent_win_rate,
+            min_profit_factor=min_profit_factor,
+            min_sqn=min_sqn,
+        )
+        return ret
+
+    def _find_out_best_parameters_from_results_store(
+        self,
+        *,
+        symbol: str,
+        exchange: str,
+        timeframe: str,
+        results_since: date | None = None,
+        downloaded_months_back: int = DEFAULT_MONTHS_BACK,
+        disable_minimal_trades: bool = False,
+        disable_decent_win_rate: bool = False,
+        decent_win_rate: float = SECOND_ITERATION_DECENT_WIN_RATE_THRESHOLD,
+        min_profit_factor: float | None = None,
+        min_sqn: float | None = None,
+        tp_filter: TakeProfitFilter = "all",
+    ) -> BacktestingExecutionSummary:
+        # XXX: [JMSOLA] Only the filters which are never relaxed are pushed down to the stored research runs
+        table = self._results_store.query(
+            symbol=symbol,
+            exchange=exchange,
+            timeframe=timeframe,
+            since=results_since,
+            only_profitable=True,
+            min_trades=None if disable_minimal_trades else get_min_trades_for_stats(downloaded_months_back),
+            tp_filter=tp_filter,
+        )
+        ret = self._get_final_results_from_table(
+            self._serde.drop_na(table),
             downloaded_months_back=downloaded_months_back,
             disable_minimal_trades=disable_minimal_trades,
             disable_decent_win_rate=disable_decent_win_rate,
             decent_win_rate=decent_win_rate,
             min_profit_factor=min_profit_factor,
             min_sqn=min_sqn,
-            executions_results=executions_results,
         )
         return ret
 
+    def _get_final_results_from_table(
+        self,
+        table: pa.Table,
+        *,
+        downloaded_months_back: int,
+        disable_minimal_trades: bool,
+        disable_decent_win_rate: bool,
+        decent_win_rate: float,
+        min_profit_factor: float | None,
+        min_sqn: float | None,
+    ) -> BacktestingExecutionSummary:
+        # XXX: [JMSOLA] Results are filtered and ranked as columns, so only the champions are deserialized
+        champion_indices = FinalResultsSelector(table).select(
+            downloaded_months_back=downloaded_months_back,
+            disable_minimal_trades=disable_minimal_trades,
+            disable_decent_win_rate=disable_decent_win_rate,
+            decent_win_rate=decent_win_rate,
+            min_profit_factor=min_profit_factor,
+            min_sqn=min_sqn,
+        )
+        champions = self._serde.from_table(table.take(pa.array(list(champion_indices.values()), type=pa.int64())))
+        ret = BacktestingExecutionSummary(**dict(zip(champion_indices.keys(), champions, strict=True)))
+        return ret
+
     def _calculate_parameter_refinement(
         self, first_execution_result_summary: BacktestingExecutionSummary
     ) -> list[ParametersRefinementResult]:
@@ -498,9 +841,12 @@ class BacktestingCliService:
         buy_min_volume_threshold_values: list[float],
         buy_max_volume_threshold_values: list[float],
         sell_min_volume_threshold_values: list[float],
+        research_executor: ResearchExecutor,
         disable_progress_bar: bool,
         df: pd.DataFrame,
         timeframe: str = "1h",
+        results_cache: BacktestResultCache | None = None,
+        checkpoint: ResearchCheckpoint | None = None,
         apply_heuristics: bool = True,
         echo_fn: Callable[[str], None] | None = None,
     ) -> list[BacktestingExecutionResult]:
@@ -514,36 +860,145 @@ class BacktestingCliService:
             apply_heuristics=apply_heuristics,
             echo_fn=echo_fn,
         )
-        # Use joblib to run the backtests in parallel across all available CPU cores
-        # tqdm is now wrapped around the parallel execution
-        ret = self._exec_joblib_execution_by_cartesian_product(
+        # Run the backtests in parallel across the research worker processes
+        ret = self._exec_parallel_execution_by_cartesian_product(
             exchange=exchange,
             initial_cash=initial_cash,
+            research_executor=research_executor,
             disable_progress_bar=disable_progress_bar,
             df=df,
             timeframe=timeframe,
             cartesian_product=cartesian_product,
+            results_cache=results_cache,
+            checkpoint=checkpoint,
         )
         return ret
 
-    def _exec_joblib_execution_by_cartesian_product(
+    def _exec_parallel_execution_by_cartesian_product(
         self,
         *,
         exchange: str,
         initial_cash: float,
+        research_executor: ResearchExecutor,
         disable_progress_bar: bool,
         df: pd.DataFrame,
         timeframe: str,
         cartesian_product: list[BuySellSignalsConfigItem],
+        results_cache: BacktestResultCache | None = None,
+        checkpoint: ResearchCheckpoint | None = None,
+        warmup_bars: int = 0,
     ) -> list[BacktestingExecutionResult]:
-        results = Parallel(n_jobs=-1)(
-            delayed(run_single_backtest_combination)(exchange, params, initial_cash, df, timeframe)
-            for params in (tqdm(cartesian_product) if not disable_progress_bar else cartesian_product)
+        # XXX: [JMSOLA] Every combination is identified by the content hash of the results cache, so combinations
+        #      already run on the same candles and with the same strategy code (either stored in the results cache
+        #      or in the checkpoint of an interrupted research) are not run again
+        candles_hash = self._results_cache.get_candles_hash(df)
+        keys = [
+            self._results_cache.get_key(
+                candles_hash=candles_hash,
+                exchange=exchange,
+                initial_cash=initial_cash,
+                timeframe=timeframe,
+                simulated_bs_config=params,
+                warmup_bars=warmup_bars,
+            )
+            for params in cartesian_product
+        ]
+        # NOTE: Checkpoints might be shared by several runs (e.g. the rungs of a successive halving search),
+        #       so only the results of these combinations are loaded
+        previous_results_by_key = checkpoint.load(keys) if checkpoint is not None else {}
+        if results_cache is not None:
+            previous_results_by_key |= results_cache.get_many(key for key in keys if key not in previous_results_by_key)
+        keys_to_run, combinations_to_run = [], []
+        for key, params in zip(keys, cartesian_product, strict=True):
+            if key not in previous_results_by_key:
+                keys_to_run.append(key)
+                combinations_to_run.append(params)
+        logger.info(
+            f"♻️ {len(cartesian_product) - len(combinations_to_run)} of {len(cartesian_product)} "
+            + "combinations found in the results cache or in the checkpoint"
         )
+        # Results are streamed into the checkpoint as soon as they are ready
+        ran_results_by_key: dict[str, BacktestingExecutionResult | None] = {}
+        for key, result in zip(
+            keys_to_run,
+            self._iter_parallel_execution(
+                exchange=exchange,
+                initial_cash=initial_cash,
+                research_executor=research_executor,
+                disable_progress_bar=disable_progress_bar,
+                df=df,
+                timeframe=timeframe,
+                cartesian_product=combinations_to_run,
+                warmup_bars=warmup_bars,
+            ),
+            strict=True,
+        ):
+            ran_results_by_key[key] = result
+            # NOTE: Failed runs are neither checkpointed nor cached, so they are retried on the next research
+            if checkpoint is not None and result is not None:
+                checkpoint.write(key, result)
+        if results_cache is not None:
+            results_cache.put_many({key: result for key, result in ran_results_by_key.items() if result is not None})
+        # Previous and new results are merged, keeping the order of the cartesian product
+        results = [
+            previous_results_by_key[key] if key in previous_results_by_key else ran_results_by_key[key] for key in keys
+        ]
         # Filter out any runs that failed (they will return None)
         executions_results = [res for res in results if res is not None]
         return executions_results
 
+    def _iter_parallel_execution(
+        self,
+        *,
+        exchange: str,
+        initial_cash: float,
+        research_executor: ResearchExecutor,
+        disable_progress_bar: bool,
+        df: pd.DataFrame,
+        timeframe: str,
+        cartesian_product: list[BuySellSignalsConfigItem],
+        warmup_bars: int = 0,
+    ) -> Iterator[BacktestingExecutionResult | None]:
+        if not cartesian_product:
+            return
+        # XXX: [JMSOLA] Indicators only depend on a few parameters (see IndicatorsKey), and most of the combinations
+        #      only differ on the signal and exit parameters, so every distinct indicators frame is calculated once
+        #      and shared among all the combinations which depend on it
+        combinations_by_indicators_key: dict[IndicatorsKey, list[BuySellSignalsConfigItem]] = pydash.group_by(
+            cartesian_product, IndicatorsKey.from_config
+        )
+        # Candles and indicators frames are published once as memory-mapped files, so workers attach to them
+        # by path, instead of pickling the whole frame on every single task
+        with SharedFrameStore() as shared_frame_store:
+            shared_df = shared_frame_store.publish(df)
+            # NOTE: One indicators frame per task, since there are only a few of them and they are expensive
+            indicators_frames = research_executor.starmap(
+                calculate_indicators_frame,
+                [
+                    (combinations[0], shared_df, shared_frame_store.new_frame_directory())
+                    for combinations in combinations_by_indicators_key.values()
+                ],
+                chunk_size=1,
+                disable_progress_bar=True,
+            )
+            indicators_frame_by_key = dict(zip(combinations_by_indicators_key.keys(), indicators_frames, strict=True))
+            # NOTE: Shared frames are kept until the last result has been consumed
+            yield from research_executor.istarmap(
+                partial(run_single_backtest_combination, indicators_calculated=True, warmup_bars=warmup_bars),
+                (
+                    (
+                        exchange,
+                        params,
+                        initial_cash,
+                        indicators_frame_by_key[IndicatorsKey.from_config(params)],
+                        timeframe,
+                    )
+                    for params in cartesian_product
+                ),
+                total=len(cartesian_product),
+                disable_progress_bar=disable_progress_bar,
+            )
+
     def _iter_over_executions_results_to_get_final_results(
         self,
         *,
@@ -555,164 +1010,17 @@ class BacktestingCliService:
         min_sqn: float | None = None,
         executions_results: list[BacktestingExecutionResult],
     ) -> BacktestingExecutionSummary:
-        ret: BacktestingExecutionSummary = None
-        # Try first to iterative over decent win rate
-        attemps = 0
-        current_decent_win_rate = None
-        while attemps < ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS and (ret is None or len(ret.all) <= 0):
-            attemps += 1
-            current_decent_win_rate = (
-                decent_win_rate if current_decent_win_rate is None else (current_decent_win_rate - 1)
-            )
-            current_decent_win_rate = (
-                round(current_decent_win_rate, ndigits=2) if current_decent_win_rate is not None else None
-            )
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=disable_minimal_trades,
-                disable_decent_win_rate=disable_decent_win_rate,
-                decent_win_rate=current_decent_win_rate
-                if current_decent_win_rate is not None and current_decent_win_rate > 0
-                else None,
-                min_profit_factor=min_profit_factor,
-                min_sqn=min_sqn,
-                executions_results=executions_results,
-            )
-
-        # Iterate over min SQN
-        attemps = 0
-        current_min_sqn = None
-        while attemps < ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS and (ret is None or len(ret.all) <= 0):
-            attemps += 1
-            current_min_sqn = min_sqn if current_min_sqn is None else (current_min_sqn - 0.1)
-            current_min_sqn = round(current_min_sqn, ndigits=2) if current_min_sqn is not None else None
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=disable_minimal_trades,
-                disable_decent_win_rate=disable_decent_win_rate,
-                decent_win_rate=decent_win_rate,
-                min_profit_factor=min_profit_factor,
-                min_sqn=current_min_sqn if current_min_sqn is not None and current_min_sqn > 0 else None,
-                executions_results=executions_results,
-            )
-        # Iterate over min profit factor
-        attemps = 0
-        current_min_profit = None
-        while attemps < ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS and (ret is None or len(ret.all) <= 0):
-            attemps += 1
-            current_min_profit = min_profit_factor if current_min_profit is None else (current_min_profit - 0.1)
-            current_min_profit = round(current_min_profit, ndigits=2) if current_min_profit is not None else None
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=disable_minimal_trades,
-                disable_decent_win_rate=disable_decent_win_rate,
-                decent_win_rate=decent_win_rate,
-                min_profit_factor=current_min_profit
-                if current_min_profit is not None and current_min_profit > 0
-                else None,
-                min_sqn=None,
-                executions_results=executions_results,
-            )
-        # Iterate over decent win rate second time, without min profit factor and min_sqn
-        attemps = 0
-        current_decent_win_rate = None
-        while attemps < ITERATE_OVER_EXEC_RESULTS_MAX_ATTEMPS and (ret is None or len(ret.all) <= 0):
-            attemps += 1
-            current_decent_win_rate = (
-                decent_win_rate if current_decent_win_rate is None else (current_decent_win_rate - 1)
-            )
-            current_decent_win_rate = (
-                round(current_decent_win_rate, ndigits=2) if current_decent_win_rate is not None else None
-            )
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=disable_minimal_trades,
-                disable_decent_win_rate=disable_decent_win_rate,
-                decent_win_rate=current_decent_win_rate
-                if current_decent_win_rate is not None and current_decent_win_rate > 0
-                else None,
-                min_profit_factor=None,
-                min_sqn=None,
-                executions_results=executions_results,
-            )
-        # Disable decent win rate
-        if ret is None:
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=disable_minimal_trades,
-                disable_decent_win_rate=True,
-                decent_win_rate=0.0,
-                min_profit_factor=None,
-                min_sqn=None,
-                executions_results=executions_results,
-            )
-        if ret is None:
-            ret = self._get_backtesting_result_summary(
-                downloaded_months_back=downloaded_months_back,
-                disable_minimal_trades=True,
-                disable_decent_win_rate=True,
-                decent_win_rate=0.0,
-                min_profit_factor=None,
-                min_sqn=None,
-                executions_results=executions_results,
-            )
-        return ret
-
-    def _get_backtesting_result_summary(
-        self,
-        *,
-        downloaded_months_back: int,
-        disable_minimal_trades: bool,
-        disable_decent_win_rate: bool,
-        decent_win_rate: float,
-        min_profit_factor: float | None,
-        min_sqn: float | None,
-        executions_results: list[BacktestingExecutionResult],
-    ) -> BacktestingExecutionSummary:
-        # 4. Filter for viable strategies to analyze
-        # We only care about strategies that were profitable and had a meaningful number of trades
-
-        # 4.1. Calculate the minimum number of trades required to consider a strategy for stats
-        num_of_weeks_downloaded = downloaded_months_back * 4
-        min_trades_for_stats = max(MIN_TRADES_FOR_STATS, math.ceil(num_of_weeks_downloaded * MIN_ENTRIES_PER_WEEK))
-        profitable_results = [
-            res
-            for res in executions_results
-            if res.net_profit_amount > 0
-            and (disable_minimal_trades or res.number_of_trades >= min_trades_for_stats)
-            and (disable_decent_win_rate or res.win_rate >= decent_win_rate)
-            and (min_sqn is None or res.sqn >= min_sqn)
-            and (min_profit_factor is None or res.profit_factor >= min_profit_factor)
-        ]
-        best_overall, highest_quality, best_profitable, best_win_rate = None, None, None, None
-        if profitable_results:
-            # --- Category 1: Best Overall (Profit x Win Rate x Trades) ---
-            best_overall = max(
-                profitable_results, key=lambda r: r.net_profit_percentage * r.win_rate * r.number_of_trades
-            )
-            # --- Category 2: Highest Quality (Return x Win Rate) ---
-            highest_quality = max(profitable_results, key=lambda r: r.net_profit_percentage * r.win_rate)
-            # --- Category 3: Best Profitable Configuration ---
-            best_profitable = max(profitable_results, key=lambda r: r.net_profit_amount)
-            # --- Category 4: Best Win Rate ---
-            # First, find the maximum win rate that was achieved
-            max_win_rate = max(p.win_rate for p in profitable_results)
-            # Create a group of "elite" candidates with a win rate close to the maximum
-            # (e.g., all strategies within 5 percentage points of the best result)
-            elite_win_rate_candidates = [res for res in profitable_results if res.win_rate >= (max_win_rate - 5.0)]
-            # From that elite group, pick the one with the highest NET RETURN.
-            if elite_win_rate_candidates:
-                best_win_rate = max(elite_win_rate_candidates, key=lambda r: r.net_profit_amount)
-            else:  # Fallback in case the list is empty (should not happen)
-                best_win_rate = max(profitable_results, key=lambda r: r.win_rate)
-
+        champion_indices = FinalResultsSelector.from_results(executions_results).select(
+            downloaded_months_back=downloaded_months_back,
+            disable_minimal_trades=disable_minimal_trades,
+            disable_decent_win_rate=disable_decent_win_rate,
+            decent_win_rate=decent_win_rate,
+            min_profit_factor=min_profit_factor,
+            min_sqn=min_sqn,
+        )
         ret = BacktestingExecutionSummary(
-            best_overall=best_overall,
-            highest_quality=highest_quality,
-            best_profitable=best_profitable,
-            best_win_rate=best_win_rate,
+            **{name: executions_results[index] for name, index in champion_indices.items()}
         )
-
         return ret
 
     def _calculate_cartesian_product(
@@ -871,7 +1179,7 @@ class BacktestingCliService:
         self,
         simulated_bs_config: BuySellSignalsConfigItem,
         initial_cash: float,
-        stats: pd.Series,
+        stats: Mapping[str, Any],
         *,
         timeframe: str = "1h",
     ) -> BacktestingExecutionResult:
@@ -897,18 +1205,56 @@ class BacktestingCliService:
         )
         return current_execution_result
 
+    def _prepare_signals(
+        self,
+        df: pd.DataFrame,
+        simulated_bs_config: BuySellSignalsConfigItem,
+        *,
+        timeframe: str,
+        echo_fn: Callable[[str], None] | None = None,
+        indicators_calculated: bool = False,
+    ) -> None:
+        # NOTE: Indicators might have been calculated beforehand and shared among several combinations
+        if not indicators_calculated:
+            self.calculate_indicators(df, simulated_bs_config)
+
+        if echo_fn:
+            echo_fn("🧠 Generating signals for each historical candle...")
+        df["buy_signal"], df["sell_signal"] = calculate_buy_sell_signals(
+            df, simulated_bs_config, volatility_threshold=self._signal_service._get_volatility_threshold(timeframe)
+        )
+        # NEW: Add previous MACD hist for the accelerating momentum check
+        df["prev_macd_hist"] = df["macd_hist"].shift(1)
+        df.fillna(False, inplace=True)
+
+    def _get_taker_fees(self, exchange: str) -> float:
+        return MEXC_TAKER_FEES if exchange == "mexc" else BIT2ME_TAKER_FEES
+
     def _save_executions_results_in_parquet_file(
         self,
         symbol: str,
+        exchange: str,
         timeframe: str,
         tp_filter: TakeProfitFilter,
         results: list[BacktestingExecutionResult],
         *,
         suffix: str,
     ) -> None:
-        os.makedirs("data/backtesting/raw", exist_ok=True)
-        parquet_file = f"data/backtesting/raw/{symbol.replace('/', '_')}_{timeframe}_{tp_filter}_{suffix}.parquet"  # noqa: E501
-        self._serde.save(results=results, filepath=parquet_file)
+        self._results_store.append(
+            results, symbol=symbol, exchange=exchange, timeframe=timeframe, run_name=f"{tp_filter}_{suffix}"
+        )
+        # Once all the results are stored, the checkpoint of the research is not needed anymore
+        self._get_research_checkpoint(symbol, timeframe, tp_filter, suffix=suffix).remove()
+
+    def _get_research_checkpoint(
+        self, symbol: str, timeframe: str, tp_filter: TakeProfitFilter, *, suffix: str
+    ) -> ResearchCheckpoint:
+        ret = ResearchCheckpoint(
+            os.path.join(
+                DEFAULT_RESEARCH_CHECKPOINTS_FOLDER_PATH, f"{symbol.replace('/', '_')}_{timeframe}_{tp_filter}_{suffix}"
+            )
+        )
+        return ret
 
     def _convert_timeframe_to_interval(self, timeframe: str) -> int:
         # The interval of entries in minutes: 1, 5, 15, 30, 60 (1 hour), 240 (4 hours), 1440 (1 day)
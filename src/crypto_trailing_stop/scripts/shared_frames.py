@@ -0,0 +1,91 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedFrameColumn:
+    name: str
+    filename: str
+    # Timezone of datetime columns, which are stored as naive UTC datetimes
+    tz: str | None = None
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """
+    Lightweight (and picklable) reference to a DataFrame published as memory-mapped numpy files,
+    so parallel workers attach to the same candles by path instead of receiving their own pickled copy.
+    """
+
+    directory: str
+    columns: tuple[SharedFrameColumn, ...]
+
+    @classmethod
+    def publish(cls, df: pd.DataFrame, directory: str) -> Self:
+        columns: list[SharedFrameColumn] = []
+        for position, (name, series) in enumerate(df.items()):
+            tz: str | None = None
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                tz = str(series.dt.tz)
+                values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+            else:
+                values = series.to_numpy()
+            if values.dtype.hasobject:
+                raise ValueError(f"Column '{name}' holds Python objects, so it can not be memory-mapped")
+            filename = f"{position}.npy"
+            np.save(os.path.join(directory, filename), values, allow_pickle=False)
+            columns.append(SharedFrameColumn(name=str(name), filename=filename, tz=tz))
+        return cls(directory=directory, columns=tuple(columns))
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Zero-copy view of the published DataFrame, with a default RangeIndex.
+        """
+        data: dict[str, np.ndarray | pd.DatetimeIndex] = {}
+        for column in self.columns:
+            # XXX: [JMSOLA] Copy-on-write mapping: pages are shared among all the workers until one of them
+            #      writes on them (e.g. fillna), which only changes its own private copy of those pages
+            # NOTE: Plain ndarray view, so pandas does not spread the memmap subclass along its results
+            values = np.load(os.path.join(self.directory, column.filename), mmap_mode="c").view(np.ndarray)
+            if column.tz:
+                # NOTE: Integers are taken as UTC epochs, whereas tz_localize would copy the whole column
+                unit, _ = np.datetime_data(values.dtype)
+                values = pd.DatetimeIndex(
+                    values.view(np.int64), dtype=pd.DatetimeTZDtype(unit=unit, tz=column.tz), copy=False
+                )
+            data[column.name] = values
+        # NOTE: Without copy, columns are not consolidated into 2-D blocks, so each one keeps its own mapping
+        ret = pd.DataFrame(data, copy=False)
+        return ret
+
+
+class SharedFrameStore:
+    """
+    Owns the temporary directory where frames are published, removing all of them on close.
+    """
+
+    def __init__(self) -> None:
+        self._temporary_directory = tempfile.TemporaryDirectory(prefix="backtesting-shared-frames-")
+
+    def new_frame_directory(self) -> str:
+        return tempfile.mkdtemp(prefix="frame-", dir=self._temporary_directory.name)
+
+    def publish(self, df: pd.DataFrame) -> SharedFrame:
+        return SharedFrame.publish(df, self.new_frame_directory())
+
+    def close(self) -> None:
+        self._temporary_directory.cleanup()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
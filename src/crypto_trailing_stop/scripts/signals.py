@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+
+# NOTE: Signals of a candle are evaluated over the closed candles right before it, the same way the bot does:
+#       last (1 candle ago), prev (2 candles ago), prior (3 candles ago) and oldest (4 candles ago)
+SIGNALS_LOOKBACK_CANDLES = 4
+
+
+def calculate_buy_sell_signals(
+    df: pd.DataFrame, buy_sell_signals_config: BuySellSignalsConfigItem, *, volatility_threshold: float
+) -> tuple[pd.Series, pd.Series]:
+    """
+    Vectorized equivalent of BuySellSignalsTaskService._check_signals for every candle of the DataFrame at once,
+    as boolean expressions over whole indicator columns and their shifted views.
+    Returns the buy and sell signals series, aligned with the DataFrame index.
+    """
+    # XXX: [JMSOLA] Every comparison is done explicitly (e.g. <= instead of negating >),
+    #      since any comparison against NaN is False, the same as it is in the per-candle path
+    ema_short_above_mid = df["ema_short"] > df["ema_mid"]
+    ema_short_not_above_mid = df["ema_short"] <= df["ema_mid"]
+    ema_short_below_mid = df["ema_short"] < df["ema_mid"]
+    ema_short_not_below_mid = df["ema_short"] >= df["ema_mid"]
+    bearish_divergence = df["bearish_divergence"].astype(bool)
+    volume_climax = _get_volume_climax(df, buy_sell_signals_config)
+    trend_momentum_confirmed = (
+        ~bearish_divergence
+        & (df["macd_hist"] > 0)
+        & _get_strong_uptrend(df, buy_sell_signals_config)
+        & _get_healthy_volume(df, buy_sell_signals_config)
+    )
+    # 1. Immediate signal, vetoed by a recent bearish divergence or volume climax
+    buy_signal = (
+        _ago(ema_short_not_above_mid, 2)
+        & _ago(ema_short_above_mid, 1)
+        & _ago(trend_momentum_confirmed, 1)
+        & ~(_ago(bearish_divergence, 2) | _ago(bearish_divergence, 3))
+        & ~(_ago(volume_climax, 2) | _ago(volume_climax, 3))
+    )
+    if buy_sell_signals_config.enable_adx_filter:
+        # 2. Delayed signal from 1 candle ago
+        signal_delayed_1_ago = (
+            _ago(ema_short_not_above_mid, 3)
+            & _ago(ema_short_above_mid, 2)
+            & _ago(trend_momentum_confirmed, 1)
+            & ~_ago(trend_momentum_confirmed, 2)
+            & ~_ago(bearish_divergence, 2)
+            & ~_ago(volume_climax, 2)
+        )
+        # 3. Delayed signal from 2 candles ago
+        signal_delayed_2_ago = (
+            _ago(ema_short_not_above_mid, 4)
+            & _ago(ema_short_above_mid, 3)
+            & _ago(trend_momentum_confirmed, 1)
+            & ~_ago(trend_momentum_confirmed, 2)
+            & ~_ago(trend_momentum_confirmed, 3)
+            & ~_ago(bearish_divergence, 2)
+            & ~_ago(volume_climax, 2)
+            & ~_ago(bearish_divergence, 3)
+            & ~_ago(volume_climax, 3)
+        )
+        buy_signal = buy_signal | signal_delayed_1_ago | signal_delayed_2_ago
+    is_sell_volume_confirmed = (
+        df["relative_vol"] >= buy_sell_signals_config.sell_min_volume_threshold
+        if buy_sell_signals_config.enable_sell_volume_filter
+        else _constant(df, True)
+    )
+    sell_signal = (
+        _ago(ema_short_not_below_mid, 2)
+        & _ago(ema_short_below_mid, 1)
+        & _ago(df["macd_hist"] < 0, 1)
+        & _ago(is_sell_volume_confirmed, 1)
+    )
+    # Volatility filter: no signals at all when the market is too choppy
+    is_choppy = _ago(df["atr"] < df["close"] * volatility_threshold, 1)
+    # The first candles do not have enough closed candles before them
+    has_enough_candles = pd.Series(np.arange(len(df)) >= SIGNALS_LOOKBACK_CANDLES, index=df.index)
+    return buy_signal & ~is_choppy & has_enough_candles, sell_signal & ~is_choppy & has_enough_candles
+
+
+def _get_strong_uptrend(df: pd.DataFrame, buy_sell_signals_config: BuySellSignalsConfigItem) -> pd.Series:
+    if not buy_sell_signals_config.enable_adx_filter:
+        return _constant(df, True)
+    trend_strength_confirmed = df["adx"] > buy_sell_signals_config.adx_threshold
+    trend_direction_confirmed = (
+        (df["adx_pos"] > df["adx_neg"])
+        | ((df["macd_line"] > 0) & (df["low"] > df["ema_mid"]))
+        | (df["close"] > df["bb_upper"])
+    )
+    return trend_strength_confirmed & trend_direction_confirmed
+
+
+def _get_healthy_volume(df: pd.DataFrame, buy_sell_signals_config: BuySellSignalsConfigItem) -> pd.Series:
+    if not buy_sell_signals_config.enable_buy_volume_filter:
+        return _constant(df, True)
+    return (df["relative_vol"] >= buy_sell_signals_config.buy_min_volume_threshold) & (
+        df["relative_vol"] <= buy_sell_signals_config.buy_max_volume_threshold
+    )
+
+
+def _get_volume_climax(df: pd.DataFrame, buy_sell_signals_config: BuySellSignalsConfigItem) -> pd.Series:
+    if not buy_sell_signals_config.enable_buy_volume_filter:
+        return _constant(df, False)
+    return df["relative_vol"] > buy_sell_signals_config.buy_max_volume_threshold
+
+
+def _ago(condition: pd.Series, candles: int) -> pd.Series:
+    # NOTE: Candles before the first one are missing, so their conditions are not met
+    return condition.shift(candles, fill_value=False)
+
+
+def _constant(df: pd.DataFrame, value: bool) -> pd.Series:
+    return pd.Series(value, index=df.index, dtype=bool)
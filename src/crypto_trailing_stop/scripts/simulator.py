@@ -0,0 +1,306 @@
+import math
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
+from crypto_trailing_stop.scripts.constants import DEFAULT_TRADING_MARKET_CONFIG
+
+# NOTE: Same fraction of the available cash backtesting.py invests on every buy (see Strategy.buy)
+_FULL_EQUITY = 1 - sys.float_info.epsilon
+# Number of candles the exit of a trade is first looked for, doubled on every unsuccessful attempt
+_EXIT_SEARCH_INITIAL_WINDOW = 64
+
+
+@dataclass(frozen=True)
+class SimulatedTrade:
+    size: int
+    entry_bar: int
+    exit_bar: int
+    entry_price: float
+    exit_price: float
+    commissions: float
+
+    @property
+    def pnl(self) -> float:
+        return (self.size * (self.exit_price - self.entry_price)) - self.commissions
+
+    @property
+    def return_pct(self) -> float:
+        return (self.exit_price / self.entry_price - 1) - self.commissions / (self.size * self.entry_price)
+
+
+class SignalStrategySimulator:
+    """
+    Event-driven equivalent of running SignalStrategy on backtesting.py. Instead of calling the strategy on every
+    candle, it jumps from a buy signal to the exit of its trade, looking for the exit over numpy arrays.
+    Fills mirror backtesting.py: orders are filled on the next candle open, the stop loss is checked before
+    any other order (even on the entry candle) and commissions are charged on both entry and exit.
+    Stats are calculated the same way backtesting.py does for a RangeIndex, so durations are measured in candles.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        simulated_bs_config: BuySellSignalsConfigItem,
+        *,
+        orders_analytics_service: OrdersAnalyticsService,
+        initial_cash: float,
+        commission: float,
+        warmup_bars: int = 0,
+    ) -> None:
+        self._df = df
+        self._simulated_bs_config = simulated_bs_config
+        self._orders_analytics_service = orders_analytics_service
+        self._initial_cash = initial_cash
+        self._commission = commission
+        self._open = df["open"].to_numpy(dtype=float)
+        self._high = df["high"].to_numpy(dtype=float)
+        self._low = df["low"].to_numpy(dtype=float)
+        self._close = df["close"].to_numpy(dtype=float)
+        self._atr = df["atr"].to_numpy(dtype=float)
+        self._macd_hist = df["macd_hist"].to_numpy(dtype=float)
+        self._prev_macd_hist = df["prev_macd_hist"].to_numpy(dtype=float)
+        self._buy_signal = df["buy_signal"].to_numpy(dtype=bool)
+        self._sell_signal = df["sell_signal"].to_numpy(dtype=bool)
+        self._bearish_divergence = df["bearish_divergence"].to_numpy(dtype=bool)
+        # XXX: [JMSOLA] The latest buy or sell signal until every candle, since an active sell signal
+        #      (which is remembered until a buy signal cancels it) allows to exit on momentum loss
+        self._last_signal_bar = np.maximum.accumulate(
+            np.where(self._buy_signal | self._sell_signal, np.arange(len(df)), -1)
+        )
+        self._is_last_signal_sell = (self._last_signal_bar >= 0) & self._sell_signal[self._last_signal_bar]
+        self._buy_signal_bars = np.flatnonzero(self._buy_signal)
+        # NOTE: Candles where the strategy indicators are still warming up are skipped, as backtesting.py does,
+        #       along with the given warm-up candles, which are only there to calculate the indicators
+        self._warmup_bars = max(
+            warmup_bars,
+            *(int(np.isnan(indicator).argmin()) for indicator in (self._atr, self._macd_hist, self._prev_macd_hist)),
+        )
+
+    def run(self) -> dict[str, Any]:
+        """
+        Runs the simulation, returning the stats under the same keys as backtesting.py does.
+        """
+        bars = len(self._df)
+        cash = float(self._initial_cash)
+        equity = np.full(bars, cash)
+        trades: list[SimulatedTrade] = []
+        # First candle whose strategy iteration might place a buy order
+        bar = 1 + self._warmup_bars
+        while bar < bars:
+            signal_bar = self._find_next_buy_signal_bar(bar)
+            # The buy order is filled on the next candle open, so signals on the last candle are never filled
+            if signal_bar is None or signal_bar + 1 >= bars:
+                break
+            entry_bar = signal_bar + 1
+            stop_loss_percent_value, stop_loss_price = self._calculate_stop_loss(signal_bar)
+            entry_price = float(self._open[entry_bar])
+            size = self._calculate_size(cash, entry_price)
+            if not size:
+                # Not enough cash even for a single unit, so the broker cancels the order
+                bar = entry_bar
+                continue
+            entry_commission = abs(size) * entry_price * self._commission
+            cash -= entry_commission
+            exit_bar, exit_price = self._find_exit(
+                signal_bar,
+                entry_bar,
+                entry_price,
+                stop_loss_percent_value=stop_loss_percent_value,
+                stop_loss_price=stop_loss_price,
+            )
+            if exit_bar is None:
+                # NOTE: Trades still open at the end are reflected on the equity, but not on the trades stats
+                equity[entry_bar:] = cash + size * (self._close[entry_bar:] - entry_price)
+                break
+            equity[entry_bar:exit_bar] = cash + size * (self._close[entry_bar:exit_bar] - entry_price)
+            exit_commission = abs(size) * exit_price * self._commission
+            cash += (size * (exit_price - entry_price)) - exit_commission
+            equity[exit_bar:] = cash
+            trades.append(
+                SimulatedTrade(
+                    size=size,
+                    entry_bar=entry_bar,
+                    exit_bar=exit_bar,
+                    entry_price=entry_price,
+                    exit_price=exit_price,
+                    commissions=exit_commission + entry_commission,
+                )
+            )
+            bar = exit_bar
+        ret = self._calculate_stats(equity, trades)
+        return ret
+
+    def _find_next_buy_signal_bar(self, bar: int) -> int | None:
+        position = int(np.searchsorted(self._buy_signal_bars, bar))
+        ret = int(self._buy_signal_bars[position]) if position < len(self._buy_signal_bars) else None
+        return ret
+
+    def _calculate_stop_loss(self, signal_bar: int) -> tuple[float, float]:
+        last_candle_metrics = CryptoMarketMetrics.from_candlestick(
+            symbol=self._simulated_bs_config.symbol,
+            candlestick=self._df.iloc[signal_bar],
+            trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
+        )
+        closing_price = float(self._close[signal_bar])
+        stop_loss_percent_value = self._orders_analytics_service.calculate_suggested_stop_loss_percent_value(
+            closing_price,
+            buy_sell_signals_config=self._simulated_bs_config,
+            last_candle_market_metrics=last_candle_metrics,
+            trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
+        )
+        stop_loss_price = self._orders_analytics_service._calculate_suggested_safeguard_stop_price(
+            closing_price,
+            suggested_stop_loss_percent_value=stop_loss_percent_value,
+            trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
+        )
+        return stop_loss_percent_value, stop_loss_price
+
+    def _calculate_size(self, cash: float, entry_price: float) -> int:
+        # XXX: [JMSOLA] Same arithmetic as backtesting.py, so the number of units never differs by rounding
+        adjusted_price_plus_commission = entry_price + (_FULL_EQUITY * entry_price * self._commission) / _FULL_EQUITY
+        margin_available = max(0.0, cash)
+        size = int((margin_available * _FULL_EQUITY) // adjusted_price_plus_commission)
+        ret = size if size * adjusted_price_plus_commission <= margin_available else 0
+        return ret
+
+    def _find_exit(
+        self,
+        signal_bar: int,
+        entry_bar: int,
+        entry_price: float,
+        *,
+        stop_loss_percent_value: float,
+        stop_loss_price: float,
+    ) -> tuple[int | None, float]:
+        break_even_price = self._orders_analytics_service._calculate_break_even_price(
+            entry_price, trading_market_config=DEFAULT_TRADING_MARKET_CONFIG
+        )
+        take_profit_price: float | None = None
+        if self._simulated_bs_config.enable_exit_on_take_profit:
+            take_profit_price, *_ = self._orders_analytics_service.calculate_take_profit_limit_price(
+                entry_price,
+                stop_loss_percent_value=stop_loss_percent_value,
+                buy_sell_signals_config=self._simulated_bs_config,
+                trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
+            )
+        exit_event_bar = self._find_first_bar(
+            entry_bar,
+            lambda start, stop: self._is_stop_loss_hit(start, stop, stop_loss_price)
+            | self._is_exit_decided(start, stop, signal_bar, break_even_price, take_profit_price),
+        )
+        if exit_event_bar is None:
+            ret = None, math.nan
+        elif stop_loss_price and self._low[exit_event_bar] <= stop_loss_price:
+            # The stop loss is filled at its price, unless the candle opens below it
+            ret = exit_event_bar, float(min(self._open[exit_event_bar], stop_loss_price))
+        elif exit_event_bar + 1 < len(self._df):
+            # The strategy closes the position, which is filled on the next candle open
+            ret = exit_event_bar + 1, float(self._open[exit_event_bar + 1])
+        else:
+            ret = None, math.nan
+        return ret
+
+    def _is_stop_loss_hit(self, start: int, stop: int, stop_loss_price: float) -> np.ndarray:
+        if not stop_loss_price:
+            return np.zeros(stop - start, dtype=bool)
+        return self._low[start:stop] <= stop_loss_price
+
+    def _is_exit_decided(
+        self, start: int, stop: int, signal_bar: int, break_even_price: float, take_profit_price: float | None
+    ) -> np.ndarray:
+        # 1. Take profit, only if it is above the break even price
+        exit_on_take_profit = (
+            (self._high[start:stop] >= take_profit_price) & (take_profit_price >= break_even_price)
+            if take_profit_price is not None
+            else np.zeros(stop - start, dtype=bool)
+        )
+        # 2. Divergence or sell signal (while the momentum is being lost), only above the break even price
+        exit_on_divergence = (
+            self._bearish_divergence[start:stop]
+            if self._simulated_bs_config.enable_exit_on_divergence_signal
+            else np.zeros(stop - start, dtype=bool)
+        )
+        # NOTE: The sell signal alert is reset when buying, so only signals after the buy signal count
+        exit_on_sell_signal_state = (
+            (self._last_signal_bar[start:stop] > signal_bar)
+            & self._is_last_signal_sell[start:stop]
+            & (self._macd_hist[start:stop] < 0)
+            & (self._macd_hist[start:stop] < self._prev_macd_hist[start:stop])
+            if self._simulated_bs_config.enable_exit_on_sell_signal
+            else np.zeros(stop - start, dtype=bool)
+        )
+        return exit_on_take_profit | (
+            (self._close[start:stop] >= break_even_price) & (exit_on_divergence | exit_on_sell_signal_state)
+        )
+
+    def _find_first_bar(self, bar: int, condition_fn: Callable[[int, int], np.ndarray]) -> int | None:
+        # NOTE: Trades usually last a few candles, so the condition is not evaluated until the end every time
+        window = _EXIT_SEARCH_INITIAL_WINDOW
+        while bar < len(self._df):
+            stop = min(bar + window, len(self._df))
+            condition = condition_fn(bar, stop)
+            if condition.any():
+                return bar + int(condition.argmax())
+            bar, window = stop, window * 2
+        return None
+
+    def _calculate_stats(self, equity: np.ndarray, trades: list[SimulatedTrade]) -> dict[str, Any]:
+        closing_prices = self._close
+        drawdown = 1 - equity / np.maximum.accumulate(equity)
+        drawdown_durations, drawdown_peaks = self._calculate_drawdown_duration_peaks(drawdown)
+        pnl = np.array([trade.pnl for trade in trades], dtype=float)
+        returns = np.array([trade.return_pct for trade in trades], dtype=float)
+        durations = np.array([trade.exit_bar - trade.entry_bar for trade in trades], dtype=float)
+        number_of_trades = len(trades)
+        pnl_std = float(pnl.std(ddof=1)) if number_of_trades > 1 else math.nan
+        ret = {
+            "Equity Final [$]": float(equity[-1]),
+            "Return [%]": float((equity[-1] - equity[0]) / equity[0] * 100),
+            "Buy & Hold Return [%]": float(
+                (closing_prices[-1] - closing_prices[self._warmup_bars]) / closing_prices[self._warmup_bars] * 100
+            ),
+            "Max. Drawdown [%]": float(-np.nan_to_num(drawdown.max()) * 100),
+            "Avg. Drawdown [%]": float(-self._mean(drawdown_peaks) * 100),
+            "Max. Drawdown Duration": self._max(drawdown_durations),
+            "Avg. Drawdown Duration": self._mean(drawdown_durations),
+            "# Trades": number_of_trades,
+            "Win Rate [%]": float((pnl > 0).mean() * 100) if number_of_trades else math.nan,
+            "Best Trade [%]": self._max(returns) * 100,
+            "Worst Trade [%]": self._min(returns) * 100,
+            "Max. Trade Duration": self._max(durations),
+            "Avg. Trade Duration": self._mean(durations),
+            "Profit Factor": float(returns[returns > 0].sum() / (abs(returns[returns < 0].sum()) or math.nan)),
+            "SQN": float(math.sqrt(number_of_trades) * self._mean(pnl) / (pnl_std or math.nan)),
+        }
+        return ret
+
+    def _calculate_drawdown_duration_peaks(self, drawdown: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # NOTE: Drawdown periods go from a candle without drawdown to the next one (or the last candle)
+        bars_without_drawdown = np.unique(np.r_[np.flatnonzero(drawdown == 0), len(drawdown) - 1])
+        period_starts, period_ends = bars_without_drawdown[:-1], bars_without_drawdown[1:]
+        is_drawdown_period = period_ends > period_starts + 1
+        if not is_drawdown_period.any():
+            # XXX: [JMSOLA] backtesting.py falls back to the raw drawdown values for both of them
+            drawdown_values = drawdown[drawdown != 0]
+            return drawdown_values, drawdown_values
+        period_starts, period_ends = period_starts[is_drawdown_period], period_ends[is_drawdown_period]
+        durations = (period_ends - period_starts).astype(float)
+        peaks = np.array([drawdown[start : end + 1].max() for start, end in zip(period_starts, period_ends)])
+        return durations, peaks
+
+    def _mean(self, values: np.ndarray) -> float:
+        return float(values.mean()) if len(values) else math.nan
+
+    def _min(self, values: np.ndarray) -> float:
+        return float(values.min()) if len(values) else math.nan
+
+    def _max(self, values: np.ndarray) -> float:
+        return float(values.max()) if len(values) else math.nan
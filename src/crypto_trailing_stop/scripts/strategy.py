@@ -2,10 +2,6 @@ import logging
 
 from backtesting import Strategy
 
-from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.impl.bit2me_operating_exchange_service import (  # noqa: E501
-    Bit2MeOperatingExchangeService,
-)
-from crypto_trailing_stop.infrastructure.services.crypto_analytics_service import CryptoAnalyticsService
 from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
@@ -21,17 +17,11 @@ class SignalStrategy(Strategy):
 
     # Parameters that will be set by the backtest engine
     simulated_bs_config: BuySellSignalsConfigItem = None
-    analytics_service: CryptoAnalyticsService = None
+    # NOTE: Built once by the backtesting service and shared among all the runs
+    orders_analytics_service: OrdersAnalyticsService = None
 
     def init(self):
-        # Instantiate the service needed for calculations
-        self._orders_analytics_service = OrdersAnalyticsService(
-            operating_exchange_service=Bit2MeOperatingExchangeService(bit2me_remote_service=None),
-            ccxt_remote_service=self.analytics_service._ccxt_remote_service,
-            stop_loss_percent_service=None,
-            buy_sell_signals_config_service=None,
-            crypto_analytics_service=self.analytics_service,
-        )
+        self._orders_analytics_service = self.orders_analytics_service
         # Map necessary data columns for easy access
         self.atr = self.I(lambda x: x, self.data.atr)
         self.macd_hist = self.I(lambda x: x, self.data.macd_hist)
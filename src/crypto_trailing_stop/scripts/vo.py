@@ -1,9 +1,16 @@
 from dataclasses import dataclass, field, fields
-from typing import Literal
+from typing import Literal, Self
 
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.constants import (
+    DEFAULT_RESEARCH_CHUNK_SIZE,
+    DEFAULT_RESEARCH_MAX_CHUNKS_PER_WORKER,
+    DEFAULT_SUCCESSIVE_HALVING_REDUCTION_FACTOR,
+    DEFAULT_SUCCESSIVE_HALVING_RUNGS,
+)
 
 TakeProfitFilter = Literal["all", "enabled", "disabled"]
+ResearchSearchStrategy = Literal["grid", "successive-halving"]
 
 
 @dataclass
@@ -16,6 +23,45 @@ class ParametersRefinementResult:
     sp_tp_tuples: list[tuple[bool, float, float]] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ResearchExecutorConfig:
+    # Number of worker processes, defaults to the number of CPUs
+    workers: int | None = None
+    # Number of combinations dispatched at once to a worker
+    chunk_size: int = DEFAULT_RESEARCH_CHUNK_SIZE
+    # Number of chunks a worker processes before being replaced, None means workers are never replaced
+    max_chunks_per_worker: int | None = DEFAULT_RESEARCH_MAX_CHUNKS_PER_WORKER
+
+
+@dataclass(frozen=True)
+class SuccessiveHalvingConfig:
+    # Only the best 1 / reduction_factor of the candidates are promoted to the next rung,
+    # whose window of candles is reduction_factor times longer
+    reduction_factor: int = DEFAULT_SUCCESSIVE_HALVING_REDUCTION_FACTOR
+    # Number of rungs, the last one runs on all the candles
+    rungs: int = DEFAULT_SUCCESSIVE_HALVING_RUNGS
+
+
+@dataclass(frozen=True)
+class IndicatorsKey:
+    """
+    Parameters of a combination which the indicators depend on,
+    so combinations sharing them share the same indicators frame as well.
+    """
+
+    ema_short_value: int
+    ema_mid_value: int
+    ema_long_value: int
+
+    @classmethod
+    def from_config(cls, simulated_bs_config: BuySellSignalsConfigItem) -> Self:
+        return cls(
+            ema_short_value=simulated_bs_config.ema_short_value,
+            ema_mid_value=simulated_bs_config.ema_mid_value,
+            ema_long_value=simulated_bs_config.ema_long_value,
+        )
+
+
 @dataclass
 class BacktestingExecutionResult:
     parameters: BuySellSignalsConfigItem
@@ -50,4 +96,12 @@ class BacktestingExecutionSummary:
         return [getattr(self, field.name) for field in fields(self) if getattr(self, field.name) is not None]
 
 
-__all__ = ["BacktestingExecutionResult", "BacktestingExecutionSummary", "TakeProfitFilter"]
+__all__ = [
+    "BacktestingExecutionResult",
+    "BacktestingExecutionSummary",
+    "IndicatorsKey",
+    "ResearchExecutorConfig",
+    "ResearchSearchStrategy",
+    "SuccessiveHalvingConfig",
+    "TakeProfitFilter",
+]
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import statistics
+import time
+
+import pytest
+from faker import Faker
+from pytest_httpserver import HTTPServer
+
+from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.infrastructure.services.enums import GlobalFlagTypeEnum
+from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
+from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
+from tests.helpers.object_mothers import SignalsEvaluationResultObjectMother
+
+logger = logging.getLogger(__name__)
+
+GUARD_READS = 200
+# NOTE: Generous upper bound, the goal is spotting lock contention regressions rather than measuring precisely
+MAX_GUARD_READ_P99_LATENCY_SECONDS = 0.5
+
+
+@pytest.mark.asyncio
+async def should_keep_guard_reads_fast_under_concurrent_signal_writes(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    services_container = get_application_container().infrastructure_container().services_container()
+    global_flag_service: GlobalFlagService = services_container.global_flag_service()
+    market_signal_service: MarketSignalService = services_container.market_signal_service()
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+
+    writes_count = 0
+    stop_writing = asyncio.Event()
+
+    async def _write_signals() -> None:
+        nonlocal writes_count
+        while not stop_writing.is_set():
+            for signals in SignalsEvaluationResultObjectMother.list(timeframe="1h", symbol=symbol):
+                await market_signal_service.on_signals_evaluation_result(signals)
+                writes_count += 1
+
+    writers = [asyncio.create_task(_write_signals()) for _ in range(3)]
+    # Same reads the Limit Sell Order Guard performs on every tick
+    latencies: list[float] = []
+    try:
+        for _ in range(GUARD_READS):
+            started_at = time.perf_counter()
+            await global_flag_service.is_enabled_for(GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD)
+            await market_signal_service.find_last_market_signal(symbol, timeframe="1h")
+            latencies.append(time.perf_counter() - started_at)
+    finally:
+        stop_writing.set()
+        await asyncio.gather(*writers)
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    p50, p99 = percentiles[49], percentiles[98]
+    logger.info(
+        f"Guard reads under {writes_count} concurrent signal writes :: "
+        + f"p50 = {p50 * 1_000:.2f} ms, p99 = {p99 * 1_000:.2f} ms, max = {max(latencies) * 1_000:.2f} ms"
+    )
+    assert writes_count > 0
+    assert p99 < MAX_GUARD_READ_P99_LATENCY_SECONDS
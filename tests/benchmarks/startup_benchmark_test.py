@@ -0,0 +1,34 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pytest_httpserver import HTTPServer
+
+logger = logging.getLogger(__name__)
+
+# NOTE: Generous upper bound, the goal is spotting startup regressions rather than measuring precisely
+MAX_STARTUP_DURATION_SECONDS = 10.0
+MAX_NON_CRITICAL_FEATURES_LOADING_SECONDS = 30.0
+
+
+@pytest.mark.asyncio
+async def should_be_ready_before_loading_non_critical_features(
+    integration_test_jobs_disabled_env: tuple[FastAPI, HTTPServer, ...],
+) -> None:
+    app, *_ = integration_test_jobs_disabled_env
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        response = await client.get("/health/readiness")
+        assert response.status_code == 200
+        startup_duration_seconds = response.json()["startup_duration_seconds"]
+        logger.info(f"Startup (ready to protect open positions) took {startup_duration_seconds:.3f} seconds")
+        assert startup_duration_seconds < MAX_STARTUP_DURATION_SECONDS
+
+        started_at = time.perf_counter()
+        while not response.json()["non_critical_features_loaded"]:
+            assert time.perf_counter() - started_at < MAX_NON_CRITICAL_FEATURES_LOADING_SECONDS
+            await asyncio.sleep(0.1)
+            response = await client.get("/health/readiness")
+        logger.info(f"Non-critical features finished loading {time.perf_counter() - started_at:.3f} seconds later")
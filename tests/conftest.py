@@ -53,6 +53,8 @@ def defaults_env(faker: Faker) -> Generator[None]:
     # Telegram bot token is not used in the tests, but it is required for the application to run
     environ["TELEGRAM_BOT_ENABLED"] = "false"
     environ["TELEGRAM_BOT_TOKEN"] = f"{faker.pyint()}:{str(uuid4()).replace('-', '_')}"
+    # Notifications are sent inline, so they are still captured while Bot.send_message is patched
+    environ["TELEGRAM_NOTIFICATION_DISPATCHER_ENABLED"] = "false"
     # Google OAuth credentials are not used in the tests, but they are required for the application to run
     environ["AUTHORIZED_GOOGLE_USER_EMAILS_COMMA_SEPARATED"] = ",".join(
         [faker.email(domain="gmail.com") for _ in range(faker.pyint(min_value=1, max_value=3))]
@@ -5,6 +5,7 @@ from tests.helpers.object_mothers.bit2me_trade_dto_object_mother import Bit2MeTr
 from tests.helpers.object_mothers.bit2me_trading_wallet_balance_dto_object_mother import (
     Bit2MeTradingWalletBalanceDtoObjectMother,
 )
+from tests.helpers.object_mothers.crypto_market_metrics_object_mother import CryptoMarketMetricsObjectMother
 from tests.helpers.object_mothers.mexc_account_balance_dto_object_mother import MEXCAccountBalanceDtoObjectMother
 from tests.helpers.object_mothers.mexc_account_info_dto_object_mother import MEXCAccountInfoDtoObjectMother
 from tests.helpers.object_mothers.mexc_order_dto_object_mother import MEXCOrderDtoObjectMother
@@ -20,6 +21,7 @@ __all__ = [
     "Bit2MeSummaryXlsxObjectMother",
     "Bit2MeTradeDtoObjectMother",
     "SignalsEvaluationResultObjectMother",
+    "CryptoMarketMetricsObjectMother",
     "Bit2MeTradingWalletBalanceDtoObjectMother",
     "MEXCTickerPriceAndBookDtoObjectMother",
     "MEXCTradeDtoObjectMother",
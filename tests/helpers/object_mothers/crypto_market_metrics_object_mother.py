@@ -0,0 +1,40 @@
+from datetime import UTC, datetime
+
+from faker import Faker
+
+from crypto_trailing_stop.infrastructure.services.vo.crypto_market_metrics import CryptoMarketMetrics
+
+
+class CryptoMarketMetricsObjectMother:
+    _faker: Faker = Faker()
+
+    @classmethod
+    def create(cls, *, symbol: str | None = None, timestamp: datetime | None = None) -> CryptoMarketMetrics:
+        closing_price = round(cls._faker.pyfloat(min_value=3_000, max_value=5_000), ndigits=2)
+        return CryptoMarketMetrics(
+            symbol=symbol or cls._faker.random_element(["ETH/EUR", "SOL/EUR"]),
+            timestamp=timestamp or datetime.now(UTC),
+            highest_price=closing_price * 1.01,
+            lowest_price=closing_price * 0.99,
+            opening_price=round(cls._faker.pyfloat(min_value=3_000, max_value=5_000), ndigits=2),
+            closing_price=closing_price,
+            ema_short=closing_price * 0.995,
+            ema_mid=closing_price * 0.99,
+            ema_long=round(cls._faker.pyfloat(min_value=1_000, max_value=2_000), ndigits=2),
+            macd_signal=cls._faker.pyfloat(min_value=-10, max_value=10),
+            macd_line=cls._faker.pyfloat(min_value=-10, max_value=10),
+            macd_hist=cls._faker.pyfloat(min_value=-10, max_value=10),
+            rsi=cls._faker.pyint(min_value=10, max_value=90),
+            atr=round(cls._faker.pyfloat(min_value=15.0, max_value=30.0), ndigits=2),
+            atr_percent=cls._faker.pyfloat(min_value=0.1, max_value=2.0),
+            adx=cls._faker.pyint(min_value=5, max_value=50),
+            adx_pos=cls._faker.pyint(min_value=5, max_value=50),
+            adx_neg=cls._faker.pyint(min_value=5, max_value=50),
+            bb_upper=closing_price * 1.02,
+            bb_middle=closing_price,
+            bb_lower=closing_price * 0.98,
+            relative_vol=cls._faker.pyfloat(min_value=0.1, max_value=4.0),
+            bearish_divergence=cls._faker.pybool(),
+            bullish_divergence=False,
+            is_rounded=False,
+        )
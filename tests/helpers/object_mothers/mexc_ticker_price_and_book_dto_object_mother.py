@@ -22,7 +22,9 @@ class MEXCTickerPriceAndBookDtoObjectMother:
         exclude_symbols = (
             list(exclude_symbols) if isinstance(exclude_symbols, (list, set, tuple, frozenset)) else [exclude_symbols]
         )
-        return [cls.create(symbol=symbol) for symbol in symbols if symbol not in exclude_symbols]
+        # NOTE: MEXC symbols have no separator (e.g. ETHUSDT), so they are compared without it
+        exclude_symbols = ["".join(exclude_symbol.split("/")) for exclude_symbol in exclude_symbols]
+        return [cls.create(symbol=symbol) for symbol in symbols if "".join(symbol.split("/")) not in exclude_symbols]
 
     @classmethod
     def create(
@@ -14,10 +14,7 @@ from pydantic import RootModel
 from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import HandlerType
 
-from crypto_trailing_stop.commons.constants import (
-    AUTO_ENTRY_TRADER_MINIMAL_AMOUNT_TO_INVEST,
-    TRIGGER_BUY_ACTION_EVENT_NAME,
-)
+from crypto_trailing_stop.commons.constants import AUTO_ENTRY_TRADER_MINIMAL_AMOUNT_TO_INVEST
 from crypto_trailing_stop.config.dependencies import get_application_container
 from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_order_dto import Bit2MeOrderDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_tickers_dto import Bit2MeTickersDto
@@ -33,7 +30,6 @@ from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enum
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.symbol_market_config import (
     SymbolMarketConfig,
 )
-from crypto_trailing_stop.infrastructure.database.models.push_notification import PushNotification
 from crypto_trailing_stop.infrastructure.services.auto_buy_trader_config_service import AutoBuyTraderConfigService
 from crypto_trailing_stop.infrastructure.services.auto_entry_trader_event_handler_service import (
     AutoEntryTraderEventHandlerService,
@@ -41,7 +37,9 @@ from crypto_trailing_stop.infrastructure.services.auto_entry_trader_event_handle
 from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
 from crypto_trailing_stop.infrastructure.services.enums.global_flag_enum import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.enums.push_notification_type_enum import PushNotificationTypeEnum
+from crypto_trailing_stop.infrastructure.services.event_bus import TRIGGER_BUY_ACTION_TOPIC
 from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_trailing_stop.infrastructure.services.risk_management_service import RiskManagementService
 from crypto_trailing_stop.infrastructure.services.vo.auto_buy_trader_config_item import AutoBuyTraderConfigItem
 from crypto_trailing_stop.infrastructure.services.vo.market_signal_item import MarketSignalItem
@@ -70,34 +68,34 @@ from tests.helpers.operating_exchange_utils import get_random_symbol_by_operatin
 logger = logging.getLogger(__name__)
 
 
-use_cases_no_event_emitter = list(
+use_cases_no_event_bus = list(
     product(
-        [False],  # use_event_emitter
+        [False],  # use_event_bus
         list(AutoEntryTraderWarningTypeEnum),
         list(AutoEntryTraderUnexpectedErrorBuyMarketOrder),
     )
 )
-use_cases_event_emitter = list(
+use_cases_event_bus = list(
     product(
-        [True],  # use_event_emitter
+        [True],  # use_event_bus
         list(AutoEntryTraderWarningTypeEnum),
         [AutoEntryTraderUnexpectedErrorBuyMarketOrder.NONE],
     )
 )
-use_cases = use_cases_no_event_emitter + use_cases_event_emitter
+use_cases = use_cases_no_event_bus + use_cases_event_bus
 use_cases = [
-    (use_event_emitter, bool(idx % 2), warning_type, unexpected_error_buy_market_order)
-    for idx, (use_event_emitter, warning_type, unexpected_error_buy_market_order) in enumerate(use_cases)
+    (use_event_bus, bool(idx % 2), warning_type, unexpected_error_buy_market_order)
+    for idx, (use_event_bus, warning_type, unexpected_error_buy_market_order) in enumerate(use_cases)
 ]
 
 
 @pytest.mark.parametrize(
-    "use_event_emitter,enable_atr_auto_take_profit,warning_type,unexpected_error_buy_market_order", use_cases
+    "use_event_bus,enable_atr_auto_take_profit,warning_type,unexpected_error_buy_market_order", use_cases
 )
 @pytest.mark.asyncio
 async def should_create_market_buy_order_and_limit_sell_when_market_buy_1h_signal_is_triggered(
     faker: Faker,
-    use_event_emitter: bool,
+    use_event_bus: bool,
     warning_type: AutoEntryTraderWarningTypeEnum,
     unexpected_error_buy_market_order: AutoEntryTraderUnexpectedErrorBuyMarketOrder,
     enable_atr_auto_take_profit: bool,
@@ -135,7 +133,7 @@ async def should_create_market_buy_order_and_limit_sell_when_market_buy_1h_signa
         operating_exchange,
         api_key,
         api_secret,
-        use_event_emitter=use_event_emitter,
+        use_event_bus=use_event_bus,
         warning_type=warning_type,
         unexpected_error_buy_market_order=unexpected_error_buy_market_order,
     )
@@ -146,14 +144,11 @@ async def should_create_market_buy_order_and_limit_sell_when_market_buy_1h_signa
 
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     # Persist 100% FIAT asssigned to the symbol
     await auto_buy_trader_config_service.save_or_update(
@@ -167,9 +162,9 @@ async def should_create_market_buy_order_and_limit_sell_when_market_buy_1h_signa
             with patch.object(Bot, "send_message"):
                 if operating_exchange == OperatingExchangeEnum.MEXC:
                     with patch.object(ccxt.mexc, "fetch_ohlcv", return_value=fetch_ohlcv_return_value):
-                        await _exec_test(use_event_emitter, market_signal_item)
+                        await _exec_test(use_event_bus, market_signal_item)
                 else:
-                    await _exec_test(use_event_emitter, market_signal_item)
+                    await _exec_test(use_event_bus, market_signal_item)
 
             httpserver.check_assertions()
 
@@ -188,10 +183,10 @@ async def should_create_market_buy_order_and_limit_sell_when_market_buy_1h_signa
                 toggle_task_mock.assert_not_called()
 
 
-async def _exec_test(use_event_emitter: bool, market_signal_item: MarketSignalItem) -> None:
-    if use_event_emitter:
-        event_emitter = get_application_container().infrastructure_container().event_emitter()
-        event_emitter.emit(TRIGGER_BUY_ACTION_EVENT_NAME, market_signal_item)
+async def _exec_test(use_event_bus: bool, market_signal_item: MarketSignalItem) -> None:
+    if use_event_bus:
+        event_bus = get_application_container().infrastructure_container().event_bus()
+        event_bus.publish(TRIGGER_BUY_ACTION_TOPIC, market_signal_item)
         await asyncio.sleep(delay=15.0)
     else:
         auto_entry_trader_event_handler_service: AutoEntryTraderEventHandlerService = (
@@ -210,7 +205,7 @@ def _prepare_httpserver_mock(
     api_key: str,
     api_secret: str,
     *,
-    use_event_emitter: bool = False,
+    use_event_bus: bool = False,
     warning_type: AutoEntryTraderWarningTypeEnum,
     unexpected_error_buy_market_order: AutoEntryTraderUnexpectedErrorBuyMarketOrder,
 ) -> tuple[str, str, str]:
@@ -301,7 +296,7 @@ def _prepare_httpserver_mock(
                 operating_exchange,
                 api_key,
                 api_secret,
-                use_event_emitter,
+                use_event_bus,
                 unexpected_error_buy_market_order,
                 buy_order_created,
             )
@@ -460,11 +455,11 @@ def _simulate_bit2me_corner_cases_if_needed(
     operating_exchange: OperatingExchangeEnum,
     api_key: str,
     api_secret: str,
-    use_event_emitter: bool,
+    use_event_bus: bool,
     unexpected_error_buy_market_order: AutoEntryTraderUnexpectedErrorBuyMarketOrder,
     buy_order_created: Bit2MeOrderDto,
 ) -> None:
-    if operating_exchange == OperatingExchangeEnum.BIT2ME and not use_event_emitter:
+    if operating_exchange == OperatingExchangeEnum.BIT2ME and not use_event_bus:
         if unexpected_error_buy_market_order == AutoEntryTraderUnexpectedErrorBuyMarketOrder.NOT_ENOUGH_BALANCE:
             _prepare_httpserver_mock_for_simulate_not_enough_balance(httpserver, api_key, api_secret)
         elif (
@@ -1,12 +1,15 @@
 import logging
 
 import pytest
+from dependency_injector.containers import DynamicContainer
 from faker import Faker
 from pytest_httpserver import HTTPServer
 
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.config.dependencies import get_application_container
 from crypto_trailing_stop.infrastructure.services.enums.global_flag_enum import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.global_flag_service import GlobalFlagService
+from crypto_trailing_stop.infrastructure.tasks.task_manager import TaskManager
 
 logger = logging.getLogger(__name__)
 
@@ -44,3 +47,49 @@ async def should_save_or_update_global_flag_properly(
     await global_flag_service.force_disable_by_name(global_flag_type)
 
     assert (await global_flag_service.is_enabled_for(global_flag_type)) is False
+
+
+@pytest.mark.asyncio
+async def should_reconcile_tasks_of_every_worker_with_the_stored_global_flags(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    configuration_properties: ConfigurationProperties = get_application_container().configuration_properties()
+    # Two workers sharing the same database, each of them with its own configuration cache and tasks
+    (
+        (first_worker_global_flag_service, first_worker_task_manager),
+        (second_worker_global_flag_service, second_worker_task_manager),
+    ) = [await _create_worker(configuration_properties) for _ in range(2)]
+    global_flag_type = faker.random_element(list(GlobalFlagTypeEnum))
+    assert first_worker_task_manager.is_started(global_flag_type) is True
+    assert second_worker_task_manager.is_started(global_flag_type) is True
+
+    # The first worker toggles the flag, so only its tasks are stopped right away
+    await first_worker_global_flag_service.toggle_by_name(global_flag_type)
+    assert first_worker_task_manager.is_started(global_flag_type) is False
+    assert second_worker_task_manager.is_started(global_flag_type) is True
+    assert (await second_worker_global_flag_service.is_enabled_for(global_flag_type)) is True
+
+    # The second worker applies it on its next heartbeat
+    await second_worker_global_flag_service.reconcile_tasks()
+    assert second_worker_task_manager.is_started(global_flag_type) is False
+    assert (await second_worker_global_flag_service.is_enabled_for(global_flag_type)) is False
+    # Every other task is left as it was
+    assert all(
+        second_worker_task_manager.is_started(current) is True
+        for current in GlobalFlagTypeEnum
+        if current != global_flag_type
+    )
+
+    await first_worker_global_flag_service.toggle_by_name(global_flag_type)
+    await first_worker_global_flag_service.reconcile_tasks()
+    await second_worker_global_flag_service.reconcile_tasks()
+    assert first_worker_task_manager.is_started(global_flag_type) is True
+    assert second_worker_task_manager.is_started(global_flag_type) is True
+
+
+async def _create_worker(configuration_properties: ConfigurationProperties) -> tuple[GlobalFlagService, TaskManager]:
+    global_flag_service = GlobalFlagService(configuration_properties)
+    task_manager = TaskManager(global_flag_service=global_flag_service, tasks_container=DynamicContainer())
+    await task_manager.load_tasks()
+    return global_flag_service, task_manager
@@ -0,0 +1,78 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from faker import Faker
+from pytest_httpserver import HTTPServer
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
+from tests.helpers.object_mothers import CryptoMarketMetricsObjectMother, SignalsEvaluationResultObjectMother
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_archive_market_metrics_and_query_them_by_time_range(
+    faker: Faker, tmp_path: Path, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    configuration_properties: ConfigurationProperties = get_application_container().configuration_properties()
+    market_history_archive_service = MarketHistoryArchiveService(
+        configuration_properties.model_copy(
+            update={
+                "market_history_archive_enabled": True,
+                "market_history_archive_folder_path": str(tmp_path),
+                "market_history_archive_compaction_min_files": 2,
+            }
+        )
+    )
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    total_hours = faker.pyint(min_value=48, max_value=96)
+    # One file per flush, as it happens on every Buy / Sell signals run
+    for hours in range(total_hours):
+        market_metrics = CryptoMarketMetricsObjectMother.create(
+            symbol=symbol, timestamp=now - timedelta(hours=total_hours - hours)
+        )
+        market_history_archive_service.append_market_metrics(
+            market_metrics,
+            timeframe="1h",
+            signals=SignalsEvaluationResultObjectMother.create(symbol=symbol, timeframe="1h"),
+        )
+        # Other symbols are archived within their own partition
+        market_history_archive_service.append_market_metrics(
+            CryptoMarketMetricsObjectMother.create(symbol="BTC/EUR", timestamp=market_metrics.timestamp),
+            timeframe="1h",
+            signals=SignalsEvaluationResultObjectMother.create(symbol="BTC/EUR", timeframe="1h"),
+        )
+        if hours % 12 == 0:
+            await market_history_archive_service.flush()
+    await market_history_archive_service.flush()
+
+    market_metrics_df = await market_history_archive_service.find_market_metrics(
+        symbol, start=now - timedelta(days=30), end=now, timeframe="1h"
+    )
+    assert len(market_metrics_df) == total_hours
+    assert set(market_metrics_df["symbol"]) == {symbol}
+    assert market_metrics_df["timestamp"].is_monotonic_increasing
+    # Time range scans only return the requested period
+    last_day_df = await market_history_archive_service.find_market_metrics(
+        symbol, start=now - timedelta(days=1), end=now, timeframe="1h"
+    )
+    assert len(last_day_df) == 24
+    # Downsampling to daily candles keeps the OHLC semantics
+    daily_df = await market_history_archive_service.find_market_metrics(
+        symbol, start=now - timedelta(days=30), end=now, timeframe="1h", resample_rule="1D"
+    )
+    assert len(daily_df) < total_hours
+    assert (daily_df["highest_price"] >= daily_df["closing_price"]).all()
+    assert (daily_df["lowest_price"] <= daily_df["closing_price"]).all()
+    # Compaction merges the small files, without losing any row
+    assert await market_history_archive_service.compact() >= 1
+    compacted_df = await market_history_archive_service.find_market_metrics(
+        symbol, start=now - timedelta(days=30), end=now, timeframe="1h"
+    )
+    assert compacted_df.equals(market_metrics_df)
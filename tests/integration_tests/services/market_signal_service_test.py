@@ -1,13 +1,17 @@
 import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 from faker import Faker
 from pytest_httpserver import HTTPServer
 
-from crypto_trailing_stop.commons.constants import SIGNALS_EVALUATION_RESULT_EVENT_NAME
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
 from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.infrastructure.database.models.market_signal import MarketSignal
+from crypto_trailing_stop.infrastructure.services.event_bus import SIGNALS_EVALUATION_RESULT_TOPIC
+from crypto_trailing_stop.infrastructure.services.market_history_archive_service import MarketHistoryArchiveService
 from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
 from crypto_trailing_stop.infrastructure.services.vo.market_signal_item import MarketSignalItem
 from crypto_trailing_stop.infrastructure.tasks.vo.signals_evaluation_result import SignalsEvaluationResult
@@ -16,10 +20,10 @@ from tests.helpers.object_mothers import SignalsEvaluationResultObjectMother
 logger = logging.getLogger(__name__)
 
 
-@pytest.mark.parametrize("use_event_emitter", [False, True])
+@pytest.mark.parametrize("use_event_bus", [False, True])
 @pytest.mark.asyncio
 async def should_save_market_signals_properly_when_invoke_to_service(
-    faker: Faker, use_event_emitter: bool, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+    faker: Faker, use_event_bus: bool, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
 ) -> None:
     _ = integration_test_jobs_disabled_env
     market_signal_service: MarketSignalService = (
@@ -30,10 +34,10 @@ async def should_save_market_signals_properly_when_invoke_to_service(
     one_hour_signals = SignalsEvaluationResultObjectMother.list(timeframe="1h", symbol=symbol)
     half_hour_signals = SignalsEvaluationResultObjectMother.list(timeframe="30m", symbol=symbol)
     for current in one_hour_signals:
-        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_emitter=use_event_emitter)
+        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_bus=use_event_bus)
     # 2. 30m signals are ignored
     for current in half_hour_signals:
-        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_emitter=use_event_emitter)
+        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_bus=use_event_bus)
 
     symbols = await market_signal_service.find_all_symbols()
     assert len(symbols) >= 1
@@ -51,12 +55,12 @@ async def should_save_market_signals_properly_when_invoke_to_service(
         timestamp=datetime.now(UTC) + timedelta(days=-10), timeframe="4h", symbol=symbol
     )
     await _invoke_on_signals_evaluation_result(
-        market_signal_service, first_four_hour_signal, use_event_emitter=use_event_emitter
+        market_signal_service, first_four_hour_signal, use_event_bus=use_event_bus
     )
     for current in one_hour_signals:
-        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_emitter=use_event_emitter)
+        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_bus=use_event_bus)
     for current in half_hour_signals:
-        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_emitter=use_event_emitter)
+        await _invoke_on_signals_evaluation_result(market_signal_service, current, use_event_bus=use_event_bus)
 
     symbols = await market_signal_service.find_all_symbols()
     assert len(symbols) >= 1
@@ -86,7 +90,7 @@ async def should_save_market_signals_properly_when_invoke_to_service(
         timestamp=datetime.now(UTC) + timedelta(days=-10), timeframe="4h", symbol=symbol, buy=first_four_hour_signal.buy
     )
     await _invoke_on_signals_evaluation_result(
-        market_signal_service, new_four_hour_signal_same_trend, use_event_emitter=use_event_emitter
+        market_signal_service, new_four_hour_signal_same_trend, use_event_bus=use_event_bus
     )
 
     market_signals_for_4h = await market_signal_service.find_by_symbol(symbol, timeframe="4h")
@@ -111,7 +115,7 @@ async def should_save_market_signals_properly_when_invoke_to_service(
         timestamp=datetime.now(UTC), timeframe="4h", symbol=symbol, buy=not first_four_hour_signal.buy
     )
     await _invoke_on_signals_evaluation_result(
-        market_signal_service, new_four_hour_signal_against_trend, use_event_emitter=use_event_emitter
+        market_signal_service, new_four_hour_signal_against_trend, use_event_bus=use_event_bus
     )
 
     market_signals = await market_signal_service.find_by_symbol(symbol)
@@ -127,13 +131,177 @@ async def should_save_market_signals_properly_when_invoke_to_service(
     assert first_4h_returned_signal.timestamp < final_4h_returned_signal.timestamp
 
 
+@pytest.mark.asyncio
+async def should_keep_last_market_signal_up_to_date_when_storing_signals(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    market_signal_service: MarketSignalService = (
+        get_application_container().infrastructure_container().services_container().market_signal_service()
+    )
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    assert await market_signal_service.find_last_market_signal(symbol, timeframe="1h") is None
+
+    for current in SignalsEvaluationResultObjectMother.list(timeframe="1h", symbol=symbol):
+        await market_signal_service.on_signals_evaluation_result(current)
+        # Served from memory, but it must match what is persisted
+        last_market_signal = await market_signal_service.find_last_market_signal(symbol, timeframe="1h")
+        last_persisted_market_signal, *_ = await market_signal_service.find_by_symbol(
+            symbol, timeframe="1h", ascending=False
+        )
+        assert last_market_signal == last_persisted_market_signal
+
+
+@pytest.mark.asyncio
+async def should_load_last_market_signal_again_every_heartbeat_when_sharding_is_enabled(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    application_container = get_application_container()
+    services_container = application_container.infrastructure_container().services_container()
+    configuration_properties: ConfigurationProperties = application_container.configuration_properties()
+    heartbeat_interval_seconds = faker.pyint(min_value=5, max_value=30)
+    market_signal_service = MarketSignalService(
+        configuration_properties=configuration_properties.model_copy(
+            update={"sharding_enabled": True, "sharding_heartbeat_interval_seconds": heartbeat_interval_seconds}
+        ),
+        event_bus=application_container.infrastructure_container().event_bus(),
+        operating_exchange_service=services_container.operating_exchange_service(),
+        push_notification_service=services_container.push_notification_service(),
+        telegram_service=services_container.telegram_service(),
+        market_history_archive_service=services_container.market_history_archive_service(),
+    )
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    assert await market_signal_service.find_last_market_signal(symbol, timeframe="1h") is None
+    # Stored by the worker owning the shard of the symbol meanwhile
+    await MarketSignal.insert(
+        MarketSignal(
+            timestamp=datetime.now(UTC),
+            symbol=symbol,
+            timeframe="1h",
+            signal_type="sell",
+            rsi_state="neutral",
+            atr=faker.pyfloat(positive=True),
+            closing_price=faker.pyfloat(positive=True),
+            ema_long_price=faker.pyfloat(positive=True),
+        )
+    )
+    assert await market_signal_service.find_last_market_signal(symbol, timeframe="1h") is None
+    # Once the heartbeat interval is over, the last stored signal is served
+    market_signal_service._last_market_signal_cache_loaded_at[(symbol, "1h")] -= heartbeat_interval_seconds
+    last_market_signal = await market_signal_service.find_last_market_signal(symbol, timeframe="1h")
+    assert last_market_signal is not None
+    assert last_market_signal.signal_type == "sell"
+
+
+@pytest.mark.asyncio
+async def should_delete_expired_market_signals_in_batches_and_archive_them(
+    faker: Faker, tmp_path: Path, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    application_container = get_application_container()
+    services_container = application_container.infrastructure_container().services_container()
+    configuration_properties: ConfigurationProperties = application_container.configuration_properties()
+    test_configuration_properties = configuration_properties.model_copy(
+        update={
+            "market_signal_retention_batch_size": faker.pyint(min_value=1, max_value=3),
+            "market_signal_archive_enabled": True,
+            "market_history_archive_folder_path": str(tmp_path),
+        }
+    )
+    market_history_archive_service = MarketHistoryArchiveService(test_configuration_properties)
+    market_signal_service = MarketSignalService(
+        configuration_properties=test_configuration_properties,
+        event_bus=application_container.infrastructure_container().event_bus(),
+        operating_exchange_service=services_container.operating_exchange_service(),
+        push_notification_service=services_container.push_notification_service(),
+        telegram_service=services_container.telegram_service(),
+        market_history_archive_service=market_history_archive_service,
+    )
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    for current in SignalsEvaluationResultObjectMother.list(timeframe="1h", symbol=symbol):
+        await market_signal_service.on_signals_evaluation_result(current)
+    market_signals = await market_signal_service.find_by_symbol(symbol, timeframe="1h")
+
+    expired_market_signals = [
+        MarketSignal(
+            timestamp=datetime.now(UTC) - timedelta(days=configuration_properties.market_signal_retention_days + days),
+            symbol=symbol,
+            timeframe=timeframe,
+            signal_type="buy",
+            rsi_state="neutral",
+            atr=faker.pyfloat(positive=True),
+            closing_price=faker.pyfloat(positive=True),
+            ema_long_price=faker.pyfloat(positive=True),
+        )
+        for days in range(1, faker.pyint(min_value=5, max_value=10))
+        for timeframe in ["1h", "4h"]
+    ]
+    await MarketSignal.insert(*expired_market_signals)
+
+    deleted_market_signals = await market_signal_service.apply_retention_policy()
+    # Only 1h signals expire, the last 4h market switcher is always kept
+    assert deleted_market_signals == len(expired_market_signals) // 2
+    assert await market_signal_service.find_by_symbol(symbol, timeframe="1h") == market_signals
+    assert len(await market_signal_service.find_by_symbol(symbol, timeframe="4h")) == len(expired_market_signals) // 2
+    archived_market_signals = await market_history_archive_service.find_market_signals(
+        symbol, start=datetime.now(UTC) - timedelta(days=30), end=datetime.now(UTC), timeframe="1h"
+    )
+    assert len(archived_market_signals) == deleted_market_signals
+    # Nothing else to delete
+    assert await market_signal_service.apply_retention_policy() == 0
+
+
+@pytest.mark.asyncio
+async def should_merge_pending_and_persisted_market_signals_when_writing_behind(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    application_container = get_application_container()
+    services_container = application_container.infrastructure_container().services_container()
+    configuration_properties: ConfigurationProperties = application_container.configuration_properties()
+    market_signal_service = MarketSignalService(
+        configuration_properties=configuration_properties.model_copy(
+            update={"market_signal_write_behind_enabled": True}
+        ),
+        event_bus=application_container.infrastructure_container().event_bus(),
+        operating_exchange_service=services_container.operating_exchange_service(),
+        push_notification_service=services_container.push_notification_service(),
+        telegram_service=services_container.telegram_service(),
+        market_history_archive_service=services_container.market_history_archive_service(),
+    )
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    one_hour_signals = SignalsEvaluationResultObjectMother.list(timeframe="1h", symbol=symbol)
+    total_expected_1h_signals = sum(
+        [2 if one_hour_signal.is_divergence_signal else 1 for one_hour_signal in one_hour_signals]
+    )
+    for current in one_hour_signals:
+        await market_signal_service.on_signals_evaluation_result(current)
+    # Signals are visible right away, even before being persisted
+    market_signals = await market_signal_service.find_by_symbol(symbol, timeframe="1h")
+    assert len(market_signals) == total_expected_1h_signals
+    assert symbol in await market_signal_service.find_all_symbols()
+    # Once flushed, they are persisted in the same order
+    await market_signal_service.close()
+    persisted_market_signals = (
+        await MarketSignal.objects()
+        .where(MarketSignal.symbol == symbol)
+        .where(MarketSignal.timeframe == "1h")
+        .order_by(MarketSignal.timestamp)
+    )
+    assert [market_signal.timestamp for market_signal in persisted_market_signals] == [
+        market_signal.timestamp for market_signal in market_signals
+    ]
+    assert await market_signal_service.find_by_symbol(symbol, timeframe="1h") == market_signals
+
+
 async def _invoke_on_signals_evaluation_result(
-    market_signal_service: MarketSignalService, signals: SignalsEvaluationResult, *, use_event_emitter: bool
+    market_signal_service: MarketSignalService, signals: SignalsEvaluationResult, *, use_event_bus: bool
 ) -> None:
-    if use_event_emitter:
+    if use_event_bus:
         application_container = get_application_container()
-        event_emitter = application_container.infrastructure_container().event_emitter()
-        event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals)
+        event_bus = application_container.infrastructure_container().event_bus()
+        event_bus.publish(SIGNALS_EVALUATION_RESULT_TOPIC, signals)
         await asyncio.sleep(delay=1.0)
     else:
         await market_signal_service.on_signals_evaluation_result(signals)
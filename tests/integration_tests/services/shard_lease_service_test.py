@@ -0,0 +1,107 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from faker import Faker
+from pytest_httpserver import HTTPServer
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.infrastructure.database.models.shard_lease import ShardLease
+from crypto_trailing_stop.infrastructure.services.event_bus import SHARDING_LEADERSHIP_CHANGED_TOPIC, EventBus
+from crypto_trailing_stop.infrastructure.services.shard_lease_service import ShardLeaseService
+from crypto_trailing_stop.infrastructure.services.vo.sharding_leadership_change import ShardingLeadershipChange
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_split_shards_between_workers_and_rebalance_them(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+
+    configuration_properties: ConfigurationProperties = get_application_container().configuration_properties()
+    event_bus = EventBus()
+    leadership_changes: list[ShardingLeadershipChange] = []
+
+    async def _on_leadership_changed(leadership_change: ShardingLeadershipChange) -> None:
+        leadership_changes.append(leadership_change)
+
+    event_bus.subscribe(SHARDING_LEADERSHIP_CHANGED_TOPIC, _on_leadership_changed, name="test", queue_size=10)
+    total_shards = faker.pyint(min_value=4, max_value=16)
+    first_worker, second_worker = [
+        ShardLeaseService(
+            configuration_properties=configuration_properties.model_copy(
+                update={
+                    "sharding_enabled": True,
+                    "sharding_worker_id": faker.uuid4(),
+                    "sharding_total_shards": total_shards,
+                }
+            ),
+            event_bus=event_bus,
+        )
+        for _ in range(2)
+    ]
+    # The first worker is alone, so it owns all the shards and leads
+    await first_worker.heartbeat()
+    assert first_worker.get_owned_shards() == frozenset(range(total_shards))
+    assert first_worker.is_leader()
+    # The second worker joins, so the first one gives back the shards above its fair share
+    await second_worker.heartbeat()
+    await first_worker.heartbeat()
+    await second_worker.heartbeat()
+    assert first_worker.get_owned_shards().isdisjoint(second_worker.get_owned_shards())
+    assert first_worker.get_owned_shards() | second_worker.get_owned_shards() == frozenset(range(total_shards))
+    assert first_worker.is_leader() and not second_worker.is_leader()
+    symbol = f"{faker.random_element(['BTC', 'ETH', 'SOL', 'XRP'])}/EUR"
+    assert first_worker.owns_symbol(symbol) != second_worker.owns_symbol(symbol)
+    # The first worker leaves, so the second one takes over all the shards and the leadership
+    await first_worker.release_all()
+    await second_worker.heartbeat()
+    assert second_worker.get_owned_shards() == frozenset(range(total_shards))
+    assert second_worker.is_leader()
+    # Every leadership change is published on the event bus
+    await event_bus.close()
+    assert leadership_changes == [
+        ShardingLeadershipChange(worker_id=first_worker.worker_id, is_leader=True),
+        ShardingLeadershipChange(worker_id=second_worker.worker_id, is_leader=True),
+    ]
+
+
+@pytest.mark.asyncio
+async def should_take_over_shards_of_a_crashed_worker_once_its_leases_expire(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+
+    configuration_properties: ConfigurationProperties = get_application_container().configuration_properties()
+    total_shards = faker.pyint(min_value=4, max_value=16)
+    first_worker, second_worker = [
+        ShardLeaseService(
+            configuration_properties=configuration_properties.model_copy(
+                update={
+                    "sharding_enabled": True,
+                    "sharding_worker_id": faker.uuid4(),
+                    "sharding_total_shards": total_shards,
+                }
+            ),
+            event_bus=EventBus(),
+        )
+        for _ in range(2)
+    ]
+    await first_worker.heartbeat()
+    await second_worker.heartbeat()
+    await first_worker.heartbeat()
+    crashed_worker_shards = first_worker.get_owned_shards()
+    assert len(crashed_worker_shards) > 0
+    # The first worker crashes without giving back its leases, so its shards are not guarded by anyone...
+    await second_worker.heartbeat()
+    assert second_worker.get_owned_shards().isdisjoint(crashed_worker_shards)
+    # ... until its leases expire (sharding_lease_ttl_seconds) and the second worker heartbeats again
+    await ShardLease.update({ShardLease.expires_at: datetime.now(UTC) - timedelta(seconds=1)}).where(
+        ShardLease.owner == first_worker.worker_id
+    )
+    await second_worker.heartbeat()
+    assert second_worker.get_owned_shards() == frozenset(range(total_shards))
+    assert second_worker.is_leader()
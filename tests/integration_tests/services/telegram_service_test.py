@@ -0,0 +1,62 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+from aiogram import Bot
+from faker import Faker
+from pytest_httpserver import HTTPServer
+
+from crypto_trailing_stop.commons.constants import TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.config.dependencies import get_application_container
+from crypto_trailing_stop.infrastructure.services.enums.push_notification_type_enum import PushNotificationTypeEnum
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_trailing_stop.interfaces.telegram.services.telegram_service import TelegramService
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_send_pending_notifications_on_close_when_dispatcher_is_enabled(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    configuration_properties: ConfigurationProperties = get_application_container().configuration_properties()
+    telegram_container = get_application_container().interfaces_container().telegram_container()
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
+    # NOTE: Dispatcher is disabled for the rest of tests (see conftest.py), so it is explicitly enabled here
+    telegram_service = TelegramService(
+        configuration_properties=configuration_properties.model_copy(
+            update={"telegram_notification_dispatcher_enabled": True}
+        ),
+        telegram_bot=telegram_container.telegram_bot(),
+        session_storage_service=telegram_container.session_storage_service(),
+        keyboards_builder=telegram_container.keyboards_builder(),
+    )
+    notification_type = faker.random_element(list(PushNotificationTypeEnum))
+    telegram_chat_ids = list(
+        dict.fromkeys(str(faker.random_number(digits=9, fix_len=True)) for _ in range(faker.pyint(2, 4)))
+    )
+    for telegram_chat_id in telegram_chat_ids:
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, notification_type)
+    messages = [faker.sentence() for _ in range(faker.pyint(min_value=2, max_value=5))]
+
+    with patch.object(Bot, "send_message") as send_message_mock:
+        for message in messages:
+            await telegram_service.notify(
+                await push_notification_service.get_actived_subscription_by_type(notification_type), message
+            )
+        # Notifying never waits for Telegram, so nothing has been sent yet
+        send_message_mock.assert_not_called()
+        await telegram_service.close()
+
+    sent_messages_by_chat_id = {
+        str(call.kwargs["chat_id"]): call.kwargs["text"] for call in send_message_mock.call_args_list
+    }
+    assert len(send_message_mock.call_args_list) == len(telegram_chat_ids)
+    assert sent_messages_by_chat_id == {
+        telegram_chat_id: TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR.join(messages)
+        for telegram_chat_id in telegram_chat_ids
+    }
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+from faker import Faker
+from pytest_httpserver import HTTPServer
+
+from crypto_trailing_stop.infrastructure.database import WriteBehindQueue
+from crypto_trailing_stop.infrastructure.database.models.market_signal import MarketSignal
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_drop_rows_when_there_are_too_many_pending_rows(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    write_behind_queue = _create_write_behind_queue(max_pending_rows=3)
+    rows = [_create_market_signal(faker, symbol) for _ in range(4)]
+    write_behind_queue.enqueue(*rows[:2])
+    # Exceeds the maximum number of pending rows, so it is dropped as a whole
+    write_behind_queue.enqueue(*rows[2:])
+    assert write_behind_queue.get_pending_rows() == rows[:2]
+    write_behind_queue.enqueue(rows[3])
+    await write_behind_queue.close()
+    assert await _find_persisted_ids(symbol) == {row.id for row in [*rows[:2], rows[3]]}
+
+
+@pytest.mark.asyncio
+async def should_drop_failing_batch_after_max_attempts_and_write_the_later_ones(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    max_attempts = 3
+    write_behind_queue = _create_write_behind_queue(batch_size=1, max_attempts=max_attempts)
+    failing_row, *later_rows = [_create_market_signal(faker, symbol) for _ in range(3)]
+    original_insert = MarketSignal.insert
+    attempts = 0
+
+    async def _insert(*rows: MarketSignal) -> None:
+        nonlocal attempts
+        if failing_row in rows:
+            attempts += 1
+            raise ValueError("Simulated storage error")
+        return await original_insert(*rows)
+
+    with patch.object(MarketSignal, "insert", new=_insert):
+        write_behind_queue.enqueue(failing_row)
+        write_behind_queue.enqueue(*later_rows)
+        for _ in range(max_attempts - 1):
+            with pytest.raises(ValueError):
+                await write_behind_queue.flush()
+        # Rows are written in order, so later rows wait for the failing batch meanwhile
+        assert write_behind_queue.get_pending_rows() == [failing_row, *later_rows]
+        await write_behind_queue.flush()
+        assert attempts == max_attempts
+        assert write_behind_queue.get_pending_rows() == []
+        await write_behind_queue.close()
+    assert await _find_persisted_ids(symbol) == {row.id for row in later_rows}
+
+
+@pytest.mark.asyncio
+async def should_wait_for_the_batch_being_written_on_close(
+    faker: Faker, integration_test_jobs_disabled_env: tuple[HTTPServer, str]
+) -> None:
+    _ = integration_test_jobs_disabled_env
+    symbol = faker.random_element(["ETH/EUR", "SOL/EUR"])
+    write_behind_queue = _create_write_behind_queue(flush_interval_seconds=0.0)
+    rows = [_create_market_signal(faker, symbol) for _ in range(5)]
+    original_insert = MarketSignal.insert
+    insert_started = asyncio.Event()
+
+    async def _slow_insert(*rows: MarketSignal) -> None:
+        ret = await original_insert(*rows)
+        insert_started.set()
+        # Committed, but still not dequeued
+        await asyncio.sleep(0.5)
+        return ret
+
+    with patch.object(MarketSignal, "insert", new=_slow_insert):
+        write_behind_queue.enqueue(*rows)
+        await insert_started.wait()
+        await write_behind_queue.close()
+    persisted_market_signals = await MarketSignal.objects().where(MarketSignal.symbol == symbol)
+    # Every row is written exactly once
+    assert sorted(str(market_signal.id) for market_signal in persisted_market_signals) == sorted(
+        str(row.id) for row in rows
+    )
+
+
+def _create_write_behind_queue(
+    *, flush_interval_seconds: float = 60.0, batch_size: int = 2, max_pending_rows: int = 100, max_attempts: int = 3
+) -> WriteBehindQueue[MarketSignal]:
+    return WriteBehindQueue(
+        MarketSignal,
+        flush_interval_seconds=flush_interval_seconds,
+        batch_size=batch_size,
+        max_pending_rows=max_pending_rows,
+        max_attempts=max_attempts,
+    )
+
+
+def _create_market_signal(faker: Faker, symbol: str) -> MarketSignal:
+    return MarketSignal(
+        symbol=symbol,
+        timeframe="1h",
+        signal_type=faker.random_element(["buy", "sell"]),
+        rsi_state="neutral",
+        atr=faker.pyfloat(min_value=1.0, max_value=10.0),
+        closing_price=faker.pyfloat(min_value=1_000.0, max_value=2_000.0),
+        ema_long_price=faker.pyfloat(min_value=1_000.0, max_value=2_000.0),
+    )
+
+
+async def _find_persisted_ids(symbol: str) -> set:
+    return {market_signal.id for market_signal in await MarketSignal.objects().where(MarketSignal.symbol == symbol)}
@@ -11,10 +11,10 @@ from pytest_httpserver.httpserver import HandlerType
 
 from crypto_trailing_stop.config.dependencies import get_application_container
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import OperatingExchangeEnum
-from crypto_trailing_stop.infrastructure.database.models.push_notification import PushNotification
 from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
 from crypto_trailing_stop.infrastructure.services.enums.global_flag_enum import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.enums.push_notification_type_enum import PushNotificationTypeEnum
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.tasks.buy_sell_signals_task_service import BuySellSignalsTaskService
 from tests.helpers.background_jobs_test_utils import disable_all_background_jobs_except
@@ -80,13 +80,12 @@ async def should_send_via_telegram_notifications_after_detecting_buy_sell_signal
         await buy_sell_signals_config_service.save_or_update(buy_sell_signals_config_item)
 
     # Provoke send a notification via Telegram
-    push_notification = PushNotification(
-        {
-            PushNotification.telegram_chat_id: faker.random_number(digits=9, fix_len=True),
-            PushNotification.notification_type: PushNotificationTypeEnum.BUY_SELL_STRATEGY_ALERT,
-        }
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
+    await push_notification_service.toggle_push_notification_by_type(
+        faker.random_number(digits=9, fix_len=True), PushNotificationTypeEnum.BUY_SELL_STRATEGY_ALERT
     )
-    await push_notification.save()
 
     if operating_exchange == OperatingExchangeEnum.MEXC:
         with patch.object(ccxt.mexc, "fetch_ohlcv", return_value=fetch_ohlcv_return_value):
@@ -14,12 +14,12 @@ from crypto_trailing_stop.commons.constants import BIT2ME_RETRYABLE_HTTP_STATUS_
 from crypto_trailing_stop.config.dependencies import get_application_container
 from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_order_dto import Bit2MeOrderDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_order_dto import MEXCOrderDto
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange import AbstractOperatingExchangeService
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import (
     OperatingExchangeEnum,
     OrderTypeEnum,
 )
-from crypto_trailing_stop.infrastructure.database.models.push_notification import PushNotification
 from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
 from crypto_trailing_stop.infrastructure.services.enums.global_flag_enum import GlobalFlagTypeEnum
 from crypto_trailing_stop.infrastructure.services.enums.push_notification_type_enum import PushNotificationTypeEnum
@@ -27,6 +27,7 @@ from crypto_trailing_stop.infrastructure.services.limit_sell_order_guard_cache_s
     LimitSellOrderGuardCacheService,
 )
 from crypto_trailing_stop.infrastructure.services.market_signal_service import MarketSignalService
+from crypto_trailing_stop.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
 from crypto_trailing_stop.infrastructure.services.vo.immediate_sell_order_item import ImmediateSellOrderItem
 from crypto_trailing_stop.infrastructure.tasks.limit_sell_order_guard_task_service import LimitSellOrderGuardTaskService
@@ -91,7 +92,12 @@ async def should_create_market_sell_order_when_market_for_immediate_sell_order(
 
     # Create fake market signals to simulate the sudden SELL 1H market signal
     await _create_fake_market_signals(first_order, closing_price_sell_1h_signal=buy_price)
-    limit_sell_order_guard_cache_service = LimitSellOrderGuardCacheService()
+    limit_sell_order_guard_cache_service: LimitSellOrderGuardCacheService = (
+        get_application_container()
+        .infrastructure_container()
+        .services_container()
+        .limit_sell_order_guard_cache_service()
+    )
     limit_sell_order_guard_cache_service.mark_immediate_sell_order(
         ImmediateSellOrderItem(
             sell_order_id=first_order.id if isinstance(first_order, Bit2MeOrderDto) else first_order.order_id,
@@ -100,14 +106,11 @@ async def should_create_market_sell_order_when_market_for_immediate_sell_order(
     )
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
         GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
@@ -124,6 +127,7 @@ async def should_create_market_sell_order_when_market_for_immediate_sell_order(
 
         notify_fatal_error_via_telegram_mock.assert_not_called()
     httpserver.check_assertions()
+    _assert_market_exit_requests_received(httpserver)
 
 
 @pytest.mark.asyncio
@@ -158,14 +162,11 @@ async def should_create_market_sell_order_when_take_profit_reached(
 
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
         GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
@@ -183,6 +184,7 @@ async def should_create_market_sell_order_when_take_profit_reached(
         notify_fatal_error_via_telegram_mock.assert_not_called()
 
     httpserver.check_assertions()
+    _assert_market_exit_requests_received(httpserver)
 
 
 @pytest.mark.parametrize(
@@ -231,14 +233,11 @@ async def should_create_market_sell_order_when_auto_exit_sell_or_bearish_diverge
 
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
         GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
@@ -254,6 +253,9 @@ async def should_create_market_sell_order_when_auto_exit_sell_or_bearish_diverge
                 await limit_sell_order_guard_task_service.run()
         notify_fatal_error_via_telegram_mock.assert_not_called()
     httpserver.check_assertions()
+    # NOTE: Exits on sell signals also depend on the MACD histogram of the random candles
+    if not simulate_future_sell_orders and bearish_divergence:
+        _assert_market_exit_requests_received(httpserver)
 
 
 @pytest.mark.asyncio
@@ -298,14 +300,11 @@ async def should_ignore_sell_1h_signal_and_not_sell_when_price_is_lower_than_bre
 
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
         GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
@@ -361,14 +360,11 @@ async def should_create_market_sell_order_when_stop_loss_triggered(
 
     # Provoke send a notification via Telegram
     telegram_chat_id = faker.random_number(digits=9, fix_len=True)
+    push_notification_service: PushNotificationService = (
+        get_application_container().infrastructure_container().services_container().push_notification_service()
+    )
     for push_notification_type in PushNotificationTypeEnum:
-        push_notification = PushNotification(
-            {
-                PushNotification.telegram_chat_id: telegram_chat_id,
-                PushNotification.notification_type: push_notification_type,
-            }
-        )
-        await push_notification.save()
+        await push_notification_service.toggle_push_notification_by_type(telegram_chat_id, push_notification_type)
 
     limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
         GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
@@ -384,6 +380,46 @@ async def should_create_market_sell_order_when_stop_loss_triggered(
                 await limit_sell_order_guard_task_service.run()
         notify_fatal_error_via_telegram_mock.assert_not_called()
     httpserver.check_assertions()
+    _assert_market_exit_requests_received(httpserver)
+
+
+@pytest.mark.asyncio
+async def should_skip_sell_order_when_operating_exchange_is_degraded_while_stop_loss_triggered(
+    faker: Faker, integration_test_env: tuple[HTTPServer, str]
+) -> None:
+    _, httpserver, api_key, api_secret, operating_exchange, *_ = integration_test_env
+    # Disable all jobs by default for test purposes!
+    await disable_all_background_jobs_except()
+    _, _, fetch_ohlcv_return_value, *_ = _prepare_httpserver_mock(
+        faker, httpserver, operating_exchange, api_key, api_secret, closing_crypto_currency_price_multipler=0.2
+    )
+    task_manager = get_application_container().infrastructure_container().tasks_container().task_manager()
+    limit_sell_order_guard_task_service: LimitSellOrderGuardTaskService = task_manager.get_tasks()[
+        GlobalFlagTypeEnum.LIMIT_SELL_ORDER_GUARD
+    ]
+    with (
+        patch.object(
+            LimitSellOrderGuardTaskService, "_notify_fatal_error_via_telegram"
+        ) as notify_fatal_error_via_telegram_mock,
+        patch.object(
+            limit_sell_order_guard_task_service._operating_exchange_service,
+            "cancel_order",
+            side_effect=CircuitBreakerOpenError("/v1/trading/order", retry_after=30.0),
+        ),
+        patch.object(ccxt.mexc, "fetch_ohlcv", return_value=fetch_ohlcv_return_value),
+    ):
+        await limit_sell_order_guard_task_service.run()
+        # The sell order is just skipped in this run
+        notify_fatal_error_via_telegram_mock.assert_not_called()
+    httpserver.check_assertions()
+    assert "POST" not in [request.method for request, _ in httpserver.log]
+
+
+def _assert_market_exit_requests_received(httpserver: HTTPServer) -> None:
+    # NOTE: Unused mocks are not reported by check_assertions, so the market exit requests are checked on their own
+    sent_methods = [request.method for request, _ in httpserver.log]
+    assert "DELETE" in sent_methods
+    assert "POST" in sent_methods
 
 
 def _prepare_httpserver_mock(
@@ -16,6 +16,7 @@ from crypto_trailing_stop.infrastructure.adapters.dtos.bit2me_tickers_dto import
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_order_dto import MEXCOrderDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_book_dto import MEXCTickerBookDto
 from crypto_trailing_stop.infrastructure.adapters.dtos.mexc_ticker_price_dto import MEXCTickerPriceDto
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
 from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import (
     OperatingExchangeEnum,
     OrderTypeEnum,
@@ -48,7 +49,7 @@ async def should_make_all_expected_calls_to_operating_exchange_when_trailing_sto
 
     task_manager = get_application_container().infrastructure_container().tasks_container().task_manager()
 
-    _prepare_httpserver_mock(
+    is_stop_price_updated = _prepare_httpserver_mock(
         faker,
         httpserver,
         operating_exchange,
@@ -66,6 +67,41 @@ async def should_make_all_expected_calls_to_operating_exchange_when_trailing_sto
         await trailing_stop_loss_task_service.run()
         notify_fatal_error_via_telegram_mock.assert_not_called()
         httpserver.check_assertions()
+        # The stop-limit order is actually cancelled and created again within the run deadline
+        sent_methods = [request.method for request, _ in httpserver.log]
+        assert ("DELETE" in sent_methods) == is_stop_price_updated
+        assert ("POST" in sent_methods) == is_stop_price_updated
+
+
+@pytest.mark.asyncio
+async def should_skip_sell_order_when_operating_exchange_is_degraded_while_trailing_stop_loss(
+    faker: Faker, integration_test_env: tuple[HTTPServer, str]
+) -> None:
+    _, httpserver, api_key, api_secret, operating_exchange, *_ = integration_test_env
+    # Disable all jobs by default for test purposes!
+    await disable_all_background_jobs_except()
+
+    task_manager = get_application_container().infrastructure_container().tasks_container().task_manager()
+
+    _prepare_httpserver_mock(faker, httpserver, operating_exchange, api_key, api_secret)
+    trailing_stop_loss_task_service: TrailingStopLossTaskService = task_manager.get_tasks()[
+        GlobalFlagTypeEnum.TRAILING_STOP_LOSS
+    ]
+    with (
+        patch.object(
+            TrailingStopLossTaskService, "_notify_fatal_error_via_telegram"
+        ) as notify_fatal_error_via_telegram_mock,
+        patch.object(
+            trailing_stop_loss_task_service._operating_exchange_service,
+            "cancel_order",
+            side_effect=CircuitBreakerOpenError("/v1/trading/order", retry_after=30.0),
+        ),
+    ):
+        await trailing_stop_loss_task_service.run()
+        # The sell order is just skipped in this run
+        notify_fatal_error_via_telegram_mock.assert_not_called()
+        httpserver.check_assertions()
+        assert "POST" not in [request.method for request, _ in httpserver.log]
 
 
 def _prepare_httpserver_mock(
@@ -76,7 +112,7 @@ def _prepare_httpserver_mock(
     api_secret: str,
     *,
     simulate_pending_buy_orders_to_filled: bool = False,
-) -> None:
+) -> bool:
     opened_sell_order, opened_buy_orders = _prepare_mock_opened_buy_and_sell_orders(
         faker,
         httpserver,
@@ -102,10 +138,11 @@ def _prepare_httpserver_mock(
         highest_buy_price = highest_opened_buy_order.stop_price or highest_opened_buy_order.price
 
     closing_price = float(tickers.close) if isinstance(tickers, Bit2MeTickersDto) else tickers[0].price
-    if not simulate_pending_buy_orders_to_filled or (
+    is_stop_price_updated = not simulate_pending_buy_orders_to_filled or (
         closing_price > highest_buy_price
         and ((1 - (lowest_buy_price / tickers.close)) * 100) > DEFAULT_TRAILING_STOP_LOSS_PERCENT
-    ):
+    )
+    if is_stop_price_updated:
         # Mock call to DELETE /v1/trading/order/{id}
         prepare_httpserver_delete_order_mock(
             httpserver, operating_exchange, api_key, api_secret, open_sell_order=opened_sell_order
@@ -119,6 +156,7 @@ def _prepare_httpserver_mock(
             order_symbol=opened_sell_order.symbol,
             order_type=OrderTypeEnum.STOP_LIMIT,
         )
+    return is_stop_price_updated
 
 
 def _prepare_mock_opened_buy_and_sell_orders(
@@ -268,8 +306,9 @@ def _prepare_httpserver_tickers_list_mock(
         tickers = Bit2MeTickersDtoObjectMother.create(
             symbol=opened_sell_order.symbol,
             close=(
-                opened_sell_order.stop_price
-                + (0.5 if simulate_pending_buy_orders_to_filled else faker.pyfloat(min_value=10.000, max_value=100.000))
+                opened_sell_order.stop_price + 0.5
+                if simulate_pending_buy_orders_to_filled
+                else _get_close_price_above_trailing_stop_loss(faker, opened_sell_order)
             ),
         )
         rest_tickers = Bit2MeTickersDtoObjectMother.list(exclude_symbols=opened_sell_order.symbol)
@@ -278,8 +317,9 @@ def _prepare_httpserver_tickers_list_mock(
         tickers = MEXCTickerPriceAndBookDtoObjectMother.create(
             symbol=opened_sell_order.symbol,
             close=(
-                float(opened_sell_order.stop_price)
-                + (0.5 if simulate_pending_buy_orders_to_filled else faker.pyfloat(min_value=10.000, max_value=100.000))
+                float(opened_sell_order.stop_price) + 0.5
+                if simulate_pending_buy_orders_to_filled
+                else _get_close_price_above_trailing_stop_loss(faker, opened_sell_order)
             ),
         )
         rest_tickers = MEXCTickerPriceAndBookDtoObjectMother.list(exclude_symbols=opened_sell_order.symbol)
@@ -295,3 +335,10 @@ def _prepare_httpserver_tickers_list_mock(
     )
 
     return tickers
+
+
+def _get_close_price_above_trailing_stop_loss(faker: Faker, opened_sell_order: Bit2MeOrderDto | MEXCOrderDto) -> float:
+    # NOTE: Far enough from the current stop price, so the new stop price is always higher
+    return float(opened_sell_order.stop_price) / (1 - DEFAULT_TRAILING_STOP_LOSS_PERCENT / 100) + faker.pyfloat(
+        min_value=10.000, max_value=100.000
+    )
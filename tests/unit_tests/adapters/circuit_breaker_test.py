@@ -0,0 +1,103 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from faker import Faker
+from httpx import HTTPStatusError, NetworkError, Request, Response
+
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import (
+    CircuitBreakerOpenError,
+    CircuitBreakerRegistry,
+    CircuitBreakerStateEnum,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def should_open_circuit_after_consecutive_failures_and_fail_fast() -> None:
+    registry = CircuitBreakerRegistry(failure_threshold=3, latency_slo_seconds=10.0, open_timeout_seconds=60.0)
+    circuit_breaker = registry.get("GET", "/v2/trading/tickers")
+    for _ in range(2):
+        circuit_breaker.acquire()
+        circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreakerStateEnum.CLOSED
+    circuit_breaker.acquire()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreakerStateEnum.OPEN
+    assert registry.is_degraded()
+    with pytest.raises(CircuitBreakerOpenError):
+        circuit_breaker.acquire()
+    # Other endpoints are not affected
+    registry.get("GET", "/v1/account").acquire()
+
+
+def should_open_circuit_when_latency_slo_is_breached() -> None:
+    registry = CircuitBreakerRegistry(failure_threshold=2, latency_slo_seconds=1.0, open_timeout_seconds=60.0)
+    circuit_breaker = registry.get("GET", "/api/v3/ticker/bookTicker")
+    circuit_breaker.record_success(elapsed_seconds=0.5)
+    assert circuit_breaker.state == CircuitBreakerStateEnum.CLOSED
+    circuit_breaker.record_success(elapsed_seconds=2.0)
+    circuit_breaker.record_success(elapsed_seconds=3.0)
+    assert circuit_breaker.state == CircuitBreakerStateEnum.OPEN
+
+
+def should_probe_half_open_circuit_and_close_it_on_success() -> None:
+    registry = CircuitBreakerRegistry(failure_threshold=1, latency_slo_seconds=10.0, open_timeout_seconds=0.0)
+    circuit_breaker = registry.get("GET", "/v2/trading/tickers")
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreakerStateEnum.HALF_OPEN
+    circuit_breaker.acquire()
+    # Only a single probe is allowed at the same time
+    with pytest.raises(CircuitBreakerOpenError):
+        circuit_breaker.acquire()
+    circuit_breaker.record_success(elapsed_seconds=0.1)
+    assert circuit_breaker.state == CircuitBreakerStateEnum.CLOSED
+    assert not registry.is_degraded()
+
+
+def should_only_consider_server_and_transport_errors_as_failures() -> None:
+    registry = CircuitBreakerRegistry(failure_threshold=1, latency_slo_seconds=10.0, open_timeout_seconds=60.0)
+
+    def _build_http_error(status_code: int) -> ValueError:
+        request = Request("GET", "https://localhost/v2/trading/tickers")
+        response = Response(status_code, request=request)
+        ret = ValueError("error", response)
+        ret.__cause__ = HTTPStatusError("error", request=request, response=response)
+        return ret
+
+    assert registry.is_failure(NetworkError("error", request=MagicMock()))
+    assert registry.is_failure(_build_http_error(503))
+    assert registry.is_failure(_build_http_error(429))
+    assert not registry.is_failure(_build_http_error(404))
+    # Retried by the remote services, but they are business errors (e.g. Bit2Me not enough balance)
+    assert not registry.is_failure(_build_http_error(412))
+    assert not registry.is_failure(ValueError("Market config not found"))
+
+
+def should_not_report_degraded_half_open_circuits_which_are_never_probed() -> None:
+    registry = CircuitBreakerRegistry(failure_threshold=1, latency_slo_seconds=10.0, open_timeout_seconds=0.0)
+    circuit_breaker = registry.get("GET", "/v2/trading/tickers")
+    circuit_breaker.record_failure()
+    # Open timeout is over, but nothing calls this endpoint again
+    assert registry.get_states() == {"GET /v2/trading/tickers": CircuitBreakerStateEnum.HALF_OPEN}
+    assert not registry.is_degraded()
+
+
+def should_share_circuit_breakers_by_route_template_within_bounded_registry(faker: Faker) -> None:
+    registry = CircuitBreakerRegistry(
+        failure_threshold=1, latency_slo_seconds=10.0, open_timeout_seconds=60.0, max_endpoints=3
+    )
+    circuit_breaker = registry.get("DELETE", f"/v1/trading/order/{faker.uuid4()}")
+    assert registry.get("DELETE", f"/v1/trading/order/{faker.uuid4()}?symbol=ETH%2FEUR") is circuit_breaker
+    assert registry.get("GET", f"/v1/trading/order/{faker.pyint()}") is not circuit_breaker
+    assert circuit_breaker.endpoint == "DELETE /v1/trading/order/{id}"
+    # Open circuit breakers are kept, the least recently used closed ones are evicted first
+    circuit_breaker.record_failure()
+    for path in ["/v1/account", "/v2/trading/tickers", "/v1/trading/trade"]:
+        registry.get("GET", path)
+    assert list(registry.get_states()) == [
+        "DELETE /v1/trading/order/{id}",
+        "GET /v2/trading/tickers",
+        "GET /v1/trading/trade",
+    ]
+    assert registry.is_degraded()
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+
+import pytest
+from httpx import AsyncClient, MockTransport, Request, Response, Timeout
+
+from crypto_trailing_stop.commons.constants import (
+    DEFAULT_JOB_INTERVAL_SECONDS,
+    NON_IDEMPOTENT_HTTP_REQUEST_MIN_REMAINING_DEADLINE_RATIO,
+)
+from crypto_trailing_stop.commons.deadline import DeadlineExceededError, deadline_scope
+from crypto_trailing_stop.infrastructure.adapters.remote.base import AbstractHttpRemoteAsyncService
+
+logger = logging.getLogger(__name__)
+
+
+class _FakeHttpRemoteAsyncService(AbstractHttpRemoteAsyncService):
+    def __init__(self) -> None:
+        self.sent_requests: list[Request] = []
+
+    async def get_http_client(self) -> AsyncClient:
+        return AsyncClient(
+            base_url="https://exchange.test", transport=MockTransport(self._handler), timeout=Timeout(10, read=60)
+        )
+
+    def _handler(self, request: Request) -> Response:
+        self.sent_requests.append(request)
+        return Response(200, json={})
+
+
+@pytest.mark.asyncio
+async def should_not_cut_short_non_idempotent_requests_once_sent() -> None:
+    remote_service = _FakeHttpRemoteAsyncService()
+    async with await remote_service.get_http_client() as client:
+        # Same deadline as the runs of the jobs placing orders
+        with deadline_scope(DEFAULT_JOB_INTERVAL_SECONDS):
+            await remote_service._perform_http_request(method="GET", url="/v1/ticker", client=client)
+            await remote_service._perform_http_request(method="POST", url="/v1/order", body={}, client=client)
+            await remote_service._perform_http_request(method="DELETE", url="/v1/order/1", client=client)
+    get_request, post_request, delete_request = remote_service.sent_requests
+    assert get_request.extensions["timeout"]["read"] <= DEFAULT_JOB_INTERVAL_SECONDS
+    assert post_request.extensions["timeout"]["read"] == 60
+    assert delete_request.extensions["timeout"]["read"] == 60
+
+
+@pytest.mark.asyncio
+async def should_not_start_non_idempotent_requests_when_deadline_is_too_close() -> None:
+    remote_service = _FakeHttpRemoteAsyncService()
+    async with await remote_service.get_http_client() as client:
+        deadline_seconds = 0.5
+        with deadline_scope(deadline_seconds):
+            await remote_service._perform_http_request(method="GET", url="/v1/ticker", client=client)
+            # Less than the minimum ratio of the deadline is left
+            await asyncio.sleep(deadline_seconds * (1 - NON_IDEMPOTENT_HTTP_REQUEST_MIN_REMAINING_DEADLINE_RATIO / 2))
+            with pytest.raises(DeadlineExceededError):
+                await remote_service._perform_http_request(method="POST", url="/v1/order", body={}, client=client)
+    assert [request.method for request in remote_service.sent_requests] == ["GET"]
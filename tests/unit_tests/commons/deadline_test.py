@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+from httpx import Timeout
+
+from crypto_trailing_stop.commons.deadline import (
+    DeadlineExceededError,
+    apply_deadline_to_timeout,
+    deadline_scope,
+    get_deadline_remaining_seconds,
+    get_deadline_seconds,
+    no_deadline_scope,
+    protective_deadline_scope,
+    raise_if_deadline_exceeded,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def should_shrink_timeouts_to_the_current_deadline() -> None:
+    timeout = Timeout(10, connect=5, read=60)
+    assert get_deadline_remaining_seconds() is None
+    assert apply_deadline_to_timeout(timeout) == timeout
+    with deadline_scope(2.0):
+        shrunk_timeout = apply_deadline_to_timeout(timeout)
+        assert 0 < shrunk_timeout.connect <= 2.0
+        assert 0 < shrunk_timeout.read <= 2.0
+        # Nested scopes can only shrink the deadline
+        with deadline_scope(30.0):
+            assert get_deadline_remaining_seconds() <= 2.0
+        with no_deadline_scope():
+            assert get_deadline_remaining_seconds() is None
+    assert get_deadline_remaining_seconds() is None
+
+
+def should_raise_deadline_exceeded_error_when_there_is_no_time_left() -> None:
+    with deadline_scope(0.0):
+        with pytest.raises(DeadlineExceededError):
+            raise_if_deadline_exceeded("HTTP GET /v2/trading/tickers")
+    raise_if_deadline_exceeded("HTTP GET /v2/trading/tickers")
+
+
+def should_only_shrink_timeouts_before_sending_non_idempotent_requests() -> None:
+    timeout = Timeout(10, connect=5, read=60)
+    with deadline_scope(2.0):
+        shrunk_timeout = apply_deadline_to_timeout(timeout, idempotent=False)
+        assert 0 < shrunk_timeout.connect <= 2.0
+        assert 0 < shrunk_timeout.pool <= 2.0
+        # Once sent, they are never cut short
+        assert shrunk_timeout.read == timeout.read
+        assert shrunk_timeout.write == timeout.write
+
+
+def should_raise_deadline_exceeded_error_when_there_is_not_enough_time_left() -> None:
+    with deadline_scope(2.0):
+        raise_if_deadline_exceeded("HTTP POST /v1/trading/order")
+        with pytest.raises(DeadlineExceededError):
+            raise_if_deadline_exceeded("HTTP POST /v1/trading/order", min_remaining_seconds=5.0)
+
+
+def should_replace_the_current_deadline_within_protective_scopes() -> None:
+    with deadline_scope(2.0):
+        with deadline_scope(30.0):
+            assert get_deadline_seconds() == 2.0
+        with protective_deadline_scope(30.0):
+            assert get_deadline_seconds() == 30.0
+            assert 2.0 < get_deadline_remaining_seconds() <= 30.0
+            with deadline_scope(1.0):
+                assert get_deadline_seconds() == 1.0
+        assert get_deadline_seconds() == 2.0
+        assert get_deadline_remaining_seconds() <= 2.0
+    assert get_deadline_seconds() is None
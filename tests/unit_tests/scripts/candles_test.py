@@ -0,0 +1,74 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import ccxt.async_support as ccxt_async
+import pandas as pd
+from faker import Faker
+
+from crypto_trailing_stop.scripts.candles import CandleStore
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+
+logger = logging.getLogger(__name__)
+
+_ONE_HOUR_IN_MILLIS = 3_600_000
+
+
+class _FakeExchange:
+    id = "mexc"
+
+    def __init__(self, candles: list[list[Any]], *, max_limit: int) -> None:
+        self._candles = candles
+        self._max_limit = max_limit
+        self.fetch_ohlcv_calls: list[tuple[str, str, int]] = []
+
+    async def load_markets(self) -> dict[str, Any]:
+        return {"ETH/EUR": {"symbol": "ETH/EUR", "quote": "EUR", "active": True, "spot": True}}
+
+    async def fetch_ohlcv(self, symbol: str, timeframe: str, *, since: int, limit: int) -> list[list[Any]]:
+        self.fetch_ohlcv_calls.append((symbol, timeframe, since))
+        # Exchanges may cap the requested limit, as MEXC or Kraken do
+        return [candle for candle in self._candles if candle[0] >= since][: min(limit, self._max_limit)]
+
+    async def close(self) -> None:
+        pass
+
+
+def should_download_candles_concurrently_and_resume_from_the_last_stored_one(faker: Faker, tmp_path: Path) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    backtesting_cli_service._candle_store = CandleStore(str(tmp_path))
+    first_timestamp = int((datetime.now(UTC) - timedelta(days=59)).timestamp() * 1000)
+    first_timestamp -= first_timestamp % _ONE_HOUR_IN_MILLIS
+    candles = [
+        [timestamp, *[faker.pyfloat(min_value=1_000, max_value=4_000) for _ in range(5)]]
+        for timestamp in range(first_timestamp, first_timestamp + 24 * 40 * _ONE_HOUR_IN_MILLIS, _ONE_HOUR_IN_MILLIS)
+    ]
+    first_exchange = _FakeExchange(candles[: 24 * 30], max_limit=250)
+    with patch.object(ccxt_async, "mexc", return_value=first_exchange):
+        downloaded_candles = backtesting_cli_service.download_backtesting_data(
+            "ETH/EUR", "mexc", "1h", months_back=2, echo_fn=logger.info
+        )
+    assert downloaded_candles == 24 * 30
+    assert {timeframe for _, timeframe, _ in first_exchange.fetch_ohlcv_calls} == {"1h"}
+
+    # The last stored candle was still open, so it changes on the next download
+    candles[24 * 30 - 1] = [
+        candles[24 * 30 - 1][0],
+        *[faker.pyfloat(min_value=1_000, max_value=4_000) for _ in range(5)],
+    ]
+    second_exchange = _FakeExchange(candles, max_limit=250)
+    with patch.object(ccxt_async, "mexc", return_value=second_exchange):
+        downloaded_candles = backtesting_cli_service.download_backtesting_data(
+            "ETH/EUR", "mexc", "1h", months_back=2, echo_fn=logger.info
+        )
+    assert downloaded_candles == 24 * 10 + 1
+    # Stored candles are never downloaded again, except for the last one
+    since_timestamps = [since for *_, since in second_exchange.fetch_ohlcv_calls]
+    assert candles[24 * 30 - 1][0] in since_timestamps
+    assert not any(candles[0][0] <= since < candles[24 * 30 - 1][0] for since in since_timestamps)
+
+    expected = pd.DataFrame(candles, columns=["timestamp", "open", "high", "low", "close", "volume"])
+    expected["timestamp"] = pd.to_datetime(expected["timestamp"], unit="ms", utc=True)
+    pd.testing.assert_frame_equal(backtesting_cli_service.load_backtesting_data("ETH/EUR", "mexc", "1h"), expected)
@@ -0,0 +1,139 @@
+import logging
+from dataclasses import asdict, replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.scripts.checkpoint import ResearchCheckpoint
+from crypto_trailing_stop.scripts.executor import ResearchExecutor
+from crypto_trailing_stop.scripts.serde import BacktestResultSerde
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, ResearchExecutorConfig
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+def should_resume_an_interrupted_research_from_its_checkpoint(tmp_path: Path) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    cartesian_product = [
+        replace(default_buy_sell_signals_config, stop_loss_atr_multiplier=stop_loss_atr_multiplier)
+        for stop_loss_atr_multiplier in [1.0, 1.5, 2.0, 2.5, 3.0]
+    ]
+    with ResearchExecutor(ResearchExecutorConfig(workers=2, chunk_size=1)) as research_executor:
+        exec_parallel_execution_kwargs = {
+            "exchange": "mexc",
+            "initial_cash": 3_000,
+            "research_executor": research_executor,
+            "disable_progress_bar": True,
+            "df": df,
+            "timeframe": "1h",
+            "cartesian_product": cartesian_product,
+        }
+        expected = backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+            **exec_parallel_execution_kwargs
+        )
+        # The research is interrupted (e.g. Ctrl-C) after the third result
+        original_write = ResearchCheckpoint.write
+        written_results = 0
+
+        def _interrupting_write(checkpoint: ResearchCheckpoint, key: str, result: BacktestingExecutionResult) -> None:
+            nonlocal written_results
+            original_write(checkpoint, key, result)
+            written_results += 1
+            if written_results >= 3:
+                raise KeyboardInterrupt()
+
+        with (
+            pytest.raises(KeyboardInterrupt),
+            patch.object(ResearchCheckpoint, "write", autospec=True, side_effect=_interrupting_write),
+            ResearchCheckpoint(str(tmp_path), row_group_size=2, row_groups_per_file=1) as checkpoint,
+        ):
+            backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+                checkpoint=checkpoint, **exec_parallel_execution_kwargs
+            )
+        with (
+            patch.object(
+                BacktestingCliService,
+                "_iter_parallel_execution",
+                autospec=True,
+                side_effect=BacktestingCliService._iter_parallel_execution,
+            ) as iter_parallel_execution_mock,
+            ResearchCheckpoint(str(tmp_path)) as checkpoint,
+        ):
+            resumed_results = backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+                checkpoint=checkpoint, **exec_parallel_execution_kwargs
+            )
+    # Only the combinations which were not checkpointed are run again
+    assert iter_parallel_execution_mock.call_args.kwargs["cartesian_product"] == cartesian_product[3:]
+    pd.testing.assert_frame_equal(_to_frame(resumed_results), _to_frame(expected))
+    assert len(ResearchCheckpoint(str(tmp_path)).load()) == len(cartesian_product)
+
+
+def should_only_deserialise_the_requested_results_of_the_checkpoint(faker: Faker, tmp_path: Path) -> None:
+    results_by_key = {faker.unique.sha256(): result for result in _create_results(faker)}
+    with ResearchCheckpoint(str(tmp_path), row_group_size=2, row_groups_per_file=2) as checkpoint:
+        for key, result in results_by_key.items():
+            checkpoint.write(key, result)
+    requested_keys = faker.random_sample(list(results_by_key.keys()), length=3)
+    with patch.object(
+        BacktestResultSerde, "from_table", autospec=True, side_effect=BacktestResultSerde.from_table
+    ) as from_table_mock:
+        loaded_results_by_key = ResearchCheckpoint(str(tmp_path)).load([*requested_keys, faker.sha256()])
+    assert set(loaded_results_by_key.keys()) == set(requested_keys)
+    pd.testing.assert_frame_equal(
+        _to_frame([loaded_results_by_key[key] for key in requested_keys]),
+        _to_frame([results_by_key[key] for key in requested_keys]),
+    )
+    # Only the rows of the requested keys are deserialised
+    assert sum(call.args[1].num_rows for call in from_table_mock.call_args_list) == len(requested_keys)
+    assert len(ResearchCheckpoint(str(tmp_path)).load()) == len(results_by_key)
+
+
+def _create_results(faker: Faker) -> list[BacktestingExecutionResult]:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    ret = [
+        BacktestingExecutionResult(
+            parameters=replace(default_buy_sell_signals_config, adx_threshold=adx_threshold),
+            number_of_trades=faker.pyint(min_value=2, max_value=50),
+            win_rate=faker.pyfloat(min_value=0, max_value=100),
+            net_profit_amount=faker.pyfloat(min_value=-1_000, max_value=1_000),
+            net_profit_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            avg_trade_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_trade_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            buy_and_hold_return_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            profit_factor=faker.pyfloat(min_value=0, max_value=3),
+            best_trade_percentage=faker.pyfloat(min_value=0, max_value=10),
+            worst_trade_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            avg_drawdown_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            max_drawdown_percentage=faker.pyfloat(min_value=-30, max_value=-10),
+            avg_drawdown_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_drawdown_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            sqn=faker.pyfloat(min_value=-3, max_value=3),
+        )
+        for adx_threshold in range(10)
+    ]
+    return ret
+
+
+def _to_frame(results: list[BacktestingExecutionResult]) -> pd.DataFrame:
+    # NOTE: Compared as frames, since metrics might be NaN
+    ret = pd.json_normalize([asdict(result) for result in results])
+    return ret
@@ -0,0 +1,34 @@
+import logging
+import os
+
+from crypto_trailing_stop.scripts import jobs
+from crypto_trailing_stop.scripts.executor import ResearchExecutor
+from crypto_trailing_stop.scripts.vo import ResearchExecutorConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _describe_worker(value: int) -> tuple[int, int, int]:
+    # Runs within the worker process, so it must be importable by it
+    return value * 2, os.getpid(), id(jobs._backtesting_cli_service)
+
+
+def should_keep_the_order_of_the_arguments_and_recycle_workers_after_max_chunks() -> None:
+    chunk_size, max_chunks_per_worker = 3, 2
+    research_executor_config = ResearchExecutorConfig(
+        workers=2, chunk_size=chunk_size, max_chunks_per_worker=max_chunks_per_worker
+    )
+    values = list(range(12))
+    with ResearchExecutor(research_executor_config) as research_executor:
+        results = research_executor.starmap(_describe_worker, [(value,) for value in values], disable_progress_bar=True)
+    assert [result for result, *_ in results] == [value * 2 for value in values]
+    # Every chunk runs within a single worker, which built its service graph once on start up
+    chunks = [results[start : start + chunk_size] for start in range(0, len(results), chunk_size)]
+    assert all(len({(pid, service_id) for _, pid, service_id in chunk}) == 1 for chunk in chunks)
+    # Workers are replaced once they have processed the maximum number of chunks
+    chunks_by_pid: dict[int, int] = {}
+    for chunk in chunks:
+        _, pid, _ = chunk[0]
+        chunks_by_pid[pid] = chunks_by_pid.get(pid, 0) + 1
+    assert max(chunks_by_pid.values()) <= max_chunks_per_worker
+    assert len(chunks_by_pid) >= len(chunks) / max_chunks_per_worker
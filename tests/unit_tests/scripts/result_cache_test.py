@@ -0,0 +1,109 @@
+import logging
+from dataclasses import asdict, replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.services.vo import crypto_market_metrics
+from crypto_trailing_stop.scripts import jobs, simulator
+from crypto_trailing_stop.scripts.executor import ResearchExecutor
+from crypto_trailing_stop.scripts.result_cache import BacktestResultCache
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, ResearchExecutorConfig
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+def should_only_run_the_combinations_missing_in_the_results_cache(tmp_path: Path) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    results_cache = BacktestResultCache(str(tmp_path / "results.sqlite"))
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    cartesian_product = [
+        replace(default_buy_sell_signals_config, stop_loss_atr_multiplier=stop_loss_atr_multiplier)
+        for stop_loss_atr_multiplier in [1.0, 1.5, 2.0, 2.5]
+    ]
+    with ResearchExecutor(ResearchExecutorConfig(workers=2)) as research_executor:
+        exec_parallel_execution_kwargs = {
+            "exchange": "mexc",
+            "initial_cash": 3_000,
+            "research_executor": research_executor,
+            "disable_progress_bar": True,
+            "df": df,
+            "timeframe": "1h",
+        }
+        expected = backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+            cartesian_product=cartesian_product, **exec_parallel_execution_kwargs
+        )
+        first_results = backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+            cartesian_product=cartesian_product[:2], results_cache=results_cache, **exec_parallel_execution_kwargs
+        )
+        with patch.object(
+            BacktestingCliService,
+            "_iter_parallel_execution",
+            autospec=True,
+            side_effect=BacktestingCliService._iter_parallel_execution,
+        ) as iter_parallel_execution_mock:
+            second_results = backtesting_cli_service._exec_parallel_execution_by_cartesian_product(
+                cartesian_product=cartesian_product, results_cache=results_cache, **exec_parallel_execution_kwargs
+            )
+    pd.testing.assert_frame_equal(_to_frame(first_results), _to_frame(expected[:2]))
+    pd.testing.assert_frame_equal(_to_frame(second_results), _to_frame(expected))
+    # Only the combinations which were not run before are dispatched
+    assert iter_parallel_execution_mock.call_args.kwargs["cartesian_product"] == cartesian_product[2:]
+
+
+def should_change_the_key_when_candles_or_parameters_change(tmp_path: Path) -> None:
+    results_cache = BacktestResultCache(str(tmp_path / "results.sqlite"))
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    simulated_bs_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    key_kwargs = {"exchange": "mexc", "initial_cash": 3_000, "timeframe": "1h"}
+    key = results_cache.get_key(
+        candles_hash=results_cache.get_candles_hash(df), simulated_bs_config=simulated_bs_config, **key_kwargs
+    )
+    assert key == results_cache.get_key(
+        candles_hash=results_cache.get_candles_hash(df.copy()),
+        simulated_bs_config=replace(simulated_bs_config),
+        **key_kwargs,
+    )
+    assert key != results_cache.get_key(
+        candles_hash=results_cache.get_candles_hash(df.iloc[1:]), simulated_bs_config=simulated_bs_config, **key_kwargs
+    )
+    assert key != results_cache.get_key(
+        candles_hash=results_cache.get_candles_hash(df),
+        simulated_bs_config=replace(simulated_bs_config, adx_threshold=simulated_bs_config.adx_threshold + 1),
+        **key_kwargs,
+    )
+
+
+def should_change_the_strategy_code_version_when_libraries_change(tmp_path: Path) -> None:
+    results_cache = BacktestResultCache(str(tmp_path / "results.sqlite"))
+    strategy_code_filepaths = results_cache._get_strategy_code_filepaths()
+    # The whole scripts package, along with the project modules it imports
+    assert {simulator.__file__, jobs.__file__, crypto_market_metrics.__file__} <= set(strategy_code_filepaths)
+    strategy_code_version = results_cache.strategy_code_version
+    with patch("crypto_trailing_stop.scripts.result_cache.version", return_value="0.0.1"):
+        assert BacktestResultCache(str(tmp_path / "results.sqlite")).strategy_code_version != strategy_code_version
+
+
+def _to_frame(results: list[BacktestingExecutionResult]) -> pd.DataFrame:
+    # NOTE: Compared as frames, since metrics might be NaN
+    ret = pd.json_normalize([asdict(result) for result in results])
+    return ret
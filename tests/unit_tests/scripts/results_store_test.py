@@ -0,0 +1,133 @@
+import logging
+import math
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.scripts.results_store import ResearchResultsStore
+from crypto_trailing_stop.scripts.serde import BACKTEST_RESULTS_SCHEMA
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+
+logger = logging.getLogger(__name__)
+
+
+def should_query_stored_research_runs_pushing_down_filters(faker: Faker, tmp_path: Path) -> None:
+    results_store = ResearchResultsStore(str(tmp_path), row_group_size=4)
+    eth_first_results, eth_second_results = _create_results(faker), _create_results(faker)
+    filepaths = [
+        results_store.append(
+            results, symbol=symbol, exchange="mexc", timeframe="1h", run_name=run_name, run_date=run_date
+        )
+        for symbol, run_name, run_date, results in [
+            ("ETH/EUR", "all_first_run", date(2025, 1, 1), eth_first_results),
+            ("ETH/EUR", "all_second_run", date(2025, 2, 1), eth_second_results),
+            ("BTC/EUR", "all_first_run", date(2025, 2, 1), _create_results(faker)),
+        ]
+    ]
+    # Every run is a Parquet file of its own partition, with several row groups
+    assert Path(filepaths[0]).parent == tmp_path / "symbol=ETH%2FEUR/exchange=mexc/timeframe=1h/date=2025-01-01"
+    assert pq.ParquetFile(filepaths[0]).metadata.num_row_groups == 5
+
+    table = results_store.query(symbol="ETH/EUR", exchange="mexc", timeframe="1h")
+    assert table.schema == BACKTEST_RESULTS_SCHEMA
+    assert table.num_rows == len(eth_first_results) + len(eth_second_results)
+
+    table = results_store.query(
+        symbol="eth/eur",
+        since=date(2025, 2, 1),
+        only_profitable=True,
+        min_trades=10,
+        min_win_rate=40.0,
+        max_drawdown_percentage=20.0,
+        tp_filter="enabled",
+        columns=["parameters.adx_threshold", "number_of_trades", "win_rate", "date"],
+    )
+    expected = [
+        result
+        for result in eth_second_results
+        if result.net_profit_amount > 0
+        and result.number_of_trades >= 10
+        and result.win_rate >= 40.0
+        and result.max_drawdown_percentage >= -20.0
+        and result.parameters.enable_exit_on_take_profit
+    ]
+    assert table.column_names == ["parameters.adx_threshold", "number_of_trades", "win_rate", "date"]
+    assert sorted(table.column("parameters.adx_threshold").to_pylist()) == sorted(
+        result.parameters.adx_threshold for result in expected
+    )
+    assert set(table.column("date").to_pylist()) <= {date(2025, 2, 1)}
+    # Nothing is stored yet
+    assert ResearchResultsStore(str(tmp_path / "empty")).query(symbol="ETH/EUR").num_rows == 0
+
+
+def should_find_out_best_parameters_from_the_stored_research_runs(faker: Faker, tmp_path: Path) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    backtesting_cli_service._results_store = ResearchResultsStore(str(tmp_path))
+    first_results, second_results = _create_results(faker), _create_results(faker)
+    for run_name, results in [("all_first_run", first_results), ("all_second_run", second_results)]:
+        backtesting_cli_service._results_store.append(
+            results, symbol="ETH/EUR", exchange="mexc", timeframe="1h", run_name=run_name
+        )
+    select_kwargs = {
+        "downloaded_months_back": 1,
+        "disable_minimal_trades": False,
+        "disable_decent_win_rate": False,
+        "decent_win_rate": 70.0,
+        "min_profit_factor": 1.0,
+        "min_sqn": None,
+    }
+    summary = backtesting_cli_service.find_out_best_parameters(
+        symbol="ETH/EUR",
+        exchange="mexc",
+        timeframe="1h",
+        initial_cash=3_000,
+        from_results_store=True,
+        echo_fn=logger.info,
+        **select_kwargs,
+    )
+    # Same champions as when selecting them among all the results of both runs
+    expected = backtesting_cli_service._iter_over_executions_results_to_get_final_results(
+        executions_results=[result for result in first_results + second_results if not math.isnan(result.sqn)],
+        **select_kwargs,
+    )
+    assert summary.all
+    assert summary == expected
+
+
+def _create_results(faker: Faker) -> list[BacktestingExecutionResult]:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    ret = [
+        BacktestingExecutionResult(
+            parameters=replace(
+                default_buy_sell_signals_config,
+                adx_threshold=faker.unique.pyint(min_value=0, max_value=10_000),
+                enable_exit_on_take_profit=faker.pybool(),
+            ),
+            number_of_trades=number_of_trades,
+            win_rate=faker.pyfloat(min_value=0, max_value=100),
+            net_profit_amount=faker.pyfloat(min_value=-1_000, max_value=1_000),
+            net_profit_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            avg_trade_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_trade_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            buy_and_hold_return_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            profit_factor=faker.pyfloat(min_value=0, max_value=3),
+            best_trade_percentage=faker.pyfloat(min_value=0, max_value=10),
+            worst_trade_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            avg_drawdown_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            max_drawdown_percentage=faker.pyfloat(min_value=-30, max_value=-10),
+            avg_drawdown_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_drawdown_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            sqn=faker.pyfloat(min_value=-3, max_value=3) if number_of_trades > 1 else math.nan,
+        )
+        for number_of_trades in [0, 1, *[faker.pyint(min_value=2, max_value=50) for _ in range(18)]]
+    ]
+    return ret
@@ -0,0 +1,64 @@
+import logging
+from dataclasses import replace
+
+import pandas as pd
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.search import SuccessiveHalvingSearch
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, SuccessiveHalvingConfig
+
+logger = logging.getLogger(__name__)
+
+
+def should_promote_the_best_candidates_to_progressively_longer_windows(faker: Faker) -> None:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    candidates = [
+        replace(default_buy_sell_signals_config, adx_threshold=adx_threshold) for adx_threshold in range(1, 28)
+    ]
+    df = pd.DataFrame({"close": [faker.pyfloat(min_value=1_000, max_value=4_000) for _ in range(9_000)]})
+    evaluated_rungs: list[tuple[int, int, int]] = []
+
+    def _evaluate(
+        rung_candidates: list[BuySellSignalsConfigItem], rung_df: pd.DataFrame, warmup_bars: int
+    ) -> list[BacktestingExecutionResult]:
+        evaluated_rungs.append((len(rung_candidates), len(rung_df), warmup_bars))
+        # Higher ADX thresholds perform better in this fake market
+        return [
+            BacktestingExecutionResult(
+                parameters=candidate,
+                number_of_trades=20,
+                win_rate=50.0,
+                net_profit_amount=float(candidate.adx_threshold),
+                net_profit_percentage=float(candidate.adx_threshold),
+                avg_trade_duration_in_days=1.0,
+                max_trade_duration_in_days=1.0,
+                buy_and_hold_return_percentage=0.0,
+                profit_factor=1.0,
+                best_trade_percentage=1.0,
+                worst_trade_percentage=-1.0,
+                avg_drawdown_percentage=-1.0,
+                max_drawdown_percentage=-1.0,
+                avg_drawdown_duration_in_days=1.0,
+                max_drawdown_duration_in_days=1.0,
+                sqn=1.0,
+            )
+            for candidate in rung_candidates
+        ]
+
+    results = SuccessiveHalvingSearch(SuccessiveHalvingConfig(reduction_factor=3, rungs=3)).search(
+        candidates, df=df, evaluate_fn=_evaluate, echo_fn=logger.info
+    )
+    warmup_candles = default_buy_sell_signals_config.ema_long_value
+    # Warm-up candles are prepended to every window, but only the window itself is traded and scored
+    assert evaluated_rungs == [
+        (27, 1_000 + warmup_candles, warmup_candles),
+        (9, 3_000 + warmup_candles, warmup_candles),
+        (3, 9_000, 0),
+    ]
+    assert [result.parameters.adx_threshold for result in results] == [27, 26, 25]
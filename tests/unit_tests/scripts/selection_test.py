@@ -0,0 +1,138 @@
+import logging
+import math
+from dataclasses import replace
+from pathlib import Path
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.services.vo.buy_sell_signals_config_item import BuySellSignalsConfigItem
+from crypto_trailing_stop.scripts.selection import FinalResultsSelector
+from crypto_trailing_stop.scripts.serde import BacktestResultSerde
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult, BacktestingExecutionSummary
+
+logger = logging.getLogger(__name__)
+
+
+def should_relax_the_decent_win_rate_until_some_result_survives(tmp_path: Path) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    results = _create_results()
+    select_kwargs = {
+        "downloaded_months_back": 1,
+        "disable_minimal_trades": False,
+        "disable_decent_win_rate": False,
+        "decent_win_rate": 70.0,
+        "min_profit_factor": 1.5,
+        "min_sqn": 1.0,
+    }
+    # No result reaches a 70% win rate along with the minimum SQN and the minimum trades,
+    # so the decent win rate is relaxed down to 60%, where only the first one survives
+    assert FinalResultsSelector.from_results(results).select(**select_kwargs) == {
+        "best_overall": 0,
+        "highest_quality": 0,
+        "best_profitable": 0,
+        "best_win_rate": 0,
+    }
+    expected = BacktestingExecutionSummary(*[results[0]] * 4)
+    assert (
+        backtesting_cli_service._iter_over_executions_results_to_get_final_results(
+            executions_results=results, **select_kwargs
+        )
+        == expected
+    )
+    # Same champions when they are selected straight from the Parquet file
+    filepath = tmp_path / "results.parquet"
+    BacktestResultSerde().save(results, str(filepath))
+    assert (
+        backtesting_cli_service._find_out_best_parameters_from_parquet_file(from_parquet=filepath, **select_kwargs)
+        == expected
+    )
+
+
+def should_pick_every_champion_among_the_profitable_results() -> None:
+    results = _create_results()
+    champion_indices = FinalResultsSelector.from_results(results).select(
+        downloaded_months_back=1,
+        disable_minimal_trades=True,
+        disable_decent_win_rate=True,
+        decent_win_rate=70.0,
+        min_profit_factor=None,
+        min_sqn=None,
+    )
+    assert champion_indices == {
+        "best_overall": 1,
+        "highest_quality": 2,
+        "best_profitable": 4,
+        # Highest net profit among the results within 5 points of the highest win rate
+        "best_win_rate": 4,
+    }
+    # Nothing is selected when no result is profitable
+    assert (
+        FinalResultsSelector.from_results([replace(result, net_profit_amount=-1.0) for result in results]).select(
+            downloaded_months_back=1,
+            disable_minimal_trades=True,
+            disable_decent_win_rate=True,
+            decent_win_rate=70.0,
+            min_profit_factor=None,
+            min_sqn=None,
+        )
+        == {}
+    )
+
+
+def _create_results() -> list[BacktestingExecutionResult]:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    ret = [
+        _create_result(
+            replace(default_buy_sell_signals_config, adx_threshold=adx_threshold),
+            number_of_trades=number_of_trades,
+            win_rate=win_rate,
+            net_profit_amount=net_profit_amount,
+            net_profit_percentage=net_profit_percentage,
+            sqn=sqn,
+        )
+        for adx_threshold, (number_of_trades, win_rate, net_profit_amount, net_profit_percentage, sqn) in enumerate(
+            [
+                (20, 60.0, 100.0, 10.0, 1.5),
+                (20, 58.0, 300.0, 30.0, 1.5),
+                # A single trade, so there is no SQN
+                (1, 90.0, 500.0, 50.0, math.nan),
+                (30, 95.0, -50.0, -5.0, 2.0),
+                (2, 88.0, 600.0, 5.0, 0.5),
+            ]
+        )
+    ]
+    return ret
+
+
+def _create_result(
+    parameters: BuySellSignalsConfigItem,
+    *,
+    number_of_trades: int,
+    win_rate: float,
+    net_profit_amount: float,
+    net_profit_percentage: float,
+    sqn: float,
+) -> BacktestingExecutionResult:
+    ret = BacktestingExecutionResult(
+        parameters=parameters,
+        number_of_trades=number_of_trades,
+        win_rate=win_rate,
+        net_profit_amount=net_profit_amount,
+        net_profit_percentage=net_profit_percentage,
+        avg_trade_duration_in_days=1.0,
+        max_trade_duration_in_days=1.0,
+        buy_and_hold_return_percentage=0.0,
+        profit_factor=2.0,
+        best_trade_percentage=1.0,
+        worst_trade_percentage=-1.0,
+        avg_drawdown_percentage=-1.0,
+        max_drawdown_percentage=-1.0,
+        avg_drawdown_duration_in_days=1.0,
+        max_drawdown_duration_in_days=1.0,
+        sqn=sqn,
+    )
+    return ret
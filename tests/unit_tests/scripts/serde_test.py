@@ -0,0 +1,80 @@
+import logging
+import math
+from dataclasses import asdict, replace
+from pathlib import Path
+
+import pandas as pd
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.scripts.serde import BACKTEST_RESULTS_SCHEMA, BacktestResultSerde
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+
+logger = logging.getLogger(__name__)
+
+
+def should_save_and_load_backtesting_results(faker: Faker, tmp_path: Path) -> None:
+    serde = BacktestResultSerde()
+    results = _create_results(faker)
+    filepath = str(tmp_path / "results.parquet")
+    serde.save(results, filepath)
+
+    assert serde.load_table(filepath, drop_na=False).schema == BACKTEST_RESULTS_SCHEMA
+    _assert_same_results(serde.load(filepath, drop_na=False), results)
+    # Results with any missing metric (e.g. SQN of a backtest without trades) are dropped by default
+    _assert_same_results(serde.load(filepath), [result for result in results if not math.isnan(result.sqn)])
+    assert serde.load_table(filepath).num_rows == len([result for result in results if not math.isnan(result.sqn)])
+
+
+def should_load_backtesting_results_saved_through_pandas(faker: Faker, tmp_path: Path) -> None:
+    serde = BacktestResultSerde()
+    results = _create_results(faker)
+    filepath = str(tmp_path / "results.parquet")
+    # Former format, where NaN metrics are stored as nulls
+    pd.json_normalize([asdict(result) for result in results], sep=".").to_parquet(filepath, index=False)
+
+    _assert_same_results(serde.load(filepath, drop_na=False), results)
+    _assert_same_results(serde.load(filepath), [result for result in results if not math.isnan(result.sqn)])
+
+
+def _create_results(faker: Faker) -> list[BacktestingExecutionResult]:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    ret = [
+        BacktestingExecutionResult(
+            parameters=replace(
+                default_buy_sell_signals_config,
+                adx_threshold=faker.pyint(min_value=0, max_value=30),
+                enable_exit_on_take_profit=faker.pybool(),
+                stop_loss_atr_multiplier=faker.pyfloat(min_value=1, max_value=3),
+            ),
+            number_of_trades=number_of_trades,
+            win_rate=faker.pyfloat(min_value=0, max_value=100),
+            net_profit_amount=faker.pyfloat(min_value=-1_000, max_value=1_000),
+            net_profit_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            avg_trade_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_trade_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            buy_and_hold_return_percentage=faker.pyfloat(min_value=-30, max_value=30),
+            profit_factor=faker.pyfloat(min_value=0, max_value=3),
+            best_trade_percentage=faker.pyfloat(min_value=0, max_value=10),
+            worst_trade_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            avg_drawdown_percentage=faker.pyfloat(min_value=-10, max_value=0),
+            max_drawdown_percentage=faker.pyfloat(min_value=-30, max_value=-10),
+            avg_drawdown_duration_in_days=faker.pyfloat(min_value=0, max_value=5),
+            max_drawdown_duration_in_days=faker.pyfloat(min_value=5, max_value=10),
+            sqn=faker.pyfloat(min_value=-3, max_value=3) if number_of_trades > 1 else math.nan,
+        )
+        for number_of_trades in [0, 1, *[faker.pyint(min_value=2, max_value=50) for _ in range(10)]]
+    ]
+    return ret
+
+
+def _assert_same_results(actual: list[BacktestingExecutionResult], expected: list[BacktestingExecutionResult]) -> None:
+    # NOTE: Compared as frames, since metrics might be NaN
+    pd.testing.assert_frame_equal(
+        pd.json_normalize([asdict(result) for result in actual]),
+        pd.json_normalize([asdict(result) for result in expected]),
+    )
@@ -0,0 +1,55 @@
+import logging
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from crypto_trailing_stop.scripts.shared_frames import SharedFrameStore
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+def should_attach_to_published_frames_without_changing_them() -> None:
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    df["bearish_divergence"] = df["close"] < df["open"]
+    with SharedFrameStore() as shared_frame_store:
+        shared_df = shared_frame_store.publish(df)
+        attached_df = shared_df.attach()
+        pd.testing.assert_frame_equal(attached_df, df)
+
+        # Every worker gets its own copy of the pages it writes on
+        attached_df.loc[0, "close"] = np.nan
+        attached_df.fillna(0.0, inplace=True)
+        attached_df.rename(columns={"close": "Close"}, inplace=True)
+        pd.testing.assert_frame_equal(shared_df.attach(), df)
+
+
+def should_attach_every_column_without_copying_it() -> None:
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.tz_convert("Europe/Madrid")
+    df["bearish_divergence"] = df["close"] < df["open"]
+    original_load = np.load
+    mapped_values_list: list[np.ndarray] = []
+
+    def _load(*args, **kwargs) -> np.ndarray:
+        mapped_values = original_load(*args, **kwargs)
+        mapped_values_list.append(mapped_values)
+        return mapped_values
+
+    with SharedFrameStore() as shared_frame_store:
+        shared_df = shared_frame_store.publish(df)
+        with patch.object(np, "load", side_effect=_load):
+            attached_df = shared_df.attach()
+        pd.testing.assert_frame_equal(attached_df, df)
+        # Every column is a view of its memory-mapped file (datetimes included)
+        for (name, series), mapped_values in zip(attached_df.items(), mapped_values_list, strict=True):
+            values = series.array.asi8 if isinstance(series.dtype, pd.DatetimeTZDtype) else series.to_numpy()
+            assert np.shares_memory(values, mapped_values), f"Column '{name}' is a copy of its mapped file"
@@ -0,0 +1,99 @@
+import logging
+from dataclasses import replace
+from itertools import product
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.services.crypto_analytics_service import CryptoAnalyticsService
+from crypto_trailing_stop.infrastructure.tasks.buy_sell_signals_task_service import BuySellSignalsTaskService
+from crypto_trailing_stop.scripts.constants import DEFAULT_TRADING_MARKET_CONFIG
+from crypto_trailing_stop.scripts.signals import SIGNALS_LOOKBACK_CANDLES, calculate_buy_sell_signals
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    "fetch_ohlcv_return_value_filename",
+    [
+        "mock_buy_signal.json",
+        "mock_choppy_market.json",
+        "mock_rsi_overbought.json",
+        "mock_rsi_oversold.json",
+        "mock_sell_signal.json",
+    ],
+)
+@pytest.mark.parametrize("timeframe", ["1h", "4h"])
+def should_calculate_the_same_signals_as_the_per_candle_evaluation(
+    fetch_ohlcv_return_value_filename: str, timeframe: str
+) -> None:
+    # NOTE: Built the same way as BacktestingCliService does, since no collaborator is needed to calculate signals
+    configuration_properties = ConfigurationProperties()
+    ccxt_remote_service = CcxtRemoteService(configuration_properties=SimpleNamespace(operating_exchange="mexc"))
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=configuration_properties, favourite_crypto_currency_service=None
+    )
+    crypto_analytics_service = CryptoAnalyticsService(
+        operating_exchange_service=None,
+        ccxt_remote_service=ccxt_remote_service,
+        favourite_crypto_currency_service=None,
+        buy_sell_signals_config_service=None,
+    )
+    buy_sell_signals_task_service = BuySellSignalsTaskService(
+        configuration_properties=configuration_properties,
+        operating_exchange_service=None,
+        push_notification_service=None,
+        telegram_service=None,
+        event_bus=None,
+        scheduler=AsyncIOScheduler(),
+        ccxt_remote_service=ccxt_remote_service,
+        global_flag_service=None,
+        favourite_crypto_currency_service=None,
+        crypto_analytics_service=None,
+        auto_buy_trader_config_service=None,
+        buy_sell_signals_config_service=None,
+        shard_lease_service=None,
+        market_history_archive_service=None,
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    for enable_adx_filter, enable_buy_volume_filter, enable_sell_volume_filter in product([True, False], repeat=3):
+        buy_sell_signals_config = replace(
+            default_buy_sell_signals_config,
+            enable_adx_filter=enable_adx_filter,
+            enable_buy_volume_filter=enable_buy_volume_filter,
+            enable_sell_volume_filter=enable_sell_volume_filter,
+        )
+        df = pd.DataFrame(
+            load_ohlcv_result_by_filename(fetch_ohlcv_return_value_filename),
+            columns=["timestamp", "open", "high", "low", "close", "volume"],
+        )
+        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+        crypto_analytics_service._calculate_simple_indicators(df, buy_sell_signals_config)
+        crypto_analytics_service._calculate_complex_indicators(df)
+
+        buy_signals, sell_signals = calculate_buy_sell_signals(
+            df,
+            buy_sell_signals_config,
+            volatility_threshold=buy_sell_signals_task_service._get_volatility_threshold(timeframe),
+        )
+
+        expected_signals = [
+            buy_sell_signals_task_service._check_signals(
+                symbol=buy_sell_signals_config.symbol,
+                timeframe=timeframe,
+                df=df.iloc[: i + 1],
+                buy_sell_signals_config=buy_sell_signals_config,
+                trading_market_config=DEFAULT_TRADING_MARKET_CONFIG,
+            )
+            for i in range(SIGNALS_LOOKBACK_CANDLES, len(df))
+        ]
+        assert not buy_signals.iloc[:SIGNALS_LOOKBACK_CANDLES].any()
+        assert not sell_signals.iloc[:SIGNALS_LOOKBACK_CANDLES].any()
+        assert buy_signals.iloc[SIGNALS_LOOKBACK_CANDLES:].tolist() == [signals.buy for signals in expected_signals]
+        assert sell_signals.iloc[SIGNALS_LOOKBACK_CANDLES:].tolist() == [signals.sell for signals in expected_signals]
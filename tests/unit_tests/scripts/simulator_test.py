@@ -0,0 +1,91 @@
+import logging
+from dataclasses import asdict, replace
+from itertools import product
+
+import pandas as pd
+import pytest
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.scripts.services import BacktestingCliService
+from crypto_trailing_stop.scripts.vo import BacktestingExecutionResult
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    "fetch_ohlcv_return_value_filename",
+    [
+        "mock_buy_signal.json",
+        "mock_choppy_market.json",
+        "mock_rsi_overbought.json",
+        "mock_rsi_oversold.json",
+        "mock_sell_signal.json",
+    ],
+)
+@pytest.mark.parametrize("exchange", ["mexc", "bit2me"])
+def should_get_the_same_results_as_backtesting_py(fetch_ohlcv_return_value_filename: str, exchange: str) -> None:
+    backtesting_cli_service = BacktestingCliService()
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    default_buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename(fetch_ohlcv_return_value_filename),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    for enable_adx_filter, enable_exit_on_take_profit, stop_loss_atr_multiplier, initial_cash in product(
+        [True, False], [True, False], [1.0, 2.5], [3_000, 100_000]
+    ):
+        simulated_bs_config = replace(
+            default_buy_sell_signals_config,
+            enable_adx_filter=enable_adx_filter,
+            enable_exit_on_take_profit=enable_exit_on_take_profit,
+            enable_exit_on_divergence_signal=not enable_exit_on_take_profit,
+            stop_loss_atr_multiplier=stop_loss_atr_multiplier,
+        )
+        expected, *_ = backtesting_cli_service.execute_backtesting(
+            exchange=exchange,
+            simulated_bs_config=simulated_bs_config,
+            initial_cash=initial_cash,
+            df=df.copy(),
+            use_tqdm=False,
+        )
+        simulated = backtesting_cli_service.simulate_backtesting(
+            exchange=exchange, simulated_bs_config=simulated_bs_config, initial_cash=initial_cash, df=df.copy()
+        )
+        assert simulated.parameters == expected.parameters
+        assert _get_metrics(simulated) == pytest.approx(_get_metrics(expected), rel=1e-9, nan_ok=True)
+
+
+def should_neither_trade_nor_score_the_warmup_candles() -> None:
+    backtesting_cli_service = BacktestingCliService()
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    simulated_bs_config = replace(
+        buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH"), enable_exit_on_take_profit=True
+    )
+    df = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+    simulate_kwargs = {"exchange": "mexc", "simulated_bs_config": simulated_bs_config, "initial_cash": 3_000}
+    expected = backtesting_cli_service.simulate_backtesting(df=df.copy(), **simulate_kwargs)
+    assert expected.number_of_trades > 0
+    # No trade is entered on the warm-up candles and neither are they scored
+    warmup_bars = len(df) - 1
+    simulated = backtesting_cli_service.simulate_backtesting(df=df.copy(), warmup_bars=warmup_bars, **simulate_kwargs)
+    assert simulated.number_of_trades == 0
+    assert simulated.net_profit_amount == 0
+    assert simulated.buy_and_hold_return_percentage == pytest.approx(
+        (df["close"].iloc[-1] / df["close"].iloc[warmup_bars] - 1) * 100
+    )
+
+
+def _get_metrics(execution_result: BacktestingExecutionResult) -> dict[str, float]:
+    ret = {name: float(value) for name, value in asdict(execution_result).items() if name != "parameters"}
+    return ret
@@ -0,0 +1,96 @@
+import logging
+from collections.abc import Hashable
+from dataclasses import replace
+from typing import Any
+
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.cache import AbstractCachedConfigurationService, ConfigurationCache
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_serve_immutable_snapshots_and_bump_version_on_put(faker: Faker) -> None:
+    stored_items = {symbol: faker.pyfloat(min_value=0.1, max_value=10.0) for symbol in ["BTC", "ETH", "SOL"]}
+    loader_calls = 0
+
+    async def _loader() -> dict[Hashable, Any]:
+        nonlocal loader_calls
+        loader_calls += 1
+        return dict(stored_items)
+
+    configuration_cache = ConfigurationCache("test", _loader)
+    first_snapshot = await configuration_cache.get_snapshot()
+    assert dict(first_snapshot.items) == stored_items
+    # Reads are served from memory, without querying again
+    assert await configuration_cache.get_snapshot() is first_snapshot
+    assert loader_calls == 1
+    with pytest.raises(TypeError):
+        first_snapshot.items["BTC"] = 0.0
+    # Saves replace the snapshot as a whole, so previous readers keep a consistent view
+    new_value = faker.pyfloat(min_value=0.1, max_value=10.0)
+    configuration_cache.put("BTC", new_value)
+    second_snapshot = await configuration_cache.get_snapshot()
+    assert second_snapshot.version > first_snapshot.version
+    assert second_snapshot.get("BTC") == new_value
+    assert first_snapshot.get("BTC") == stored_items["BTC"]
+    assert second_snapshot.get("XRP", 1.0) == 1.0
+    assert loader_calls == 1
+
+
+@pytest.mark.asyncio
+async def should_load_again_when_saving_during_the_load(faker: Faker) -> None:
+    new_value = faker.pyint(min_value=1, max_value=100)
+    configuration_cache: ConfigurationCache | None = None
+    stored_items: dict[Hashable, Any] = {"BTC": 0}
+
+    async def _loader() -> dict[Hashable, Any]:
+        ret = dict(stored_items)
+        if stored_items["BTC"] != new_value:
+            # Simulate a concurrent save while the table is being read
+            stored_items["BTC"] = new_value
+            configuration_cache.put("BTC", new_value)
+        return ret
+
+    configuration_cache = ConfigurationCache("test", _loader)
+    snapshot = await configuration_cache.load()
+    assert snapshot.get("BTC") == new_value
+
+
+@pytest.mark.asyncio
+async def should_expire_configuration_every_heartbeat_when_sharding_is_enabled(faker: Faker) -> None:
+    class _CachedConfigurationService(AbstractCachedConfigurationService):
+        loader_calls = 0
+
+        async def _load_configuration_cache_items(self) -> dict[Hashable, Any]:
+            self.loader_calls += 1
+            return {}
+
+    configuration_properties = ConfigurationProperties().model_copy(update={"configuration_cache_ttl_seconds": None})
+    # A single worker owns the database, so the configuration never expires
+    assert _CachedConfigurationService(configuration_properties)._configuration_cache._ttl_seconds is None
+    # Otherwise, configuration saved by another worker is reloaded on the next heartbeat interval at the latest
+    heartbeat_interval_seconds = faker.pyint(min_value=5, max_value=30)
+    cached_configuration_service = _CachedConfigurationService(
+        configuration_properties.model_copy(
+            update={"sharding_enabled": True, "sharding_heartbeat_interval_seconds": heartbeat_interval_seconds}
+        )
+    )
+    configuration_cache = cached_configuration_service._configuration_cache
+    snapshot = await configuration_cache.get_snapshot()
+    assert await configuration_cache.get_snapshot() is snapshot
+    configuration_cache._snapshot = replace(snapshot, loaded_at=snapshot.loaded_at - heartbeat_interval_seconds)
+    assert (await configuration_cache.get_snapshot()).version > snapshot.version
+    assert cached_configuration_service.loader_calls == 2
+    # Unless it is explicitly set
+    assert (
+        _CachedConfigurationService(
+            configuration_properties.model_copy(
+                update={"sharding_enabled": True, "configuration_cache_ttl_seconds": 300.0}
+            )
+        )._configuration_cache._ttl_seconds
+        == 300.0
+    )
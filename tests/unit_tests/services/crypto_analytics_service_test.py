@@ -0,0 +1,43 @@
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.services.crypto_analytics_service import CryptoAnalyticsService
+from tests.helpers.ohlcv_test_utils import get_fetch_ohlcv_random_result
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_only_retry_fetching_ohlcv_when_no_data_is_returned(faker: Faker) -> None:
+    operating_exchange_service, ccxt_remote_service = MagicMock(), MagicMock()
+    ccxt_remote_service.get_exchange_symbols_by_fiat_currency = AsyncMock(return_value=[])
+    buy_sell_signals_config_service = MagicMock()
+    buy_sell_signals_config_service.find_by_symbol = AsyncMock(
+        return_value=BuySellSignalsConfigService(
+            configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+        )._get_defaults_by_symbol(symbol="ETH")
+    )
+    crypto_analytics_service = CryptoAnalyticsService(
+        operating_exchange_service=operating_exchange_service,
+        ccxt_remote_service=ccxt_remote_service,
+        favourite_crypto_currency_service=MagicMock(),
+        buy_sell_signals_config_service=buy_sell_signals_config_service,
+    )
+    fetch_ohlcv_return_value = get_fetch_ohlcv_random_result(faker)
+    operating_exchange_service.fetch_ohlcv = AsyncMock(side_effect=[[], fetch_ohlcv_return_value])
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        ohlcv = await crypto_analytics_service.fetch_ohlcv_dataframe("ETH/EUR")
+        assert len(ohlcv) == len(fetch_ohlcv_return_value)
+        assert operating_exchange_service.fetch_ohlcv.await_count == 2
+
+        # Given OHLCV data is never fetched again, even if it is not enough
+        with pytest.raises(IndexError):
+            await crypto_analytics_service.calculate_technical_indicators("ETH/EUR", ohlcv=ohlcv.iloc[:0])
+        assert operating_exchange_service.fetch_ohlcv.await_count == 2
+        technical_indicators, _ = await crypto_analytics_service.calculate_technical_indicators("ETH/EUR", ohlcv=ohlcv)
+        assert not technical_indicators.empty
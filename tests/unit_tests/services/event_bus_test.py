@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.infrastructure.services.event_bus import EventBus, EventOverflowPolicyEnum, EventTopic
+
+logger = logging.getLogger(__name__)
+
+_TEST_TOPIC = EventTopic("test", str)
+
+
+@pytest.mark.asyncio
+async def should_drop_oldest_events_when_the_subscriber_queue_is_full(faker: Faker) -> None:
+    event_bus = EventBus()
+    handled_events: list[str] = []
+
+    async def _handler(event: str) -> None:
+        handled_events.append(event)
+
+    event_bus.subscribe(_TEST_TOPIC, _handler, name="test_subscriber", queue_size=2)
+    events = [faker.uuid4() for _ in range(5)]
+    # Publishing never awaits the handlers, so the whole burst is queued before any of them runs
+    for event in events:
+        event_bus.publish(_TEST_TOPIC, event)
+    await event_bus.close(timeout=5.0)
+    assert handled_events == events[-2:]
+    metrics, *_ = event_bus.get_metrics()
+    assert metrics.subscriber == "test_subscriber"
+    assert metrics.published == len(events)
+    assert metrics.dropped == len(events) - 2
+    assert metrics.handled == 2
+    assert metrics.max_queue_depth == 2
+    assert metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def should_keep_pending_events_when_dropping_newest_and_count_failures(faker: Faker) -> None:
+    event_bus = EventBus()
+    handled_events: list[str] = []
+
+    async def _handler(event: str) -> None:
+        handled_events.append(event)
+        raise ValueError(event)
+
+    event_bus.subscribe(
+        _TEST_TOPIC,
+        _handler,
+        name="test_subscriber",
+        queue_size=2,
+        workers=2,
+        overflow_policy=EventOverflowPolicyEnum.DROP_NEWEST,
+    )
+    events = [faker.uuid4() for _ in range(3)]
+    for event in events:
+        event_bus.publish(_TEST_TOPIC, event)
+    await event_bus.close(timeout=5.0)
+    assert sorted(handled_events) == sorted(events[:2])
+    metrics, *_ = event_bus.get_metrics()
+    assert metrics.dropped == 1
+    assert metrics.failed == 2
+    assert metrics.handled == 0
+
+
+@pytest.mark.asyncio
+async def should_coalesce_pending_events_with_the_same_key() -> None:
+    event_bus = EventBus()
+    handled_events: list[str] = []
+
+    async def _handler(event: str) -> None:
+        handled_events.append(event)
+
+    event_bus.subscribe(
+        _TEST_TOPIC,
+        _handler,
+        name="test_subscriber",
+        queue_size=10,
+        overflow_policy=EventOverflowPolicyEnum.COALESCE,
+        coalesce_key=lambda event: event.split(":")[0],
+    )
+    for event in ["ETH:1", "SOL:1", "ETH:2", "ETH:3"]:
+        event_bus.publish(_TEST_TOPIC, event)
+    await event_bus.close(timeout=5.0)
+    # The latest event replaces the pending one, keeping its position in the queue
+    assert handled_events == ["ETH:3", "SOL:1"]
+    metrics, *_ = event_bus.get_metrics()
+    assert metrics.coalesced == 2
+
+
+def should_reject_events_which_do_not_match_the_topic_type() -> None:
+    event_bus = EventBus()
+    with pytest.raises(TypeError):
+        event_bus.publish(_TEST_TOPIC, 1)
+    with pytest.raises(ValueError):
+        event_bus.subscribe(
+            _TEST_TOPIC, lambda _: None, name="test", queue_size=1, overflow_policy=EventOverflowPolicyEnum.COALESCE
+        )
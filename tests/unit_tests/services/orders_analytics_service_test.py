@@ -0,0 +1,63 @@
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.infrastructure.adapters.remote.circuit_breaker import CircuitBreakerOpenError
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.enums import OrderSideEnum, OrderTypeEnum
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.order import Order
+from crypto_trailing_stop.infrastructure.adapters.remote.operating_exchange.vo.symbol_tickers import SymbolTickers
+from crypto_trailing_stop.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_fall_back_to_last_known_tickers_when_circuit_is_open(faker: Faker) -> None:
+    operating_exchange_service = MagicMock()
+    orders_analytics_service = OrdersAnalyticsService(
+        operating_exchange_service=operating_exchange_service,
+        ccxt_remote_service=MagicMock(),
+        stop_loss_percent_service=MagicMock(),
+        buy_sell_signals_config_service=MagicMock(),
+        crypto_analytics_service=MagicMock(),
+    )
+    client = MagicMock()
+    open_sell_orders = [
+        Order(
+            symbol=symbol,
+            order_type=OrderTypeEnum.LIMIT,
+            side=OrderSideEnum.SELL,
+            amount=faker.pyfloat(min_value=0.1, max_value=10.0),
+            price=faker.pyfloat(min_value=1.0, max_value=1_000.0),
+        )
+        for symbol in ["BTC/EUR", "ETH/EUR"]
+    ]
+    tickers_list = [
+        SymbolTickers(
+            timestamp=faker.unix_time(), symbol=sell_order.symbol, close=faker.pyfloat(min_value=1.0, max_value=1_000.0)
+        )
+        for sell_order in open_sell_orders
+    ]
+    operating_exchange_service.get_tickers_by_symbols = AsyncMock(return_value=tickers_list)
+    tickers_by_symbol = await orders_analytics_service._fetch_tickers_for_open_sell_orders(
+        open_sell_orders, client=client
+    )
+    assert tickers_by_symbol == {tickers.symbol: tickers for tickers in tickers_list}
+
+    # Circuit is open, so the last known tickers are served instead
+    operating_exchange_service.get_tickers_by_symbols = AsyncMock(
+        side_effect=CircuitBreakerOpenError("/v2/trading/tickers", retry_after=30.0)
+    )
+    assert (
+        await orders_analytics_service._fetch_tickers_for_open_sell_orders(open_sell_orders, client=client)
+        == tickers_by_symbol
+    )
+
+    # Unless any of the symbols has never been fetched before
+    open_sell_orders.append(
+        Order(symbol="SOL/EUR", order_type=OrderTypeEnum.LIMIT, side=OrderSideEnum.SELL, amount=1.0, price=100.0)
+    )
+    with pytest.raises(CircuitBreakerOpenError):
+        await orders_analytics_service._fetch_tickers_for_open_sell_orders(open_sell_orders, client=client)
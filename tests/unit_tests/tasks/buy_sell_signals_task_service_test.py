@@ -0,0 +1,91 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from crypto_trailing_stop.commons.constants import BUY_SELL_SIGNALS_CANDLE_CLOSE_CONFIRMATION_WINDOW_MINUTES
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.adapters.remote.ccxt_remote_service import CcxtRemoteService
+from crypto_trailing_stop.infrastructure.tasks.buy_sell_signals_task_service import BuySellSignalsTaskService
+from crypto_trailing_stop.infrastructure.tasks.vo.closed_candles_fingerprint import ClosedCandlesFingerprint
+
+logger = logging.getLogger(__name__)
+
+SYMBOL = "ETH/EUR"
+
+
+def should_only_evaluate_signals_when_a_new_candle_has_closed_or_within_the_confirmation_window() -> None:
+    buy_sell_signals_task_service = _create_buy_sell_signals_task_service()
+    confirmation_window = timedelta(minutes=BUY_SELL_SIGNALS_CANDLE_CLOSE_CONFIRMATION_WINDOW_MINUTES)
+    current_candle_open = datetime(2025, 6, 2, 9, 0, tzinfo=UTC)
+    # Never evaluated before
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(SYMBOL, "1h", now=current_candle_open)
+
+    # Last evaluation already took the candle closed right before the current one into account
+    _store_fingerprint(buy_sell_signals_task_service, "1h", current_candle_open - timedelta(hours=1))
+    # ... but the exchange might not have published its final values yet
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(SYMBOL, "1h", now=current_candle_open)
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "1h", now=current_candle_open + confirmation_window
+    )
+    assert not buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "1h", now=current_candle_open + confirmation_window + timedelta(seconds=1)
+    )
+    assert not buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "1h", now=current_candle_open + timedelta(minutes=59)
+    )
+
+    # Last evaluation missed a closed candle (e.g. the exchange was degraded), so it is due at any time
+    _store_fingerprint(buy_sell_signals_task_service, "1h", current_candle_open - timedelta(hours=2))
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "1h", now=current_candle_open + timedelta(minutes=30)
+    )
+
+
+def should_align_signals_evaluation_to_4h_candles() -> None:
+    buy_sell_signals_task_service = _create_buy_sell_signals_task_service()
+    # 4h candles open at 00:00, 04:00, 08:00, ... UTC
+    current_candle_open = datetime(2025, 6, 2, 8, 0, tzinfo=UTC)
+    _store_fingerprint(buy_sell_signals_task_service, "1h", datetime(2025, 6, 2, 8, 0, tzinfo=UTC))
+    _store_fingerprint(buy_sell_signals_task_service, "4h", current_candle_open - timedelta(hours=4))
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "4h", now=current_candle_open + timedelta(minutes=2)
+    )
+    # A new 1h candle opened at 09:00, but the 4h one is still alive
+    now = datetime(2025, 6, 2, 9, 2, tzinfo=UTC)
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(SYMBOL, "1h", now=now)
+    assert not buy_sell_signals_task_service._is_signals_evaluation_due(SYMBOL, "4h", now=now)
+    assert not buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "4h", now=datetime(2025, 6, 2, 11, 59, tzinfo=UTC)
+    )
+    assert buy_sell_signals_task_service._is_signals_evaluation_due(
+        SYMBOL, "4h", now=datetime(2025, 6, 2, 12, 0, tzinfo=UTC)
+    )
+
+
+def _store_fingerprint(
+    buy_sell_signals_task_service: BuySellSignalsTaskService, timeframe: str, last_closed_candle_timestamp: datetime
+) -> None:
+    buy_sell_signals_task_service._closed_candles_fingerprint_cache[(SYMBOL, timeframe)] = ClosedCandlesFingerprint(
+        last_closed_candle_timestamp=last_closed_candle_timestamp, digest="digest"
+    )
+
+
+def _create_buy_sell_signals_task_service() -> BuySellSignalsTaskService:
+    return BuySellSignalsTaskService(
+        configuration_properties=ConfigurationProperties(),
+        operating_exchange_service=None,
+        push_notification_service=None,
+        telegram_service=None,
+        event_bus=None,
+        scheduler=AsyncIOScheduler(),
+        ccxt_remote_service=CcxtRemoteService(configuration_properties=SimpleNamespace(operating_exchange="mexc")),
+        global_flag_service=None,
+        favourite_crypto_currency_service=None,
+        crypto_analytics_service=None,
+        auto_buy_trader_config_service=None,
+        buy_sell_signals_config_service=None,
+        shard_lease_service=None,
+        market_history_archive_service=None,
+    )
@@ -0,0 +1,40 @@
+import logging
+from dataclasses import replace
+
+import pandas as pd
+
+from crypto_trailing_stop.config.configuration_properties import ConfigurationProperties
+from crypto_trailing_stop.infrastructure.services.buy_sell_signals_config_service import BuySellSignalsConfigService
+from crypto_trailing_stop.infrastructure.tasks.vo.closed_candles_fingerprint import ClosedCandlesFingerprint
+from tests.helpers.ohlcv_test_utils import load_ohlcv_result_by_filename
+
+logger = logging.getLogger(__name__)
+
+
+def should_only_change_fingerprint_when_closed_candles_or_config_change() -> None:
+    buy_sell_signals_config_service = BuySellSignalsConfigService(
+        configuration_properties=ConfigurationProperties(), favourite_crypto_currency_service=None
+    )
+    buy_sell_signals_config = buy_sell_signals_config_service._get_defaults_by_symbol(symbol="ETH")
+    ohlcv = pd.DataFrame(
+        load_ohlcv_result_by_filename("mock_buy_signal.json"),
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    ohlcv["timestamp"] = pd.to_datetime(ohlcv["timestamp"], unit="ms", utc=True)
+    fingerprint = ClosedCandlesFingerprint.from_ohlcv(ohlcv, buy_sell_signals_config)
+    assert fingerprint.last_closed_candle_timestamp == ohlcv.iloc[-2]["timestamp"]
+
+    # The current candle is still alive, so its changes do not matter
+    live_candle_updated_ohlcv = ohlcv.copy()
+    live_candle_updated_ohlcv.loc[live_candle_updated_ohlcv.index[-1], "close"] *= 1.01
+    assert ClosedCandlesFingerprint.from_ohlcv(live_candle_updated_ohlcv, buy_sell_signals_config) == fingerprint
+
+    # A new closed candle means a new evaluation
+    new_candle_closed_ohlcv = ohlcv.iloc[1:].reset_index(drop=True)
+    assert ClosedCandlesFingerprint.from_ohlcv(new_candle_closed_ohlcv, buy_sell_signals_config) != fingerprint
+
+    # As well as changing the symbol configuration
+    updated_buy_sell_signals_config = replace(
+        buy_sell_signals_config, enable_adx_filter=not buy_sell_signals_config.enable_adx_filter
+    )
+    assert ClosedCandlesFingerprint.from_ohlcv(ohlcv, updated_buy_sell_signals_config) != fingerprint
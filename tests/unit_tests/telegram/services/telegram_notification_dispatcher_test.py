@@ -0,0 +1,76 @@
+import logging
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from faker import Faker
+
+from crypto_trailing_stop.commons.constants import TELEGRAM_MESSAGE_MAX_LENGTH, TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR
+from crypto_trailing_stop.interfaces.telegram.services.telegram_notification_dispatcher import (
+    TelegramNotificationDispatcher,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _create_dispatcher(
+    telegram_bot: AsyncMock, *, per_chat_interval_seconds: float = 0.0
+) -> TelegramNotificationDispatcher:
+    ret = TelegramNotificationDispatcher(
+        telegram_bot,
+        workers=2,
+        digest_window_seconds=0.05,
+        per_chat_interval_seconds=per_chat_interval_seconds,
+        global_rate_limit_per_second=1_000,
+        max_pending_messages=100,
+    )
+    return ret
+
+
+@pytest.mark.asyncio
+async def should_merge_bursts_of_messages_for_the_same_chat_into_a_single_digest(faker: Faker) -> None:
+    telegram_bot = AsyncMock()
+    dispatcher = _create_dispatcher(telegram_bot)
+    first_chat_id, second_chat_id = (
+        str(faker.random_number(digits=9, fix_len=True)),
+        str(faker.random_number(digits=10, fix_len=True)),
+    )
+    first_chat_messages = [faker.sentence() for _ in range(3)]
+    second_chat_message = faker.sentence()
+    for message in first_chat_messages:
+        dispatcher.enqueue(first_chat_id, message)
+    dispatcher.enqueue(second_chat_id, second_chat_message)
+    # Enqueueing never waits for Telegram
+    telegram_bot.send_message.assert_not_awaited()
+    await dispatcher.close(timeout=5.0)
+    sent_messages_by_chat_id = {
+        call.kwargs["chat_id"]: call.kwargs["text"] for call in telegram_bot.send_message.await_args_list
+    }
+    assert len(telegram_bot.send_message.await_args_list) == 2
+    assert sent_messages_by_chat_id[first_chat_id] == TELEGRAM_NOTIFICATION_DIGEST_SEPARATOR.join(first_chat_messages)
+    assert sent_messages_by_chat_id[second_chat_id] == second_chat_message
+
+
+@pytest.mark.asyncio
+async def should_split_digests_exceeding_the_message_length_and_honour_the_per_chat_rate_limit(faker: Faker) -> None:
+    sent_at_list: list[float] = []
+    telegram_bot = AsyncMock()
+    telegram_bot.send_message.side_effect = lambda **_: sent_at_list.append(time.monotonic())
+    per_chat_interval_seconds = 0.1
+    dispatcher = _create_dispatcher(telegram_bot, per_chat_interval_seconds=per_chat_interval_seconds)
+    chat_id = str(faker.random_number(digits=9, fix_len=True))
+    messages = [faker.pystr(min_chars=3_000, max_chars=3_000) for _ in range(3)]
+    for message in messages:
+        dispatcher.enqueue(chat_id, message)
+    await dispatcher.close(timeout=5.0)
+    sent_texts = [call.kwargs["text"] for call in telegram_bot.send_message.await_args_list]
+    # Every message exceeds half of the limit, so none of them can be merged
+    assert sent_texts == messages
+    assert all(len(sent_text) <= TELEGRAM_MESSAGE_MAX_LENGTH for sent_text in sent_texts)
+    assert all(
+        later - earlier >= per_chat_interval_seconds * 0.9
+        for earlier, later in zip(sent_at_list, sent_at_list[1:], strict=False)
+    )
+    # Messages enqueued after closing are dropped
+    dispatcher.enqueue(chat_id, faker.sentence())
+    assert len(telegram_bot.send_message.await_args_list) == len(messages)